@@ -0,0 +1,194 @@
+"""
+Retrieve throughput under mixed read/write load: per-retrieve vs write-behind
+access tracking on SQLite.
+
+Seeds ``--rows`` memories, then runs ``--readers`` concurrent retrieve loops
+(``recall_by_embedding`` + access tracking) next to one writer inserting
+``--write-rate`` memories/s through its own connection — so the two contend for SQLite's write
+lock the way separate server workers / CLI processes do. Reports
+retrieves/s, retrieve latency, writes/s and the share of access hits that
+actually reached ``access_count`` (per-retrieve tracking that loses the
+lock race past ``busy_timeout`` is dropped, as in the route) for:
+
+* ``per-retrieve, full FTS trigger`` — the old shape: each retrieve schedules
+  ``bump_access_counts`` and ``record_retrieval_event`` (two commits), and
+  the pre-031 ``memories_fts_au`` trigger re-indexes every bumped row;
+* ``per-retrieve`` — the same two commits with the 031 trigger;
+* ``write-behind`` — :class:`~lore.server.access_tracking.AccessTracker`
+  buffering both and flushing them in one transaction per interval.
+
+Usage:
+    python benchmarks/bench_access_tracking.py [--rows 5000] [--readers 8] [--write-rate 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import NewMemory, NewRetrievalEvent, RecallParams  # noqa: E402
+from lore.server.access_tracking import AccessTracker  # noqa: E402
+from lore.services import retrieve as retrieve_service  # noqa: E402
+
+_ORG = "bench"
+_WORDS = ("deploy staging rollback cache token rotate webhook retry queue index "
+          "schema migration tenant latency budget alert").split()
+
+_PRE_031_TRIGGER = """
+DROP TRIGGER IF EXISTS memories_fts_au;
+CREATE TRIGGER memories_fts_au AFTER UPDATE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content, context)
+    VALUES ('delete', old.rowid, old.content, COALESCE(old.context, ''));
+    INSERT INTO memories_fts(rowid, content, context)
+    VALUES (new.rowid, new.content, COALESCE(new.context, ''));
+END;
+"""
+
+Track = Callable[[SqliteStore, List[str], NewRetrievalEvent], None]
+
+
+def _content(rng: np.random.Generator) -> str:
+    return " ".join(rng.choice(_WORDS, size=120))
+
+
+def _vec(rng: np.random.Generator) -> List[float]:
+    v = rng.standard_normal(EMBED_DIM).astype(np.float32)
+    return (v / np.linalg.norm(v)).tolist()
+
+
+async def _open(rows: int, old_trigger: bool) -> Tuple[SqliteStore, str]:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    store = await SqliteStore.open(url)
+    await store._conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES (?, ?)", (_ORG, _ORG))
+    if old_trigger:
+        await store._conn.executescript(_PRE_031_TRIGGER)
+    await store._conn.commit()
+    rng = np.random.default_rng(0)
+    for _ in range(rows):
+        await store.insert_memory(NewMemory(org_id=_ORG, content=_content(rng), embedding=_vec(rng)))
+    return store, url
+
+
+async def _load(
+    store: SqliteStore, writer_store: SqliteStore, readers: int, retrieves: int,
+    write_rate: float, track: Track, drain: Callable[[], Awaitable[None]],
+) -> Tuple[List[float], float, int]:
+    """(retrieve latencies ms, wall s, writes done) for one mixed run."""
+    latencies: List[float] = []
+    stop = asyncio.Event()
+    writes = 0
+
+    async def reader(seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        for _ in range(retrieves):
+            t = time.perf_counter()
+            hits = await store.recall_by_embedding(RecallParams(
+                org_id=_ORG, query_vec=_vec(rng), limit=10, min_score=-1.0, scope_mode="all",
+            ))
+            ids = [m.id for m in hits]
+            track(store, ids, NewRetrievalEvent(
+                org_id=_ORG, query="q", results_count=len(ids), scores=[m.score for m in hits],
+                memory_ids=ids, avg_score=None, max_score=None, min_score_threshold=0.0,
+                query_time_ms=0.0,
+            ))
+            latencies.append((time.perf_counter() - t) * 1000)
+            await asyncio.sleep(0)
+
+    async def writer() -> None:
+        nonlocal writes
+        rng = np.random.default_rng(99)
+        while not stop.is_set():
+            await writer_store.insert_memory(
+                NewMemory(org_id=_ORG, content=_content(rng), embedding=_vec(rng))
+            )
+            writes += 1
+            await asyncio.sleep(1 / write_rate)
+
+    w = asyncio.create_task(writer())
+    t0 = time.perf_counter()
+    await asyncio.gather(*(reader(i) for i in range(readers)))
+    await drain()
+    wall = time.perf_counter() - t0
+    stop.set()
+    await w
+    return latencies, wall, writes
+
+
+async def _run(
+    rows: int, readers: int, retrieves: int, write_rate: float, interval: float,
+) -> None:
+    results: List[BenchResult] = []
+    rates = []
+    for label, old_trigger, write_behind in (
+        ("per-retrieve, full FTS trigger", True, False),
+        ("per-retrieve", False, False),
+        ("write-behind", False, True),
+    ):
+        store, url = await _open(rows, old_trigger)
+        writer_store = await SqliteStore.open(url)
+        tasks: List[asyncio.Task] = []
+        tracker = AccessTracker(flush_interval=interval)
+
+        def per_retrieve(store: SqliteStore, ids: List[str], event: NewRetrievalEvent) -> None:
+            tasks.append(asyncio.create_task(retrieve_service.bump_access_counts(store, _ORG, ids)))
+            tasks.append(asyncio.create_task(store.record_retrieval_event(event)))
+
+        def buffered(store: SqliteStore, ids: List[str], event: NewRetrievalEvent) -> None:
+            tracker.record(store, _ORG, ids, event)
+
+        async def drain() -> None:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await tracker.flush()
+
+        try:
+            latencies, wall, writes = await _load(
+                store, writer_store, readers, retrieves, write_rate,
+                buffered if write_behind else per_retrieve, drain,
+            )
+            async with store._conn.execute("SELECT SUM(access_count) FROM memories") as cur:
+                persisted = (await cur.fetchone())[0] or 0
+        finally:
+            await writer_store.close()
+            await store.close()
+        results.append(BenchResult(
+            name=label, iterations=len(latencies),
+            median_ms=_percentile(latencies, 50), p95_ms=_percentile(latencies, 99),
+        ))
+        rates.append((label, len(latencies) / wall, writes / wall,
+                      persisted / (len(latencies) * 10) * 100))
+
+    print(format_table(results).replace("P95 (ms)", "P99 (ms)"))
+    print(f"\n{'tracking':<32} {'retrieves/s':>12} {'writes/s':>10} {'hits kept':>10}")
+    for label, rps, wps, kept in rates:
+        print(f"{label:<32} {rps:>12.1f} {wps:>10.1f} {kept:>9.0f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--retrieves", type=int, default=200, help="retrieves per reader")
+    parser.add_argument("--write-rate", type=float, default=50, help="inserts/s")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="write-behind flush interval (LORE_ACCESS_FLUSH_INTERVAL)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.readers, args.retrieves, args.write_rate, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Write throughput in memories/sec: one-by-one creates vs the bulk path, on SQLite.
+
+Writes ``--count`` pre-embedded memories into a fresh store for each of:
+
+* ``insert_memory`` x N — one transaction (and one vec0 insert) per memory;
+* ``insert_memories`` — one transaction, multi-row ``INSERT``s;
+* ``create_memory`` x N — the service path of ``POST /v1/memories``
+  (redaction + write-time reconciliation + insert), one call per memory;
+* ``create_memories`` — the service path of ``POST /v1/memories/bulk``,
+  ``--batch`` memories per call.
+
+Reconciliation runs with its default thresholds, so the service rows include
+one k-NN per memory. Embedding is excluded: vectors are random and given.
+
+Usage:
+    python benchmarks/bench_bulk_insert.py [--count 2000] [--batch 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, List, Sequence
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import NewMemory  # noqa: E402
+from lore.services import memories as memories_service  # noqa: E402
+from lore.services.memories import MemoryInput  # noqa: E402
+
+_ORG = "bench"
+_WORDS = ("deploy staging rollback cache token rotate webhook retry queue index "
+          "schema migration tenant latency budget alert").split()
+
+
+def _items(count: int) -> List[MemoryInput]:
+    rng = np.random.default_rng(0)
+    vecs = rng.standard_normal((count, EMBED_DIM)).astype(np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    return [
+        MemoryInput(
+            content=" ".join(rng.choice(_WORDS, size=40)),
+            embedding=vec.tolist(),
+            tags=("bench",),
+            project="bench",
+            meta={"type": "note"},
+        )
+        for vec in vecs
+    ]
+
+
+def _new(item: MemoryInput) -> NewMemory:
+    return NewMemory(
+        org_id=_ORG, content=item.content, embedding=item.embedding,
+        tags=item.tags, project=item.project, meta=item.meta or {},
+    )
+
+
+def _chunks(items: Sequence[MemoryInput], size: int) -> List[Sequence[MemoryInput]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def _timed(write: Callable[[SqliteStore], Awaitable[None]]) -> float:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    store = await SqliteStore.open(f"sqlite:///{os.path.join(tmpdir, 'bench.db')}")
+    try:
+        await store._conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES (?, ?)", (_ORG, _ORG))
+        await store._conn.commit()
+        t0 = time.perf_counter()
+        await write(store)
+        return time.perf_counter() - t0
+    finally:
+        await store.close()
+
+
+async def _run(count: int, batch: int) -> None:
+    items = _items(count)
+
+    async def single_insert(store: SqliteStore) -> None:
+        for item in items:
+            await store.insert_memory(_new(item))
+
+    async def bulk_insert(store: SqliteStore) -> None:
+        for chunk in _chunks(items, batch):
+            await store.insert_memories([_new(item) for item in chunk])
+
+    async def single_create(store: SqliteStore) -> None:
+        for item in items:
+            await memories_service.create_memory(
+                store, org_id=_ORG, content=item.content, embedding=item.embedding,
+                tags=item.tags, project=item.project, meta=item.meta,
+            )
+
+    async def bulk_create(store: SqliteStore) -> None:
+        for chunk in _chunks(items, batch):
+            await memories_service.create_memories(store, org_id=_ORG, items=chunk)
+
+    print(f"{'path':<32} {'memories/s':>12} {'ms/memory':>10}")
+    for label, write in (
+        ("insert_memory x N", single_insert),
+        (f"insert_memories ({batch}/call)", bulk_insert),
+        ("create_memory x N", single_create),
+        (f"create_memories ({batch}/call)", bulk_create),
+    ):
+        wall = await _timed(write)
+        print(f"{label:<32} {count / wall:>12.0f} {wall * 1000 / count:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=500, help="memories per bulk call")
+    args = parser.parse_args()
+    asyncio.run(_run(args.count, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Consolidation near-duplicate grouping time by corpus size.
+
+Builds ``--sizes`` corpora of random unit vectors (``--dim``, default 384)
+with about 5% of rows planted as near-copies of others, then groups them
+with ``near_duplicate_groups`` (blocked matrix products over the whole
+corpus). The old pairwise loops are timed up to ``--pairwise-max`` rows and
+extrapolated quadratically beyond that: the sync engine's per-pair
+``np.dot`` and ``AsyncLore``'s pure-Python ``sum(x * y)``. An incremental
+run (``queries=``) is timed for ``--new-fraction`` of the rows being new
+since the last run, as ``ConsolidationEngine`` does after its first pass.
+
+Usage:
+    python benchmarks/bench_consolidation_dedup.py [--sizes 1000,10000,100000] [--pairwise-max 500] [--new-fraction 0.01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, format_table  # noqa: E402
+
+from lore.near_duplicates import near_duplicate_groups  # noqa: E402
+
+_THRESHOLD = 0.95
+
+
+def _corpus(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    copies = rng.choice(n, size=n // 20, replace=False)
+    sources = rng.integers(0, n, size=copies.size)
+    vectors[copies] = vectors[sources] + rng.standard_normal((copies.size, dim)).astype(np.float32) * 0.05
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _pairwise_numpy(vectors: np.ndarray) -> int:
+    """The old sync-engine inner loop (pairs only, no grouping)."""
+    hits = 0
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            if float(np.dot(vectors[i], vectors[j])) > _THRESHOLD:
+                hits += 1
+    return hits
+
+
+def _pairwise_python(vectors: List[List[float]]) -> int:
+    """The old ``AsyncLore._find_duplicate_groups`` inner loop."""
+    hits = 0
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            if sum(x * y for x, y in zip(vectors[i], vectors[j])) > _THRESHOLD:
+                hits += 1
+    return hits
+
+
+def _time(fn, *args) -> float:
+    t = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated corpus sizes")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--pairwise-max", type=int, default=500,
+                        help="largest size to time the old pairwise loops at")
+    parser.add_argument("--new-fraction", type=float, default=0.01,
+                        help="share of rows treated as new for the incremental run")
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.sizes.split(",")]
+
+    results: List[BenchResult] = []
+    rows = []
+    baseline = min(args.pairwise_max, min(sizes))
+    sample = _corpus(baseline, args.dim)
+    numpy_ms = _time(_pairwise_numpy, sample)
+    python_ms = _time(_pairwise_python, sample.tolist())
+
+    for n in sizes:
+        vectors = _corpus(n, args.dim)
+        t = time.perf_counter()
+        groups = near_duplicate_groups(list(vectors), _THRESHOLD)
+        blocked_ms = (time.perf_counter() - t) * 1000
+        results.append(BenchResult(name=f"blocked n={n}", iterations=1,
+                                   median_ms=blocked_ms, p95_ms=blocked_ms))
+        new_rows = range(n - max(1, int(n * args.new_fraction)), n)
+        t = time.perf_counter()
+        near_duplicate_groups(list(vectors), _THRESHOLD, queries=new_rows)
+        incremental_ms = (time.perf_counter() - t) * 1000
+        results.append(BenchResult(name=f"incremental n={n} new={len(new_rows)}", iterations=1,
+                                   median_ms=incremental_ms, p95_ms=incremental_ms))
+        scale = (n / baseline) ** 2
+        rows.append((n, len(groups), blocked_ms / 1000, numpy_ms * scale / 1000, python_ms * scale / 1000))
+
+    print(format_table(results))
+    print(f"\npairwise loops timed at n={baseline}, scaled by (n/{baseline})^2 beyond it\n")
+    print(f"{'n':>8} {'groups':>8} {'blocked s':>10} {'np.dot s':>12} {'python s':>12}")
+    for n, found, blocked, numpy_s, python_s in rows:
+        print(f"{n:>8} {found:>8} {blocked:>10.1f} {numpy_s:>12.0f} {python_s:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
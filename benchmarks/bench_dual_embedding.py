@@ -0,0 +1,76 @@
+"""
+Dual-model query embedding: sequential vs concurrent ``embed_query_dual``.
+
+Code-aware recall embeds every query with both the prose and the code model.
+The baseline runs them one after the other (what ``EmbeddingRouter`` used to
+do); the router now runs the code model on a helper thread alongside the
+prose one. Both paths are compared with single-model ``embed`` latency, and
+``detect_content_type`` is timed on a mixed corpus.
+
+Usage:
+    python benchmarks/bench_dual_embedding.py [--model-dir ~/.lore/models] [--iterations 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import List
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _bench, format_table  # noqa: E402
+
+from lore.embed.local import CODE_MODEL, LocalEmbedder  # noqa: E402
+from lore.embed.router import EmbeddingRouter, detect_content_types  # noqa: E402
+
+_QUERY = "how do we retry failed webhook deliveries"
+_CORPUS = [
+    "Always use exponential backoff for retries.",
+    'def hello():\n    print("hi")\n    return True',
+    "The staging cluster is rebuilt every Monday morning.",
+    "const x = (a) => {\n  return a + 1;\n};",
+    "Ask the on-call engineer before rotating production secrets.",
+    "import os\nfrom pathlib import Path\nos.getcwd()\n",
+] * 50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    prose = LocalEmbedder(model_dir=args.model_dir)
+    try:
+        code = LocalEmbedder(model_dir=args.model_dir, model_spec=CODE_MODEL)
+        code.embed("warmup")
+    except Exception:  # code model not downloaded — time two prose sessions
+        code = LocalEmbedder(model_dir=args.model_dir)
+    router = EmbeddingRouter(prose_embedder=prose, code_embedder=code)
+    prose.embed("warmup")
+    code.embed("warmup")
+    router.embed_query_dual("warmup")
+
+    def sequential() -> None:
+        prose.embed(_QUERY)
+        code.embed(_QUERY)
+
+    n = args.iterations
+    results: List[BenchResult] = [
+        _bench("single model — embed", lambda: prose.embed(_QUERY), n),
+        _bench("dual — sequential", sequential, n),
+        _bench("dual — concurrent (router)", lambda: router.embed_query_dual(_QUERY), n),
+        _bench(f"detect_content_types × {len(_CORPUS)}",
+               lambda: detect_content_types(_CORPUS), n),
+    ]
+    router.close()
+    print(format_table(results))
+    print(f"\ncpus: {os.cpu_count()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Embedding under concurrency: per-request inference vs the micro-batching service.
+
+``--clients`` concurrent async callers each embed ``--requests`` short
+queries. The baseline is what the routes did before — every call runs its own
+single-text ``LocalEmbedder.embed`` on a worker thread (``asyncio.to_thread``),
+so concurrent calls compete for the same cores. The batched path awaits a
+``BatchingEmbedder`` that coalesces whatever is in flight into one inference.
+Reports embeddings/sec and per-call latency percentiles; the query cache is
+left out so every call runs inference.
+
+Usage:
+    python benchmarks/bench_embed_batching.py [--model-dir ~/.lore/models] [--clients 1 8 32]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.embed.base import embed_async  # noqa: E402
+from lore.embed.batching import BatchingEmbedder  # noqa: E402
+from lore.embed.local import LocalEmbedder  # noqa: E402
+
+
+async def _load(
+    embed: Callable[[str], Awaitable[object]], clients: int, requests: int,
+) -> Tuple[List[float], float]:
+    """Run ``clients`` callers × ``requests`` embeds; (latencies ms, wall s)."""
+    latencies: List[float] = []
+
+    async def client(c: int) -> None:
+        for r in range(requests):
+            t = time.perf_counter()
+            await embed(f"what did client {c} decide about deploy {r}")
+            latencies.append((time.perf_counter() - t) * 1000)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return latencies, time.perf_counter() - t0
+
+
+async def _run(model_dir: str, clients_list: List[int], requests: int, wait_ms: float) -> None:
+    embedder = LocalEmbedder(model_dir=model_dir)
+    embedder.embed("warmup")
+    batcher = BatchingEmbedder(embedder, max_wait_ms=wait_ms)
+
+    results: List[BenchResult] = []
+    rates = []
+    for clients in clients_list:
+        for label, embed in (
+            ("per-request", lambda text: embed_async(embedder, text)),
+            ("batched", batcher.aembed),
+        ):
+            latencies, wall = await _load(embed, clients, requests)
+            results.append(BenchResult(
+                name=f"{clients} clients — {label}", iterations=len(latencies),
+                median_ms=_percentile(latencies, 50), p95_ms=_percentile(latencies, 99),
+            ))
+            rates.append((clients, label, len(latencies) / wall))
+    stats = batcher.stats()
+    batcher.close()
+
+    print(format_table(results).replace("P95 (ms)", "P99 (ms)"))
+    print(f"\n{'clients':>7} {'path':<12} {'embeds/s':>10}")
+    for clients, label, rate in rates:
+        print(f"{clients:>7} {label:<12} {rate:>10.1f}")
+    print(f"\nmean coalesced batch: {stats['texts'] / max(stats['batches'], 1):.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=20, help="embeds per client")
+    parser.add_argument("--wait-ms", type=float, default=2.0,
+                        help="coalescing window (LORE_EMBED_COALESCE_WAIT_MS)")
+    args = parser.parse_args()
+    asyncio.run(_run(args.model_dir, args.clients, args.requests, args.wait_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+LocalEmbedder CPU cost: dynamic length-bucketed padding vs fixed 256 tokens.
+
+Measures single short-query latency (the recall path) and bulk throughput over
+a mixed-length corpus (ingest / re-embedding) for the current
+``LocalEmbedder`` next to the path it replaced, which padded every input to
+256 tokens and ran the whole list as one ONNX batch. Both paths share the
+same loaded session, so the difference is padding and batching alone.
+``--intra-op-threads`` / ``--inter-op-threads`` set the onnxruntime pools
+(``LORE_EMBED_INTRA_OP_THREADS`` / ``LORE_EMBED_INTER_OP_THREADS``).
+
+Usage:
+    python benchmarks/bench_embedder.py [--model-dir ~/.lore/models] [--docs 512]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _bench, format_table  # noqa: E402
+
+from lore.embed.local import _MAX_SEQ_LEN, LocalEmbedder  # noqa: E402
+
+_WORDS = (
+    "user prefers dark mode deploy staging database migration timeout retry "
+    "stripe webhook returns error after rate limit exceeded cache invalidation "
+    "kubernetes pod restarts memory leak fixed by upgrading the client library "
+    "meeting notes decided to postpone the release until tests pass"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _fixed_padding(embedder: LocalEmbedder, texts: List[str]) -> List[List[float]]:
+    """The replaced path: every input padded to 256 tokens, one ONNX run."""
+    tokenizer = embedder._tokenizer
+    tokenizer.enable_padding(length=_MAX_SEQ_LEN)
+    try:
+        encodings = tokenizer.encode_batch(texts)
+    finally:
+        tokenizer.no_padding()
+    input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+    attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+    return embedder._run(input_ids, attention_mask).tolist()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--docs", type=int, default=512, help="bulk corpus size")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--intra-op-threads", type=int, default=None)
+    parser.add_argument("--inter-op-threads", type=int, default=None)
+    args = parser.parse_args()
+
+    embedder = LocalEmbedder(
+        model_dir=args.model_dir,
+        intra_op_threads=args.intra_op_threads,
+        inter_op_threads=args.inter_op_threads,
+    )
+    embedder._load()
+
+    rng = random.Random(0)
+    query = "what does the user prefer for the editor theme"
+    # Mostly short memories with a long tail, like a real store.
+    corpus = [
+        _text(rng, rng.choice([4, 8, 12, 16, 24, 40, 80, 200])) for _ in range(args.docs)
+    ]
+
+    dynamic = np.array(embedder.embed_batch(corpus[:64]))
+    fixed = np.array(_fixed_padding(embedder, corpus[:64]))
+    drift = float(np.abs(dynamic - fixed).max())
+
+    results: List[BenchResult] = [
+        _bench("short query — fixed 256", lambda: _fixed_padding(embedder, [query]),
+               args.iterations),
+        _bench("short query — dynamic", lambda: embedder.embed(query), args.iterations),
+    ]
+    bulk = max(3, args.iterations // 10)
+    throughput = []
+    for label, fn in (
+        ("fixed 256", lambda: _fixed_padding(embedder, corpus)),
+        ("dynamic", lambda: embedder.embed_batch(corpus)),
+    ):
+        res = _bench(f"bulk {args.docs} docs — {label}", fn, bulk)
+        results.append(res)
+        throughput.append((label, args.docs / (res.median_ms / 1000)))
+
+    print(format_table(results))
+    print()
+    for label, docs_per_s in throughput:
+        print(f"{label:<10} {docs_per_s:>10.1f} docs/s")
+    print(f"max |dynamic - fixed| = {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Postgres pool acquire wait under load, by pool size.
+
+Runs ``--clients`` concurrent callers, each issuing ``--queries`` statements
+that hold a connection for ``--hold-ms`` (``pg_sleep``), through the server's
+``InstrumentedPool`` for each ``--pool-sizes`` setting. Reports how long
+callers waited for a connection (the ``lore_db_pool_acquire_seconds``
+histogram on ``/metrics``), the peak number of waiters, and throughput. Once
+clients outnumber connections, acquire wait grows with the queue.
+
+Needs a reachable Postgres (``--database-url`` or ``DATABASE_URL``).
+
+Usage:
+    python benchmarks/bench_pg_pool.py [--database-url postgresql://...] [--clients 64] [--pool-sizes 5,10,20,40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.persistence.factory import PoolOptions  # noqa: E402
+from lore.server.db import close_pool, init_pool  # noqa: E402
+
+
+async def _run_one(url: str, size: int, clients: int, queries: int, hold_s: float):
+    pool = await init_pool(url, PoolOptions(min_size=size, max_size=size))
+    waits: List[float] = []
+    peak_waiters = 0
+
+    async def client() -> None:
+        nonlocal peak_waiters
+        for _ in range(queries):
+            t = time.perf_counter()
+            async with pool.acquire() as conn:
+                waits.append((time.perf_counter() - t) * 1000)
+                peak_waiters = max(peak_waiters, pool.waiting)
+                await conn.execute("SELECT pg_sleep($1)", hold_s)
+
+    try:
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        wall = time.perf_counter() - t0
+    finally:
+        await close_pool()
+    return waits, peak_waiters, wall
+
+
+async def _run(url: str, clients: int, queries: int, hold_ms: float, sizes: List[int]) -> None:
+    results: List[BenchResult] = []
+    rows = []
+    for size in sizes:
+        waits, peak, wall = await _run_one(url, size, clients, queries, hold_ms / 1000)
+        label = f"max_size={size}"
+        results.append(BenchResult(
+            name=label, iterations=len(waits),
+            median_ms=_percentile(waits, 50), p95_ms=_percentile(waits, 99),
+        ))
+        rows.append((label, peak, len(waits) / wall))
+
+    print(f"acquire wait, {clients} clients holding a connection {hold_ms:g} ms per query\n")
+    print(format_table(results).replace("P95 (ms)", "P99 (ms)"))
+    print(f"\n{'pool':<16} {'peak waiters':>12} {'queries/s':>10}")
+    for label, peak, qps in rows:
+        print(f"{label:<16} {peak:>12} {qps:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=20, help="queries per client")
+    parser.add_argument("--hold-ms", type=float, default=5.0,
+                        help="server-side time each query holds its connection")
+    parser.add_argument("--pool-sizes", default="5,10,20,40",
+                        help="comma-separated pool max sizes to compare")
+    args = parser.parse_args()
+    if not args.database_url or not args.database_url.startswith(("postgres://", "postgresql://")):
+        parser.error("a Postgres --database-url (or DATABASE_URL) is required")
+    sizes = [int(n) for n in args.pool_sizes.split(",")]
+    asyncio.run(_run(args.database_url, args.clients, args.queries, args.hold_ms, sizes))
+
+
+if __name__ == "__main__":
+    main()
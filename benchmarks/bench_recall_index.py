@@ -0,0 +1,86 @@
+"""
+Recall latency over a large local corpus (in-memory vector index).
+
+Seeds a MemoryStore directly with random unit vectors (no embedding cost)
+and measures ``Lore.recall`` top-5 latency, next to the pre-index path that
+``struct.unpack``-ed and re-normalised every stored embedding per query.
+
+Usage:
+    python benchmarks/bench_recall_index.py [--sizes 10000,100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+from datetime import datetime, timezone
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _bench, format_table  # noqa: E402
+
+from lore import Lore  # noqa: E402
+from lore.store.memory import MemoryStore  # noqa: E402
+from lore.types import Memory  # noqa: E402
+
+_DIM = 384
+
+
+def _seeded_lore(n: int) -> Lore:
+    rng = np.random.default_rng(0)
+    vecs = rng.standard_normal((n, _DIM)).astype(np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    store = MemoryStore()
+    now = datetime.now(timezone.utc).isoformat()
+    for i in range(n):
+        store.save(Memory(
+            id=f"m{i:07d}", content=f"memory {i}", type="general", tier="long",
+            embedding=vecs[i].tobytes(), created_at=now, updated_at=now,
+        ))
+    query = rng.standard_normal(_DIM).astype(np.float32).tolist()
+    return Lore(store=store, embedding_fn=lambda _t: query, redact=False)
+
+
+def _legacy_cosine(lore: Lore, query: List[float]) -> None:
+    """The per-query deserialisation the index replaced."""
+    memories = lore._store.list()
+    q = np.array(query, dtype=np.float32)
+    q /= max(float(np.linalg.norm(q)), 1e-9)
+    emb = np.array(
+        [np.array(struct.unpack(f"{len(m.embedding) // 4}f", m.embedding), dtype=np.float32) for m in memories],
+        dtype=np.float32,
+    )
+    emb /= np.clip(np.linalg.norm(emb, axis=1, keepdims=True), 1e-9, None)
+    _ = emb @ q
+
+
+def run(sizes: List[int]) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for n in sizes:
+        lore = _seeded_lore(n)
+        query = lore._embedder.embed("q")
+        lore.recall("warmup", limit=5)  # builds the index once
+        results.append(_bench(f"recall() top-5 — {n:,} memories (index)",
+                              lambda: lore.recall("q", limit=5)))
+        results.append(_bench(f"legacy unpack+cosine — {n:,} memories",
+                              lambda: _legacy_cosine(lore, query), iterations=3))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(format_table(run(sizes)))
+
+
+if __name__ == "__main__":
+    main()
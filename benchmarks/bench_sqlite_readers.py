@@ -0,0 +1,124 @@
+"""
+SqliteStore read throughput by reader-pool size, with a slow export alongside.
+
+Seeds ``--rows`` memories, then runs ``--clients`` concurrent
+``recall_by_embedding`` loops while one client repeatedly pages through the
+whole table (``list_memories_with_embeddings``, the export path). Reports
+recalls/s and recall latency for each ``--readers`` setting; ``0`` is the
+old shape, where every query queues on the writer's connection thread.
+
+Usage:
+    python benchmarks/bench_sqlite_readers.py [--rows 20000] [--clients 8] [--readers 0,1,2,4,8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import MemoryFilter, NewMemory, RecallParams  # noqa: E402
+
+_ORG = "bench"
+
+
+def _vec(rng: np.random.Generator) -> List[float]:
+    v = rng.standard_normal(EMBED_DIM).astype(np.float32)
+    return (v / np.linalg.norm(v)).tolist()
+
+
+async def _seed(url: str, rows: int) -> None:
+    store = await SqliteStore.open(url, readers=0)
+    try:
+        await store._conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES (?, ?)", (_ORG, _ORG))
+        await store._conn.commit()
+        rng = np.random.default_rng(0)
+        batch = 500
+        for start in range(0, rows, batch):
+            await store.insert_memories([
+                NewMemory(org_id=_ORG, content=f"memory {i}", embedding=_vec(rng))
+                for i in range(start, min(rows, start + batch))
+            ])
+    finally:
+        await store.close()
+
+
+async def _run_one(url: str, readers: int, clients: int, recalls: int):
+    store = await SqliteStore.open(url, readers=readers)
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def client(seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        for _ in range(recalls):
+            t = time.perf_counter()
+            await store.recall_by_embedding(RecallParams(
+                org_id=_ORG, query_vec=_vec(rng), limit=10, min_score=-1.0, scope_mode="all",
+            ))
+            latencies.append((time.perf_counter() - t) * 1000)
+
+    async def exporter() -> None:
+        while not done.is_set():
+            await store.list_memories_with_embeddings(MemoryFilter(org_id=_ORG))
+
+    try:
+        export = asyncio.create_task(exporter())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client(i) for i in range(clients)))
+        wall = time.perf_counter() - t0
+        done.set()
+        await export
+    finally:
+        await store.close()
+    return latencies, wall
+
+
+async def _run(rows: int, clients: int, recalls: int, reader_counts: List[int]) -> None:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    await _seed(url, rows)
+
+    results: List[BenchResult] = []
+    rates = []
+    for readers in reader_counts:
+        latencies, wall = await _run_one(url, readers, clients, recalls)
+        label = f"readers={readers}" if readers else "writer only"
+        results.append(BenchResult(
+            name=label, iterations=len(latencies),
+            median_ms=_percentile(latencies, 50), p95_ms=_percentile(latencies, 99),
+        ))
+        rates.append((label, len(latencies) / wall))
+
+    print(format_table(results).replace("P95 (ms)", "P99 (ms)"))
+    print(f"\n{'pool':<16} {'recalls/s':>10}")
+    for label, rps in rates:
+        print(f"{label:<16} {rps:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--recalls", type=int, default=100, help="recalls per client")
+    parser.add_argument("--readers", default="0,1,2,4,8",
+                        help="comma-separated reader-pool sizes to compare")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.readers.split(",")]
+    asyncio.run(_run(args.rows, args.clients, args.recalls, counts))
+
+
+if __name__ == "__main__":
+    main()
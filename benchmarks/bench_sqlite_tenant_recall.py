@@ -0,0 +1,133 @@
+"""
+SQLite recall completeness + latency for a small tenant in a large database.
+
+Seeds ``--rows`` memories split between a big tenant and a small one
+(``--tenant-pct`` of the rows, default 1%), then runs top-``--limit`` recalls
+for the small tenant through ``SqliteStore.recall_by_embedding`` (org-partitioned
+vec0 KNN + adaptive over-fetch) and through the previous shape (global KNN with
+``k = limit * 4``, then filter by org). Reports median/p95 latency and the
+fraction of requested results actually returned.
+
+Usage:
+    python benchmarks/bench_sqlite_tenant_recall.py [--rows 1000000] [--tenant-pct 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import RecallParams  # noqa: E402
+
+_BATCH = 5000
+
+
+async def _seed(store: SqliteStore, rows: int, tenant_rows: int) -> None:
+    conn = store._conn
+    for org in ("big", "small"):
+        await conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES (?, ?)", (org, org))
+    # Unpartitioned copy of the vectors, i.e. the pre-partition schema.
+    await conn.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS legacy_vectors USING vec0("
+        f"memory_rowid INTEGER PRIMARY KEY, embedding FLOAT[{EMBED_DIM}] distance_metric=cosine)"
+    )
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, _BATCH):
+        n = min(_BATCH, rows - start)
+        vecs = rng.standard_normal((n, EMBED_DIM)).astype(np.float32)
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        for i in range(n):
+            idx = start + i
+            org = "small" if idx % max(rows // tenant_rows, 1) == 0 else "big"
+            cur = await conn.execute(
+                "INSERT INTO memories (id, org_id, content, context, tags, meta, scope) "
+                "VALUES (?, ?, ?, '', '[]', '{}', 'global')",
+                (f"mem_{idx:08d}", org, f"memory {idx}"),
+            )
+            await conn.execute(
+                "INSERT INTO memory_vectors(memory_rowid, org_id, embedding) VALUES (?, ?, ?)",
+                (cur.lastrowid, org, vecs[i].tobytes()),
+            )
+            await conn.execute(
+                "INSERT INTO legacy_vectors(memory_rowid, embedding) VALUES (?, ?)",
+                (cur.lastrowid, vecs[i].tobytes()),
+            )
+        await conn.commit()
+
+
+async def _legacy_recall(store: SqliteStore, query: List[float], limit: int) -> int:
+    """Pre-partition shape: global top ``limit*4`` KNN, then the org filter."""
+    async with store._conn.execute(
+        "SELECT m.id FROM (SELECT memory_rowid, distance FROM legacy_vectors "
+        "WHERE embedding MATCH ? AND k = ?) v "
+        "JOIN memories m ON m.rowid = v.memory_rowid WHERE m.org_id = 'small' "
+        "ORDER BY v.distance LIMIT ?",
+        (repr(query), limit * 4, limit),
+    ) as cur:
+        return len(await cur.fetchall())
+
+
+async def _run(rows: int, tenant_pct: float, limit: int, iterations: int) -> List[BenchResult]:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    store = await SqliteStore.open(f"sqlite:///{os.path.join(tmpdir, 'bench.db')}")
+    try:
+        tenant_rows = max(int(rows * tenant_pct / 100), 1)
+        t0 = time.perf_counter()
+        await _seed(store, rows, tenant_rows)
+        print(f"Seeded {rows:,} rows ({tenant_rows:,} small-tenant) in {time.perf_counter() - t0:.1f}s")
+
+        rng = np.random.default_rng(1)
+        results: List[BenchResult] = []
+        for name, fn in (
+            ("partitioned", lambda q: store.recall_by_embedding(
+                RecallParams(org_id="small", query_vec=q, limit=limit, min_score=-1.0, scope_mode="all")
+            )),
+            ("global KNN + filter", lambda q: _legacy_recall(store, q, limit)),
+        ):
+            times: List[float] = []
+            found = 0
+            for _ in range(iterations):
+                q = rng.standard_normal(EMBED_DIM).astype(np.float32).tolist()
+                t = time.perf_counter()
+                out = await fn(q)
+                times.append((time.perf_counter() - t) * 1000)
+                found += out if isinstance(out, int) else len(out)
+            completeness = found / (iterations * limit) * 100
+            results.append(BenchResult(
+                name=f"{name} — {completeness:.0f}% of limit={limit} returned",
+                iterations=iterations,
+                median_ms=_percentile(times, 50),
+                p95_ms=_percentile(times, 95),
+            ))
+        return results
+    finally:
+        await store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--tenant-pct", type=float, default=1.0)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    results = asyncio.run(_run(args.rows, args.tenant_pct, args.limit, args.iterations))
+    print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Quantized candidate search: recall@k, index size and latency vs float.
+
+Seeds ``--rows`` clustered unit vectors into a SqliteStore, then for the float
+baseline and each ``LORE_VECTOR_QUANTIZATION`` mode (``int8``, ``binary``)
+reports ``recall_by_embedding`` latency, recall@k against the exact float
+top-k, and the on-disk size of the vec0 tables the candidate scan walks
+(``dbstat``). The quantized modes re-rank with exact float distances, so any
+recall loss comes from true neighbours missing from the candidate set; each
+mode is swept over ``--rerank-factors`` (``LORE_VECTOR_RERANK_FACTOR``).
+
+Usage:
+    python benchmarks/bench_vector_quantization.py [--rows 20000] [--k 10] [--rerank-factors 2 4 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _percentile, format_table  # noqa: E402
+
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import NewMemory, RecallParams  # noqa: E402
+
+
+def _clustered(n: int, rng: np.random.Generator, clusters: int = 64) -> np.ndarray:
+    """Unit vectors around ``clusters`` centres — closer to real embeddings
+    than isotropic noise, which is the worst case for sign-bit codes."""
+    centres = rng.standard_normal((clusters, EMBED_DIM)).astype(np.float32)
+    vecs = centres[rng.integers(0, clusters, n)] + 0.8 * rng.standard_normal((n, EMBED_DIM)).astype(np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+async def _table_bytes(store: SqliteStore, table: str) -> int:
+    """Pages used by a vec0 table: its shadow tables and their indexes."""
+    async with store._conn.execute(
+        "SELECT COALESCE(SUM(pgsize), 0) FROM dbstat "
+        "WHERE name GLOB ? || '_*' AND name NOT GLOB ? || '_q_*'",
+        (table, table),
+    ) as cur:
+        return int((await cur.fetchone())[0])
+
+
+async def _measure(
+    store: SqliteStore, label: str, queries: np.ndarray, truth: List[set], k: int,
+) -> tuple[BenchResult, float]:
+    times: List[float] = []
+    hits = 0
+    for q, expected in zip(queries, truth):
+        params = RecallParams(org_id="bench", query_vec=q.tolist(), limit=k, min_score=-1.0,
+                              half_life_days=1e9)
+        t = time.perf_counter()
+        got = await store.recall_by_embedding(params)
+        times.append((time.perf_counter() - t) * 1000)
+        hits += len({m.content for m in got} & expected)
+    result = BenchResult(name=f"recall_by_embedding top-{k} — {label}", iterations=len(queries),
+                         median_ms=_percentile(times, 50), p95_ms=_percentile(times, 95))
+    return result, hits / (k * len(queries))
+
+
+async def _run(rows: int, queries: int, k: int, factors: List[int]) -> None:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    store = await SqliteStore.open(f"sqlite:///{os.path.join(tmpdir, 'bench.db')}")
+    try:
+        await store._conn.execute("INSERT INTO orgs (id, name) VALUES ('bench', 'bench')")
+        await store._conn.commit()
+        rng = np.random.default_rng(0)
+        vecs = _clustered(rows + queries, rng)
+        corpus, qs = vecs[:rows], vecs[rows:]
+        t0 = time.perf_counter()
+        for i in range(rows):
+            await store.insert_memory(NewMemory(
+                org_id="bench", content=str(i), embedding=corpus[i].tolist(), scope="global",
+            ))
+        print(f"Seeded {rows:,} rows in {time.perf_counter() - t0:.1f}s")
+        truth = [set(map(str, np.argsort(-(corpus @ q))[:k])) for q in qs]
+
+        results: List[BenchResult] = []
+        summary = []
+        res, recall = await _measure(store, "float", qs, truth, k)
+        results.append(res)
+        summary.append(("float", recall, await _table_bytes(store, "memory_vectors")))
+        for mode in ("int8", "binary"):
+            t0 = time.perf_counter()
+            await store.backfill_quantized_vectors(mode)
+            print(f"Backfilled {mode} in {time.perf_counter() - t0:.1f}s")
+            size = await _table_bytes(store, "memory_vectors_q")
+            for factor in factors:
+                os.environ["LORE_VECTOR_RERANK_FACTOR"] = str(factor)
+                label = f"{mode} ×{factor} + exact rerank"
+                res, recall = await _measure(store, label, qs, truth, k)
+                results.append(res)
+                summary.append((f"{mode} ×{factor}", recall, size))
+    finally:
+        os.environ.pop("LORE_VECTOR_RERANK_FACTOR", None)
+        await store.close()
+
+    print(format_table(results))
+    print(f"\n{'Mode':<12} {'recall@' + str(k):>10} {'candidate index':>16}")
+    for mode, recall, size in summary:
+        print(f"{mode:<12} {recall:>10.3f} {size / 1e6:>14.1f}MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--rerank-factors", type=int, nargs="+", default=[2, 4, 10],
+                        help="LORE_VECTOR_RERANK_FACTOR values to sweep per mode")
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.queries, args.k, args.rerank_factors))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Vector transport cost: float32 blobs vs JSON text.
+
+Seeds ``--rows`` memories into a SqliteStore and measures the bulk embedding
+listing (``list_memories_with_embeddings``, the consolidation/export scan) and
+``recall_by_embedding`` next to the text path they replaced (``vec_to_json`` +
+``json.loads`` on read, ``repr(list(...))`` on query). Also times the
+pgvector codec itself (binary vs the text literal asyncpg used to exchange),
+which needs no running Postgres.
+
+Usage:
+    python benchmarks/bench_vector_transport.py [--rows 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+import numpy as np
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_REPO_ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from run_benchmarks import BenchResult, _bench, _percentile, format_table  # noqa: E402
+
+from lore.persistence.postgres import _decode_vector, _encode_vector  # noqa: E402
+from lore.persistence.sqlite import EMBED_DIM, SqliteStore  # noqa: E402
+from lore.persistence.types import MemoryFilter, NewMemory, RecallParams  # noqa: E402
+
+
+async def _abench(name: str, fn: Callable[[], Awaitable[object]], iterations: int) -> BenchResult:
+    await fn()  # warmup
+    times: List[float] = []
+    for _ in range(iterations):
+        t = time.perf_counter()
+        await fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return BenchResult(name=name, iterations=iterations,
+                       median_ms=_percentile(times, 50), p95_ms=_percentile(times, 95))
+
+
+async def _text_listing(store: SqliteStore) -> int:
+    """The pre-blob read path: vec_to_json in SQL, json.loads per row."""
+    async with store._conn.execute(
+        "SELECT m.id, vec_to_json(v.embedding) AS e FROM memories m "
+        "JOIN memory_vectors v ON v.memory_rowid = m.rowid WHERE m.org_id = 'bench' "
+        "ORDER BY m.created_at"
+    ) as cur:
+        rows = await cur.fetchall()
+    return len([[float(x) for x in json.loads(r["e"])] for r in rows])
+
+
+async def _text_knn(store: SqliteStore, query: List[float]) -> int:
+    async with store._conn.execute(
+        "SELECT memory_rowid FROM memory_vectors WHERE embedding MATCH ? AND k = 40 "
+        "AND org_id = 'bench'",
+        (repr(list(query)),),
+    ) as cur:
+        return len(await cur.fetchall())
+
+
+async def _blob_knn(store: SqliteStore, query: List[float]) -> int:
+    async with store._conn.execute(
+        "SELECT memory_rowid FROM memory_vectors WHERE embedding MATCH ? AND k = 40 "
+        "AND org_id = 'bench'",
+        (np.asarray(query, dtype="<f4").tobytes(),),
+    ) as cur:
+        return len(await cur.fetchall())
+
+
+async def _run(rows: int, iterations: int) -> List[BenchResult]:
+    tmpdir = tempfile.mkdtemp(prefix="lore_bench_")
+    store = await SqliteStore.open(f"sqlite:///{os.path.join(tmpdir, 'bench.db')}")
+    try:
+        await store._conn.execute("INSERT INTO orgs (id, name) VALUES ('bench', 'bench')")
+        await store._conn.commit()
+        rng = np.random.default_rng(0)
+        vecs = rng.standard_normal((rows, EMBED_DIM)).astype(np.float32)
+        t0 = time.perf_counter()
+        for i in range(rows):
+            await store.insert_memory(NewMemory(
+                org_id="bench", content=f"memory {i}", embedding=vecs[i].tolist(), scope="global",
+            ))
+        print(f"Seeded {rows:,} rows in {time.perf_counter() - t0:.1f}s")
+
+        query = rng.standard_normal(EMBED_DIM).astype(np.float32).tolist()
+        flt = MemoryFilter(org_id="bench")
+        params = RecallParams(org_id="bench", query_vec=query, limit=10, min_score=-1.0)
+        results = [
+            await _abench(f"list_memories_with_embeddings — {rows:,} rows (blob)",
+                          lambda: store.list_memories_with_embeddings(flt), iterations),
+            await _abench(f"vec_to_json + json.loads — {rows:,} rows (text)",
+                          lambda: _text_listing(store), iterations),
+            await _abench("recall_by_embedding top-10 (blob query)",
+                          lambda: store.recall_by_embedding(params), iterations * 10),
+            await _abench("vec0 KNN k=40 — blob query", lambda: _blob_knn(store, query), iterations * 10),
+            await _abench("vec0 KNN k=40 — text query", lambda: _text_knn(store, query), iterations * 10),
+        ]
+    finally:
+        await store.close()
+
+    vec = vecs[0]
+    text = json.dumps(vec.tolist())
+    blob = _encode_vector(vec)
+    results += [
+        _bench("pgvector binary encode+decode", lambda: _decode_vector(_encode_vector(vec)), 2000),
+        _bench("pgvector text encode+decode",
+               lambda: [float(x) for x in json.dumps(vec.tolist()).strip("[]").split(",")], 2000),
+    ]
+    print(f"Per-vector payload: binary {len(blob)} B, text {len(text)} B")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    print(format_table(asyncio.run(_run(args.rows, args.iterations))))
+
+
+if __name__ == "__main__":
+    main()
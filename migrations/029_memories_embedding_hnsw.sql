@@ -0,0 +1,42 @@
+-- Migration 029: guarantee an HNSW index on memories.embedding.
+--
+-- PostgresStore.recall_by_embedding now runs as two stages: an ANN candidate
+-- scan (`ORDER BY embedding <=> $q LIMIT n`) followed by decay re-scoring of
+-- those candidates. The first stage is only sub-linear if pgvector can serve
+-- it from an HNSW index with the cosine operator class.
+--
+-- Migration 001 created `idx_lessons_embedding` (renamed to
+-- `idx_memories_embedding` by 009) only when `lessons` was still a base table,
+-- so databases that came up through another path may have no vector index at
+-- all, or an IVFFlat one. An existing HNSW cosine index is left untouched.
+--
+-- Migrations run in a transaction, so this one cannot use CONCURRENTLY, and
+-- a plain CREATE INDEX blocks writes to memories for the whole build. It
+-- therefore only builds the index while the table is empty. On a populated
+-- table it leaves a NOTICE; run `lore vector-index` (before or after
+-- migrating) to build the index CONCURRENTLY. That command also drops IVFFlat
+-- indexes on the column, which this migration leaves alone: dropping them
+-- here would leave recall without any vector index until the HNSW one
+-- exists.
+--
+-- Query-time recall/latency is tuned with `hnsw.ef_search`
+-- (LORE_HNSW_EF_SEARCH), which the store sets per recall with SET LOCAL.
+--
+-- Mirrors migrations_sqlite/029_memories_embedding_hnsw.sql.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = 'memories'
+          AND indexdef ILIKE '%USING hnsw (embedding vector_cosine_ops)%'
+    ) THEN
+        RETURN;
+    END IF;
+    IF EXISTS (SELECT 1 FROM memories) THEN
+        RAISE NOTICE 'memories has no HNSW index on embedding; run `lore vector-index` to build it CONCURRENTLY';
+    ELSE
+        EXECUTE 'CREATE INDEX idx_memories_embedding_hnsw ON memories USING hnsw (embedding vector_cosine_ops)';
+    END IF;
+END $$;
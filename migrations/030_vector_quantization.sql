@@ -0,0 +1,24 @@
+-- Migration 030: state for the opt-in quantized vector index.
+--
+-- With LORE_VECTOR_QUANTIZATION=halfvec|binary, PostgresStore.recall_by_embedding
+-- runs its ANN candidate scan over a compact HNSW index and re-ranks the
+-- candidates with the exact `embedding <=> $q` distance:
+--   * binary — `binary_quantize(embedding)::bit(384)` (bit_hamming_ops,
+--     pgvector >= 0.7);
+--   * halfvec — `embedding::halfvec(384)` (halfvec_cosine_ops), fp16.
+-- pgvector has no int8 vector type, so the SQLite-only `int8` mode is
+-- rejected here with a ConfigError.
+--
+-- Both are expression indexes, so no column is added and writes need no
+-- extra maintenance. They are opt-in and can take a while on a large table,
+-- so this migration does not build them. `lore quantize-vectors` builds
+-- them CONCURRENTLY. It then records the mode here, and the store only
+-- switches to the quantized scan for a mode listed in this table.
+--
+-- Mirrors migrations_sqlite/030_vector_quantization.sql.
+
+CREATE TABLE IF NOT EXISTS vector_quantization (
+    mode         TEXT PRIMARY KEY,
+    vectors      BIGINT NOT NULL DEFAULT 0,
+    completed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
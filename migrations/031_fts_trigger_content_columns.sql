@@ -0,0 +1,9 @@
+-- Migration 031: FTS maintenance limited to content changes.
+--
+-- No-op on Postgres. The full-text index from 020 is an expression GIN index
+-- over ``content`` / ``context``; updates that only touch access tracking
+-- columns leave it alone. The file exists for
+-- version parity with migrations_sqlite/031_fts_trigger_content_columns.sql,
+-- which narrows SQLite's FTS5 sync trigger to ``UPDATE OF content, context``.
+
+SELECT 1;
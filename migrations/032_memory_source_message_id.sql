@@ -0,0 +1,33 @@
+-- Migration 032: indexed source-message key for ingest dedup.
+--
+-- Ingested memories carry the upstream message id (Slack ts, Telegram
+-- message id, commit sha, ...) of the adapter (`source`) that produced
+-- them. It used to live only in `meta.source_info`, so the ingest
+-- Deduplicator could only find it by scanning the metadata of the newest
+-- memories. `source_message_id` is now a column with a partial unique
+-- index on (org_id, source, source_message_id): the exact-id check is one
+-- index lookup at any age, and two workers ingesting the same message race
+-- on the index instead of both inserting.
+--
+-- Backfill: the oldest existing memory per key takes it; later duplicates
+-- (which the old windowed check let through) keep a NULL key.
+--
+-- Mirrors migrations_sqlite/032_memory_source_message_id.sql.
+
+ALTER TABLE memories ADD COLUMN IF NOT EXISTS source_message_id TEXT;
+
+UPDATE memories m
+SET source_message_id = k.smid
+FROM (
+    SELECT DISTINCT ON (org_id, source, meta->'source_info'->>'source_message_id')
+           id, meta->'source_info'->>'source_message_id' AS smid
+    FROM memories
+    WHERE meta->'source_info'->>'source_message_id' IS NOT NULL
+      AND meta->'source_info'->>'adapter' = source
+    ORDER BY org_id, source, meta->'source_info'->>'source_message_id', created_at, id
+) k
+WHERE m.id = k.id AND m.source_message_id IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_source_message
+    ON memories (org_id, source, source_message_id)
+    WHERE source_message_id IS NOT NULL;
@@ -0,0 +1,21 @@
+-- Migration 033: indexes for set-based memory deletes.
+--
+-- Deletes and expiry sweeps now remove memories in bounded chunks, one
+-- transaction per chunk:
+--
+--   * `expire_memories` picks each chunk with `expires_at < now()`. Without an
+--     index, every chunk scanned the whole memories table.
+--   * Deleting a memory also deletes the knowledge-graph relationships
+--     extracted from it. `relationships.source_memory_id` has no FK to
+--     `memories`, so each chunk runs one `DELETE ... WHERE source_memory_id =
+--     ANY(...)`, which needs this index to avoid a full table scan.
+--
+-- Mirrors migrations_sqlite/033_bulk_delete_indexes.sql.
+
+CREATE INDEX IF NOT EXISTS idx_memories_expires_at
+    ON memories (expires_at)
+    WHERE expires_at IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_rel_org_source_memory
+    ON relationships (org_id, source_memory_id)
+    WHERE source_memory_id IS NOT NULL;
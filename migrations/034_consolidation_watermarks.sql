@@ -0,0 +1,17 @@
+-- Migration 034: incremental consolidation watermarks.
+--
+-- `AsyncLore.consolidate` used to export and compare every memory on each
+-- run. It now records when a run started, per org and project, and the next
+-- run only takes memories created since then and looks up their nearest
+-- neighbours with `recall_by_embedding`. `project` is '' for an org-wide run.
+-- `watermark` is the start of the last run that finished cleanly.
+--
+-- Mirrors migrations_sqlite/034_consolidation_watermarks.sql.
+
+CREATE TABLE IF NOT EXISTS consolidation_watermarks (
+    org_id     TEXT NOT NULL,
+    project    TEXT NOT NULL DEFAULT '',
+    watermark  TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (org_id, project)
+);
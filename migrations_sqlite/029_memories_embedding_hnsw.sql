@@ -0,0 +1,9 @@
+-- Migration 029: HNSW index on memories.embedding (SQLite translation).
+--
+-- Translation notes:
+--   * No-op. SQLite keeps embeddings in the org-partitioned sqlite-vec
+--     `memory_vectors` virtual table (managed by SqliteStore, not by
+--     migrations), which has no HNSW index type. The file exists for
+--     version parity with migrations/029_memories_embedding_hnsw.sql.
+
+SELECT 1;
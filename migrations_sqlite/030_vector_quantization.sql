@@ -0,0 +1,17 @@
+-- Migration 030: state for the opt-in quantized vector index.
+-- SQLite translation of migrations/030_vector_quantization.sql.
+--
+-- Translation notes:
+--   * TIMESTAMPTZ -> TEXT (ISO-8601 via datetime('now')).
+--   * The quantized vectors live in a `memory_vectors_q` vec0 virtual table
+--     (INT8 or BIT column, org-partitioned like `memory_vectors`). Like
+--     `memory_vectors` it is created by SqliteStore, not by migrations.
+--     `lore quantize-vectors` creates and backfills it and then records the
+--     mode here. SqliteStore keeps the table in step with `memory_vectors`
+--     on every write while it exists.
+
+CREATE TABLE IF NOT EXISTS vector_quantization (
+    mode         TEXT PRIMARY KEY,
+    vectors      INTEGER NOT NULL DEFAULT 0,
+    completed_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
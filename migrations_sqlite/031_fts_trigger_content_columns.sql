@@ -0,0 +1,20 @@
+-- Migration 031: restrict the FTS update trigger to the indexed columns.
+--
+-- 020's ``memories_fts_au`` fired on every UPDATE of ``memories``, so each
+-- access-count bump from retrieve deleted and re-inserted the recalled rows'
+-- FTS entries even though ``content`` / ``context`` never changed. Listing
+-- the columns limits it to updates that actually change the index.
+--
+-- Translation notes:
+--   * SQLite-only. Postgres indexes ``to_tsvector(...)`` with an expression
+--     GIN index, which is untouched by updates to other columns; see
+--     migrations/031_fts_trigger_content_columns.sql.
+
+DROP TRIGGER IF EXISTS memories_fts_au;
+
+CREATE TRIGGER memories_fts_au AFTER UPDATE OF content, context ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content, context)
+    VALUES ('delete', old.rowid, old.content, COALESCE(old.context, ''));
+    INSERT INTO memories_fts(rowid, content, context)
+    VALUES (new.rowid, new.content, COALESCE(new.context, ''));
+END;
@@ -0,0 +1,23 @@
+-- Migration 032: indexed source-message key for ingest dedup.
+-- SQLite translation of migrations/032_memory_source_message_id.sql.
+--
+-- Translation notes:
+--   * `meta->'source_info'->>'…'` -> json_extract(meta, '$.source_info.…').
+--   * DISTINCT ON -> MIN(rowid) per key (rowid order is insert order).
+--   * SQLite supports partial unique indexes, so the constraint is the same.
+
+ALTER TABLE memories ADD COLUMN source_message_id TEXT;
+
+UPDATE memories
+SET source_message_id = json_extract(meta, '$.source_info.source_message_id')
+WHERE rowid IN (
+    SELECT MIN(rowid)
+    FROM memories
+    WHERE json_extract(meta, '$.source_info.source_message_id') IS NOT NULL
+      AND json_extract(meta, '$.source_info.adapter') = source
+    GROUP BY org_id, source, json_extract(meta, '$.source_info.source_message_id')
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_source_message
+    ON memories (org_id, source, source_message_id)
+    WHERE source_message_id IS NOT NULL;
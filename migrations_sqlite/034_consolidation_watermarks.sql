@@ -0,0 +1,14 @@
+-- Migration 034: incremental consolidation watermarks (SQLite translation).
+--
+-- Mirrors migrations/034_consolidation_watermarks.sql. Translation notes:
+--   * TIMESTAMPTZ -> TEXT, in the `YYYY-MM-DD HH:MM:SS` UTC shape that
+--     `datetime('now')` gives `memories.created_at`, so the two compare
+--     lexicographically.
+
+CREATE TABLE IF NOT EXISTS consolidation_watermarks (
+    org_id     TEXT NOT NULL,
+    project    TEXT NOT NULL DEFAULT '',
+    watermark  TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (org_id, project)
+);
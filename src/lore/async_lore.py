@@ -30,7 +30,7 @@ import inspect
 import logging
 from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -41,6 +41,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
@@ -50,11 +51,13 @@ from lore._workers import (
     RetentionWorker,
     SloWorker,
 )
+from lore.embed.base import embed_async, inference_executor
 from lore.persistence import (
     ConfigError,
     MemoryFilter,
     NewMemory,
     NewMention,
+    RecallParams,
     Store,
     StoredConversationJob,
     StoredMemory,
@@ -85,15 +88,23 @@ logger = logging.getLogger(__name__)
 EmbeddingFn = Callable[[str], Union[Sequence[float], Awaitable[Sequence[float]]]]
 
 
+def _default_write_embedder() -> "Embedder":
+    """The default embedder behind the persistent content-hash store."""
+    from lore.embed.batching import shared_write_embedding_service
+
+    return shared_write_embedding_service()
+
+
 def _default_embedder() -> "Embedder":
-    """Build the default in-process embedder (LocalEmbedder, 384-dim).
+    """The default in-process embedder: the shared, cached, micro-batching
+    LocalEmbedder (384-dim) — one model per process, not per call.
 
     Lazy import: pulling in ``lore.embed.local`` triggers onnxruntime/
     tokenizers loads, which we want to defer past ``AsyncLore`` import.
     """
-    from lore.embed.local import LocalEmbedder
+    from lore.embed.batching import shared_embedding_service
 
-    return LocalEmbedder()
+    return shared_embedding_service()
 
 
 async def _resolve_org_id(store: Store, requested: Optional[str]) -> str:
@@ -379,13 +390,22 @@ class AsyncLore:
         """The underlying Store. Exposed for advanced/Phase 4B+ use."""
         return self._require_store()
 
-    async def _embed_text(self, text: str) -> List[float]:
-        """Run the configured embedder. Lazy-instantiate the default."""
+    async def _embed_text(self, text: str, *, write: bool = False) -> List[float]:
+        """Run the configured embedder off the event loop.
+
+        The default embedder is awaited through its async interface (for
+        ``write`` paths, behind the persistent content-hash store); a sync
+        ``embed`` callable runs on the inference executor, an async one is
+        awaited directly.
+        """
         embed_fn = self._embed
         if embed_fn is None:
-            embedder = _default_embedder()
-            return list(embedder.embed(text))
-        result = embed_fn(text)
+            embedder = _default_write_embedder() if write else _default_embedder()
+            return list(await embed_async(embedder, text))
+        if inspect.iscoroutinefunction(embed_fn):
+            return list(await embed_fn(text))
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(inference_executor(), embed_fn, text)
         if inspect.isawaitable(result):
             result = await result
         return list(result)
@@ -409,7 +429,7 @@ class AsyncLore:
         ``content``. Pass an explicit vector to skip the embedding step.
         """
         store = self._require_store()
-        vec = list(embedding) if embedding is not None else await self._embed_text(content)
+        vec = list(embedding) if embedding is not None else await self._embed_text(content, write=True)
         return await memories_service.create_memory(
             store,
             org_id=self.org_id,
@@ -803,24 +823,40 @@ class AsyncLore:
     # ponytail: LLM "summarize" strategy is deferred — needs an async LLM
     # client on the embedded path (same gap noted on enrich/topic_detail).
     _DEDUP_THRESHOLD = 0.95
+    # Incremental runs take memories created since the watermark minus this
+    # overlap, so a row stamped just before the previous run started but
+    # committed after its export is not skipped. Re-checking them is harmless.
+    _WATERMARK_OVERLAP = timedelta(minutes=5)
+    # Neighbours looked up per new memory. A cluster wider than this is
+    # finished off by the next run, once its canonical memory is itself new.
+    _INCREMENTAL_NEIGHBOURS = 16
+    # recall_by_embedding decays scores by recency; a huge half-life keeps
+    # them at raw cosine similarity so the dedup threshold means the same.
+    _NO_DECAY_HALF_LIFE = 1_000_000
 
     async def consolidate(
         self,
         *,
         project: Optional[str] = None,
         dry_run: bool = True,
+        full: bool = False,
     ) -> "ConsolidationReport":
         """Deduplicate near-identical memories on the embedded path.
 
         Groups memories whose embeddings are within ``_DEDUP_THRESHOLD``
-        cosine similarity (transitive closure via Union-Find), keeps the
-        most-recent member of each group as the canonical memory, and
-        supersedes + deletes the rest. The canonical memory's ``meta``
-        records ``consolidated_from`` / ``original_count`` so
+        cosine similarity (transitive closure), keeps the most-recent
+        member of each group as the canonical memory, and supersedes +
+        deletes the rest. The canonical memory's ``meta`` records
+        ``consolidated_from`` / ``original_count`` so
         :meth:`get_consolidation_log` can reconstruct the history.
 
+        Runs are incremental per ``(org, project)``: after the first clean
+        run only memories created since the stored watermark are compared,
+        each against its nearest neighbours from ``recall_by_embedding``.
+        ``full=True`` (or no watermark yet) compares the whole export.
+
         ``dry_run=True`` (default) computes the groups and previews them
-        in the report without mutating anything.
+        in the report without mutating anything, watermark included.
         """
         store = self._require_store()
         report = ConsolidationReport(
@@ -829,88 +865,118 @@ class AsyncLore:
             groups_found=0,
             memories_consolidated=0,
         )
-
-        exported = await store.list_memories_with_embeddings(
-            MemoryFilter(org_id=self.org_id, project=project, limit=100000)
-        )
-        # Only originals: skip rows that are themselves consolidation
-        # outputs (avoid re-folding a just-created summary).
-        rows = [
-            m for m in exported
-            if not (m.meta or {}).get("consolidated_from")
-            and m.embedding is not None
-        ]
-        if not rows:
-            return report
-
-        groups = self._find_duplicate_groups(rows)
+        started = datetime.now(timezone.utc)
+        since = None
+        if not full:
+            since = await store.get_consolidation_watermark(self.org_id, project)
+
+        if since is None:
+            groups = await self._full_duplicate_groups(store, project)
+        else:
+            groups = await self._incremental_duplicate_groups(
+                store, project, since - self._WATERMARK_OVERLAP,
+            )
         report.groups_found = len(groups)
-        if not groups:
-            return report
 
         if dry_run:
             for group in groups:
                 report.memories_consolidated += len(group)
             return report
 
+        failed = False
         for group in groups:
             try:
                 await self._consolidate_group(store, group)
                 report.memories_consolidated += len(group)
             except Exception:  # pragma: no cover - defensive
+                failed = True
                 logger.error(
                     "AsyncLore.consolidate: failed to consolidate a group of %d",
                     len(group), exc_info=True,
                 )
+        # A failed group keeps the watermark where it was so the next run
+        # retries the same window.
+        if not failed:
+            await store.set_consolidation_watermark(self.org_id, started, project)
         return report
 
+    @staticmethod
+    def _is_original(m: Any) -> bool:
+        # Skip rows that are themselves consolidation outputs (avoid
+        # re-folding a just-created summary).
+        return not (m.meta or {}).get("consolidated_from")
+
+    async def _full_duplicate_groups(
+        self, store: Store, project: Optional[str],
+    ) -> List[List[Any]]:
+        exported = await store.list_memories_with_embeddings(
+            MemoryFilter(org_id=self.org_id, project=project, limit=100000)
+        )
+        rows = [
+            m for m in exported
+            if self._is_original(m) and m.embedding is not None
+        ]
+        return self._find_duplicate_groups(rows) if rows else []
+
+    async def _incremental_duplicate_groups(
+        self, store: Store, project: Optional[str], since: datetime,
+    ) -> List[List[Any]]:
+        """Groups formed by memories created since ``since``.
+
+        Each new memory's neighbours above the threshold come from the
+        vector index, so the cost follows the number of new writes rather
+        than the corpus size. Pairs among older memories were settled by
+        earlier runs.
+        """
+        exported = await store.list_memories_with_embeddings(
+            MemoryFilter(org_id=self.org_id, project=project, since=since)
+        )
+        fresh = [
+            m for m in exported
+            if self._is_original(m) and m.embedding is not None
+        ]
+        from lore.near_duplicates import groups_from_edges
+
+        members: Dict[str, Any] = {m.id: m for m in fresh}
+        edges: List[Tuple[str, str]] = []
+        for m in fresh:
+            hits = await store.recall_by_embedding(
+                RecallParams(
+                    org_id=self.org_id,
+                    query_vec=list(m.embedding or ()),
+                    limit=self._INCREMENTAL_NEIGHBOURS,
+                    min_score=self._DEDUP_THRESHOLD,
+                    project=project,
+                    half_life_days=self._NO_DECAY_HALF_LIFE,
+                    scope_mode="all",
+                )
+            )
+            for hit in hits:
+                if hit.id == m.id or hit.score <= self._DEDUP_THRESHOLD:
+                    continue
+                if not self._is_original(hit):
+                    continue
+                members.setdefault(hit.id, hit)
+                edges.append((m.id, hit.id))
+
+        return [
+            [members[mid] for mid in group]
+            for group in groups_from_edges(edges)
+        ]
+
     def _find_duplicate_groups(self, rows: Sequence[Any]) -> List[List[Any]]:
-        """Union-Find cosine-similarity grouping (port of the sync engine).
+        """Cosine-similarity grouping with transitive closure, shared with
+        the sync engine (:func:`lore.near_duplicates.near_duplicate_groups`).
 
         ``rows`` are ``ExportedMemory`` with float-sequence embeddings.
         Returns groups of size >= 2.
         """
-        import math
-        from collections import defaultdict
+        from lore.near_duplicates import near_duplicate_groups
 
-        vecs: Dict[str, List[float]] = {}
-        norms: Dict[str, float] = {}
-        for m in rows:
-            vec = list(m.embedding or ())
-            norm = math.sqrt(sum(v * v for v in vec))
-            if norm > 0:
-                vecs[m.id] = vec
-                norms[m.id] = norm
-
-        parent: Dict[str, str] = {mid: mid for mid in vecs}
-
-        def find(x: str) -> str:
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-
-        def union(a: str, b: str) -> None:
-            ra, rb = find(a), find(b)
-            if ra != rb:
-                parent[ra] = rb
-
-        ids = list(vecs)
-        for i in range(len(ids)):
-            a = ids[i]
-            va, na = vecs[a], norms[a]
-            for j in range(i + 1, len(ids)):
-                b = ids[j]
-                vb, nb = vecs[b], norms[b]
-                dot = sum(x * y for x, y in zip(va, vb))
-                if dot / (na * nb) > self._DEDUP_THRESHOLD:
-                    union(a, b)
-
-        by_id = {m.id: m for m in rows}
-        clusters: Dict[str, List[Any]] = defaultdict(list)
-        for mid in vecs:
-            clusters[find(mid)].append(by_id[mid])
-        return [g for g in clusters.values() if len(g) > 1]
+        groups = near_duplicate_groups(
+            [m.embedding for m in rows], self._DEDUP_THRESHOLD,
+        )
+        return [[rows[i] for i in group] for group in groups]
 
     async def _consolidate_group(self, store: Store, group: Sequence[Any]) -> None:
         """Keep the most-recent member; supersede + delete the duplicates."""
@@ -649,6 +649,27 @@ def build_parser() -> argparse.ArgumentParser:
         help="Rows per batch (default: 500).",
     )
 
+    # vector-index
+    sub.add_parser(
+        "vector-index",
+        help="Build the Postgres HNSW index on memories.embedding without blocking writes",
+    )
+
+    # quantize-vectors
+    p_qv = sub.add_parser(
+        "quantize-vectors",
+        help="Build the quantized vector index used by LORE_VECTOR_QUANTIZATION",
+    )
+    p_qv.add_argument(
+        "--mode", choices=["int8", "halfvec", "binary"], default=None,
+        help="Quantization mode: int8 (SQLite), halfvec (Postgres) or binary "
+             "(default: $LORE_VECTOR_QUANTIZATION)",
+    )
+    p_qv.add_argument(
+        "--batch-size", type=int, default=None, dest="batch_size",
+        help="Vectors per write transaction on SQLite (default: 1000).",
+    )
+
     # ui
     p_ui = sub.add_parser("ui", help="Open graph visualization in browser")
     p_ui.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
@@ -827,6 +848,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     from lore.cli.commands.server import cmd_mcp, cmd_serve, cmd_ui
     from lore.cli.commands.session_finalize import cmd_session_finalize
     from lore.cli.commands.snapshot import cmd_consolidate, cmd_snapshot, cmd_snapshot_save
+    from lore.cli.commands.vectors import cmd_quantize_vectors, cmd_vector_index
 
     if args.command == "keys":
         if not args.keys_command:
@@ -898,6 +920,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         "mcp": cmd_mcp,
         "ui": cmd_ui,
         "migrate": cmd_migrate,
+        "quantize-vectors": cmd_quantize_vectors,
+        "vector-index": cmd_vector_index,
         "observations": cmd_observations,
         "capture-extract": cmd_capture,
         "session-finalize": cmd_session_finalize,
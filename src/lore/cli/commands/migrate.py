@@ -509,7 +509,8 @@ async def _write_memories_sqlite(
         f"VALUES ({placeholders})"
     )
     sql_vec = (
-        "INSERT INTO memory_vectors(memory_rowid, embedding) VALUES (?, ?)"
+        "INSERT INTO memory_vectors(memory_rowid, org_id, embedding) "
+        "VALUES (?, ?, ?)"
     )
     for r in rows:
         cur = await conn.execute(
@@ -535,7 +536,7 @@ async def _write_memories_sqlite(
                 )
                 emb = None
         if emb:
-            await conn.execute(sql_vec, (rowid, repr(list(emb))))
+            await conn.execute(sql_vec, (rowid, r.get("org_id"), repr(list(emb))))
 
 
 async def _write_memories_pg(
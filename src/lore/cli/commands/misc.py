@@ -273,7 +273,9 @@ def cmd_ingest(args: argparse.Namespace) -> None:
 
     adapter = RawAdapter()
     adapter.adapter_name = source  # override adapter name to match --source
-    deduplicator = Deduplicator(store=lore._store, embedder=lore._embedder)
+    # Same write-path embedder as remember(): the dedup embedding is
+    # persisted, so storing the item does not infer it again.
+    deduplicator = Deduplicator(store=lore._store, embedder=lore._embedder_for_write())
     pipeline = IngestionPipeline(
         lore=lore,
         deduplicator=deduplicator,
@@ -0,0 +1,82 @@
+"""Vector index maintenance commands.
+
+``lore vector-index`` builds the Postgres HNSW index on ``memories.embedding``
+without blocking writes (migration 029 only builds it on an empty table).
+
+``lore quantize-vectors`` backfills the compact copy of the embeddings that
+``recall_by_embedding`` searches for candidates when
+``LORE_VECTOR_QUANTIZATION`` is set (see :mod:`lore.persistence.quantization`),
+then records the mode as ready. Until this has run, stores keep using the
+float index. Safe to re-run: only missing vectors are quantized.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from lore.cli.commands.dream import _resolve_database_url
+from lore.persistence.quantization import env_vector_quantization, normalize_mode
+
+
+def cmd_quantize_vectors(args: argparse.Namespace) -> int:
+    """``lore quantize-vectors [--mode int8|halfvec|binary] [--batch-size N]``."""
+    try:
+        mode = normalize_mode(getattr(args, "mode", None)) or env_vector_quantization()
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    if mode is None:
+        print(
+            "No quantization mode: pass --mode int8|halfvec|binary or set LORE_VECTOR_QUANTIZATION.",
+            file=sys.stderr,
+        )
+        return 1
+
+    async def _run() -> int:
+        from lore.persistence.factory import make_store
+
+        store = await make_store(_resolve_database_url())
+        try:
+            if not hasattr(store, "backfill_quantized_vectors"):
+                raise RuntimeError(f"{type(store).__name__} does not support vector quantization")
+            return await store.backfill_quantized_vectors(
+                mode, batch_size=getattr(args, "batch_size", None) or 1000,
+            )
+        finally:
+            await store.close()
+
+    try:
+        count = asyncio.run(_run())
+    except Exception as exc:  # noqa: BLE001
+        print(f"quantize-vectors failed: {exc}", file=sys.stderr)
+        return 1
+    print(f"Quantized vector index ({mode}) ready: {count} vectors processed.")
+    print(f"Set LORE_VECTOR_QUANTIZATION={mode} on the server to search it.")
+    return 0
+
+
+def cmd_vector_index(args: argparse.Namespace) -> int:
+    """``lore vector-index`` — build the HNSW index CONCURRENTLY, drop IVFFlat."""
+
+    async def _run() -> list[str]:
+        from lore.persistence.factory import make_store
+
+        store = await make_store(_resolve_database_url())
+        try:
+            if not hasattr(store, "build_vector_index"):
+                raise RuntimeError(f"{type(store).__name__} has no vector index to build")
+            return await store.build_vector_index()
+        finally:
+            await store.close()
+
+    try:
+        dropped = asyncio.run(_run())
+    except Exception as exc:  # noqa: BLE001
+        print(f"vector-index failed: {exc}", file=sys.stderr)
+        return 1
+    print("HNSW index on memories.embedding ready.")
+    for name in dropped:
+        print(f"Dropped IVFFlat index {name}.")
+    return 0
@@ -4,26 +4,40 @@ from __future__ import annotations
 
 import logging
 import struct
+import time
 from collections import Counter, defaultdict
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
-import numpy as np
 from ulid import ULID
 
 from lore.embed.base import Embedder
 from lore.llm.base import LLMProvider
+from lore.near_duplicates import (
+    groups_from_edges,
+    max_pairwise_similarity,
+    near_duplicate_groups,
+)
 from lore.store.base import Store
 from lore.types import (
     DEFAULT_CONSOLIDATION_CONFIG,
+    VALID_TIERS,
     ConsolidationLogEntry,
     ConsolidationResult,
     EntityMention,
     Memory,
 )
 
+if TYPE_CHECKING:
+    from lore.store.vector_index import VectorIndex
+
 logger = logging.getLogger(__name__)
 
+# Incremental runs read memories created since the watermark minus each
+# tier's retention age, widened by this much so created_at strings that
+# compare slightly differently from the bound are still read.
+_SINCE_OVERLAP = timedelta(minutes=5)
+
 CONSOLIDATION_PROMPT = """You are a memory consolidation system. Given a group of related memories, create a single concise memory that preserves all important information.
 
 Rules:
@@ -42,6 +56,17 @@ Consolidated memory:"""
 class ConsolidationEngine:
     """Six-stage consolidation pipeline.
 
+    Runs are incremental: the engine remembers when each ``(project, tier,
+    strategy)`` scope last completed, and the next run only groups memories
+    that became eligible since then against the rest of the candidates.
+    Those are read with one ``Store.list(since=...)`` per tier; their
+    near-duplicates come from ``vector_index`` (a callable returning a
+    synced :class:`~lore.store.vector_index.VectorIndex` for a dimension)
+    when one is given, so an incremental run does not list the corpus.
+    The first run of a scope, or ``consolidate(full=True)``, compares
+    everything. Watermarks live on the engine only: a new engine (e.g.
+    after a restart) starts with a full run.
+
     Pipeline stages:
       1. IDENTIFY  — Find candidates by tier/age/importance
       2. GROUP     — Cluster by dedup (cosine sim) and entity (graph)
@@ -57,6 +82,7 @@ class ConsolidationEngine:
         embedder: Embedder,
         llm_provider: Optional[LLMProvider] = None,
         config: Optional[Dict[str, Any]] = None,
+        vector_index: Optional[Callable[[int], "VectorIndex"]] = None,
     ) -> None:
         self._store = store
         self._embedder = embedder
@@ -65,6 +91,9 @@ class ConsolidationEngine:
         if config:
             cfg.update(config)
         self._config = cfg
+        # (project, tier, strategy) -> start of the last completed run.
+        self._watermarks: Dict[tuple, datetime] = {}
+        self._vector_index = vector_index
 
     # ------------------------------------------------------------------
     # Stage 1: Identify Candidates
@@ -76,23 +105,60 @@ class ConsolidationEngine:
         tier: Optional[str] = None,
     ) -> List[Memory]:
         """Find memories eligible for consolidation based on age and tier."""
-        policies = self._config["retention_policies"]
         now = datetime.now(timezone.utc)
         candidates = []
 
         all_memories = self._store.list(project=project, tier=tier)
 
         for memory in all_memories:
-            if memory.archived:
-                continue
-            created = datetime.fromisoformat(memory.created_at)
-            age_seconds = (now - created).total_seconds()
-            threshold = policies.get(memory.tier, policies["long"])
-            if age_seconds > threshold:
+            if not memory.archived and self._is_eligible(memory, now):
                 candidates.append(memory)
 
         return candidates
 
+    def _is_eligible(self, memory: Memory, now: datetime) -> bool:
+        """Whether ``memory`` is older than its tier's retention age at ``now``."""
+        policies = self._config["retention_policies"]
+        created = datetime.fromisoformat(memory.created_at)
+        threshold = policies.get(memory.tier, policies["long"])
+        return (now - created).total_seconds() > threshold
+
+    def _newly_eligible(
+        self,
+        project: Optional[str],
+        tier: Optional[str],
+        since: datetime,
+        now: datetime,
+    ) -> List[Memory]:
+        """Candidates that crossed their retention age after ``since``.
+
+        Each tier only reads memories created since ``since`` less its
+        retention age, so the cost follows recent writes, not corpus size.
+        """
+        policies = self._config["retention_policies"]
+        tiers = [tier] if tier is not None else sorted(set(VALID_TIERS) | set(policies))
+        fresh: List[Memory] = []
+        for name in tiers:
+            threshold = timedelta(seconds=policies.get(name, policies["long"]))
+            lower = since - threshold - _SINCE_OVERLAP
+            for memory in self._store.list(project=project, tier=name, since=lower.isoformat()):
+                if memory.archived or not self._is_eligible(memory, now):
+                    continue
+                created = datetime.fromisoformat(memory.created_at)
+                if created + threshold >= since:
+                    fresh.append(memory)
+        return fresh
+
+    def count_newly_eligible(
+        self,
+        since: datetime,
+        project: Optional[str] = None,
+        tier: Optional[str] = None,
+    ) -> int:
+        """How many memories crossed their retention age after ``since``."""
+        now = datetime.now(timezone.utc)
+        return len(self._newly_eligible(project, tier, since, now))
+
     # ------------------------------------------------------------------
     # Stage 2a: Deduplication Grouping
     # ------------------------------------------------------------------
@@ -100,62 +166,66 @@ class ConsolidationEngine:
     def _find_duplicates(
         self,
         candidates: List[Memory],
+        fresh: Optional[Set[str]] = None,
     ) -> List[List[Memory]]:
         """Group near-duplicate memories by embedding cosine similarity.
 
-        Uses Union-Find for true transitive closure: if A~B and B~C are
-        above threshold, A, B, C are grouped together even if A~C is below.
+        Compares every candidate against every other (blocked matrix
+        products, see :mod:`lore.near_duplicates`) and takes the transitive
+        closure: if A~B and B~C are above threshold, A, B, C are grouped
+        together even if A~C is below. With ``fresh`` (memory ids), only
+        pairs involving at least one of those memories are compared.
         """
-        threshold = self._config["dedup_threshold"]
+        queries = None
+        if fresh is not None:
+            queries = [i for i, mem in enumerate(candidates) if mem.id in fresh]
+        groups = near_duplicate_groups(
+            [mem.embedding for mem in candidates],
+            self._config["dedup_threshold"],
+            queries=queries,
+        )
+        return [[candidates[i] for i in group] for group in groups]
 
-        # Deserialize embeddings once
-        embeddings: Dict[str, np.ndarray] = {}
-        norms: Dict[str, float] = {}
-        for mem in candidates:
-            if mem.embedding is not None:
-                count = len(mem.embedding) // 4
-                vec = np.array(
-                    struct.unpack(f"{count}f", mem.embedding), dtype=np.float32
-                )
-                norm = float(np.linalg.norm(vec))
-                if norm > 0:
-                    embeddings[mem.id] = vec
-                    norms[mem.id] = norm
-
-        # Union-Find data structure
-        parent: Dict[str, str] = {mid: mid for mid in embeddings}
-
-        def find(x: str) -> str:
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]  # path compression
-                x = parent[x]
-            return x
-
-        def union(a: str, b: str) -> None:
-            ra, rb = find(a), find(b)
-            if ra != rb:
-                parent[ra] = rb
-
-        # Compare all pairs and union those above threshold
-        valid = [m for m in candidates if m.id in embeddings]
-        for i in range(len(valid)):
-            mid_a = valid[i].id
-            vec_a, norm_a = embeddings[mid_a], norms[mid_a]
-            for j in range(i + 1, len(valid)):
-                mid_b = valid[j].id
-                vec_b, norm_b = embeddings[mid_b], norms[mid_b]
-                sim = float(np.dot(vec_a, vec_b) / (norm_a * norm_b))
-                if sim > threshold:
-                    union(mid_a, mid_b)
-
-        # Collect groups from Union-Find
-        group_map: Dict[str, List[Memory]] = defaultdict(list)
-        mem_by_id = {m.id: m for m in candidates}
-        for mid in embeddings:
-            root = find(mid)
-            group_map[root].append(mem_by_id[mid])
-
-        return [g for g in group_map.values() if len(g) > 1]
+    def _find_fresh_duplicates(
+        self,
+        fresh: List[Memory],
+        project: Optional[str],
+        tier: Optional[str],
+        now: datetime,
+    ) -> List[List[Memory]]:
+        """Near-duplicate groups touching ``fresh``, found through the index.
+
+        Each fresh memory is scored against the indexed rows in scope; hits
+        that are candidates themselves join its group. Pairs among older
+        candidates were settled by earlier runs.
+        """
+        threshold = self._config["dedup_threshold"]
+        members: Dict[str, Memory] = {m.id: m for m in fresh}
+        edges: List[tuple] = []
+        # dim -> (index, rows in scope); the index is synced once per run.
+        scoped: Dict[int, tuple] = {}
+        for memory in fresh:
+            if not memory.embedding or len(memory.embedding) % 4:
+                continue
+            dim = len(memory.embedding) // 4
+            if dim not in scoped:
+                index = self._vector_index(dim)
+                scoped[dim] = (index, index.select(now=now.timestamp(), project=project, tier=tier))
+            index, rows = scoped[dim]
+            if not rows.size:
+                continue
+            query = struct.unpack(f"{index.dim}f", memory.embedding)
+            hits = rows[index.cosine(query, rows) > threshold]
+            for row in hits.tolist():
+                hit = index.memory(row)
+                if hit.id == memory.id:
+                    continue
+                if hit.id not in members:
+                    if not self._is_eligible(hit, now):
+                        continue
+                    members[hit.id] = hit
+                edges.append((memory.id, hit.id))
+        return [[members[mid] for mid in group] for group in groups_from_edges(edges)]
 
     # ------------------------------------------------------------------
     # Stage 2b: Entity/Topic Grouping
@@ -165,8 +235,13 @@ class ConsolidationEngine:
         self,
         candidates: List[Memory],
         already_grouped: Set[str],
+        fresh: Optional[Set[str]] = None,
     ) -> List[List[Memory]]:
-        """Group memories sharing entities via graph entity_mentions table."""
+        """Group memories sharing entities via graph entity_mentions table.
+
+        With ``fresh`` (memory ids), only groups containing one of those
+        memories are kept; the others were already considered last run.
+        """
         min_group_size = self._config["min_group_size"]
         entity_to_memories: Dict[str, List[Memory]] = defaultdict(list)
 
@@ -187,12 +262,49 @@ class ConsolidationEngine:
             reverse=True,
         ):
             ungrouped = [m for m in memories if m.id not in used]
+            if fresh is not None and not any(m.id in fresh for m in ungrouped):
+                continue
             if len(ungrouped) >= min_group_size:
                 groups.append(ungrouped)
                 used.update(m.id for m in ungrouped)
 
         return groups
 
+    def _sharing_entities(
+        self,
+        fresh: List[Memory],
+        project: Optional[str],
+        tier: Optional[str],
+        now: datetime,
+    ) -> List[Memory]:
+        """``fresh`` plus every candidate mentioning an entity one of them mentions.
+
+        Those are the only memories an entity group kept by an incremental
+        run can contain; they are found through the mentions rather than
+        by listing the corpus.
+        """
+        pool: Dict[str, Memory] = {m.id: m for m in fresh}
+        seen: Set[str] = set()
+        for memory in fresh:
+            for mention in self._store.get_entity_mentions_for_memory(memory.id):
+                if mention.entity_id in seen:
+                    continue
+                seen.add(mention.entity_id)
+                for other in self._store.get_entity_mentions_for_entity(mention.entity_id):
+                    if other.memory_id in pool:
+                        continue
+                    candidate = self._store.get(other.memory_id)
+                    if (
+                        candidate is None
+                        or candidate.archived
+                        or (project is not None and candidate.project != project)
+                        or (tier is not None and candidate.tier != tier)
+                        or not self._is_eligible(candidate, now)
+                    ):
+                        continue
+                    pool[candidate.id] = candidate
+        return sorted(pool.values(), key=lambda m: m.created_at, reverse=True)
+
     # ------------------------------------------------------------------
     # Stage 3: LLM Summarization
     # ------------------------------------------------------------------
@@ -357,29 +469,7 @@ class ConsolidationEngine:
 
     def _max_pairwise_similarity(self, group: List[Memory]) -> float:
         """Compute max pairwise cosine similarity within a group."""
-        embeddings = []
-        for mem in group:
-            if mem.embedding is not None:
-                count = len(mem.embedding) // 4
-                embeddings.append(
-                    np.array(struct.unpack(f"{count}f", mem.embedding), dtype=np.float32)
-                )
-
-        if len(embeddings) < 2:
-            return 0.0
-
-        max_sim = 0.0
-        for i in range(len(embeddings)):
-            norm_i = float(np.linalg.norm(embeddings[i]))
-            if norm_i == 0:
-                continue
-            for j in range(i + 1, len(embeddings)):
-                norm_j = float(np.linalg.norm(embeddings[j]))
-                if norm_j == 0:
-                    continue
-                sim = float(np.dot(embeddings[i], embeddings[j]) / (norm_i * norm_j))
-                max_sim = max(max_sim, sim)
-        return round(max_sim, 4)
+        return round(max_pairwise_similarity([mem.embedding for mem in group]), 4)
 
     def _get_shared_entities(self, group: List[Memory]) -> List[str]:
         """Get entity names shared by memories in a group."""
@@ -405,36 +495,66 @@ class ConsolidationEngine:
         tier: Optional[str] = None,
         strategy: str = "all",
         dry_run: bool = True,
+        full: bool = False,
     ) -> ConsolidationResult:
-        """Run the full consolidation pipeline."""
-        result = ConsolidationResult(dry_run=dry_run)
+        """Run the consolidation pipeline.
 
-        # Stage 1: Identify candidates
-        candidates = self._identify_candidates(project=project, tier=tier)
+        Only memories that became eligible since this scope's last completed
+        run are grouped (against all candidates) unless ``full`` is set. A
+        dry run never moves the watermark, and neither does a run that hit
+        ``max_groups_per_run`` or failed a group, so the next run covers the
+        same window again.
+        """
+        result = ConsolidationResult(dry_run=dry_run)
+        started = datetime.now(timezone.utc)
+        scope = (project, tier, strategy)
+        since = None if full else self._watermarks.get(scope)
+
+        # Stage 1: Identify candidates. An incremental run reads only the
+        # memories that became eligible since the watermark.
+        if since is None:
+            candidates = self._identify_candidates(project=project, tier=tier)
+            fresh_memories: List[Memory] = []
+            fresh: Optional[Set[str]] = None
+        else:
+            fresh_memories = self._newly_eligible(project, tier, since, started)
+            candidates = fresh_memories
+            fresh = {m.id for m in fresh_memories}
         if not candidates:
+            if not dry_run:
+                self._watermarks[scope] = started
             return result
 
-        # Stage 2: Group (in batches)
+        # Stage 2: Group. Dedup spans all candidates so duplicates that land
+        # in different batches still meet; entity grouping stays batched.
         all_groups: List[tuple] = []  # (group, strategy_name)
         already_grouped: Set[str] = set()
         batch_size = self._config.get("batch_size", 50)
 
-        for batch_start in range(0, len(candidates), batch_size):
-            batch = candidates[batch_start : batch_start + batch_size]
-
-            if strategy in ("deduplicate", "all"):
-                dedup_groups = self._find_duplicates(batch)
-                for group in dedup_groups:
-                    all_groups.append((group, "deduplicate"))
-                    already_grouped.update(m.id for m in group)
-
-            if strategy in ("summarize", "all") and self._llm is not None:
-                entity_groups = self._group_by_entity(batch, already_grouped)
+        if strategy in ("deduplicate", "all"):
+            if fresh is None:
+                dup_groups = self._find_duplicates(candidates)
+            elif self._vector_index is not None:
+                dup_groups = self._find_fresh_duplicates(fresh_memories, project, tier, started)
+            else:
+                everything = self._identify_candidates(project=project, tier=tier)
+                dup_groups = self._find_duplicates(everything, fresh)
+            for group in dup_groups:
+                all_groups.append((group, "deduplicate"))
+                already_grouped.update(m.id for m in group)
+
+        if strategy in ("summarize", "all") and self._llm is not None:
+            if fresh is not None:
+                candidates = self._sharing_entities(fresh_memories, project, tier, started)
+            for batch_start in range(0, len(candidates), batch_size):
+                batch = candidates[batch_start : batch_start + batch_size]
+                entity_groups = self._group_by_entity(batch, already_grouped, fresh)
                 for group in entity_groups:
                     all_groups.append((group, "summarize"))
 
         # Apply max_groups_per_run safety limit
         max_groups = self._config["max_groups_per_run"]
+        truncated = len(all_groups) > max_groups
         all_groups = all_groups[:max_groups]
         result.groups_found = len(all_groups)
 
@@ -463,15 +583,19 @@ class ConsolidationEngine:
             return result
 
         # Execute consolidation
+        failed = False
         for group, strat in all_groups:
             try:
                 await self._process_group(group, strat, result)
             except Exception:
+                failed = True
                 logger.error(
                     "Failed to consolidate group of %d memories (strategy=%s), skipping",
                     len(group), strat, exc_info=True,
                 )
 
+        if not truncated and not failed:
+            self._watermarks[scope] = started
         return result
 
     async def _process_group(
@@ -526,12 +650,23 @@ _SCHEDULE_INTERVALS: Dict[str, int] = {
 
 
 class ConsolidationScheduler:
-    """Background scheduler for periodic consolidation runs."""
+    """Background scheduler for consolidation runs.
+
+    By default a run fires every ``interval``. With ``min_eligible`` the
+    scheduler instead checks every ``poll_seconds`` and runs once that many
+    memories have crossed their retention age (become consolidation
+    candidates) since the last run it started; ``interval`` then only
+    bounds how long a quiet store goes between runs. Writes alone don't
+    count: a memory only becomes a candidate by ageing.
+    """
 
     def __init__(
         self,
         engine: ConsolidationEngine,
         interval: str = "daily",
+        *,
+        min_eligible: Optional[int] = None,
+        poll_seconds: float = 60.0,
     ) -> None:
         self._engine = engine
         if interval not in _SCHEDULE_INTERVALS:
@@ -539,24 +674,50 @@ class ConsolidationScheduler:
                 f"Invalid schedule interval: {interval!r}. "
                 f"Must be one of {list(_SCHEDULE_INTERVALS.keys())}"
             )
+        if min_eligible is not None and min_eligible < 1:
+            raise ValueError(f"min_eligible must be >= 1, got {min_eligible!r}")
         self._interval_seconds = _SCHEDULE_INTERVALS[interval]
+        self._min_eligible = min_eligible
+        self._poll_seconds = poll_seconds
+        self._since = datetime.now(timezone.utc)
+        self._last_run = time.monotonic()
         self._task: Any = None
 
+    @property
+    def pending_eligible(self) -> int:
+        """Memories that became candidates since the last run started."""
+        return self._engine.count_newly_eligible(self._since)
+
+    def _due(self) -> bool:
+        if time.monotonic() - self._last_run >= self._interval_seconds:
+            return True
+        return self._min_eligible is not None and self.pending_eligible >= self._min_eligible
+
+    async def _run_once(self) -> None:
+        self._since = datetime.now(timezone.utc)
+        self._last_run = time.monotonic()
+        try:
+            result = await self._engine.consolidate(dry_run=False)
+            logger.info(
+                "Scheduled consolidation: %d groups, %d archived, %d created",
+                result.groups_found,
+                result.memories_consolidated,
+                result.memories_created,
+            )
+        except Exception:
+            logger.error("Scheduled consolidation failed", exc_info=True)
+
     async def _run_loop(self) -> None:
         import asyncio
 
+        if self._min_eligible is None:
+            while True:
+                await self._run_once()
+                await asyncio.sleep(self._interval_seconds)
         while True:
-            try:
-                result = await self._engine.consolidate(dry_run=False)
-                logger.info(
-                    "Scheduled consolidation: %d groups, %d archived, %d created",
-                    result.groups_found,
-                    result.memories_consolidated,
-                    result.memories_created,
-                )
-            except Exception:
-                logger.error("Scheduled consolidation failed", exc_info=True)
-            await asyncio.sleep(self._interval_seconds)
+            if self._due():
+                await self._run_once()
+            await asyncio.sleep(self._poll_seconds)
 
     def start(self) -> None:
         """Start the background consolidation task."""
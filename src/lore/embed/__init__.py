@@ -1,14 +1,24 @@
 """Embedding engine for Lore SDK."""
 
-from lore.embed.base import Embedder
+from lore.embed.base import Embedder, embed_async, embed_batch_async
+from lore.embed.batching import BatchingEmbedder, shared_embedding_service
+from lore.embed.cache import CachedEmbedder, EmbeddingCache, shared_embedding_cache
 from lore.embed.local import CODE_MODEL, PROSE_MODEL, LocalEmbedder, make_code_embedder
-from lore.embed.router import EmbeddingRouter, detect_content_type
+from lore.embed.router import EmbeddingRouter, detect_content_type, detect_content_types
 
 __all__ = [
     "Embedder",
+    "embed_async",
+    "embed_batch_async",
+    "BatchingEmbedder",
+    "shared_embedding_service",
+    "CachedEmbedder",
+    "EmbeddingCache",
+    "shared_embedding_cache",
     "LocalEmbedder",
     "EmbeddingRouter",
     "detect_content_type",
+    "detect_content_types",
     "make_code_embedder",
     "PROSE_MODEL",
     "CODE_MODEL",
@@ -1,9 +1,45 @@
-"""Abstract embedder interface."""
+"""Abstract embedder interface.
+
+Embedding is CPU-bound ONNX work, so async code never calls ``embed``
+directly: it awaits :meth:`Embedder.aembed` (or :func:`embed_async` for
+duck-typed embedders), which runs inference on a small dedicated thread pool
+— :func:`inference_executor`, sized by ``LORE_EMBED_EXECUTOR_THREADS``
+(default 2) — and keeps the event loop free for other requests.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+_DEFAULT_EXECUTOR_THREADS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def inference_executor() -> ThreadPoolExecutor:
+    """The process-wide, bounded pool that runs embedding inference.
+
+    Kept separate from the loop's default executor so file/DB work offloaded
+    with ``asyncio.to_thread`` never queues behind (or starves) inference.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                workers = int(os.environ.get("LORE_EMBED_EXECUTOR_THREADS", _DEFAULT_EXECUTOR_THREADS))
+            except ValueError:
+                workers = _DEFAULT_EXECUTOR_THREADS
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, workers), thread_name_prefix="lore-embed",
+            )
+        return _executor
 
 
 class Embedder(ABC):
@@ -16,3 +52,36 @@ class Embedder(ABC):
     @abstractmethod
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Embed multiple texts. Returns a list of embedding vectors."""
+
+    async def aembed(self, text: str) -> List[float]:
+        """Embed from async code; runs ``embed`` on the inference executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(inference_executor(), self.embed, text)
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Async ``embed_batch``, on the inference executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(inference_executor(), self.embed_batch, texts)
+
+
+async def embed_async(embedder: object, text: str) -> List[float]:
+    """Embed ``text`` from async code without blocking the event loop.
+
+    Uses the embedder's ``aembed`` coroutine when it has one (every
+    :class:`Embedder`; the micro-batching service awaits its queued future);
+    otherwise runs ``embed`` on the inference executor.
+    """
+    aembed = getattr(embedder, "aembed", None)
+    if inspect.iscoroutinefunction(aembed):
+        return await aembed(text)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor(), embedder.embed, text)  # type: ignore[attr-defined]
+
+
+async def embed_batch_async(embedder: object, texts: List[str]) -> List[List[float]]:
+    """:func:`embed_async` for a batch: one ``aembed_batch`` / ``embed_batch`` call."""
+    aembed_batch = getattr(embedder, "aembed_batch", None)
+    if inspect.iscoroutinefunction(aembed_batch):
+        return await aembed_batch(texts)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor(), embedder.embed_batch, texts)  # type: ignore[attr-defined]
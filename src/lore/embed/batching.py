@@ -0,0 +1,214 @@
+"""Micro-batching embedding service.
+
+Under concurrent load every retrieve / write request used to run its own
+single-text ONNX inference, so N in-flight requests meant N batch-of-one runs
+competing for the same cores. ``BatchingEmbedder`` puts a request queue in
+front of an :class:`~lore.embed.base.Embedder`: callers get a
+:class:`concurrent.futures.Future` per text, and one worker thread coalesces
+whatever has queued up — plus anything arriving within ``max_wait_ms`` of
+the first item, up to ``max_batch`` texts — into a single ``embed_batch``
+call. The window is only waited on when other requests are already queued,
+so an idle server adds no latency; a busy one amortises each inference over
+every request that arrived while the previous one ran.
+
+Async callers use :meth:`BatchingEmbedder.aembed`, which awaits the future
+without holding an event-loop thread. Sync callers (``embed`` /
+``embed_batch``) block on it as before.
+
+One process-wide service (:func:`shared_embedding_service`) — the shared
+query cache over a batching ``LocalEmbedder`` — backs the server routes,
+ingestion and the MCP server, so an MCP process running the embedded server
+loads the model once. ``LORE_EMBED_COALESCE_MAX_BATCH`` (default 64) and
+``LORE_EMBED_COALESCE_WAIT_MS`` (default 2) tune the window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from lore.embed.base import Embedder
+
+_DEFAULT_MAX_BATCH = 64
+_DEFAULT_WAIT_MS = 2.0
+
+_Request = Tuple[str, "Future[List[float]]"]
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+class BatchingEmbedder(Embedder):
+    """Coalesces concurrent embed calls into batched inference on one worker.
+
+    Identical texts in the same batch are embedded once. An exception from
+    the wrapped embedder fails every future of that batch.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ) -> None:
+        self.embedder = embedder
+        self.max_batch = max(1, int(
+            max_batch if max_batch is not None
+            else _env_number("LORE_EMBED_COALESCE_MAX_BATCH", _DEFAULT_MAX_BATCH)
+        ))
+        self.max_wait_ms = (
+            max_wait_ms if max_wait_ms is not None
+            else _env_number("LORE_EMBED_COALESCE_WAIT_MS", _DEFAULT_WAIT_MS)
+        )
+        self._queue: "queue.SimpleQueue[Optional[_Request]]" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._batches = 0
+        self._texts = 0
+
+    @property
+    def model_id(self) -> str:
+        return getattr(self.embedder, "model_id", type(self.embedder).__name__)
+
+    def submit(self, text: str) -> "Future[List[float]]":
+        """Queue ``text``; the future resolves to its vector."""
+        future: "Future[List[float]]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchingEmbedder is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="lore-embed-batcher", daemon=True,
+                )
+                self._worker.start()
+            self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> List[float]:
+        return self.submit(text).result()
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        futures = [self.submit(t) for t in texts]
+        return [f.result() for f in futures]
+
+    async def aembed(self, text: str) -> List[float]:
+        """Embed without blocking the event loop (or an executor thread)."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        futures = [asyncio.wrap_future(self.submit(t)) for t in texts]
+        return list(await asyncio.gather(*futures))
+
+    def stats(self) -> Dict[str, int]:
+        """``{"batches": ..., "texts": ...}`` run since start."""
+        return {"batches": self._batches, "texts": self._texts}
+
+    def close(self) -> None:
+        """Finish queued work and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _collect(self, first: _Request) -> Tuple[List[_Request], bool]:
+        """``first`` plus whatever arrives within the window; (batch, stop).
+
+        The window is only waited on once something else was already queued:
+        a lone request on an idle service runs immediately.
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch:
+            try:
+                # Drain what is already queued before waiting on the window.
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if len(batch) == 1 or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, stop = self._collect(first)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[_Request]) -> None:
+        live = [(text, f) for text, f in batch if f.set_running_or_notify_cancel()]
+        if not live:
+            return
+        unique: Dict[str, int] = {}
+        for text, _ in live:
+            unique.setdefault(text, len(unique))
+        try:
+            vecs = self.embedder.embed_batch(list(unique))
+        except BaseException as exc:  # noqa: BLE001 — delivered to every caller
+            for _, future in live:
+                future.set_exception(exc)
+            return
+        self._batches += 1
+        self._texts += len(live)
+        for text, future in live:
+            future.set_result(vecs[unique[text]])
+
+
+_shared: Optional[Embedder] = None
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_service() -> Embedder:
+    """The process-wide embedder: query cache → micro-batcher → ``LocalEmbedder``."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            from lore.embed.cache import CachedEmbedder
+            from lore.embed.local import LocalEmbedder
+
+            _shared = CachedEmbedder(BatchingEmbedder(LocalEmbedder()))
+        return _shared
+
+
+def shared_write_embedding_service() -> Embedder:
+    """The shared service behind the persistent content-hash store, for writes
+    (see :mod:`lore.embed.persistent`)."""
+    from lore.embed.persistent import with_embedding_store
+
+    return with_embedding_store(shared_embedding_service())
+
+
+def shared_service_stats() -> Optional[Dict[str, int]]:
+    """Batcher stats of the shared service, or None if it was never started."""
+    inner = getattr(_shared, "embedder", None)
+    return inner.stats() if isinstance(inner, BatchingEmbedder) else None
@@ -0,0 +1,232 @@
+"""Bounded LRU cache for query embeddings.
+
+Recall entry points (``/v1/retrieve``, ``/v1/memories/search``, MCP
+``recall``, hook-driven retrieve) embed the query text on every call, and
+hook-driven agents repeat the same prompt constantly. ``CachedEmbedder``
+sits in front of an :class:`~lore.embed.base.Embedder` and returns the
+stored vector for a text it has already embedded, skipping ONNX inference.
+
+Keys are ``(model_id, normalized text)``. Normalisation only collapses
+whitespace runs — the tokenizers split on whitespace, so it never changes
+the token ids and therefore never changes the vector. Texts longer than
+``max_text_len`` (documents rather than queries) bypass the cache so one
+bulk import cannot evict every hot query.
+
+One process-wide cache (``shared_embedding_cache``) is shared by every
+default embedder; it is sized by ``LORE_EMBED_CACHE_SIZE`` (``0`` disables
+caching) and optionally persisted to ``LORE_EMBED_CACHE_PATH`` (``.npz``),
+which is reloaded on start-up and written at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lore.embed.base import Embedder, embed_async
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAXSIZE = 2048
+_DEFAULT_MAX_TEXT_LEN = 2000
+
+_Key = Tuple[str, str]
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors keyed by ``(model_id, text)``."""
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        *,
+        path: Optional[str] = None,
+        max_text_len: int = _DEFAULT_MAX_TEXT_LEN,
+    ) -> None:
+        self.maxsize = maxsize
+        self.path = path
+        self.max_text_len = max_text_len
+        self._entries: "OrderedDict[_Key, Tuple[float, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # model_id -> [hits, misses]
+        self._stats: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, model_id: str, text: str) -> Optional[_Key]:
+        if self.maxsize <= 0 or len(text) > self.max_text_len:
+            return None
+        return (model_id, _normalize_text(text))
+
+    def get(self, model_id: str, text: str) -> Optional[List[float]]:
+        """Return the cached vector (and count a hit), or None (and count a miss)."""
+        key = self._key(model_id, text)
+        if key is None:
+            return None
+        with self._lock:
+            stats = self._stats.setdefault(model_id, [0, 0])
+            vec = self._entries.get(key)
+            if vec is None:
+                stats[1] += 1
+                return None
+            self._entries.move_to_end(key)
+            stats[0] += 1
+        return list(vec)
+
+    def put(self, model_id: str, text: str, vec: List[float]) -> None:
+        key = self._key(model_id, text)
+        if key is None or not isinstance(vec, (list, tuple)):
+            return
+        with self._lock:
+            self._entries[key] = tuple(vec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """``{model_id: (hits, misses)}`` since the cache was created."""
+        with self._lock:
+            return {model: (h, m) for model, (h, m) in self._stats.items()}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the entries to ``path`` (``.npz``); grouped per model/dimension."""
+        path = path or self.path
+        if path is None:
+            return
+        with self._lock:
+            items = list(self._entries.items())
+        arrays: Dict[str, np.ndarray] = {}
+        groups: Dict[Tuple[str, int], List[Tuple[str, Tuple[float, ...]]]] = {}
+        for (model_id, text), vec in items:
+            groups.setdefault((model_id, len(vec)), []).append((text, vec))
+        for i, ((model_id, _dim), rows) in enumerate(groups.items()):
+            arrays[f"model_{i}"] = np.array(model_id)
+            arrays[f"texts_{i}"] = np.array([t for t, _ in rows])
+            arrays[f"vecs_{i}"] = np.array([v for _, v in rows], dtype=np.float32)
+        tmp = f"{path}.tmp.npz"
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+
+    def load(self, path: Optional[str] = None) -> int:
+        """Merge entries from ``path``; returns how many were loaded (0 if missing/unreadable)."""
+        path = path or self.path
+        if path is None or not os.path.exists(path):
+            return 0
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                loaded = 0
+                i = 0
+                while f"model_{i}" in data:
+                    model_id = str(data[f"model_{i}"])
+                    for text, vec in zip(data[f"texts_{i}"], data[f"vecs_{i}"]):
+                        self.put(model_id, str(text), vec.tolist())
+                        loaded += 1
+                    i += 1
+        except (OSError, ValueError, KeyError):
+            logger.warning("Ignoring unreadable embedding cache at %s", path, exc_info=True)
+            return 0
+        return loaded
+
+
+class CachedEmbedder(Embedder):
+    """An :class:`Embedder` that consults an :class:`EmbeddingCache` first.
+
+    ``model_id`` defaults to the wrapped embedder's ``model_id`` attribute
+    (``LocalEmbedder`` exposes its model name), so two models never share
+    entries.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        cache: Optional[EmbeddingCache] = None,
+        *,
+        model_id: Optional[str] = None,
+    ) -> None:
+        self.embedder = embedder
+        self.cache = cache if cache is not None else shared_embedding_cache()
+        self.model_id = model_id or getattr(embedder, "model_id", type(embedder).__name__)
+
+    def embed(self, text: str) -> List[float]:
+        vec = self.cache.get(self.model_id, text)
+        if vec is not None:
+            return vec
+        vec = self.embedder.embed(text)
+        self.cache.put(self.model_id, text, vec)
+        return vec
+
+    async def aembed(self, text: str) -> List[float]:
+        vec = self.cache.get(self.model_id, text)
+        if vec is not None:
+            return vec
+        vec = await embed_async(self.embedder, text)
+        self.cache.put(self.model_id, text, vec)
+        return vec
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        results: List[Optional[List[float]]] = [self.cache.get(self.model_id, t) for t in texts]
+        missing = [i for i, v in enumerate(results) if v is None]
+        if missing:
+            vecs = self.embedder.embed_batch([texts[i] for i in missing])
+            for i, vec in zip(missing, vecs):
+                results[i] = vec
+                self.cache.put(self.model_id, texts[i], vec)
+        return results  # type: ignore[return-value]
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        results: List[Optional[List[float]]] = [self.cache.get(self.model_id, t) for t in texts]
+        missing = [i for i, v in enumerate(results) if v is None]
+        if missing:
+            vecs = await self.embedder.aembed_batch([texts[i] for i in missing])
+            for i, vec in zip(missing, vecs):
+                results[i] = vec
+                self.cache.put(self.model_id, texts[i], vec)
+        return results  # type: ignore[return-value]
+
+
+_shared: Optional[EmbeddingCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_cache() -> EmbeddingCache:
+    """The process-wide cache, configured from the environment on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            try:
+                maxsize = int(os.environ.get("LORE_EMBED_CACHE_SIZE", _DEFAULT_MAXSIZE))
+            except ValueError:
+                maxsize = _DEFAULT_MAXSIZE
+            path = os.environ.get("LORE_EMBED_CACHE_PATH") or None
+            _shared = EmbeddingCache(maxsize, path=path)
+            if path is not None and maxsize > 0:
+                _shared.load()
+                atexit.register(_save_shared)
+        return _shared
+
+
+def _save_shared() -> None:
+    if _shared is not None:
+        try:
+            _shared.save()
+        except OSError:
+            logger.warning("Failed to persist embedding cache to %s", _shared.path, exc_info=True)
@@ -20,6 +20,25 @@ _MODEL_DIR = os.path.join(os.path.expanduser("~"), ".lore", "models")
 
 _EMBEDDING_DIM = 384
 
+# Longest input (in tokens) the model sees; longer texts are truncated.
+_MAX_SEQ_LEN = 256
+# Texts per ONNX run. ``embed_batch`` sorts its inputs by token count and
+# runs them in chunks of this size, so each chunk is padded only to its own
+# longest member.
+_DEFAULT_BATCH_SIZE = 32
+
+
+def _env_int(name: str) -> Optional[int]:
+    """A positive int from the environment, or None when unset/invalid."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
 
 # ---------------------------------------------------------------------------
 # Model registry — each entry describes how to download one ONNX model
@@ -153,6 +172,13 @@ class LocalEmbedder(Embedder):
 
     Downloads the model on first use and caches it to ``~/.lore/models/``.
 
+    Inputs are padded dynamically: ``embed_batch`` tokenizes without padding,
+    sorts the texts into length buckets of ``batch_size`` and pads each bucket
+    only to its longest member, so a short query no longer pays for 256
+    tokens of attention. Results come back in input order and match
+    fixed-length padding (padding positions are masked out of both the
+    attention and the mean pooling).
+
     Parameters
     ----------
     model_dir:
@@ -160,17 +186,52 @@ class LocalEmbedder(Embedder):
     model_spec:
         A ``_ModelSpec`` describing which model to use.  Defaults to
         :data:`PROSE_MODEL` (``all-MiniLM-L6-v2``).
+    intra_op_threads, inter_op_threads:
+        onnxruntime thread pools. Default to ``LORE_EMBED_INTRA_OP_THREADS``
+        / ``LORE_EMBED_INTER_OP_THREADS``, else onnxruntime's own defaults
+        (one intra-op thread per physical core).
+    batch_size:
+        Texts per ONNX run (``LORE_EMBED_BATCH_SIZE``, default 32).
     """
 
     def __init__(
         self,
         model_dir: Optional[str] = None,
         model_spec: _ModelSpec = PROSE_MODEL,
+        *,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         self._model_dir = model_dir
         self._model_spec = model_spec
+        self._intra_op_threads = intra_op_threads or _env_int("LORE_EMBED_INTRA_OP_THREADS")
+        self._inter_op_threads = inter_op_threads or _env_int("LORE_EMBED_INTER_OP_THREADS")
+        self._batch_size = (
+            batch_size or _env_int("LORE_EMBED_BATCH_SIZE") or _DEFAULT_BATCH_SIZE
+        )
         self._session = None
         self._tokenizer = None
+        # Resolved once at load instead of per batch.
+        self._pad_id = 0
+        self._wants_token_type_ids = False
+
+    @property
+    def model_id(self) -> str:
+        """Name of the model this embedder runs (cache key namespace)."""
+        return self._model_spec.name
+
+    def _session_options(self, ort):
+        options = ort.SessionOptions()
+        if self._intra_op_threads:
+            options.intra_op_num_threads = self._intra_op_threads
+        if self._inter_op_threads:
+            options.inter_op_num_threads = self._inter_op_threads
+            if self._inter_op_threads > 1:
+                # Inter-op threads only run independent graph branches in
+                # parallel mode.
+                options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+        return options
 
     def _load(self) -> None:
         """Lazy-load model and tokenizer."""
@@ -182,16 +243,25 @@ class LocalEmbedder(Embedder):
 
         model_path = _ensure_model(self._model_spec, self._model_dir)
 
-        self._session = ort.InferenceSession(
+        session = ort.InferenceSession(
             os.path.join(model_path, "model.onnx"),
+            sess_options=self._session_options(ort),
             providers=["CPUExecutionProvider"],
         )
-        self._tokenizer = Tokenizer.from_file(
+        tokenizer = Tokenizer.from_file(
             os.path.join(model_path, "tokenizer.json")
         )
-        # Max sequence length
-        self._tokenizer.enable_truncation(max_length=256)
-        self._tokenizer.enable_padding(length=256)
+        # Max sequence length; padding is applied per bucket in embed_batch.
+        tokenizer.enable_truncation(max_length=_MAX_SEQ_LEN)
+        tokenizer.no_padding()
+        pad_id = tokenizer.token_to_id("[PAD]")
+        self._pad_id = pad_id if pad_id is not None else 0
+        # Only feed token_type_ids if the model accepts it.
+        self._wants_token_type_ids = any(
+            inp.name == "token_type_ids" for inp in session.get_inputs()
+        )
+        self._tokenizer = tokenizer
+        self._session = session
 
     def embed(self, text: str) -> List[float]:
         """Embed a single text string."""
@@ -207,20 +277,37 @@ class LocalEmbedder(Embedder):
         assert self._session is not None
 
         encodings = self._tokenizer.encode_batch(texts)
-        input_ids = np.array(
-            [e.ids for e in encodings], dtype=np.int64
+        lengths = np.fromiter(
+            (len(e.ids) for e in encodings), dtype=np.int64, count=len(encodings)
         )
-        attention_mask = np.array(
-            [e.attention_mask for e in encodings], dtype=np.int64
-        )
-
-        # Build inputs dict — only include token_type_ids if model accepts it
+        # Stable sort keeps equal-length texts in input order.
+        order = np.argsort(lengths, kind="stable")
+        result: Optional[np.ndarray] = None
+        for start in range(0, len(order), self._batch_size):
+            bucket = order[start:start + self._batch_size]
+            width = max(int(lengths[bucket].max()), 1)
+            input_ids = np.full((len(bucket), width), self._pad_id, dtype=np.int64)
+            attention_mask = np.zeros((len(bucket), width), dtype=np.int64)
+            for row, idx in enumerate(bucket):
+                n = int(lengths[idx])
+                input_ids[row, :n] = encodings[idx].ids
+                attention_mask[row, :n] = 1
+            vectors = self._run(input_ids, attention_mask)
+            if result is None:
+                result = np.empty((len(texts), vectors.shape[1]), dtype=vectors.dtype)
+            result[bucket] = vectors
+
+        assert result is not None
+        return result.tolist()
+
+    def _run(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """One ONNX pass → L2-normalised mean-pooled vectors."""
+        assert self._session is not None
         inputs: dict = {
             "input_ids": input_ids,
             "attention_mask": attention_mask,
         }
-        input_names = {inp.name for inp in self._session.get_inputs()}
-        if "token_type_ids" in input_names:
+        if self._wants_token_type_ids:
             inputs["token_type_ids"] = np.zeros_like(input_ids)
 
         outputs = self._session.run(None, inputs)
@@ -228,9 +315,7 @@ class LocalEmbedder(Embedder):
         # outputs[0] is token embeddings: (batch, seq_len, hidden_dim)
         token_embeddings = outputs[0]
         pooled = _mean_pooling(token_embeddings, attention_mask)
-        normalized = _normalize(pooled)
-
-        return [vec.tolist() for vec in normalized]
+        return _normalize(pooled)
 
 
 def make_code_embedder(
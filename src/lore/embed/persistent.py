@@ -0,0 +1,285 @@
+"""Persistent content-hash embedding cache for write paths.
+
+Writes re-embed text whose vector is often already known: ingestion dedup
+embeds the content and ``remember`` embeds the same string again, export →
+import and ``reindex`` re-embed unchanged memories, conversation extraction
+recalls a candidate before remembering it. ``PersistentCachedEmbedder`` puts
+a table in front of an :class:`~lore.embed.base.Embedder` so a
+``(model_id, sha256(text))`` that has been embedded once is never inferred
+again — across processes and restarts — which turns reindex / import of
+unchanged content into I/O instead of ONNX work.
+
+The table is opt-in: it lives in the SQLite file named by
+``LORE_EMBED_STORE_PATH`` (e.g. ``~/.lore/embeddings.db``), shared by every
+process on the host, and is off while that is unset. It holds at most
+``LORE_EMBED_STORE_MAX_ROWS`` vectors (default 100k, roughly 150 MB of
+384-dim vectors; ``0`` = unbounded): each row carries the time it was last
+stored or served, and once the table outgrows the cap the least recently
+used rows are evicted. Keys hash the exact text, without the query LRU's
+whitespace normalisation: for long-lived stored vectors, exact-text hashing
+is the conservative choice and matches the stored content byte for byte.
+Only write paths go through it — queries stay in the
+in-process LRU so the table grows with stored content, not with search
+traffic.
+
+Storage failures are logged and degrade to plain inference; they never fail
+a write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lore.embed.base import Embedder, embed_async, embed_batch_async
+
+logger = logging.getLogger(__name__)
+
+_DISABLED = {"", "off", "none", "false", "0"}
+_DEFAULT_MAX_ROWS = 100_000
+# Eviction trims to this share of the cap, so it runs once per ~10% growth
+# rather than on every write past the limit.
+_EVICT_TO = 0.9
+# Host-parameter budget per ``IN (...)`` lookup.
+_LOOKUP_CHUNK = 500
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model_id     TEXT NOT NULL,
+    content_hash BLOB NOT NULL,
+    embedding    BLOB NOT NULL,
+    last_used    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (model_id, content_hash)
+) WITHOUT ROWID
+"""
+_LAST_USED_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used "
+    "ON embedding_cache (last_used)"
+)
+
+
+def content_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingStore:
+    """``(model_id, content hash) → float32 vector`` table in a SQLite file.
+
+    Opened lazily on first use; thread-safe. Holds at most ``max_rows``
+    vectors (``0`` = unbounded), evicting the least recently used.
+    """
+
+    def __init__(self, path: str, *, max_rows: int = _DEFAULT_MAX_ROWS) -> None:
+        self.path = os.path.expanduser(path)
+        self.max_rows = max(0, max_rows)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._failed = False
+        # Rows in the table as last counted plus this process's inserts since
+        # (other processes share the file, so it is recounted before evicting).
+        self._rows = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._failed:
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_DDL)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(embedding_cache)")}
+                if "last_used" not in columns:  # file written before the row cap
+                    conn.execute(
+                        "ALTER TABLE embedding_cache ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0"
+                    )
+                conn.execute(_LAST_USED_INDEX)
+                conn.commit()
+                self._rows = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                logger.warning("Embedding store at %s unavailable; embedding without it",
+                               self.path, exc_info=True)
+                self._failed = True
+        return self._conn
+
+    def get_many(self, model_id: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Stored vectors for ``texts`` (``None`` where absent), in order."""
+        hashes = [content_hash(t) for t in texts]
+        found: Dict[bytes, bytes] = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return [None] * len(texts)
+            unique = list(dict.fromkeys(hashes))
+            try:
+                for start in range(0, len(unique), _LOOKUP_CHUNK):
+                    chunk = unique[start:start + _LOOKUP_CHUNK]
+                    rows = conn.execute(
+                        "SELECT content_hash, embedding FROM embedding_cache "
+                        f"WHERE model_id = ? AND content_hash IN ({','.join('?' * len(chunk))})",
+                        (model_id, *chunk),
+                    ).fetchall()
+                    found.update(rows)
+                if found and self.max_rows:
+                    self._touch(conn, model_id, list(found))
+            except sqlite3.Error:
+                logger.warning("Embedding store lookup failed", exc_info=True)
+                return [None] * len(texts)
+        return [
+            np.frombuffer(found[h], dtype=np.float32).tolist() if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(self, model_id: str, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        if not items:
+            return
+        now = int(time.time())
+        rows = [
+            (model_id, content_hash(text), np.asarray(vec, dtype=np.float32).tobytes(), now)
+            for text, vec in items
+        ]
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embedding_cache "
+                        "(model_id, content_hash, embedding, last_used) VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                self._rows += len(rows)
+                if self.max_rows and self._rows > self.max_rows:
+                    self._evict(conn)
+            except sqlite3.Error:
+                logger.warning("Embedding store write failed", exc_info=True)
+
+    def _touch(self, conn: sqlite3.Connection, model_id: str, hashes: List[bytes]) -> None:
+        """Mark served rows as used now. Caller holds the lock."""
+        now = int(time.time())
+        with conn:
+            for start in range(0, len(hashes), _LOOKUP_CHUNK):
+                chunk = hashes[start:start + _LOOKUP_CHUNK]
+                conn.execute(
+                    "UPDATE embedding_cache SET last_used = ? "
+                    f"WHERE model_id = ? AND content_hash IN ({','.join('?' * len(chunk))}) "
+                    "AND last_used < ?",
+                    (now, model_id, *chunk, now),
+                )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used rows down to ``_EVICT_TO`` of the cap. Caller holds the lock."""
+        self._rows = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        if self._rows <= self.max_rows:
+            return
+        excess = self._rows - int(self.max_rows * _EVICT_TO)
+        with conn:
+            conn.execute(
+                "DELETE FROM embedding_cache WHERE (model_id, content_hash) IN ("
+                "SELECT model_id, content_hash FROM embedding_cache "
+                "ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+        self._rows -= excess
+
+    def count(self, model_id: Optional[str] = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            if model_id is None:
+                return conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            return conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache WHERE model_id = ?", (model_id,),
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class PersistentCachedEmbedder(Embedder):
+    """An :class:`Embedder` that consults an :class:`EmbeddingStore` first.
+
+    ``model_id`` defaults to the wrapped embedder's ``model_id`` (which
+    ``CachedEmbedder`` and ``BatchingEmbedder`` pass through from
+    ``LocalEmbedder``), so switching models never serves stale vectors.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        store: EmbeddingStore,
+        *,
+        model_id: Optional[str] = None,
+    ) -> None:
+        self.embedder = embedder
+        self.store = store
+        self.model_id = model_id or getattr(embedder, "model_id", type(embedder).__name__)
+
+    def embed(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        results = self.store.get_many(self.model_id, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, results) if v is None))
+        if missing:
+            fresh = dict(zip(missing, self.embedder.embed_batch(missing)))
+            self.store.put_many(self.model_id, list(fresh.items()))
+            results = [v if v is not None else fresh[t] for t, v in zip(texts, results)]
+        return results  # type: ignore[return-value]
+
+    async def aembed(self, text: str) -> List[float]:
+        vec = (await asyncio.to_thread(self.store.get_many, self.model_id, [text]))[0]
+        if vec is not None:
+            return vec
+        vec = await embed_async(self.embedder, text)
+        await asyncio.to_thread(self.store.put_many, self.model_id, [(text, vec)])
+        return vec
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        results = await asyncio.to_thread(self.store.get_many, self.model_id, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, results) if v is None))
+        if missing:
+            fresh = dict(zip(missing, await embed_batch_async(self.embedder, missing)))
+            await asyncio.to_thread(self.store.put_many, self.model_id, list(fresh.items()))
+            results = [v if v is not None else fresh[t] for t, v in zip(texts, results)]
+        return results  # type: ignore[return-value]
+
+
+_shared: Dict[str, EmbeddingStore] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_store() -> Optional[EmbeddingStore]:
+    """The process-wide store for ``LORE_EMBED_STORE_PATH``, or None when unset/disabled."""
+    path = os.environ.get("LORE_EMBED_STORE_PATH", "").strip()
+    if path.lower() in _DISABLED:
+        return None
+    with _shared_lock:
+        store = _shared.get(path)
+        if store is None:
+            try:
+                max_rows = int(os.environ.get("LORE_EMBED_STORE_MAX_ROWS", _DEFAULT_MAX_ROWS))
+            except ValueError:
+                max_rows = _DEFAULT_MAX_ROWS
+            store = _shared[path] = EmbeddingStore(path, max_rows=max_rows)
+        return store
+
+
+def with_embedding_store(embedder: Embedder) -> Embedder:
+    """``embedder`` behind the shared store — or unchanged when it is disabled."""
+    store = shared_embedding_store()
+    return PersistentCachedEmbedder(embedder, store) if store is not None else embedder
@@ -4,14 +4,28 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Dict, List, Literal, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
 
 from lore.embed.base import Embedder
 
 logger = logging.getLogger(__name__)
 
+ContentType = Literal["code", "prose"]
 
-def detect_content_type(text: str) -> Literal["code", "prose"]:
+# Heuristics are compiled once at import; ``detect_content_type`` runs on
+# every write and every batch item.
+_LINE_END_SYNTAX = re.compile(r"[{};()]\s*$", re.MULTILINE)
+_KEYWORD = re.compile(
+    r"\b(def |function |class |import |from |const |let |var |return |if |elif |else:)"
+)
+_OPERATOR = re.compile(r"=>|->|::|\.\.")
+_METHOD_CALL = re.compile(r"\w+\.\w+\(")
+_INDENTED_LINE = re.compile(r"^(?:  |\t)", re.MULTILINE)
+
+
+def detect_content_type(text: str) -> ContentType:
     """Classify text as code or prose using lightweight heuristics.
 
     Returns ``"code"`` when the text looks like source code, otherwise
@@ -19,42 +33,57 @@ def detect_content_type(text: str) -> Literal["code", "prose"]:
     """
     indicators = 0
 
-    # Syntax characters at end of lines: { } ; ( )
-    if re.search(r"[{};()]\s*$", text, re.MULTILINE):
+    # Fenced code blocks
+    if "```" in text:
         indicators += 2
 
-    # Language keywords
-    kw_matches = re.findall(
-        r"\b(def |function |class |import |from |const |let |var |return |if |elif |else:)",
-        text,
-    )
-    if kw_matches:
+    # Syntax characters at end of lines: { } ; ( )
+    if _LINE_END_SYNTAX.search(text):
         indicators += 2
-    if len(kw_matches) >= 3:
-        indicators += 1  # multiple keywords → strong code signal
+
+    # Language keywords; three or more is a strong code signal.
+    keywords = 0
+    for _ in _KEYWORD.finditer(text):
+        keywords += 1
+        if keywords == 3:
+            break
+    if keywords:
+        indicators += 3 if keywords >= 3 else 2
+
+    if indicators >= 3:
+        return "code"
 
     # Operator patterns common in code
-    if re.search(r"(=>|->|::|\.\.)", text):
+    if _OPERATOR.search(text):
         indicators += 1
 
     # Indentation-heavy (proxy for code blocks)
-    lines = text.split("\n")
-    if len(lines) > 1:
-        indented = sum(1 for ln in lines if ln.startswith("  ") or ln.startswith("\t"))
-        if indented / len(lines) > 0.4:
+    line_count = text.count("\n") + 1
+    if line_count > 1:
+        indented = len(_INDENTED_LINE.findall(text))
+        if indented / line_count > 0.4:
             indicators += 1
 
-    # Fenced code blocks
-    if re.search(r"```", text):
-        indicators += 2
-
     # Camel/snake identifiers like myFunc or my_func chained with dots
-    if re.search(r"\w+\.\w+\(", text):
+    if _METHOD_CALL.search(text):
         indicators += 1
 
     return "code" if indicators >= 3 else "prose"
 
 
+def detect_content_types(texts: Sequence[str]) -> List[ContentType]:
+    """:func:`detect_content_type` for each of *texts*, in order."""
+    detect = detect_content_type
+    return [detect(t) for t in texts]
+
+
+def _innermost(embedder: Embedder) -> Embedder:
+    """The model under any cache/batching wrappers (they expose ``.embedder``)."""
+    while isinstance(getattr(embedder, "embedder", None), Embedder):
+        embedder = embedder.embedder  # type: ignore[attr-defined]
+    return embedder
+
+
 class EmbeddingRouter(Embedder):
     """Routes content to a prose or code embedder based on heuristics.
 
@@ -62,7 +91,16 @@ class EmbeddingRouter(Embedder):
     drop-in replacement throughout the Lore SDK.
 
     When only a prose embedder is available (code model download failed),
-    falls back to prose for all content.
+    falls back to prose for all content.  A code embedder that wraps the
+    same model as the prose one counts as that fallback too, so each text
+    is embedded once.
+
+    Work that needs both models — :meth:`embed_query_dual` and mixed
+    :meth:`embed_batch` calls — runs the code model on a dedicated helper
+    thread while the prose model runs on the caller's, so a dual query costs
+    roughly one model's latency rather than two.  (ONNX Runtime releases the
+    GIL during inference.)  The helper never submits further work, so it
+    cannot deadlock when the caller is itself an executor thread.
     """
 
     def __init__(
@@ -72,60 +110,94 @@ class EmbeddingRouter(Embedder):
     ) -> None:
         self._prose = prose_embedder
         self._code = code_embedder or prose_embedder
-        self._last_embed_model: str = "prose"
+        self._single_model = _innermost(self._code) is _innermost(self._prose)
+        self._local = threading.local()
+        self._helper: Optional[ThreadPoolExecutor] = None
+        self._helper_lock = threading.Lock()
 
     @property
     def last_embed_model(self) -> str:
-        """The model tag (``"prose"`` or ``"code"``) used by the last
-        :meth:`embed` call.  Useful for storing in memory metadata."""
-        return self._last_embed_model
+        """The model tag used by this thread's last :meth:`embed` call.
+
+        Kept for compatibility; prefer :meth:`embed_with_model`, which
+        returns the tag with the vector.
+        """
+        return getattr(self._local, "last_embed_model", "prose")
+
+    def _embedder_for(self, ctype: ContentType) -> Embedder:
+        return self._code if ctype == "code" else self._prose
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._helper_lock:
+            if self._helper is None:
+                self._helper = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="lore-embed-router",
+                )
+            return self._helper
 
     # --- Embedder protocol ---------------------------------------------------
 
+    def embed_with_model(self, text: str) -> Tuple[List[float], ContentType]:
+        """Embed *text* with the matching model; ``(vector, model tag)``."""
+        ctype = detect_content_type(text)
+        self._local.last_embed_model = ctype
+        return self._embedder_for(ctype).embed(text), ctype
+
     def embed(self, text: str) -> List[float]:
         """Embed *text*, routing to the appropriate model."""
-        ctype = detect_content_type(text)
-        self._last_embed_model = ctype
-        if ctype == "code":
-            return self._code.embed(text)
-        return self._prose.embed(text)
+        return self.embed_with_model(text)[0]
 
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Embed multiple texts, grouping by detected content type."""
+    def embed_batch_with_models(
+        self, texts: List[str],
+    ) -> Tuple[List[List[float]], List[ContentType]]:
+        """Embed *texts* in one batch per model; ``(vectors, model tags)``.
+
+        When both models have work, the two batches run concurrently.
+        """
         if not texts:
-            return []
-
-        # Classify each text
-        types: List[Literal["code", "prose"]] = [
-            detect_content_type(t) for t in texts
-        ]
-
-        # Gather indices per type
-        groups: Dict[str, List[Tuple[int, str]]] = {"prose": [], "code": []}
-        for i, (t, ctype) in enumerate(zip(texts, types)):
-            groups[ctype].append((i, t))
-
-        results: List[List[float] | None] = [None] * len(texts)  # type: ignore[assignment]
-
-        for ctype, items in groups.items():
-            if not items:
-                continue
-            indices, batch_texts = zip(*items)
-            embedder = self._code if ctype == "code" else self._prose
-            vecs = embedder.embed_batch(list(batch_texts))
+            return [], []
+
+        types = detect_content_types(texts)
+        code_idx = [i for i, ctype in enumerate(types) if ctype == "code"]
+        prose_idx = [i for i, ctype in enumerate(types) if ctype == "prose"]
+        if not code_idx or not prose_idx or self._single_model:
+            embedder = self._code if code_idx and not prose_idx else self._prose
+            return embedder.embed_batch(list(texts)), types
+
+        code_future = self._executor().submit(
+            self._code.embed_batch, [texts[i] for i in code_idx],
+        )
+        prose_vecs = self._prose.embed_batch([texts[i] for i in prose_idx])
+        code_vecs = code_future.result()
+
+        results: List[List[float]] = [None] * len(texts)  # type: ignore[list-item]
+        for indices, vecs in ((prose_idx, prose_vecs), (code_idx, code_vecs)):
             for idx, vec in zip(indices, vecs):
                 results[idx] = vec
+        return results, types
 
-        return results  # type: ignore[return-value]
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed multiple texts, grouping by detected content type."""
+        return self.embed_batch_with_models(texts)[0]
 
     # --- Dual query helpers ---------------------------------------------------
 
     def embed_query_dual(self, query: str) -> Dict[str, List[float]]:
-        """Embed *query* with **both** models.
+        """Embed *query* with **both** models, concurrently.
 
         Returns ``{"prose": [...], "code": [...]}``.  Used at search time
         so each memory can be compared against the model that embedded it.
         """
+        if self._single_model:
+            vec = self._prose.embed(query)
+            return {"prose": vec, "code": vec}
+        code_future = self._executor().submit(self._code.embed, query)
         prose_vec = self._prose.embed(query)
-        code_vec = self._code.embed(query)
-        return {"prose": prose_vec, "code": code_vec}
+        return {"prose": prose_vec, "code": code_future.result()}
+
+    def close(self) -> None:
+        """Stop the helper thread (it is restarted on next use)."""
+        with self._helper_lock:
+            helper, self._helper = self._helper, None
+        if helper is not None:
+            helper.shutdown(wait=True)
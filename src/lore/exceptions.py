@@ -26,3 +26,19 @@ class SecretBlockedError(Exception):
             f"Blocked: content contains a secret ({finding_type} detected). "
             "Remove the secret and retry."
         )
+
+
+class DuplicateSourceMessageError(Exception):
+    """Raised when ``(source, source_message_id)`` is already stored.
+
+    The ingest key is unique across the org, so the existing memory may be in
+    a project the caller cannot see.
+    """
+
+    def __init__(self, source: str, source_message_id: str) -> None:
+        self.source = source
+        self.source_message_id = source_message_id
+        super().__init__(
+            f"Memory for source={source!r} message {source_message_id!r} "
+            "already exists"
+        )
@@ -207,9 +207,11 @@ class Importer:
                 try:
                     mem = self._store.get(mid)
                     if mem and mem.embedding is None:
+                        # Same text remember()/reindex() embed, so the
+                        # persistent embedding store serves unchanged content.
                         embed_text = mem.content
                         if mem.context:
-                            embed_text = f"{mem.content}\n{mem.context}"
+                            embed_text = f"{mem.content} {mem.context}"
                         vec = self._embedder.embed(embed_text)
                         import struct
                         mem.embedding = struct.pack(f"{len(vec)}f", *vec)
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from lore.ingest.adapters.base import NormalizedMessage
     from lore.store.base import Store
-    from lore.types import Memory
 
 
 @dataclass
@@ -17,6 +16,9 @@ class DedupResult:
     duplicate_of: Optional[str] = None
     similarity: float = 0.0
     strategy: str = ""  # "exact_id" | "content_similarity"
+    # The content's vector when the similarity check computed one; the
+    # pipeline stores it instead of embedding the same text again.
+    embedding: Optional[List[float]] = None
 
 
 class Deduplicator:
@@ -40,13 +42,14 @@ class Deduplicator:
     ) -> DedupResult:
         """Check if content is a near-duplicate of an existing memory.
 
-        Strategy 1: Exact source message ID match.
+        Strategy 1: Exact source message ID match — an indexed lookup of the
+        ``(org, adapter, source_message_id)`` key, so it holds at any age.
         Strategy 2: Content embedding similarity.
         """
         # Strategy 1: Exact source message ID
         if normalized.source_message_id:
-            existing = self._find_by_source_id(
-                normalized.source_message_id, adapter_name, project
+            existing = self.store.get_by_source_id(
+                adapter_name, normalized.source_message_id
             )
             if existing:
                 return DedupResult(
@@ -74,20 +77,7 @@ class Deduplicator:
                     duplicate_of=result.memory.id,
                     similarity=result.score,
                     strategy="content_similarity",
+                    embedding=embedding,
                 )
 
-        return DedupResult(is_duplicate=False)
-
-    def _find_by_source_id(
-        self, source_message_id: str, adapter_name: str, project: Optional[str]
-    ) -> Optional["Memory"]:
-        """Search for existing memory with matching source_info.source_message_id."""
-        candidates = self.store.list(project=project, limit=100)
-        for mem in candidates:
-            si = (mem.metadata or {}).get("source_info", {})
-            if (
-                si.get("source_message_id") == source_message_id
-                and si.get("adapter") == adapter_name
-            ):
-                return mem
-        return None
+        return DedupResult(is_duplicate=False, embedding=embedding)
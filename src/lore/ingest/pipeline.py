@@ -7,8 +7,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from lore.exceptions import DuplicateSourceMessageError
 from lore.ingest.adapters.base import NormalizedMessage, SourceAdapter
-from lore.ingest.dedup import Deduplicator
+from lore.ingest.dedup import Deduplicator, DedupResult
 
 logger = logging.getLogger(__name__)
 
@@ -63,31 +64,11 @@ class IngestionPipeline:
             return IngestResult(status="failed", error="Content is empty after normalization")
 
         # Stage 3: Dedup
+        dedup: Optional[DedupResult] = None
         if mode != "allow":
             dedup = self.deduplicator.check(normalized, adapter.adapter_name, project)
             if dedup.is_duplicate:
-                if mode == "reject":
-                    return IngestResult(
-                        status="duplicate_rejected",
-                        duplicate_of=dedup.duplicate_of,
-                        similarity=dedup.similarity,
-                        dedup_strategy=dedup.strategy,
-                    )
-                elif mode == "skip":
-                    return IngestResult(
-                        status="duplicate_skipped",
-                        duplicate_of=dedup.duplicate_of,
-                        similarity=dedup.similarity,
-                        dedup_strategy=dedup.strategy,
-                    )
-                elif mode == "merge":
-                    self._merge_source_info(dedup.duplicate_of, normalized, adapter.adapter_name)
-                    return IngestResult(
-                        status="duplicate_merged",
-                        duplicate_of=dedup.duplicate_of,
-                        similarity=dedup.similarity,
-                        dedup_strategy=dedup.strategy,
-                    )
+                return self._duplicate_result(mode, dedup, normalized, adapter.adapter_name)
 
         # Stage 4: Build source_info metadata
         source_info = self._build_source_info(normalized, adapter.adapter_name)
@@ -99,6 +80,10 @@ class IngestionPipeline:
         if extra_tags:
             tags.extend(extra_tags)
 
+        # The (source, source_message_id) key is unique in the store, so a
+        # concurrent worker that stored the same message first makes this
+        # insert fail; "allow" keeps the duplicate by leaving the key unset.
+        source_message_id = normalized.source_message_id if mode != "allow" else None
         try:
             memory_id = self.lore.remember(
                 content=normalized.content,
@@ -108,8 +93,22 @@ class IngestionPipeline:
                 metadata=metadata,
                 source=adapter.adapter_name,
                 project=project,
+                source_message_id=source_message_id or None,
+                # The similarity check already embedded this text.
+                embedding=dedup.embedding if dedup is not None else None,
             )
+        except DuplicateSourceMessageError:
+            # The key is unique across the org, so the holder may sit in a
+            # project the exact-id check cannot see; it is still a duplicate.
+            dedup = self.deduplicator.check(normalized, adapter.adapter_name, project)
+            if not (dedup.is_duplicate and dedup.strategy == "exact_id"):
+                dedup = DedupResult(is_duplicate=True, similarity=1.0, strategy="exact_id")
+            return self._duplicate_result(mode, dedup, normalized, adapter.adapter_name)
         except Exception as e:
+            if source_message_id:
+                dedup = self.deduplicator.check(normalized, adapter.adapter_name, project)
+                if dedup.is_duplicate and dedup.strategy == "exact_id":
+                    return self._duplicate_result(mode, dedup, normalized, adapter.adapter_name)
             logger.error("Ingestion storage failed: %s", e, exc_info=True)
             return IngestResult(status="failed", error=str(e))
 
@@ -141,6 +140,28 @@ class IngestionPipeline:
             results.append(result)
         return results
 
+    def _duplicate_result(
+        self,
+        mode: str,
+        dedup: DedupResult,
+        normalized: NormalizedMessage,
+        adapter_name: str,
+    ) -> IngestResult:
+        if mode == "merge" and dedup.duplicate_of is not None:
+            self._merge_source_info(dedup.duplicate_of, normalized, adapter_name)
+            status = "duplicate_merged"
+        elif mode in ("merge", "skip"):
+            # Nothing visible to merge into: keep the existing memory as is.
+            status = "duplicate_skipped"
+        else:
+            status = "duplicate_rejected"
+        return IngestResult(
+            status=status,
+            duplicate_of=dedup.duplicate_of,
+            similarity=dedup.similarity,
+            dedup_strategy=dedup.strategy,
+        )
+
     def _build_source_info(self, normalized: NormalizedMessage, adapter_name: str) -> dict:
         return {
             "adapter": adapter_name,
@@ -83,7 +83,8 @@ class IngestionQueue:
                     item.adapter_name,
                     **adapter_secrets.get(item.adapter_name, {}),
                 )
-                result = pipeline.ingest(
+                result = await asyncio.to_thread(
+                    pipeline.ingest,
                     adapter=adapter,
                     payload=item.payload,
                     project=item.project,
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import os
 import struct
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from ulid import ULID
@@ -18,14 +20,17 @@ from lore.classify.rules import RuleBasedClassifier
 from lore.consolidation import ConsolidationResult
 from lore.decay import decay_factor, resolve_half_life
 from lore.embed.base import Embedder
+from lore.embed.cache import CachedEmbedder
 from lore.embed.local import LocalEmbedder, make_code_embedder
-from lore.embed.router import EmbeddingRouter
+from lore.embed.persistent import with_embedding_store
+from lore.embed.router import EmbeddingRouter, detect_content_type
 from lore.exceptions import MemoryNotFoundError
 from lore.recent import group_memories_by_project
 from lore.redact.pipeline import RedactionPipeline
 from lore.redact.write import redact_for_write
 from lore.store.base import Store
 from lore.store.http import HttpStore
+from lore.store.vector_index import VectorIndex
 from lore.types import (
     DECAY_HALF_LIVES,
     TIER_DEFAULT_TTL,
@@ -72,12 +77,6 @@ def _serialize_embedding(vec: List[float]) -> bytes:
     return struct.pack(f"{len(vec)}f", *vec)
 
 
-def _deserialize_embedding(data: bytes) -> np.ndarray:
-    """Deserialize bytes to numpy array (float32)."""
-    count = len(data) // 4
-    return np.array(struct.unpack(f"{count}f", data), dtype=np.float32)
-
-
 def _memory_decay(memory, half_life_days: float, *, now=None) -> float:
     """Recency decay multiplier for a memory.
 
@@ -162,8 +161,16 @@ class Lore:
         graph_co_occurrence_weight: float = 0.3,
         consolidation_config: Optional[Dict[str, Any]] = None,
         consolidation_schedule: Optional[str] = None,
+        consolidation_min_eligible: Optional[int] = None,
+        vector_index_path: Optional[str] = None,
     ) -> None:
         self.project = project
+        # In-memory vector index for _recall_local (built lazily, kept in
+        # sync by remember/forget/update, re-synced from the store when its
+        # write generation moves). ``vector_index_path`` persists it as
+        # ``<path>.npy`` and re-opens it memory-mapped on the next start.
+        self._vector_index_path = vector_index_path
+        self._vector_index: Optional[VectorIndex] = None
         self._tier_weights = tier_recall_weights or dict(TIER_RECALL_WEIGHT)
         self._half_life_days = decay_half_life_days
         self._half_lives: Dict[str, float] = {**DECAY_HALF_LIVES}
@@ -222,16 +229,30 @@ class Lore:
 
         # Resolve embedder: explicit embedder > embedding_fn > default local
         self._dual_embedding = dual_embedding
+        # Write paths (remember, reindex, import, dedup, consolidation) go
+        # through the persistent content-hash store on top of the query
+        # embedder; only for embedders built here, whose model id is known.
+        self._write_embedder: Optional[Embedder] = None
         if embedder is not None:
             self._embedder = embedder
         elif embedding_fn is not None:
             self._embedder = _FnEmbedder(embedding_fn)
         elif dual_embedding:
-            prose = LocalEmbedder()
-            code = make_code_embedder(fallback=prose)
+            prose = CachedEmbedder(LocalEmbedder())
+            code_model = make_code_embedder(fallback=prose.embedder)
+            # A failed code-model load hands back the prose model: route both
+            # through the same wrappers so the router embeds each text once.
+            code = prose if code_model is prose.embedder else CachedEmbedder(code_model)
             self._embedder = EmbeddingRouter(prose_embedder=prose, code_embedder=code)
+            write_prose = with_embedding_store(prose)
+            self._write_embedder = EmbeddingRouter(
+                prose_embedder=write_prose,
+                code_embedder=write_prose if code is prose else with_embedding_store(code),
+            )
         else:
-            self._embedder = LocalEmbedder()
+            self._embedder = CachedEmbedder(LocalEmbedder())
+            self._write_embedder = with_embedding_store(self._embedder)
+        self._write_embedder_base = self._embedder
 
         # Classification setup
         self._classifier: Optional[Classifier] = None
@@ -339,9 +360,10 @@ class Lore:
 
         self._consolidation_engine = ConsolidationEngine(
             store=self._store,
-            embedder=self._embedder,
+            embedder=self._embedder_for_write(),
             llm_provider=consolidation_llm,
             config=consolidation_config,
+            vector_index=self._synced_vector_index,
         )
 
         # Scheduled consolidation (optional)
@@ -350,6 +372,7 @@ class Lore:
             self._consolidation_scheduler = ConsolidationScheduler(
                 engine=self._consolidation_engine,
                 interval=consolidation_schedule,
+                min_eligible=consolidation_min_eligible,
             )
 
         # Temporal recall engine (on-this-day)
@@ -357,8 +380,21 @@ class Lore:
 
         self._temporal_engine = OnThisDayEngine(store=self._store, log=logger)
 
+    def _embedder_for_write(self) -> Embedder:
+        """Embedder for embed-on-write paths.
+
+        The persistent-store wrapper when it was built for the current
+        ``_embedder``; if ``_embedder`` has since been replaced, that
+        replacement is used as-is.
+        """
+        if self._write_embedder is not None and self._embedder is self._write_embedder_base:
+            return self._write_embedder
+        return self._embedder
+
     def close(self) -> None:
         """Close underlying store if it supports closing."""
+        if self._vector_index is not None:
+            self._vector_index.flush()
         if hasattr(self._store, "close"):
             self._store.close()  # type: ignore[attr-defined]
 
@@ -385,6 +421,8 @@ class Lore:
         project: Optional[str] = None,
         ttl: Optional[int] = None,
         scope: Optional[str] = None,
+        source_message_id: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
     ) -> str:
         """Store a memory. Returns the memory ID (ULID).
 
@@ -393,6 +431,14 @@ class Lore:
         universal types (lesson/preference/pattern/convention) become
         'global', everything else stays 'project'. Pass ``scope='project'``
         or ``scope='global'`` to override.
+
+        ``source_message_id`` (ingestion) is the upstream message id of the
+        adapter named by ``source``; the server rejects a second memory with
+        the same pair.
+
+        ``embedding`` is a vector the caller already computed for ``content``
+        with this client's write embedder (ingestion's dedup check); it is
+        used unless redaction changed the text or ``context`` is set.
         """
         if tier not in VALID_TIERS:
             raise ValueError(
@@ -410,6 +456,7 @@ class Lore:
         # write path via redact_for_write). This Lore SDK keeps its own
         # redactor, which blocks secrets by default; the helper just applies it
         # and surfaces the redaction tag.
+        original_content = content
         if self._redactor is not None:
             content, context, _redaction_meta = redact_for_write(
                 self._redactor, content, context
@@ -419,15 +466,19 @@ class Lore:
 
         # Compute embedding
         embed_text = f"{content} {context}" if context else content
-        embedding_vec = self._embedder.embed(embed_text)
+        embedder = self._embedder_for_write()
+        if embedding is not None and embed_text == original_content:
+            embedding_vec = list(embedding)
+            if isinstance(embedder, EmbeddingRouter):
+                metadata = {**(metadata or {}), "embed_model": detect_content_type(embed_text)}
+        elif isinstance(embedder, EmbeddingRouter):
+            # Track which embedding model was used
+            embedding_vec, embed_model = embedder.embed_with_model(embed_text)
+            metadata = {**(metadata or {}), "embed_model": embed_model}
+        else:
+            embedding_vec = embedder.embed(embed_text)
         embedding_bytes = _serialize_embedding(embedding_vec)
 
-        # Track which embedding model was used
-        if isinstance(self._embedder, EmbeddingRouter):
-            meta = dict(metadata) if metadata else {}
-            meta["embed_model"] = self._embedder.last_embed_model
-            metadata = meta
-
         # Classification (after redaction, before save)
         if self._classifier:
             try:
@@ -487,8 +538,12 @@ class Lore:
             ttl=effective_ttl,
             expires_at=expires_at,
             scope=scope,
+            source_message_id=source_message_id,
         )
-        self._store.save(memory)
+        with self._indexed_writes() as index:
+            self._store.save(memory)
+            if index is not None:
+                index.upsert(memory.id, embedding_bytes, memory)
 
         # Fact extraction (after save, so memory exists for FK)
         extracted_facts = []
@@ -931,75 +986,32 @@ class Lore:
         """Client-side semantic search for local stores."""
         now = datetime.now(timezone.utc)
 
-        # Get all candidates (scope to project if set, optionally by type/tier)
-        all_memories = self._store.list(project=self.project, type=type, tier=tier)
-
-        # Filter expired memories
-        all_memories = [
-            m for m in all_memories
-            if m.expires_at is None
-            or datetime.fromisoformat(m.expires_at) > now
-        ]
-
-        # Filter by user_id if specified
-        if user_id is not None:
-            all_memories = [
-                m for m in all_memories
-                if (m.metadata or {}).get("user_id") == user_id
-            ]
-
-        # Temporal filter (F3)
+        # Candidates come from the vector index's filter columns (project,
+        # type/tier, expiry, owner, time window, tags) rather than a
+        # Store.list of the corpus; memories without embeddings are never
+        # indexed. The index re-reads the store only after foreign writes.
+        index = self._synced_vector_index(len(query_vec))
         t_from, t_to = temporal_range
-        if t_from is not None or t_to is not None:
-            filtered: List[Memory] = []
-            for m in all_memories:
-                if not m.created_at:
-                    continue
-                created = datetime.fromisoformat(m.created_at)
-                if created.tzinfo is None:
-                    created = created.replace(tzinfo=timezone.utc)
-                if t_from is not None and created < t_from:
-                    continue
-                if t_to is not None and created > t_to:
-                    continue
-                filtered.append(m)
-            all_memories = filtered
-
-        # Filter by tags
-        if tags:
-            tag_set = set(tags)
-            all_memories = [
-                m for m in all_memories
-                if tag_set.issubset(set(m.tags))
-            ]
-
-        # Filter out memories without embeddings
-        candidates = [m for m in all_memories if m.embedding]
-        if not candidates:
+        rows = index.select(
+            now=now.timestamp(),
+            project=self.project,
+            type=type,
+            tier=tier,
+            user_id=user_id,
+            created_from=t_from.timestamp() if t_from is not None else None,
+            created_to=t_to.timestamp() if t_to is not None else None,
+            tags=tags,
+        )
+        if not rows.size:
             return []
 
-        # Pre-compute normalised query vectors
-        query_arr = np.array(query_vec, dtype=np.float32)
-        query_norm = query_arr / max(float(np.linalg.norm(query_arr)), 1e-9)
-
-        code_query_norm: Optional[np.ndarray] = None
+        # Cosine similarity: one matrix-vector product over contiguous
+        # float32 rows instead of unpacking every blob.
+        cosine = index.cosine(query_vec, rows)
         if query_vecs and "code" in query_vecs:
-            code_arr = np.array(query_vecs["code"], dtype=np.float32)
-            code_query_norm = code_arr / max(float(np.linalg.norm(code_arr)), 1e-9)
-
-        # Vectorized cosine similarity
-        embeddings = np.array(
-            [_deserialize_embedding(m.embedding) for m in candidates],  # type: ignore[arg-type]
-            dtype=np.float32,
-        )
-        emb_norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        emb_norms = np.clip(emb_norms, 1e-9, None)
-        embeddings_normed = embeddings / emb_norms
-
-        cosine_prose = embeddings_normed @ query_norm
-        cosine_code: Optional[np.ndarray] = None
-        if code_query_norm is not None:
-            cosine_code = embeddings_normed @ code_query_norm
+            # Pick cosine score matching the model that embedded each memory
+            cosine_code = index.cosine(query_vecs["code"], rows)
+            cosine = np.where(index.is_code(rows), cosine_code, cosine)
 
         # Graph context for boost (only if graph_depth > 0 and graph enabled)
         graph_context: Optional[GraphContext] = None
@@ -1013,21 +1025,34 @@ class Lore:
                     depth=graph_depth,
                 )
 
+        # How many post-filter results can reach the returned page. Without a
+        # graph boost (the only multiplier > 1 besides tier weight) a memory's
+        # final score is bounded by max(cosine, 0) * max_tier_weight, so once
+        # that bound drops below the ``needed``-th best score seen, no later
+        # candidate can make the page and scoring stops early.
+        needed: Optional[int] = None
+        if graph_context is None:
+            needed = offset + limit
+            if any([topic, sentiment, entity, category]):
+                needed *= 3
+        max_tier_weight = max([1.0, *self._tier_weights.values()])
+        has_cls_filter = bool(intent or domain or emotion)
+
         # Multiplicative scoring: cosine_similarity * time_decay * tier_weight * graph_boost.
         # Per-memory importance was dropped in 025_drop_quality_score_columns; ranking now
         # depends purely on (a) semantic similarity, (b) recency decay against tier-typed
         # half-life, (c) tier weight, (d) optional graph proximity boost.
-        results: List[RecallResult] = []
-        for i, memory in enumerate(candidates):
-            # Pick cosine score matching the model that embedded this memory
-            if cosine_code is not None:
-                embed_model = (memory.metadata or {}).get("embed_model", "prose")
-                cosine_score = float(
-                    cosine_code[i] if embed_model == "code" else cosine_prose[i]
-                )
-            else:
-                cosine_score = float(cosine_prose[i])
-
+        scored: List[RecallResult] = []
+        kept: List[float] = []  # min-heap of the best ``needed`` qualifying scores
+        for i in _iter_descending(cosine, block=max(4 * (needed or 0), 256)):
+            cosine_score = float(cosine[i])
+            if (
+                needed is not None
+                and len(kept) >= needed
+                and max(cosine_score, 0.0) * max_tier_weight < kept[0]
+            ):
+                break
+            memory = index.memory(int(rows[i]))
             half_life = resolve_half_life(
                 memory.tier,
                 memory.type,
@@ -1037,7 +1062,19 @@ class Lore:
             tier_weight = self._tier_weights.get(memory.tier, 1.0)
             graph_boost = self._compute_graph_boost(memory.id, graph_context) if graph_context else 1.0
             final_score = cosine_score * decay * tier_weight * graph_boost
-            results.append(RecallResult(memory=memory, score=final_score))
+            scored.append(RecallResult(memory=memory, score=final_score))
+            if (
+                needed is not None
+                and final_score >= min_score
+                and not (has_cls_filter and not self._matches_classification(memory, intent, domain, emotion))
+            ):
+                if len(kept) < needed:
+                    heapq.heappush(kept, final_score)
+                elif final_score > kept[0]:
+                    heapq.heapreplace(kept, final_score)
+        # Newest first, so equal scores tie-break as in Store.list order
+        scored.sort(key=lambda r: r.memory.created_at, reverse=True)
+        results = scored
 
         # Add graph-discovered memories not in vector results
         if graph_context and graph_context.entities:
@@ -1051,9 +1088,7 @@ class Lore:
                 mem = self._store.get(mid)
                 if mem and mem.embedding:
                     # Compute a basic score for graph-discovered memories
-                    mem_vec = _deserialize_embedding(mem.embedding)
-                    mem_norm = mem_vec / max(float(np.linalg.norm(mem_vec)), 1e-9)
-                    cosine_score = float(query_norm @ mem_norm)
+                    cosine_score = float(index.cosine(query_vec, index.rows_for([mem]))[0])
                     half_life = resolve_half_life(mem.tier, mem.type, overrides=self._decay_config)
                     decay = _memory_decay(mem, half_life, now=now)
                     tier_weight = self._tier_weights.get(mem.tier, 1.0)
@@ -1090,14 +1125,58 @@ class Lore:
 
         # Access tracking: update returned memories
         access_now = _utc_now_iso()
-        for r in top_results:
-            memory = r.memory
-            memory.access_count += 1
-            memory.last_accessed_at = access_now
-            self._store.update(memory)
+        with self._indexed_writes() as index:
+            for r in top_results:
+                memory = r.memory
+                memory.access_count += 1
+                memory.last_accessed_at = access_now
+                self._store.update(memory)
+                if index is not None:
+                    index.refresh(memory)
 
         return top_results
 
+    def _get_vector_index(self, dim: int) -> VectorIndex:
+        """Return the recall vector index, (re)creating it for ``dim``-wide vectors."""
+        index = self._vector_index
+        if index is None or index.dim != dim:
+            if self._vector_index_path:
+                index = VectorIndex.load(self._vector_index_path, dim)
+            else:
+                index = VectorIndex(dim)
+            self._vector_index = index
+        return index
+
+    def _synced_vector_index(self, dim: int) -> VectorIndex:
+        """The recall index, re-synced from the store if a write bypassed it.
+
+        A store that reports no write generation is re-read on every call.
+        """
+        index = self._get_vector_index(dim)
+        generation = self._store.write_generation()
+        if generation is None or index.generation != generation:
+            memories = [m for m in self._store.list(include_archived=True) if m.embedding]
+            for memory in memories:
+                index.sync(memory.id, memory.embedding, memory)
+            index.retain(m.id for m in memories)
+            index.generation = generation
+        return index
+
+    @contextmanager
+    def _indexed_writes(self) -> Iterator[Optional[VectorIndex]]:
+        """Make memory writes whose index rows the block maintains itself.
+
+        Yields the recall index (None if not built yet); the block upserts,
+        refreshes or removes the rows it writes. If the index was in step
+        with the store before, it is stamped with the store's new write
+        generation after, so recall doesn't re-read the corpus for them.
+        """
+        index = self._vector_index
+        before = self._store.write_generation() if index is not None else None
+        yield index
+        if index is not None and before is not None and index.generation == before:
+            index.generation = self._store.write_generation()
+
     def classify(self, text: str) -> Classification:
         """Classify text by intent, domain, and emotion.
 
@@ -1168,12 +1247,28 @@ class Lore:
 
     def forget(self, memory_id: str) -> bool:
         """Delete a memory by ID. Returns True if it existed."""
+        return self._forget_many([memory_id]) == 1
+
+    def _forget_many(self, memory_ids: List[str]) -> int:
+        """Delete ``memory_ids`` with their graph data and vector-index entries.
+
+        One graph cascade and one ``Store.delete_many`` call for the whole
+        set. Returns how many memories existed.
+        """
+        if not memory_ids:
+            return 0
         if getattr(self, '_knowledge_graph_enabled', False):
             try:
-                self._cascade_graph_on_forget(memory_id)
+                self._cascade_graph_on_forget(memory_ids)
             except Exception:
-                logger.warning("Graph cascade failed for forget(%s)", memory_id, exc_info=True)
-        return self._store.delete(memory_id)
+                logger.warning(
+                    "Graph cascade failed for forget(%d memories)", len(memory_ids), exc_info=True,
+                )
+        with self._indexed_writes() as index:
+            if index is not None:
+                for memory_id in memory_ids:
+                    index.remove(memory_id)
+            return self._store.delete_many(memory_ids)
 
     def get(self, memory_id: str) -> Optional[Memory]:
         """Get a memory by ID."""
@@ -1398,10 +1493,17 @@ class Lore:
         tier: Optional[str] = None,
         strategy: str = "all",
         dry_run: bool = True,
+        full: bool = False,
     ) -> "ConsolidationResult":
-        """Run the consolidation pipeline."""
+        """Run the consolidation pipeline.
+
+        Incremental after the first run; ``full=True`` regroups every
+        candidate. The watermarks are kept in memory, so the first run in
+        a new process compares every candidate again.
+        """
         return await self._consolidation_engine.consolidate(
             project=project, tier=tier, strategy=strategy, dry_run=dry_run,
+            full=full,
         )
 
     def get_consolidation_log(
@@ -1422,7 +1524,10 @@ class Lore:
             raise MemoryNotFoundError(memory_id)
         memory.upvotes += 1
         memory.updated_at = _utc_now_iso()
-        self._store.update(memory)
+        with self._indexed_writes() as index:
+            self._store.update(memory)
+            if index is not None:
+                index.refresh(memory)
 
     def downvote(self, memory_id: str) -> None:
         """Increment downvotes for a memory."""
@@ -1434,7 +1539,10 @@ class Lore:
             raise MemoryNotFoundError(memory_id)
         memory.downvotes += 1
         memory.updated_at = _utc_now_iso()
-        self._store.update(memory)
+        with self._indexed_writes() as index:
+            self._store.update(memory)
+            if index is not None:
+                index.refresh(memory)
 
     def _matches_enrichment_filters(
         self,
@@ -1505,7 +1613,10 @@ class Lore:
                 if memory.metadata is None:
                     memory.metadata = {}
                 memory.metadata["enrichment"] = enrichment_data
-                self._store.update(memory)
+                with self._indexed_writes() as index:
+                    self._store.update(memory)
+                    if index is not None:
+                        index.refresh(memory)
                 results["enriched"] += 1
             except Exception as e:
                 results["failed"] += 1
@@ -1534,6 +1645,7 @@ class Lore:
         all_memories = self._store.list()
         total = len(all_memories)
         updated = 0
+        embedder = self._embedder_for_write()
 
         for idx, memory in enumerate(all_memories):
             embed_text = (
@@ -1541,13 +1653,13 @@ class Lore:
                 if memory.context
                 else memory.content
             )
-            new_vec = self._embedder.embed(embed_text)
-            new_bytes = _serialize_embedding(new_vec)
-
             # Determine embed_model tag
             new_model: Optional[str] = None
-            if isinstance(self._embedder, EmbeddingRouter):
-                new_model = self._embedder.last_embed_model
+            if isinstance(embedder, EmbeddingRouter):
+                new_vec, new_model = embedder.embed_with_model(embed_text)
+            else:
+                new_vec = embedder.embed(embed_text)
+            new_bytes = _serialize_embedding(new_vec)
 
             old_model = (memory.metadata or {}).get("embed_model")
             embedding_changed = memory.embedding != new_bytes
@@ -1565,7 +1677,10 @@ class Lore:
                     meta["embed_model"] = new_model
                     memory.metadata = meta
                 memory.updated_at = _utc_now_iso()
-                self._store.update(memory)
+                with self._indexed_writes() as index:
+                    self._store.update(memory)
+                    if index is not None:
+                        index.upsert(memory.id, new_bytes, memory)
 
             updated += 1
             if progress_fn:
@@ -1584,13 +1699,16 @@ class Lore:
         count = 0
 
         # Phase 1: TTL/expiry cleanup
-        count += self._store.cleanup_expired()
+        expired = self._store.cleanup_expired()
+        count += expired
+        if expired and self._vector_index is not None:
+            self._vector_index.retain(m.id for m in self._store.list(include_archived=True))
 
         # Phase 2: decay-based cleanup. Memories whose recency-decay
         # multiplier falls below ``threshold`` (computed against the
         # tier-typed half-life) are pruned. Replaces the prior
         # importance-based cleanup; the importance_score column is gone.
-        all_memories = self._store.list(limit=10000)
+        all_memories = self._store.list()
         to_delete = []
         for memory in all_memories:
             half_life = resolve_half_life(
@@ -1602,10 +1720,7 @@ class Lore:
             if decay < threshold:
                 to_delete.append(memory.id)
 
-        for memory_id in to_delete:
-            self._store.delete(memory_id)
-            count += 1
-
+        count += self._forget_many(to_delete)
         return count
 
     def _maybe_cleanup_expired(self) -> None:
@@ -1681,24 +1796,25 @@ class Lore:
         boost = 1.0 + (overlap_ratio * graph_context.relevance_score * 0.5)
         return min(boost, 1.5)
 
-    def _cascade_graph_on_forget(self, memory_id: str) -> None:
-        """Clean up graph data when a memory is forgotten."""
-        mentions = self._store.get_entity_mentions_for_memory(memory_id)
+    def _cascade_graph_on_forget(self, memory_ids: List[str]) -> None:
+        """Clean up graph data when memories are forgotten."""
+        mentions = self._store.list_all_entity_mentions(memory_ids)
+        dropped: Dict[str, int] = {}
         for mention in mentions:
-            entity = self._store.get_entity(mention.entity_id)
+            dropped[mention.entity_id] = dropped.get(mention.entity_id, 0) + 1
+        now = datetime.now(timezone.utc).isoformat()
+        for entity_id, n in dropped.items():
+            entity = self._store.get_entity(entity_id)
             if entity:
-                entity.mention_count -= 1
+                entity.mention_count -= n
                 if entity.mention_count <= 0:
                     self._store.delete_entity(entity.id)
                 else:
-                    entity.updated_at = datetime.now(timezone.utc).isoformat()
+                    entity.updated_at = now
                     self._store.update_entity(entity)
 
-        # Delete relationships sourced from this memory
-        rels = self._store.list_relationships(limit=10000)
-        for rel in rels:
-            if rel.source_memory_id == memory_id:
-                self._store.delete_relationship(rel.id)
+        # Delete relationships sourced from these memories
+        self._store.delete_relationships_for_memories(memory_ids)
 
         if self._entity_cache:
             self._entity_cache.invalidate()
@@ -1894,7 +2010,7 @@ class Lore:
     ) -> "ImportResult":
         from lore.export.importer import Importer
 
-        embedder = None if skip_embeddings else self._embedder
+        embedder = None if skip_embeddings else self._embedder_for_write()
         redaction_pipeline = self._redaction_pipeline if redact else None
 
         importer = Importer(
@@ -1945,6 +2061,27 @@ class Lore:
         recorder.record(memory_id, feedback, actor_id)
 
 
+def _iter_descending(scores: np.ndarray, block: int):
+    """Yield indices of ``scores`` in descending order, one partitioned block at a time.
+
+    Avoids a full O(n log n) sort when the caller stops after the first few
+    hundred entries; each subsequent block doubles in size.
+    """
+    remaining = np.arange(len(scores))
+    while remaining.size:
+        take = min(block, remaining.size)
+        sub = -scores[remaining]
+        if take < remaining.size:
+            part = np.argpartition(sub, take - 1)[:take]
+        else:
+            part = np.arange(remaining.size)
+        yield from remaining[part[np.argsort(sub[part], kind="stable")]].tolist()
+        keep = np.ones(remaining.size, dtype=bool)
+        keep[part] = False
+        remaining = remaining[keep]
+        block *= 2
+
+
 def _utc_now_iso() -> str:
     """Return current UTC time as ISO 8601 string."""
     return datetime.now(timezone.utc).isoformat()
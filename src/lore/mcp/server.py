@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from lore.embed.batching import shared_embedding_service
 from lore.lore import Lore
 
 logger = logging.getLogger(__name__)
@@ -275,6 +276,7 @@ def _get_lore() -> Lore:
             store="remote",
             api_url=os.environ.get("LORE_API_URL"),
             api_key=os.environ.get("LORE_API_KEY"),
+            embedder=shared_embedding_service(),
         )
     elif store_type == "local":
         _enrich_env = os.environ.get("LORE_ENRICHMENT_ENABLED", "").lower()
@@ -299,6 +301,9 @@ def _get_lore() -> Lore:
             api_key=api_key,
             enrichment=enrichment,
             enrichment_model=enrichment_model,
+            # Same service as the embedded server's routes: one model,
+            # one batching queue for the whole process.
+            embedder=shared_embedding_service(),
         )
     else:
         raise ValueError(
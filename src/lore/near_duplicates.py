@@ -0,0 +1,210 @@
+"""Near-duplicate grouping for consolidation over the whole corpus.
+
+Both consolidation paths — the sync ``ConsolidationEngine`` and
+``AsyncLore.consolidate`` — group memories whose embeddings are within a
+cosine threshold, with transitive closure (A~B and B~C put A, B, C in one
+group). They used to compare pairs one at a time: the sync engine only
+within batches of 50 candidates, so duplicates in different batches were
+never found, and the async path in pure Python over up to 100k vectors.
+
+Here the unit-normalised vectors sit in one float32 matrix and each block
+of rows is multiplied against every later row, so the upper triangle of the
+similarity matrix is produced in BLAS-sized pieces and never held whole:
+at most ``block_cells`` similarities are live at a time. Pairs above the
+threshold are merged into components with a vectorised union-find (roots
+hooked onto the smaller index, then pointer-jumped), so dense duplicate
+clusters don't fall back to a Python loop per pair. The same union-find
+closes edges found elsewhere (:func:`groups_from_edges`), e.g. the
+neighbour hits incremental consolidation gets from the vector index.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
+
+Vector = Union[bytes, bytearray, memoryview, Sequence[float], np.ndarray]
+K = TypeVar("K", bound=Hashable)
+
+# Similarities materialised per block (rows x columns). 16M float32 cells is
+# 64 MB; the row count per block shrinks as the corpus grows.
+DEFAULT_BLOCK_CELLS = 16 * 1024 * 1024
+
+
+def _as_array(vector: Optional[Vector]) -> Optional[np.ndarray]:
+    if vector is None:
+        return None
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        if len(vector) == 0 or len(vector) % 4:
+            return None
+        return np.frombuffer(vector, dtype=np.float32)
+    arr = np.asarray(vector, dtype=np.float32)
+    return arr if arr.ndim == 1 and arr.size else None
+
+
+def _normalized_rows(vectors: Sequence[Optional[Vector]]) -> Dict[int, tuple]:
+    """Bucket usable vectors by dimension → ``{dim: (indices, unit matrix)}``.
+
+    ``None``, malformed and zero-norm vectors are dropped. Vectors of
+    different dimensions (e.g. a model switch mid-corpus) are never compared.
+    """
+    buckets: Dict[int, List[tuple]] = defaultdict(list)
+    for i, vector in enumerate(vectors):
+        arr = _as_array(vector)
+        if arr is not None:
+            buckets[arr.shape[0]].append((i, arr))
+
+    out: Dict[int, tuple] = {}
+    for dim, items in buckets.items():
+        matrix = np.empty((len(items), dim), dtype=np.float32)
+        for row, (_, arr) in enumerate(items):
+            matrix[row] = arr
+        norms = np.linalg.norm(matrix, axis=1)
+        keep = norms > 0
+        if not keep.any():
+            continue
+        indices = np.fromiter((i for i, _ in items), dtype=np.int64, count=len(items))[keep]
+        out[dim] = (indices, matrix[keep] / norms[keep][:, None])
+    return out
+
+
+def _roots(labels: np.ndarray) -> np.ndarray:
+    """Pointer-jump ``labels`` in place until every entry names its root."""
+    while True:
+        jumped = labels[labels]
+        if np.array_equal(jumped, labels):
+            return labels
+        labels[:] = jumped
+
+
+def _union(labels: np.ndarray, a: np.ndarray, b: np.ndarray) -> None:
+    """Merge the components of each pair ``(a[k], b[k])``.
+
+    Labels only ever point at a smaller index, so hooking the larger root
+    onto the smaller can't form a cycle.
+    """
+    while a.size:
+        _roots(labels)
+        ra, rb = labels[a], labels[b]
+        differ = ra != rb
+        if not differ.any():
+            return
+        a, b, ra, rb = a[differ], b[differ], ra[differ], rb[differ]
+        np.minimum.at(labels, np.maximum(ra, rb), np.minimum(ra, rb))
+
+
+def near_duplicate_groups(
+    vectors: Sequence[Optional[Vector]],
+    threshold: float,
+    *,
+    queries: Optional[Iterable[int]] = None,
+    block_cells: int = DEFAULT_BLOCK_CELLS,
+) -> List[List[int]]:
+    """Group indices of ``vectors`` whose cosine similarity exceeds ``threshold``.
+
+    ``vectors`` may mix float32 embedding blobs and float sequences; unusable
+    entries are skipped. Returns groups of two or more input indices, each
+    sorted, ordered by their first index — i.e. input order, as the old
+    pairwise loops produced.
+
+    With ``queries`` (input indices), only pairs touching at least one query
+    row are compared: each query block is multiplied against the whole
+    corpus, so the cost is ``len(queries) x len(vectors)`` rather than
+    quadratic. Incremental consolidation passes the memories that are new
+    since its last run; pairs among older rows were settled then.
+    """
+    wanted = None if queries is None else set(queries)
+    groups: List[List[int]] = []
+    for indices, matrix in _normalized_rows(vectors).values():
+        n = matrix.shape[0]
+        labels = np.arange(n, dtype=np.int64)
+        if wanted is None:
+            _union_all_pairs(labels, matrix, threshold, block_cells)
+        else:
+            rows = np.flatnonzero(np.isin(indices, list(wanted)))
+            _union_query_pairs(labels, matrix, rows, threshold, block_cells)
+        _roots(labels)
+        members: Dict[int, List[int]] = defaultdict(list)
+        for index, root in zip(indices.tolist(), labels.tolist()):
+            members[root].append(index)
+        groups.extend(g for g in members.values() if len(g) > 1)
+    groups.sort(key=lambda g: g[0])
+    return groups
+
+
+def groups_from_edges(edges: Iterable[Tuple[K, K]]) -> List[List[K]]:
+    """Connected components of the graph given by ``edges``.
+
+    Keys are any hashables (memory ids, say). Returns components of two or
+    more keys, each in first-seen order, ordered by their first key's
+    appearance; self-edges are ignored.
+    """
+    position: Dict[K, int] = {}
+    a: List[int] = []
+    b: List[int] = []
+    for left, right in edges:
+        if left == right:
+            continue
+        a.append(position.setdefault(left, len(position)))
+        b.append(position.setdefault(right, len(position)))
+    if not a:
+        return []
+    labels = np.arange(len(position), dtype=np.int64)
+    _union(labels, np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+    _roots(labels)
+    members: Dict[int, List[K]] = defaultdict(list)
+    for key, root in zip(position, labels.tolist()):
+        members[root].append(key)
+    return [g for g in members.values() if len(g) > 1]
+
+
+def _union_all_pairs(
+    labels: np.ndarray, matrix: np.ndarray, threshold: float, block_cells: int,
+) -> None:
+    n = matrix.shape[0]
+    step = max(1, block_cells // n)
+    for start in range(0, n, step):
+        stop = min(n, start + step)
+        sims = matrix[start:stop] @ matrix[start:].T
+        # Only pairs (i, j) with j > i: blank the block's own lower triangle.
+        diagonal = sims[:, : stop - start]
+        diagonal[np.tril_indices(stop - start)] = -np.inf
+        rows, cols = np.nonzero(sims > threshold)
+        if rows.size:
+            _union(labels, rows + start, cols + start)
+
+
+def _union_query_pairs(
+    labels: np.ndarray,
+    matrix: np.ndarray,
+    query_rows: np.ndarray,
+    threshold: float,
+    block_cells: int,
+) -> None:
+    n = matrix.shape[0]
+    step = max(1, block_cells // n)
+    for start in range(0, query_rows.size, step):
+        block = query_rows[start:start + step]
+        sims = matrix[block] @ matrix.T
+        sims[np.arange(block.size), block] = -np.inf
+        rows, cols = np.nonzero(sims > threshold)
+        if rows.size:
+            _union(labels, block[rows], cols)
+
+
+def max_pairwise_similarity(vectors: Sequence[Optional[Vector]]) -> float:
+    """Highest cosine similarity between any two comparable ``vectors``.
+
+    Meant for previewing a (small) group; returns 0.0 when fewer than two
+    vectors are usable.
+    """
+    best = 0.0
+    for _, matrix in _normalized_rows(vectors).values():
+        if matrix.shape[0] < 2:
+            continue
+        sims = matrix @ matrix.T
+        upper = sims[np.triu_indices(matrix.shape[0], k=1)]
+        best = max(best, float(upper.max()))
+    return best
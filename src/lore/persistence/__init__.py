@@ -3,6 +3,7 @@
 from lore.persistence.exceptions import (
     BackendUnavailableError,
     ConfigError,
+    DuplicateSourceMessageError,
     IntegrityError,
     LastRootKeyError,
     LoreError,
@@ -85,6 +86,7 @@ __all__ = [
     "ConfigError",
     "DailyStatRow",
     "DenyListRuleData",
+    "DuplicateSourceMessageError",
     "ExportedMemory",
     "GraphStats",
     "IntegrityError",
@@ -12,6 +12,7 @@ called out in the solo-mode design (``StoreCorruption``, ``EmbeddingDimMismatch`
     │   ├── StoreCorruption          (new in 3J)
     │   └── IntegrityError
     │       ├── EmbeddingDimMismatch (new in 3J)
+    │       ├── DuplicateSourceMessageError
     │       └── DanglingVectorError  (new in 3J)
     ├── ConfigError
     │   ├── BackendUnavailableError
@@ -22,6 +23,8 @@ called out in the solo-mode design (``StoreCorruption``, ``EmbeddingDimMismatch`
 
 from __future__ import annotations
 
+from typing import Optional
+
 
 class LoreError(Exception):
     """Base for all Lore errors."""
@@ -81,6 +84,24 @@ class EmbeddingDimMismatch(IntegrityError):  # noqa: N818 — name fixed by Phas
         )
 
 
+class DuplicateSourceMessageError(IntegrityError):
+    """A memory with the same ``(org_id, source, source_message_id)`` exists.
+
+    Raised by ``insert_memory`` / ``insert_memories`` when the ingest key
+    (migration 032) is already taken — e.g. two ingest workers storing the
+    same upstream message. ``get_memory_by_source_id`` finds the winner.
+    """
+
+    def __init__(self, org_id: str, source: Optional[str], source_message_id: str):
+        self.org_id = org_id
+        self.source = source
+        self.source_message_id = source_message_id
+        super().__init__(
+            f"Memory for source={source!r} message {source_message_id!r} "
+            f"already exists in org_id={org_id!r}"
+        )
+
+
 class DanglingVectorError(IntegrityError):
     """A ``memories`` row exists without its companion ``memory_vectors`` row.
 
@@ -2,34 +2,152 @@
 
 from __future__ import annotations
 
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 from lore.persistence.exceptions import ConfigError
 from lore.persistence.protocol import Store
 
+logger = logging.getLogger(__name__)
 
-async def make_store(database_url: str) -> Store:
+
+def _env_number(name: str, default, cast, *, minimum=0):
+    """``name`` parsed with ``cast``; ``default`` when unset, invalid or below ``minimum``."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+    if value < minimum:
+        logger.warning("Ignoring %s=%r (must be >= %s)", name, raw, minimum)
+        return default
+    return value
+
+
+@dataclass(frozen=True)
+class PoolOptions:
+    """Sizing and lifetime knobs for an asyncpg pool.
+
+    Defaults match what the server always used (2–10 connections) and
+    asyncpg's own defaults for the rest.
+    """
+
+    min_size: int = 2
+    max_size: int = 10
+    statement_cache_size: int = 100
+    # Seconds a caller may wait for a free connection; None waits forever.
+    acquire_timeout: Optional[float] = None
+    # Idle connections older than this are closed (0 disables).
+    max_inactive_connection_lifetime: float = 300.0
+
+    @classmethod
+    def from_env(cls) -> "PoolOptions":
+        """Read ``LORE_DB_POOL_*`` / ``LORE_DB_STATEMENT_CACHE_SIZE``."""
+        max_size = _env_number("LORE_DB_POOL_MAX_SIZE", cls.max_size, int, minimum=1)
+        min_size = _env_number("LORE_DB_POOL_MIN_SIZE", cls.min_size, int)
+        if min_size > max_size:
+            logger.warning(
+                "LORE_DB_POOL_MIN_SIZE=%d exceeds max size %d; using %d",
+                min_size, max_size, max_size,
+            )
+            min_size = max_size
+        timeout = _env_number("LORE_DB_POOL_ACQUIRE_TIMEOUT", 0.0, float)
+        return cls(
+            min_size=min_size,
+            max_size=max_size,
+            statement_cache_size=_env_number(
+                "LORE_DB_STATEMENT_CACHE_SIZE", cls.statement_cache_size, int,
+            ),
+            acquire_timeout=timeout or None,
+            max_inactive_connection_lifetime=_env_number(
+                "LORE_DB_POOL_MAX_INACTIVE_LIFETIME",
+                cls.max_inactive_connection_lifetime, float,
+            ),
+        )
+
+    def create_pool_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ``asyncpg.create_pool``.
+
+        ``acquire_timeout`` is not among them: asyncpg takes it per
+        ``acquire()`` call, so callers apply it there.
+        """
+        return {
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "statement_cache_size": self.statement_cache_size,
+            "max_inactive_connection_lifetime": self.max_inactive_connection_lifetime,
+        }
+
+
+async def _init_pg_connection(conn) -> None:
+    """Pool ``init=``: binary pgvector codec when the ``vector`` type exists."""
+    from lore.persistence.postgres import register_vector_codec
+
+    try:
+        await register_vector_codec(conn)
+    except ValueError:
+        # Not migrated yet; has_vector_type() tells the store which
+        # transport the pool's connections use.
+        pass
+
+
+async def create_pg_pool(database_url: str, options: Optional[PoolOptions] = None):
+    """Create an asyncpg pool sized by ``options`` (default: from the environment).
+
+    Each connection registers the binary pgvector codec if the ``vector``
+    type already exists. A pool created before migrations install pgvector
+    should be cycled with ``pool.expire_connections()`` once they have run.
+    """
+    try:
+        import asyncpg
+    except ImportError as e:
+        raise ConfigError(
+            "asyncpg is required for postgres URLs. "
+            "Install with: pip install lore-sdk[server]"
+        ) from e
+    options = options or PoolOptions.from_env()
+    return await asyncpg.create_pool(
+        database_url, init=_init_pg_connection, **options.create_pool_kwargs(),
+    )
+
+
+async def has_vector_type(pool) -> bool:
+    """True when the database behind ``pool`` has the pgvector ``vector`` type."""
+    async with pool.acquire() as conn:
+        return bool(await conn.fetchval("SELECT to_regtype('public.vector') IS NOT NULL"))
+
+
+async def make_store(database_url: str, *, pool=None) -> Store:
     """Build a Store from a database URL.
 
     Supported schemes:
     - postgresql://..., postgres://...    -> PostgresStore (requires lore-sdk[server])
-    - sqlite:///path/to/file.db            -> SqliteStore (Phase 3+; not yet implemented)
+    - sqlite:///path/to/file.db            -> SqliteStore
+
+    For Postgres, ``pool`` reuses an existing pool (built by
+    ``create_pg_pool``) instead of opening a new one; otherwise a pool is
+    sized from ``PoolOptions.from_env()``.
 
     Raises ConfigError on unknown or unsupported schemes.
     """
     scheme = urlparse(database_url).scheme.lower()
     if scheme in ("postgres", "postgresql"):
-        try:
-            import asyncpg
-        except ImportError as e:
-            raise ConfigError(
-                "asyncpg is required for postgres URLs. "
-                "Install with: pip install lore-sdk[server]"
-            ) from e
         from lore.persistence.postgres import PostgresStore
 
-        pool = await asyncpg.create_pool(database_url, min_size=2, max_size=10)
-        return PostgresStore.from_pool(pool)
+        if pool is None:
+            pool = await create_pg_pool(database_url)
+        if not await has_vector_type(pool):
+            # No ``vector`` type yet (pgvector not installed / not migrated):
+            # fall back to the text representation.
+            logger.warning("pgvector type not found; using text vector transport")
+            return PostgresStore.from_pool(pool)
+        return PostgresStore.from_pool(pool, binary_vectors=True)
     if scheme == "sqlite":
         from lore.persistence.sqlite import SqliteStore
 
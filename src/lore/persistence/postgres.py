@@ -7,22 +7,34 @@ existing route SQL until 1B–1G migrate them.
 from __future__ import annotations
 
 import json
+import os
+import struct
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
 try:
     import asyncpg
 except ImportError:  # pragma: no cover
     asyncpg = None  # type: ignore[assignment]
 
+import numpy as np
 from ulid import ULID
 
 from lore.persistence.exceptions import (
     BackendUnavailableError,
+    ConfigError,
+    DuplicateSourceMessageError,
     EmbeddingDimMismatch,
     IntegrityError,
     StoreNotFoundError,
 )
+from lore.persistence.quantization import (
+    env_vector_quantization,
+    normalize_mode,
+    require_backend_mode,
+    rerank_factor,
+)
 from lore.persistence.types import (
     AgentSharingConfigData,
     AuditEventData,
@@ -88,6 +100,132 @@ from lore.persistence.types import (
 # (see migrations/001_initial.sql and lore.embed defaults).
 EMBED_DIM = 384
 
+# ``recall_by_embedding`` ANN candidate over-fetch factor: candidates per
+# requested row handed to the re-scoring stage, so the recency decay can
+# still promote a slightly less similar but fresher memory.
+_RECALL_OVERFETCH = 4
+# pgvector's ``hnsw.ef_search`` default and upper bound.
+_HNSW_DEFAULT_EF_SEARCH = 40
+_HNSW_MAX_EF_SEARCH = 1000
+# Rows per multi-row INSERT in ``insert_memories`` (13 bind parameters per
+# row, well under the wire protocol's 32767).
+_BULK_INSERT_ROWS = 500
+# Memories removed per statement (one implicit transaction each) by
+# ``delete_memories`` / ``expire_memories``.
+_BULK_DELETE_ROWS = 500
+# Relationships extracted from a memory have no FK to it; the deletes below
+# remove them in the same statement (migration 033 indexes the lookup).
+_CASCADE_SOURCED_RELATIONSHIPS = """
+    , sourced AS (
+        DELETE FROM relationships r USING gone g
+        WHERE r.org_id = g.org_id AND r.source_memory_id = g.id
+    )
+"""
+# Migration 032's partial unique index on the ingest key.
+_SOURCE_MESSAGE_INDEX = "idx_memories_source_message"
+
+
+# The float HNSW index recall's candidate scan runs on (migration 029 builds
+# it only on an empty table; ``lore vector-index`` builds it CONCURRENTLY).
+_EMBEDDING_HNSW_INDEX = "idx_memories_embedding_hnsw"
+_EMBEDDING_INDEXES_SQL = """
+SELECT c.relname AS name, am.amname AS method, i.indisvalid AS valid,
+       pg_get_indexdef(i.indexrelid) AS indexdef
+FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+JOIN pg_am am ON am.oid = c.relam
+WHERE i.indrelid = 'memories'::regclass AND am.amname IN ('hnsw', 'ivfflat')
+"""
+
+
+# Opt-in quantized candidate scan (lore.persistence.quantization): the HNSW
+# expression index per mode, its operator class, and the ordering that uses it.
+# pgvector has no int8 vector type, so ``int8`` is rejected rather than
+# silently served from fp16.
+_QUANT_INDEXES = {
+    "binary": (
+        "idx_memories_embedding_bq_hnsw",
+        f"(binary_quantize(embedding)::bit({EMBED_DIM})) bit_hamming_ops",
+    ),
+    "halfvec": (
+        "idx_memories_embedding_hq_hnsw",
+        f"(embedding::halfvec({EMBED_DIM})) halfvec_cosine_ops",
+    ),
+}
+_QUANT_ORDER = {
+    "binary": f"binary_quantize(embedding)::bit({EMBED_DIM}) <~> binary_quantize(${{emb}}::vector)",
+    "halfvec": f"embedding::halfvec({EMBED_DIM}) <=> ${{emb}}::vector::halfvec({EMBED_DIM})",
+}
+# How often a store whose quantized index is not ready yet re-reads
+# ``vector_quantization`` (so a ``lore quantize-vectors`` run is picked up).
+_QUANT_READY_RECHECK_S = 30.0
+
+
+def _env_hnsw_ef_search() -> Optional[int]:
+    """``LORE_HNSW_EF_SEARCH`` as an int, or None when unset/invalid."""
+    raw = os.environ.get("LORE_HNSW_EF_SEARCH", "").strip()
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+_VECTOR_HEADER = struct.Struct("!HH")  # dim, unused
+
+
+def _encode_vector(value: Any) -> bytes:
+    """pgvector binary send format: ``int16 dim, int16 0, float4[dim]`` (big-endian).
+
+    A pgvector text literal (``'[0.1,...]'``) is accepted too so a caller
+    still passing the text form keeps working.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    vec = np.asarray(value, dtype=">f4")
+    return _VECTOR_HEADER.pack(vec.shape[0], 0) + vec.tobytes()
+
+
+def _decode_vector(data: bytes) -> np.ndarray:
+    """pgvector binary receive format -> native float32 ndarray."""
+    dim, _ = _VECTOR_HEADER.unpack_from(data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=_VECTOR_HEADER.size).astype(np.float32)
+
+
+async def register_vector_codec(conn) -> None:
+    """Register the binary pgvector codec on ``conn`` (asyncpg pool ``init=``).
+
+    Without it asyncpg moves ``vector`` values as text: every write and query
+    formats ~4 KB of JSON per 384-dim vector and every read parses it back.
+    Raises ``ValueError`` if the ``vector`` type does not exist (extension not
+    installed yet).
+    """
+    await conn.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=_encode_vector,
+        decoder=_decode_vector,
+        format="binary",
+    )
+
+
+def _embedding_from_row(value: Any) -> Optional[list[float]]:
+    """Normalise a selected ``embedding`` column to a list of floats.
+
+    ndarray when the binary codec is registered; the text literal
+    ``'[0.1,0.2,...]'`` otherwise.
+    """
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, str):
+        stripped = value.strip("[]")
+        return [float(x) for x in stripped.split(",")] if stripped else None
+    return list(value)
+
 
 def _check_embedding_dim(embedding: Optional[Sequence[float]]) -> None:
     """Validate an embedding has the configured ``EMBED_DIM``.
@@ -104,6 +242,11 @@ def _check_embedding_dim(embedding: Optional[Sequence[float]]) -> None:
         raise EmbeddingDimMismatch(EMBED_DIM, n)
 
 
+def _quote_ident(name: str) -> str:
+    """Double-quote a catalog identifier for interpolation into DDL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 def _row_to_stored(row: "asyncpg.Record") -> StoredMemory:
     tags = row["tags"]
     if isinstance(tags, str):
@@ -331,18 +474,7 @@ def _row_to_recommendation_candidate(row: "asyncpg.Record") -> RecommendationCan
         meta = json.loads(meta) if meta else {}
     elif meta is None:
         meta = {}
-    embedding = row["embedding"]
-    # asyncpg returns pgvector as a string '[0.1,0.2,...]' unless a codec is registered.
-    # The recommendation engine accepts whatever shape is passed (the pre-1F route
-    # passed it through unmodified). If it's a string, parse it; if it's already a
-    # list, pass through.
-    if isinstance(embedding, str):
-        # pgvector text format: '[0.1,0.2,...]'
-        stripped = embedding.strip("[]")
-        if stripped:
-            embedding = [float(x) for x in stripped.split(",")]
-        else:
-            embedding = []
+    embedding = _embedding_from_row(row["embedding"])
     return RecommendationCandidate(
         id=row["id"],
         content=row["content"] or "",
@@ -423,13 +555,7 @@ def _row_to_exported_memory(row: "asyncpg.Record") -> ExportedMemory:
     meta = row["meta"]
     if isinstance(meta, str):
         meta = json.loads(meta)
-    embedding = row["embedding"]
-    if isinstance(embedding, str) and embedding:
-        # pgvector text format '[0.1,0.2,...]'
-        stripped = embedding.strip("[]")
-        embedding = [float(x) for x in stripped.split(",")] if stripped else None
-    elif embedding is not None and not isinstance(embedding, str):
-        embedding = list(embedding)
+    embedding = _embedding_from_row(row["embedding"])
     return ExportedMemory(
         id=row["id"],
         org_id=row["org_id"],
@@ -563,7 +689,15 @@ _METRIC_SQL = {
 class PostgresStore:
     """Store implementation backed by Postgres+pgvector."""
 
-    def __init__(self, *, pool=None, conn=None):
+    def __init__(
+        self,
+        *,
+        pool=None,
+        conn=None,
+        hnsw_ef_search: Optional[int] = None,
+        binary_vectors: bool = False,
+        vector_quantization: Optional[str] = None,
+    ):
         if asyncpg is None:
             raise BackendUnavailableError(
                 "asyncpg is not installed. Install with: pip install lore-sdk[server]"
@@ -572,10 +706,32 @@ class PostgresStore:
             raise ValueError("PostgresStore needs exactly one of pool=, conn=")
         self._pool = pool
         self._conn = conn
+        # True when the connections carry ``register_vector_codec``: vector
+        # parameters are then sent as float32 arrays instead of JSON text.
+        self._binary_vectors = binary_vectors
+        # ``hnsw.ef_search`` for recall; None keeps the server default (40).
+        self._hnsw_ef_search = (
+            hnsw_ef_search if hnsw_ef_search is not None else _env_hnsw_ef_search()
+        )
+        # Quantized candidate scan (opt-in); used once ``vector_quantization``
+        # records the mode's index as built.
+        self._quantization = require_backend_mode(
+            normalize_mode(vector_quantization)
+            if vector_quantization is not None else env_vector_quantization(),
+            tuple(_QUANT_INDEXES), "PostgresStore",
+        )
+        self._quant_ready = False
+        self._quant_checked_at = float("-inf")
 
     @classmethod
-    def from_pool(cls, pool) -> "PostgresStore":
-        return cls(pool=pool)
+    def from_pool(cls, pool, *, binary_vectors: bool = False) -> "PostgresStore":
+        return cls(pool=pool, binary_vectors=binary_vectors)
+
+    def _vector_param(self, vec: Sequence[float]) -> Any:
+        """Encode ``vec`` for a ``$n::vector`` parameter on this store's connections."""
+        if self._binary_vectors:
+            return np.asarray(vec, dtype=np.float32)
+        return json.dumps(list(vec))
 
     @classmethod
     def from_connection(cls, conn) -> "PostgresStore":
@@ -602,32 +758,140 @@ class PostgresStore:
     async def insert_memory(self, memory: NewMemory) -> StoredMemory:
         _check_embedding_dim(memory.embedding)
         memory_id = f"mem_{ULID()}"
+        async with self._acquire() as conn:
+            try:
+                row = await conn.fetchrow(
+                    """
+                    INSERT INTO memories
+                        (id, org_id, content, context, tags, source,
+                         project, embedding, expires_at, meta, scope, user_id,
+                         source_message_id)
+                    VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8::vector, $9, $10::jsonb,
+                            $11, $12, $13)
+                    RETURNING id, org_id, content, context, tags, source,
+                              project, created_at, updated_at, expires_at, upvotes,
+                              downvotes, meta, access_count,
+                              last_accessed_at, scope, visibility, user_id
+                    """,
+                    memory_id,
+                    memory.org_id,
+                    memory.content,
+                    memory.context or "",  # context is NOT NULL in the schema; coerce None to ""
+                    json.dumps(list(memory.tags)),
+                    memory.source,
+                    memory.project,
+                    self._vector_param(memory.embedding),
+                    memory.expires_at,
+                    json.dumps(dict(memory.meta)),
+                    memory.scope,
+                    memory.user_id,
+                    memory.source_message_id,
+                )
+            except asyncpg.UniqueViolationError as e:
+                if e.constraint_name == _SOURCE_MESSAGE_INDEX:
+                    raise DuplicateSourceMessageError(
+                        memory.org_id, memory.source, memory.source_message_id or ""
+                    ) from e
+                raise
+        return _row_to_stored(row)
+
+    async def insert_memories(self, memories: Sequence[NewMemory]) -> Sequence[StoredMemory]:
+        """Insert many memories in one transaction, ``_BULK_INSERT_ROWS`` per
+        multi-row ``INSERT … RETURNING``; rows come back in input order."""
+        for memory in memories:
+            _check_embedding_dim(memory.embedding)
+        ids = [f"mem_{ULID()}" for _ in memories]
+        by_id: dict = {}
+        async with self._acquire() as conn:
+            try:
+                await self._insert_memory_chunks(conn, memories, ids, by_id)
+            except asyncpg.UniqueViolationError as e:
+                if e.constraint_name != _SOURCE_MESSAGE_INDEX:
+                    raise
+                taken = await conn.fetchrow(
+                    """
+                    SELECT m.org_id, m.source, m.source_message_id
+                    FROM memories m
+                    JOIN unnest($1::text[], $2::text[], $3::text[]) AS k(org_id, source, smid)
+                      ON m.org_id = k.org_id AND m.source = k.source
+                     AND m.source_message_id = k.smid
+                    LIMIT 1
+                    """,
+                    [m.org_id for m in memories],
+                    [m.source for m in memories],
+                    [m.source_message_id for m in memories],
+                )
+                if taken is None:  # a key repeated within the batch itself
+                    keys = [(m.org_id, m.source, m.source_message_id)
+                            for m in memories if m.source_message_id is not None]
+                    taken = next((k for k in keys if keys.count(k) > 1), keys[0])
+                raise DuplicateSourceMessageError(*taken) from e
+        return [_row_to_stored(by_id[memory_id]) for memory_id in ids]
+
+    async def _insert_memory_chunks(
+        self, conn, memories: Sequence[NewMemory], ids: Sequence[str], by_id: dict,
+    ) -> None:
+        """``insert_memories``' transaction: one multi-row INSERT per chunk."""
+        async with conn.transaction():
+            for start in range(0, len(memories), _BULK_INSERT_ROWS):
+                chunk = memories[start:start + _BULK_INSERT_ROWS]
+                values, params = [], []
+                for memory_id, memory in zip(ids[start:], chunk):
+                    n = len(params)
+                    values.append(
+                        f"(${n + 1}, ${n + 2}, ${n + 3}, ${n + 4}, ${n + 5}::jsonb, ${n + 6}, "
+                        f"${n + 7}, ${n + 8}::vector, ${n + 9}, ${n + 10}::jsonb, ${n + 11}, "
+                        f"${n + 12}, ${n + 13})"
+                    )
+                    params.extend((
+                        memory_id,
+                        memory.org_id,
+                        memory.content,
+                        memory.context or "",
+                        json.dumps(list(memory.tags)),
+                        memory.source,
+                        memory.project,
+                        self._vector_param(memory.embedding),
+                        memory.expires_at,
+                        json.dumps(dict(memory.meta)),
+                        memory.scope,
+                        memory.user_id,
+                        memory.source_message_id,
+                    ))
+                rows = await conn.fetch(
+                    f"""
+                    INSERT INTO memories
+                        (id, org_id, content, context, tags, source,
+                         project, embedding, expires_at, meta, scope, user_id,
+                         source_message_id)
+                    VALUES {", ".join(values)}
+                    RETURNING id, org_id, content, context, tags, source,
+                              project, created_at, updated_at, expires_at, upvotes,
+                              downvotes, meta, access_count,
+                              last_accessed_at, scope, visibility, user_id
+                    """,
+                    *params,
+                )
+                by_id.update((row["id"], row) for row in rows)
+
+    async def get_memory_by_source_id(
+        self, org_id: str, source: str, source_message_id: str
+    ) -> Optional[StoredMemory]:
         async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
-                INSERT INTO memories
-                    (id, org_id, content, context, tags, source,
-                     project, embedding, expires_at, meta, scope, user_id)
-                VALUES ($1, $2, $3, $4, $5::jsonb, $6, $7, $8::vector, $9, $10::jsonb, $11, $12)
-                RETURNING id, org_id, content, context, tags, source,
-                          project, created_at, updated_at, expires_at, upvotes,
-                          downvotes, meta, access_count,
-                          last_accessed_at, scope, visibility, user_id
+                SELECT id, org_id, content, context, tags, source,
+                       project, created_at, updated_at, expires_at, upvotes,
+                       downvotes, meta, access_count,
+                       last_accessed_at, scope, visibility, user_id
+                FROM memories
+                WHERE org_id = $1 AND source = $2 AND source_message_id = $3
                 """,
-                memory_id,
-                memory.org_id,
-                memory.content,
-                memory.context or "",  # context is NOT NULL in the schema; coerce None to ""
-                json.dumps(list(memory.tags)),
-                memory.source,
-                memory.project,
-                json.dumps(list(memory.embedding)),
-                memory.expires_at,
-                json.dumps(dict(memory.meta)),
-                memory.scope,
-                memory.user_id,
+                org_id,
+                source,
+                source_message_id,
             )
-        return _row_to_stored(row)
+        return _row_to_stored(row) if row else None
 
     async def get_memory(
         self, org_id: str, memory_id: str, *, requesting_user_id: Optional[str] = None
@@ -777,17 +1041,42 @@ class PostgresStore:
         self, org_id: str, memory_id: str, *, requesting_user_id: Optional[str] = None
     ) -> bool:
         # Migration 026: a non-owner's private row is not deleted (returns False).
-        params: list = [memory_id, org_id]
-        vis_where: list[str] = []
-        _append_visibility(vis_where, params, requesting_user_id, include_shared=False)
-        vis_clause = (" AND " + " AND ".join(vis_where)) if vis_where else ""
-        async with self._acquire() as conn:
-            result = await conn.execute(
-                f"DELETE FROM memories WHERE id = $1 AND org_id = $2{vis_clause}",
-                *params,
-            )
-        # asyncpg returns "DELETE n"
-        return result.endswith(" 1")
+        deleted = await self.delete_memories(
+            org_id, [memory_id], requesting_user_id=requesting_user_id,
+        )
+        return bool(deleted)
+
+    async def delete_memories(
+        self,
+        org_id: str,
+        memory_ids: Sequence[str],
+        *,
+        requesting_user_id: Optional[str] = None,
+    ) -> list[str]:
+        """Delete ``_BULK_DELETE_ROWS`` memories per statement; returns the ids deleted.
+
+        ``entity_mentions`` / ``memory_supersessions`` cascade by FK; the
+        relationships sourced from the memories go in the same statement.
+        """
+        ids = list(dict.fromkeys(memory_ids))
+        deleted: list[str] = []
+        async with self._acquire() as conn:
+            for start in range(0, len(ids), _BULK_DELETE_ROWS):
+                params: list = [org_id, ids[start:start + _BULK_DELETE_ROWS]]
+                vis_where: list[str] = []
+                _append_visibility(vis_where, params, requesting_user_id, include_shared=False)
+                vis_clause = (" AND " + " AND ".join(vis_where)) if vis_where else ""
+                rows = await conn.fetch(
+                    "WITH gone AS ("
+                    "    DELETE FROM memories WHERE org_id = $1 AND id = ANY($2::text[])"
+                    f"   {vis_clause} RETURNING id, org_id"
+                    ")"
+                    f"{_CASCADE_SOURCED_RELATIONSHIPS}"
+                    "SELECT id FROM gone",
+                    *params,
+                )
+                deleted.extend(r["id"] for r in rows)
+        return deleted
 
     async def list_memories(
         self, filter: "MemoryFilter"
@@ -970,7 +1259,7 @@ class PostgresStore:
         _check_embedding_dim(embedding)
         encoded_tags = json.dumps(list(tags))
         encoded_meta = json.dumps(dict(meta))
-        encoded_embedding = json.dumps(list(embedding)) if embedding is not None else None
+        encoded_embedding = self._vector_param(embedding) if embedding is not None else None
         safe_context = context if context is not None else ""
 
         query = """
@@ -1041,18 +1330,21 @@ class PostgresStore:
             where.append("(expires_at IS NULL OR expires_at > now())")
         where.append("embedding IS NOT NULL")
 
-        sql_params.append(json.dumps(list(params.query_vec)))
+        sql_params.append(self._vector_param(params.query_vec))
         emb_idx = len(sql_params)
-        sql_params.append(params.min_score)
-        score_idx = len(sql_params)
-        sql_params.append(params.limit)
-        limit_idx = len(sql_params)
-
-        sql = f"""
+        sql_params.append(max(params.limit, 1) * _RECALL_OVERFETCH)
+        cand_idx = len(sql_params)
+
+        # Two stages so the HNSW index (migration 029) is usable: the inner
+        # query is a plain ``ORDER BY embedding <=> q LIMIT n`` nearest-
+        # neighbour scan, the outer one applies the recency decay to those
+        # candidates only. Ordering by the decayed score directly forced a
+        # sequential scan over the whole org.
+        sql = """
             SELECT id, org_id, content, context, tags, source, project,
                    created_at, updated_at, expires_at, upvotes, downvotes, meta,
                    access_count, last_accessed_at, scope, visibility, user_id,
-                   (1 - (embedding <=> ${emb_idx}::vector)) *
+                   (1 - distance) *
                    power(0.5,
                        LEAST(
                            EXTRACT(EPOCH FROM (now() - created_at)) / 86400.0,
@@ -1061,16 +1353,68 @@ class PostgresStore:
                                EXTRACT(EPOCH FROM (now() - created_at)) / 86400.0
                            )
                        )
-                       / {params.half_life_days}
-                   ) AS score
-            FROM memories
-            WHERE {' AND '.join(where)}
-              AND (1 - (embedding <=> ${emb_idx}::vector)) >= ${score_idx}
+                       / {half_life}
+                   ) AS score,
+                   1 - distance AS similarity
+            FROM (
+                SELECT id, org_id, content, context, tags, source, project,
+                       created_at, updated_at, expires_at, upvotes, downvotes, meta,
+                       access_count, last_accessed_at, scope, visibility, user_id,
+                       embedding <=> ${emb}::vector AS distance
+                FROM {source}
+                WHERE {where}
+                ORDER BY {order}
+                LIMIT ${cand}
+            ) candidates
             ORDER BY score DESC
-            LIMIT ${limit_idx}
         """
-        async with self._acquire() as conn:
-            rows = await conn.fetch(sql, *sql_params)
+        fmt = dict(
+            half_life=params.half_life_days, where=" AND ".join(where),
+            emb=emb_idx, cand=cand_idx, source="memories",
+        )
+        candidates = sql_params[cand_idx - 1]
+        async with self._acquire() as conn:
+            quantized = await self._quant_search_ready(conn)
+            exact_params = list(sql_params)
+            if quantized:
+                # Extra innermost stage: the quantized index picks
+                # ``rerank_factor`` times as many rows, which the exact
+                # ``embedding <=> q`` distance then re-ranks.
+                sql_params.append(min(candidates * rerank_factor(self._quantization), _HNSW_MAX_EF_SEARCH))
+                candidates = sql_params[-1]
+                quant_sql = sql.format(
+                    order="distance", **{
+                        **fmt,
+                        "source": (
+                            "(SELECT * FROM memories WHERE {where} "
+                            f"ORDER BY {_QUANT_ORDER[self._quantization].format(emb=emb_idx)} "
+                            f"LIMIT ${len(sql_params)}) quantized"
+                        ).format(where=fmt["where"]),
+                        "where": "TRUE",
+                    },
+                )
+            # The index must return at least as many rows as we ask for.
+            ef_search = min(
+                max(self._hnsw_ef_search or _HNSW_DEFAULT_EF_SEARCH, candidates),
+                _HNSW_MAX_EF_SEARCH,
+            )
+            async with conn.transaction():
+                # SET LOCAL: scoped to this transaction, so pooled
+                # connections never leak the setting to other queries.
+                await conn.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+                if quantized:
+                    rows = await conn.fetch(quant_sql, *sql_params)
+                else:
+                    rows = await conn.fetch(sql.format(order="distance", **fmt), *sql_params)
+                # HNSW filters *after* the graph walk, so a selective project /
+                # visibility filter can starve the candidate set. Fall back to
+                # an exact scan; ``distance + 0`` is an ordering the index
+                # cannot serve, which keeps the planner off it.
+                if len(rows) < min(params.limit, exact_params[cand_idx - 1]):
+                    rows = await conn.fetch(sql.format(order="distance + 0", **fmt), *exact_params)
+        # min_score gates raw similarity (not the decayed score); applied
+        # here so the candidate count above is measured before it.
+        rows = [r for r in rows if r["similarity"] >= params.min_score][: params.limit]
         scored: list[ScoredMemory] = []
         for r in rows:
             sm = _row_to_stored(r)
@@ -1099,16 +1443,124 @@ class PostgresStore:
             )
         return scored
 
-    async def expire_memories(self) -> int:
+    async def _quant_search_ready(self, conn) -> bool:
+        """True when the configured mode's quantized index is recorded as built.
+
+        A not-ready answer is re-checked every ``_QUANT_READY_RECHECK_S``.
+        """
+        if self._quantization is None:
+            return False
+        if self._quant_ready:
+            return True
+        now = time.monotonic()
+        if now - self._quant_checked_at < _QUANT_READY_RECHECK_S:
+            return False
+        self._quant_checked_at = now
+        self._quant_ready = bool(await conn.fetchval(
+            "SELECT 1 FROM vector_quantization WHERE mode = $1", self._quantization,
+        ))
+        return self._quant_ready
+
+    async def backfill_quantized_vectors(
+        self, mode: Optional[str] = None, *, batch_size: int = 1000,
+    ) -> int:
+        """Build the quantized HNSW index for ``mode`` and mark it searchable.
+
+        Postgres quantizes through an expression index, so there is nothing
+        to copy (``batch_size`` is accepted for parity with ``SqliteStore``):
+        the index is created ``CONCURRENTLY`` — writes keep flowing, and the
+        statement cannot run inside a transaction — then the mode is recorded
+        in ``vector_quantization``. Returns the number of vectors indexed.
+        """
+        mode = require_backend_mode(
+            normalize_mode(mode) or self._quantization, tuple(_QUANT_INDEXES), "PostgresStore",
+        )
+        if mode is None:
+            raise ConfigError(
+                "backfill_quantized_vectors needs a mode (halfvec or binary); "
+                "pass one or set LORE_VECTOR_QUANTIZATION"
+            )
+        index_name, index_expr = _QUANT_INDEXES[mode]
         async with self._acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM memories WHERE expires_at IS NOT NULL AND expires_at < now()"
+            await conn.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON memories USING hnsw ({index_expr})"
             )
-        # asyncpg "DELETE n"
-        try:
-            return int(result.split()[-1])
-        except (ValueError, IndexError):
-            return 0
+            vectors = await conn.fetchval(
+                "SELECT COUNT(*) FROM memories WHERE embedding IS NOT NULL"
+            )
+            await conn.execute(
+                """
+                INSERT INTO vector_quantization (mode, vectors, completed_at)
+                VALUES ($1, $2, now())
+                ON CONFLICT (mode) DO UPDATE
+                    SET vectors = EXCLUDED.vectors, completed_at = EXCLUDED.completed_at
+                """,
+                mode,
+                int(vectors or 0),
+            )
+        self._quantization = mode
+        self._quant_ready = True
+        return int(vectors or 0)
+
+    async def build_vector_index(self) -> list[str]:
+        """Create the HNSW cosine index on ``memories.embedding`` without blocking writes.
+
+        Migration 029 only builds it on an empty table, where a plain
+        ``CREATE INDEX`` is instant. Here it is created ``CONCURRENTLY``
+        (an invalid leftover of an interrupted build is dropped first), then
+        IVFFlat indexes on the column are dropped the same way: recall's
+        candidate scan is tuned for HNSW (``hnsw.ef_search``), and keeping
+        both would make every write maintain two vector indexes. Returns the
+        names of the dropped IVFFlat indexes.
+        """
+        async with self._acquire() as conn:
+            rows = await conn.fetch(_EMBEDDING_INDEXES_SQL)
+            hnsw = [
+                r for r in rows
+                if r["method"] == "hnsw" and "(embedding vector_cosine_ops)" in r["indexdef"]
+            ]
+            if not any(r["valid"] for r in hnsw):
+                for r in hnsw:
+                    await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote_ident(r['name'])}")
+                await conn.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_EMBEDDING_HNSW_INDEX} "
+                    "ON memories USING hnsw (embedding vector_cosine_ops)"
+                )
+            dropped = [
+                r["name"] for r in rows
+                if r["method"] == "ivfflat" and "(embedding vector_" in r["indexdef"]
+            ]
+            for name in dropped:
+                await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote_ident(name)}")
+        return dropped
+
+    async def expire_memories(self) -> int:
+        """Delete rows with ``expires_at < now()``, ``_BULK_DELETE_ROWS`` per statement.
+
+        Chunks are picked through ``idx_memories_expires_at`` with ``SKIP
+        LOCKED``, so a concurrent sweep or an in-flight update never blocks
+        this one; sourced relationships are deleted alongside.
+        """
+        total = 0
+        async with self._acquire() as conn:
+            while True:
+                removed = await conn.fetchval(
+                    "WITH victims AS ("
+                    "    SELECT id FROM memories"
+                    "    WHERE expires_at IS NOT NULL AND expires_at < now()"
+                    "    LIMIT $1 FOR UPDATE SKIP LOCKED"
+                    "), gone AS ("
+                    "    DELETE FROM memories m USING victims v WHERE m.id = v.id"
+                    "    RETURNING m.id, m.org_id"
+                    ")"
+                    f"{_CASCADE_SOURCED_RELATIONSHIPS}"
+                    "SELECT count(*) FROM gone",
+                    _BULK_DELETE_ROWS,
+                )
+                total += int(removed or 0)
+                if (removed or 0) < _BULK_DELETE_ROWS:
+                    return total
 
     async def bump_access_counts(self, org_id: str, memory_ids: Sequence[str]) -> None:
         if not memory_ids:
@@ -1290,6 +1742,25 @@ class PostgresStore:
             )
         return _row_to_entity(row) if row else None
 
+    async def get_entities_by_names(
+        self, names: Sequence[str], org_id: str,
+    ) -> Sequence[StoredEntity]:
+        if not names:
+            return []
+        async with self._acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, org_id, name, entity_type, aliases, description, metadata,
+                       mention_count, first_seen_at, last_seen_at,
+                       created_at, updated_at
+                FROM entities
+                WHERE org_id = $1 AND name = ANY($2::text[])
+                """,
+                org_id,
+                list(names),
+            )
+        return [_row_to_entity(r) for r in rows]
+
     async def find_entity_by_name_or_alias(
         self, name: str, org_id: str,
     ) -> Optional[StoredEntity]:
@@ -2718,6 +3189,49 @@ class PostgresStore:
                 event.format,
             )
 
+    async def record_access_batch(
+        self,
+        bumps: Mapping[Tuple[str, str], int],
+        events: Sequence[NewRetrievalEvent],
+    ) -> None:
+        if not bumps and not events:
+            return
+        async with self._acquire() as conn:
+            async with conn.transaction():
+                if bumps:
+                    keys = sorted(bumps)  # stable lock order across flushes
+                    await conn.execute(
+                        """
+                        UPDATE memories m
+                        SET access_count = COALESCE(m.access_count, 0) + b.hits,
+                            last_accessed_at = now()
+                        FROM unnest($1::text[], $2::text[], $3::int[]) AS b(org_id, id, hits)
+                        WHERE m.id = b.id AND m.org_id = b.org_id
+                        """,
+                        [org for org, _ in keys],
+                        [mid for _, mid in keys],
+                        [bumps[k] for k in keys],
+                    )
+                if events:
+                    await conn.executemany(
+                        """
+                        INSERT INTO retrieval_events
+                            (org_id, query, results_count, scores, memory_ids,
+                             avg_score, max_score, min_score_threshold, query_time_ms,
+                             project, format)
+                        VALUES ($1, $2, $3, $4::jsonb, $5::jsonb, $6, $7, $8, $9, $10, $11)
+                        """,
+                        [
+                            (
+                                e.org_id, e.query, e.results_count,
+                                json.dumps(list(e.scores)), json.dumps(list(e.memory_ids)),
+                                e.avg_score, e.max_score, e.min_score_threshold,
+                                e.query_time_ms, e.project, e.format,
+                            )
+                            for e in events
+                        ],
+                    )
+
     async def record_memory_access(
         self, org_id: str, memory_id: str
     ) -> Optional[StoredMemory]:
@@ -4051,6 +4565,36 @@ class PostgresStore:
             )
         return int(row["n"]) if row and row["n"] is not None else 0
 
+    # ── ConsolidationOps ─────────────────────────────────────────────
+
+    async def get_consolidation_watermark(
+        self, org_id: str, project: Optional[str] = None,
+    ) -> "Optional[datetime]":
+        async with self._acquire() as conn:
+            return await conn.fetchval(
+                "SELECT watermark FROM consolidation_watermarks "
+                "WHERE org_id = $1 AND project = $2",
+                org_id,
+                project or "",
+            )
+
+    async def set_consolidation_watermark(
+        self, org_id: str, watermark: datetime, project: Optional[str] = None,
+    ) -> None:
+        async with self._acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO consolidation_watermarks (org_id, project, watermark)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (org_id, project) DO UPDATE SET
+                    watermark = EXCLUDED.watermark,
+                    updated_at = now()
+                """,
+                org_id,
+                project or "",
+                watermark,
+            )
+
     # ── SupersessionOps (Phase 6F) ───────────────────────────────────
 
     async def record_supersession(
@@ -4123,7 +4667,7 @@ class PostgresStore:
     async def are_superseded(
         self,
         memory_ids: "set[str]",
-        org_id: str,
+        org_id: Optional[str] = None,
         *,
         at: Optional[datetime] = None,
     ) -> "set[str]":
@@ -4139,10 +4683,10 @@ class PostgresStore:
                                memory_id, superseded_by
                         FROM memory_supersessions ms
                         WHERE memory_id = ANY($1)
-                          AND EXISTS (
+                          AND ($2::text IS NULL OR EXISTS (
                               SELECT 1 FROM memories m
                               WHERE m.id = ms.memory_id AND m.org_id = $2
-                          )
+                          ))
                         ORDER BY memory_id, ts DESC, id DESC
                     ) latest
                     WHERE superseded_by IS NOT NULL
@@ -4159,10 +4703,10 @@ class PostgresStore:
                         FROM memory_supersessions ms
                         WHERE memory_id = ANY($1)
                           AND ts <= $3
-                          AND EXISTS (
+                          AND ($2::text IS NULL OR EXISTS (
                               SELECT 1 FROM memories m
                               WHERE m.id = ms.memory_id AND m.org_id = $2
-                          )
+                          ))
                         ORDER BY memory_id, ts DESC, id DESC
                     ) latest
                     WHERE superseded_by IS NOT NULL
@@ -9,7 +9,7 @@ SnapshotOps, AnalyticsOps, PolicyOps, AuthOps, etc.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Mapping, Optional, Protocol, Sequence, runtime_checkable
+from typing import Any, Mapping, Optional, Protocol, Sequence, Tuple, runtime_checkable
 
 from lore.persistence.types import (
     AgentSharingConfigData,
@@ -93,6 +93,19 @@ class Store(Protocol):
         """Insert a memory; returns the stored row with server-generated id/timestamps."""
         ...
 
+    async def insert_memories(self, memories: Sequence[NewMemory]) -> Sequence[StoredMemory]:
+        """Insert many memories in a single transaction; returns the stored rows
+        in input order. All-or-nothing: a failure inserts none of them."""
+        ...
+
+    async def get_memory_by_source_id(
+        self, org_id: str, source: str, source_message_id: str
+    ) -> Optional[StoredMemory]:
+        """Return the memory holding the ingest key ``(org_id, source,
+        source_message_id)`` (migration 032), or None. One unique-index lookup,
+        regardless of the memory's age or expiry."""
+        ...
+
     async def get_memory(
         self, org_id: str, memory_id: str, *, requesting_user_id: Optional[str] = None
     ) -> Optional[StoredMemory]:
@@ -131,6 +144,22 @@ class Store(Protocol):
         """
         ...
 
+    async def delete_memories(
+        self,
+        org_id: str,
+        memory_ids: Sequence[str],
+        *,
+        requesting_user_id: Optional[str] = None,
+    ) -> Sequence[str]:
+        """Delete many memories set-wise, in bounded chunks (one transaction per
+        chunk); returns the ids actually deleted.
+
+        Like ``delete_memory``, also removes each memory's vector, entity
+        mentions, supersession rows and the relationships extracted from it.
+        Visibility filtering as in ``delete_memory``.
+        """
+        ...
+
     async def promote_memory(
         self, org_id: str, memory_id: str, *, promoted_by: Optional[str]
     ) -> Optional[StoredMemory]:
@@ -159,7 +188,8 @@ class Store(Protocol):
         ...
 
     async def expire_memories(self) -> int:
-        """Delete rows with expires_at < now(); returns rowcount."""
+        """Delete rows with expires_at < now() (in bounded chunks, cascading as
+        ``delete_memories`` does); returns rowcount."""
         ...
 
     async def bump_access_counts(self, org_id: str, memory_ids: Sequence[str]) -> None:
@@ -262,11 +292,13 @@ class Store(Protocol):
     async def are_superseded(
         self,
         memory_ids: "set[str]",
+        org_id: Optional[str] = None,
         *,
         at: Optional[datetime] = None,
     ) -> "set[str]":
         """Batch helper: return the subset of ``memory_ids`` that are
-        superseded as of ``at`` (default ``now``).
+        superseded as of ``at`` (default ``now``), restricted to memories of
+        ``org_id`` when given.
 
         Used by the hybrid-recall pipeline to score-suppress superseded
         memories in a single round-trip.
@@ -365,6 +397,16 @@ class Store(Protocol):
         """Return an org-scoped entity whose name matches exactly (case-sensitive); services normalize (#83)."""
         ...
 
+    async def get_entities_by_names(
+        self, names: Sequence[str], org_id: str,
+    ) -> Sequence[StoredEntity]:
+        """Batched ``get_entity_by_name``: every org-scoped entity whose name is in ``names``.
+
+        Exact (case-sensitive) match in one query on the ``(org_id, name)``
+        index; misses are simply absent from the result, order unspecified.
+        """
+        ...
+
     async def list_entities(
         self,
         org_id: str,
@@ -816,6 +858,18 @@ class Store(Protocol):
         """Persist a retrieval analytics event row."""
         ...
 
+    async def record_access_batch(
+        self,
+        bumps: Mapping[Tuple[str, str], int],
+        events: Sequence[NewRetrievalEvent],
+    ) -> None:
+        """Apply buffered access tracking in one transaction.
+
+        ``bumps`` maps ``(org_id, memory_id)`` to the number of hits to add
+        to ``access_count`` (``last_accessed_at`` is set to now); ``events``
+        are inserted as retrieval_events rows."""
+        ...
+
     async def record_memory_access(self, org_id: str, memory_id: str) -> Optional[StoredMemory]:
         """Increment access counters and return the updated memory, or None if absent."""
         ...
@@ -1097,3 +1151,21 @@ class Store(Protocol):
         Memories without a ``session_id`` in their meta are ignored.
         """
         ...
+
+    # ── ConsolidationOps ─────────────────────────────────────────────
+
+    async def get_consolidation_watermark(
+        self, org_id: str, project: Optional[str] = None,
+    ) -> Optional[datetime]:
+        """Start of the last clean consolidation run for ``(org, project)``.
+
+        ``project=None`` is the org-wide scope. Returns None before the
+        first run, which makes the caller compare the whole corpus.
+        """
+        ...
+
+    async def set_consolidation_watermark(
+        self, org_id: str, watermark: datetime, project: Optional[str] = None,
+    ) -> None:
+        """Record ``watermark`` for ``(org, project)``, replacing any earlier one."""
+        ...
@@ -0,0 +1,111 @@
+"""Opt-in quantized candidate search for ``recall_by_embedding``.
+
+With ``LORE_VECTOR_QUANTIZATION`` set, both stores run the nearest-neighbour
+candidate scan over a compact copy of the embeddings and re-rank the
+candidates with the exact float32 cosine distance, so only
+``limit × overfetch × rerank_factor`` full vectors are ever read per query:
+
+* ``int8`` — one signed byte per dimension (4× smaller than float32).
+  SQLite only: a ``memory_vectors_q`` vec0 ``INT8`` column (cosine) — note
+  that sqlite-vec scans int8 no faster than float32, so this only saves scan
+  memory. pgvector has no int8 vector type, so Postgres rejects this mode.
+* ``halfvec`` — fp16 per dimension (2× smaller). Postgres only: an HNSW
+  index on ``embedding::halfvec(384)`` (pgvector ≥ 0.7). sqlite-vec has no
+  fp16 column, so SQLite rejects this mode.
+* ``binary`` — one bit per dimension (32× smaller), compared by Hamming
+  distance, and the mode that cuts scan time. SQLite: a vec0 ``BIT``
+  column. Postgres: an HNSW index on ``binary_quantize(embedding)::bit(384)``
+  (pgvector ≥ 0.7).
+
+The quantized index is built by ``lore quantize-vectors``, which records the
+finished mode in the ``vector_quantization`` table (migration 030). A store
+only searches the quantized index once its mode is recorded there, so a
+half-built index never costs recall.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional, Sequence
+
+import numpy as np
+
+from lore.persistence.exceptions import ConfigError
+
+VECTOR_QUANTIZATION_MODES = ("int8", "halfvec", "binary")
+
+# Default quantized candidates fetched per row the float KNN would have
+# returned; binary codes are much coarser, so they need a wider net before
+# re-ranking. ``LORE_VECTOR_RERANK_FACTOR`` overrides both.
+RERANK_FACTOR = {"int8": 2, "halfvec": 2, "binary": 10}
+
+
+def normalize_mode(value: Optional[str]) -> Optional[str]:
+    """Validate a quantization mode; ``None`` / ``""`` / ``"off"`` mean disabled."""
+    if value is None:
+        return None
+    mode = value.strip().lower()
+    if mode in ("", "off", "none", "float"):
+        return None
+    if mode not in VECTOR_QUANTIZATION_MODES:
+        raise ValueError(
+            f"Unknown vector quantization {value!r}; expected one of "
+            f"{', '.join(VECTOR_QUANTIZATION_MODES)} or 'off'"
+        )
+    return mode
+
+
+def env_vector_quantization() -> Optional[str]:
+    """``LORE_VECTOR_QUANTIZATION`` as a mode, or None when unset/invalid."""
+    try:
+        return normalize_mode(os.environ.get("LORE_VECTOR_QUANTIZATION"))
+    except ValueError:
+        return None
+
+
+def require_backend_mode(
+    mode: Optional[str], supported: Sequence[str], backend: str,
+) -> Optional[str]:
+    """Return ``mode`` if ``backend`` can build it; raise ``ConfigError`` if not.
+
+    The mode names the storage, so a deployment never gets a different
+    compact format than the one it asked for after switching backends.
+    """
+    if mode is not None and mode not in supported:
+        raise ConfigError(
+            f"{backend} does not support vector quantization {mode!r}; "
+            f"use one of {', '.join(supported)}"
+        )
+    return mode
+
+
+def rerank_factor(mode: str) -> int:
+    """``LORE_VECTOR_RERANK_FACTOR`` when set to a positive int, else the mode's default."""
+    raw = os.environ.get("LORE_VECTOR_RERANK_FACTOR", "").strip()
+    try:
+        value = int(raw) if raw else 0
+    except ValueError:
+        value = 0
+    return value if value > 0 else RERANK_FACTOR[mode]
+
+
+def quantize_int8(vec: Sequence[float]) -> bytes:
+    """Scale by the vector's own max magnitude into ``[-127, 127]``.
+
+    Cosine distance ignores the per-vector scale, so this keeps the full
+    int8 range for every vector instead of assuming unit-range components.
+    """
+    arr = np.asarray(vec, dtype=np.float32)
+    peak = float(np.abs(arr).max()) if arr.size else 0.0
+    if peak == 0.0:
+        return np.zeros(arr.shape, dtype=np.int8).tobytes()
+    return np.rint(arr * (127.0 / peak)).astype(np.int8).tobytes()
+
+
+def quantize_binary(vec: Sequence[float]) -> bytes:
+    """One sign bit per dimension, packed 8 per byte."""
+    return np.packbits(np.asarray(vec, dtype=np.float32) > 0.0).tobytes()
+
+
+def quantize(vec: Sequence[float], mode: str) -> bytes:
+    return quantize_int8(vec) if mode == "int8" else quantize_binary(vec)
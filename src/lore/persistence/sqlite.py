@@ -19,16 +19,19 @@ import json
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+import numpy as np
 from ulid import ULID
 
 from lore.persistence.exceptions import (
     BackendUnavailableError,
     ConfigError,
+    DuplicateSourceMessageError,
     EmbeddingDimMismatch,
     IntegrityError,
     StoreBusyError,
@@ -36,6 +39,13 @@ from lore.persistence.exceptions import (
     StoreError,
     StoreNotFoundError,
 )
+from lore.persistence.quantization import (
+    env_vector_quantization,
+    normalize_mode,
+    quantize,
+    require_backend_mode,
+    rerank_factor,
+)
 from lore.persistence.types import (
     AgentSharingConfigData,
     AuditEventData,
@@ -127,6 +137,48 @@ logger = logging.getLogger(__name__)
 # decorator below catches the typed message, sleeps with exponential
 # backoff, and surfaces ``StoreBusyError`` once the budget is exhausted.
 _BUSY_RETRY_DELAYS_S: tuple[float, ...] = (0.05, 0.1, 0.2, 0.4)
+
+# ``memory_vectors`` vec0 schema; ``org_id`` partitions the KNN per tenant.
+_MEMORY_VECTORS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING vec0("
+    " memory_rowid INTEGER PRIMARY KEY,"
+    " org_id TEXT partition key,"
+    f" embedding FLOAT[{EMBED_DIM}] distance_metric=cosine"
+    ")"
+)
+# Opt-in quantized copy of ``memory_vectors`` (see lore.persistence.quantization):
+# the vec0 column per mode, and the SQL constructor for its query/insert blobs.
+# sqlite-vec has no fp16 column, so ``halfvec`` is rejected.
+_MEMORY_VECTORS_Q_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memory_vectors_q USING vec0("
+    " memory_rowid INTEGER PRIMARY KEY,"
+    " org_id TEXT partition key,"
+    " {column}"
+    ")"
+)
+_QUANT_COLUMNS = {
+    "int8": f"embedding INT8[{EMBED_DIM}] distance_metric=cosine",
+    "binary": f"embedding BIT[{EMBED_DIM}]",
+}
+_QUANT_SQL_FN = {"int8": "vec_int8", "binary": "vec_bit"}
+# How often a store whose quantized index is not ready yet re-reads
+# ``vector_quantization`` (so a backfill finishing elsewhere is picked up).
+_QUANT_READY_RECHECK_S = 30.0
+# Read-only connections ``SqliteStore.open`` keeps next to the writer
+# (``LORE_SQLITE_READERS``; 0 sends reads through the writer). Capped by
+# the CPU count: each aiosqlite connection runs queries on its own thread.
+_DEFAULT_READERS = 4
+# vec0 rejects KNN queries with ``k`` above this (sqlite-vec compile-time cap).
+_VEC0_MAX_K = 4096
+# ``recall_by_embedding`` KNN over-fetch factor; also the growth factor of
+# ``k`` when post-KNN filters leave fewer than ``limit`` rows.
+_RECALL_OVERFETCH = 4
+# Rows per multi-row INSERT in ``insert_memories`` (12 bound parameters per
+# row keeps a chunk well under SQLite's host-parameter limit).
+_BULK_INSERT_ROWS = 500
+# Memories removed per transaction by ``delete_memories`` / ``expire_memories``:
+# bounds both the IN-list size and how long each chunk holds the write lock.
+_BULK_DELETE_ROWS = 500
 _BUSY_MESSAGE_HINTS: tuple[str, ...] = (
     "database is locked",
     "database table is locked",
@@ -227,6 +279,19 @@ def _migrations_dir() -> Path:
     return _DEV_MIGRATIONS_DIR
 
 
+def _env_reader_count() -> int:
+    """``LORE_SQLITE_READERS``, defaulting to ``min(4, cpu count)``."""
+    default = min(_DEFAULT_READERS, os.cpu_count() or 1)
+    raw = os.environ.get("LORE_SQLITE_READERS")
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid LORE_SQLITE_READERS=%r", raw)
+        return default
+
+
 def _resolve_db_path(database_url: str) -> str:
     """Convert a sqlite:/// URL to a filesystem path.
 
@@ -273,20 +338,46 @@ def _parse_iso(value: Optional[str]) -> Optional[datetime]:
     return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
-def _decode_vec_to_json(value) -> Optional[list[float]]:
-    """Decode a sqlite-vec ``vec_to_json`` output into a list of floats.
+async def _taken_source_key(
+    conn: Any, memories: Sequence["NewMemory"]
+) -> Tuple[str, Optional[str], str]:
+    """The first ``(org_id, source, source_message_id)`` of ``memories`` that
+    repeats within the batch or already exists — for the error message."""
+    keyed = [m for m in memories if m.source_message_id is not None]
+    seen: set = set()
+    for m in keyed:
+        key = (m.org_id, m.source, m.source_message_id)
+        if key in seen:
+            return key
+        seen.add(key)
+        async with conn.execute(
+            "SELECT 1 FROM memories WHERE org_id = ? AND source IS ? AND source_message_id = ?",
+            key,
+        ) as cur:
+            if await cur.fetchone() is not None:
+                return key
+    first = keyed[0]
+    return first.org_id, first.source, first.source_message_id or ""
+
+
+def _encode_vec(embedding: Sequence[float]) -> bytes:
+    """Pack an embedding as the little-endian float32 blob sqlite-vec stores.
+
+    vec0 accepts a JSON-array string too, but formatting (``repr``) and
+    re-parsing a 384-float text on every write/query cost far more than the
+    vector math; the blob is the column's native representation.
+    """
+    return np.asarray(embedding, dtype="<f4").tobytes()
+
+
+def _decode_vec(value) -> Optional[list[float]]:
+    """Decode a raw vec0 float32 blob into a list of floats.
 
-    ``vec_to_json`` produces a JSON-array string like ``"[0.1,0.2,...]"``.
     Returns ``None`` if the input is None / empty (e.g. LEFT JOIN miss).
     """
-    if value is None:
-        return None
-    if isinstance(value, (bytes, bytearray)):
-        value = value.decode("utf-8")
     if not value:
         return None
-    parsed = json.loads(value)
-    return [float(x) for x in parsed]
+    return np.frombuffer(value, dtype="<f4").tolist()
 
 
 def _row_to_exported(row, embedding: Optional[list[float]]) -> ExportedMemory:
@@ -511,8 +602,7 @@ def _row_to_recommendation_candidate(row) -> RecommendationCandidate:
     """Translate a SQLite ``memories`` ⨯ ``memory_vectors`` row to a
     ``RecommendationCandidate``.
 
-    The embedding is the ``vec_to_json(v.embedding)`` output (a JSON-array
-    string like ``"[0.1,0.2,...]"``) decoded via ``_decode_vec_to_json``;
+    The embedding is the raw vec0 float32 blob decoded via ``_decode_vec``;
     meta is JSON-decoded from TEXT.
     """
     meta_raw = row["meta"]
@@ -522,7 +612,7 @@ def _row_to_recommendation_candidate(row) -> RecommendationCandidate:
         meta = {}
     else:
         meta = meta_raw
-    embedding = _decode_vec_to_json(row["embedding_json"])
+    embedding = _decode_vec(row["embedding"])
     return RecommendationCandidate(
         id=row["id"],
         content=row["content"] or "",
@@ -843,13 +933,23 @@ class SqliteStore:
       * Connection management with WAL pragmas (journal_mode=WAL,
         synchronous=NORMAL, busy_timeout=5000, foreign_keys=ON).
       * sqlite-vec extension load on every connection.
+      * One writer connection (``_acquire()`` / ``transaction()``) plus a
+        pool of ``query_only`` reader connections (``_read()``) for
+        file-backed stores, so WAL readers run concurrently with each other
+        and with the writer instead of queueing on one connection thread.
       * Migration runner: applies migrations_sqlite/*.sql in order and tracks
         applied versions via a `schema_migrations` table.
 
     Per-method Store-protocol implementations land in 3C–3F.
     """
 
-    def __init__(self, *, db_path: str, conn: Optional[Any] = None):
+    def __init__(
+        self,
+        *,
+        db_path: str,
+        conn: Optional[Any] = None,
+        vector_quantization: Optional[str] = None,
+    ):
         if aiosqlite is None:
             raise BackendUnavailableError(
                 "aiosqlite is not installed. Install with: pip install lore-sdk[solo]"
@@ -862,6 +962,25 @@ class SqliteStore:
         self._bound_conn = conn  # bound-connection mode (used by tests)
         self._owned_conn: Optional[Any] = None  # owned-by-store mode
         self._closed = False
+        # Serializes ``transaction()`` blocks: they share one connection, so
+        # a second ``BEGIN IMMEDIATE`` issued while another coroutine's
+        # transaction is open would fail ("transaction within a transaction").
+        self._tx_lock = asyncio.Lock()
+        # Reader pool (file-backed ``open()`` stores only): every reader, and
+        # a queue of the idle ones. None → reads go through the writer.
+        self._readers: list = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        # Quantized candidate search (opt-in): the configured mode, the mode
+        # of the existing ``memory_vectors_q`` table (maintained on every
+        # write while it exists), and whether a finished backfill is recorded.
+        self._quantization = require_backend_mode(
+            normalize_mode(vector_quantization)
+            if vector_quantization is not None else env_vector_quantization(),
+            tuple(_QUANT_COLUMNS), "SqliteStore",
+        )
+        self._quant_table: Optional[str] = None
+        self._quant_ready = False
+        self._quant_checked_at = float("-inf")
 
     @property
     def _conn(self):
@@ -877,9 +996,19 @@ class SqliteStore:
     # ── Lifecycle ──────────────────────────────────────────────────────
 
     @classmethod
-    async def open(cls, database_url: str) -> "SqliteStore":
+    async def open(
+        cls,
+        database_url: str,
+        *,
+        vector_quantization: Optional[str] = None,
+        readers: Optional[int] = None,
+    ) -> "SqliteStore":
         """Open a SqliteStore from a sqlite:// URL, applying migrations.
 
+        ``readers`` read-only connections (default ``LORE_SQLITE_READERS``)
+        are opened after the migrations for ``_read()``; ``:memory:``
+        databases are per-connection, so they always read through the writer.
+
         Phase 3J: after migrations + vec0 init, bootstrap the solo org +
         first API key on a fresh DB (skips when ``api_keys`` is already
         populated; in-memory URLs skip entirely). The bootstrap is wrapped
@@ -891,10 +1020,17 @@ class SqliteStore:
             parent = Path(db_path).parent
             if str(parent) not in ("", "."):
                 parent.mkdir(parents=True, exist_ok=True)
-        store = cls(db_path=db_path)
+        store = cls(db_path=db_path, vector_quantization=vector_quantization)
         store._owned_conn = await store._open_connection(db_path)
         await store._apply_migrations(store._owned_conn)
         await store._init_vec_tables(store._owned_conn)
+        n_readers = _env_reader_count() if readers is None else readers
+        if db_path != ":memory:" and n_readers > 0:
+            store._idle_readers = asyncio.Queue()
+            for _ in range(n_readers):
+                reader = await store._open_connection(db_path, read_only=True)
+                store._readers.append(reader)
+                store._idle_readers.put_nowait(reader)
         # Bootstrap the solo org + first key on an empty DB.
         from lore.persistence.bootstrap import bootstrap_solo_if_empty
         try:
@@ -913,7 +1049,7 @@ class SqliteStore:
         """
         return cls(db_path=":bound:", conn=conn)
 
-    async def _open_connection(self, db_path: str):
+    async def _open_connection(self, db_path: str, *, read_only: bool = False):
         conn = await aiosqlite.connect(db_path)
         conn.row_factory = aiosqlite.Row
         # WAL + reasonable concurrency defaults.
@@ -922,6 +1058,10 @@ class SqliteStore:
             await conn.execute("PRAGMA synchronous=NORMAL")
             await conn.execute("PRAGMA busy_timeout=5000")
             await conn.execute("PRAGMA foreign_keys=ON")
+            if read_only:
+                # A write routed to a reader by mistake fails loudly instead
+                # of racing the writer for the lock.
+                await conn.execute("PRAGMA query_only=ON")
         except aiosqlite.DatabaseError as exc:
             with contextlib.suppress(Exception):
                 await conn.close()
@@ -950,6 +1090,9 @@ class SqliteStore:
         if self._closed:
             return
         self._closed = True
+        readers, self._readers, self._idle_readers = self._readers, [], None
+        for reader in readers:
+            await reader.close()
         if self._owned_conn is not None:
             await self._owned_conn.close()
             self._owned_conn = None
@@ -1032,18 +1175,141 @@ class SqliteStore:
         recall path computes ``score = 1 - distance`` to mirror PG's
         ``(1 - (embedding <=> $vec))`` similarity expression.
 
+        ``org_id`` is a vec0 *partition key*: each tenant's vectors live in
+        their own shard, so a KNN with ``org_id = ?`` never walks (or returns)
+        another tenant's rows — a small tenant in a large database gets its
+        full ``k`` neighbours instead of losing them to post-filtering.
+
         Not migration-versioned because vec0 is provider-specific to the
         SQLite backend and not part of the cross-dialect schema contract.
-        Idempotent thanks to `IF NOT EXISTS`.
+        Idempotent thanks to `IF NOT EXISTS`; a pre-partition table is
+        rebuilt in place once (see ``_partition_vec_table``).
+        """
+        async with conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memory_vectors'"
+        ) as cur:
+            row = await cur.fetchone()
+        if row is not None and "partition key" not in (row["sql"] or "").lower():
+            await self._partition_vec_table(conn)
+        await conn.execute(_MEMORY_VECTORS_DDL.format(table="memory_vectors"))
+        await self._init_quant_table(conn)
+        await conn.commit()
+
+    async def _init_quant_table(self, conn) -> None:
+        """Detect (or create) the opt-in ``memory_vectors_q`` table.
+
+        An existing table is kept in step with ``memory_vectors`` on every
+        write whatever this process is configured for, so a store opened
+        without ``LORE_VECTOR_QUANTIZATION`` never leaves it stale. A table
+        built for a different mode than the configured one is dropped (and
+        its readiness record cleared) — ``lore quantize-vectors`` rebuilds it.
         """
-        await conn.execute(
-            f"""
-            CREATE VIRTUAL TABLE IF NOT EXISTS memory_vectors USING vec0(
-                memory_rowid INTEGER PRIMARY KEY,
-                embedding FLOAT[{EMBED_DIM}] distance_metric=cosine
+        async with conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memory_vectors_q'"
+        ) as cur:
+            row = await cur.fetchone()
+        existing: Optional[str] = None
+        if row is not None:
+            existing = "binary" if "bit[" in (row["sql"] or "").lower() else "int8"
+        if self._quantization is not None and existing not in (None, self._quantization):
+            logger.info(
+                "SqliteStore: dropping %s quantized vectors (configured: %s)",
+                existing, self._quantization,
             )
-            """
+            await conn.execute("DROP TABLE memory_vectors_q")
+            await conn.execute("DELETE FROM vector_quantization WHERE mode = ?", (existing,))
+            existing = None
+        if self._quantization is not None and existing is None:
+            await conn.execute(
+                _MEMORY_VECTORS_Q_DDL.format(column=_QUANT_COLUMNS[self._quantization])
+            )
+            existing = self._quantization
+        self._quant_table = existing
+
+    async def _quant_search_ready(self, conn) -> bool:
+        """True when recall may use ``memory_vectors_q`` for candidates.
+
+        Requires the configured mode's table to exist *and* a finished
+        backfill recorded in ``vector_quantization``; until then recall keeps
+        using the float KNN. A not-ready answer is re-checked every
+        ``_QUANT_READY_RECHECK_S`` seconds.
+        """
+        if self._quantization is None or self._quant_table != self._quantization:
+            return False
+        if self._quant_ready:
+            return True
+        now = time.monotonic()
+        if now - self._quant_checked_at < _QUANT_READY_RECHECK_S:
+            return False
+        self._quant_checked_at = now
+        async with conn.execute(
+            "SELECT 1 FROM vector_quantization WHERE mode = ?", (self._quantization,)
+        ) as cur:
+            self._quant_ready = await cur.fetchone() is not None
+        return self._quant_ready
+
+    async def _insert_vector(self, tx, rowid: int, org_id: str, blob: bytes) -> None:
+        """Insert the vec0 row(s) for one memory: float, plus quantized if present."""
+        await self._insert_vectors(tx, [(rowid, org_id, blob)])
+
+    async def _insert_vectors(
+        self, tx, rows: Sequence[Tuple[int, str, bytes]]
+    ) -> None:
+        """Multi-row :meth:`_insert_vector` for ``(rowid, org_id, blob)`` triples."""
+        values = ", ".join(["(?, ?, ?)"] * len(rows))
+        await tx.execute(
+            f"INSERT INTO memory_vectors(memory_rowid, org_id, embedding) VALUES {values}",
+            [v for row in rows for v in row],
         )
+        if self._quant_table is not None:
+            fn = _QUANT_SQL_FN[self._quant_table]
+            await tx.execute(
+                "INSERT INTO memory_vectors_q(memory_rowid, org_id, embedding) "
+                f"VALUES {', '.join([f'(?, ?, {fn}(?))'] * len(rows))}",
+                [
+                    v
+                    for rowid, org_id, blob in rows
+                    for v in (rowid, org_id, quantize(np.frombuffer(blob, dtype="<f4"), self._quant_table))
+                ],
+            )
+
+    async def _delete_vectors(self, tx, predicate: str, params: Sequence[Any]) -> None:
+        """``DELETE … WHERE memory_rowid {predicate}`` on every vector table."""
+        tables = ["memory_vectors"]
+        if self._quant_table is not None:
+            tables.append("memory_vectors_q")
+        for table in tables:
+            await tx.execute(f"DELETE FROM {table} WHERE memory_rowid {predicate}", tuple(params))
+
+    async def _partition_vec_table(self, conn) -> None:
+        """Rebuild a legacy (unpartitioned) ``memory_vectors`` with ``org_id``.
+
+        vec0 tables can't be ALTERed or renamed, so the vectors are copied
+        through a scratch table stamped with their memory's ``org_id``, the
+        old table is dropped and recreated, and the rows copied back — all in
+        one transaction. Orphaned vectors (no ``memories`` row) are dropped.
+        """
+        logger.info("SqliteStore: partitioning memory_vectors by org_id (one-time rebuild)")
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            await conn.execute("DROP TABLE IF EXISTS memory_vectors_rebuild")
+            await conn.execute(_MEMORY_VECTORS_DDL.format(table="memory_vectors_rebuild"))
+            await conn.execute(
+                "INSERT INTO memory_vectors_rebuild(memory_rowid, org_id, embedding) "
+                "SELECT v.memory_rowid, m.org_id, v.embedding FROM memory_vectors v "
+                "JOIN memories m ON m.rowid = v.memory_rowid"
+            )
+            await conn.execute("DROP TABLE memory_vectors")
+            await conn.execute(_MEMORY_VECTORS_DDL.format(table="memory_vectors"))
+            await conn.execute(
+                "INSERT INTO memory_vectors(memory_rowid, org_id, embedding) "
+                "SELECT memory_rowid, org_id, embedding FROM memory_vectors_rebuild"
+            )
+            await conn.execute("DROP TABLE memory_vectors_rebuild")
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await conn.rollback()
+            raise
         await conn.commit()
 
     @contextlib.asynccontextmanager
@@ -1070,44 +1336,53 @@ class SqliteStore:
         if conn is None:
             raise StoreError("SqliteStore connection is closed")
 
-        for attempt, delay in enumerate((*_BUSY_RETRY_DELAYS_S, None)):
-            try:
-                await conn.execute("BEGIN IMMEDIATE")
-                break
-            except Exception as exc:
-                if not _is_busy_error(exc):
-                    if _is_corruption_error(exc):
-                        raise StoreCorruption(
-                            f"SQLite database is malformed: {exc}"
+        async with self._tx_lock:
+            for attempt, delay in enumerate((*_BUSY_RETRY_DELAYS_S, None)):
+                try:
+                    await conn.execute("BEGIN IMMEDIATE")
+                    break
+                except Exception as exc:
+                    if not _is_busy_error(exc):
+                        if _is_corruption_error(exc):
+                            raise StoreCorruption(
+                                f"SQLite database is malformed: {exc}"
+                            ) from exc
+                        raise
+                    if delay is None:
+                        raise StoreBusyError(
+                            f"SQLite write contention exceeded retry budget "
+                            f"({len(_BUSY_RETRY_DELAYS_S)} retries): {exc}"
                         ) from exc
-                    raise
-                if delay is None:
-                    raise StoreBusyError(
-                        f"SQLite write contention exceeded retry budget "
-                        f"({len(_BUSY_RETRY_DELAYS_S)} retries): {exc}"
-                    ) from exc
-                logger.debug(
-                    "SQLITE_BUSY on BEGIN IMMEDIATE; retrying in %.0fms (attempt %d)",
-                    delay * 1000, attempt + 1,
-                )
-                await asyncio.sleep(delay)
-        try:
-            yield conn
-        except BaseException:
-            with contextlib.suppress(Exception):
-                await conn.rollback()
-            raise
-        else:
-            await conn.commit()
+                    logger.debug(
+                        "SQLITE_BUSY on BEGIN IMMEDIATE; retrying in %.0fms (attempt %d)",
+                        delay * 1000, attempt + 1,
+                    )
+                    await asyncio.sleep(delay)
+            try:
+                yield conn
+            except BaseException:
+                with contextlib.suppress(Exception):
+                    await conn.rollback()
+                raise
+            else:
+                await conn.commit()
 
     def _acquire(self):
-        """Return an async context manager yielding a usable connection.
+        """Return an async context manager yielding the writer connection.
 
-        SQLite is a single-process backend; we don't need a real pool. The
-        same connection is re-used.
+        For writes outside ``transaction()`` and for reads that must see the
+        writer's own uncommitted state; plain reads use ``_read()``.
         """
         return _SqliteConnCtx(self._conn)
 
+    def _read(self):
+        """Return an async context manager yielding a read-only connection.
+
+        Borrows an idle reader from the pool (waiting while all are busy)
+        and returns it on exit; without a pool, yields the writer.
+        """
+        return _SqliteReaderCtx(self)
+
     # ── MemoryOps: insert, get, delete (Phase 3C) ─────────────────────
 
     async def insert_memory(self, memory: "NewMemory") -> "StoredMemory":
@@ -1122,34 +1397,39 @@ class SqliteStore:
         _check_embedding_dim(memory.embedding)
         memory_id = f"mem_{ULID()}"
         async with self.transaction() as tx:
-            cursor = await tx.execute(
-                """
-                INSERT INTO memories
-                    (id, org_id, content, context, tags, source,
-                     project, expires_at, meta, scope, user_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    memory_id,
-                    memory.org_id,
-                    memory.content,
-                    memory.context or "",  # NOT NULL in PG schema; mirror
-                    json.dumps(list(memory.tags)),
-                    memory.source,
-                    memory.project,
-                    memory.expires_at.isoformat() if memory.expires_at else None,
-                    json.dumps(dict(memory.meta)),
-                    memory.scope,
-                    memory.user_id,
-                ),
-            )
+            try:
+                cursor = await tx.execute(
+                    """
+                    INSERT INTO memories
+                        (id, org_id, content, context, tags, source,
+                         project, expires_at, meta, scope, user_id, source_message_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        memory_id,
+                        memory.org_id,
+                        memory.content,
+                        memory.context or "",  # NOT NULL in PG schema; mirror
+                        json.dumps(list(memory.tags)),
+                        memory.source,
+                        memory.project,
+                        memory.expires_at.isoformat() if memory.expires_at else None,
+                        json.dumps(dict(memory.meta)),
+                        memory.scope,
+                        memory.user_id,
+                        memory.source_message_id,
+                    ),
+                )
+            except aiosqlite.IntegrityError as e:
+                if "source_message_id" in str(e):
+                    raise DuplicateSourceMessageError(
+                        memory.org_id, memory.source, memory.source_message_id or ""
+                    ) from e
+                raise
             rowid = cursor.lastrowid
             await cursor.close()
 
-            await tx.execute(
-                "INSERT INTO memory_vectors(memory_rowid, embedding) VALUES (?, ?)",
-                (rowid, repr(list(memory.embedding))),
-            )
+            await self._insert_vector(tx, rowid, memory.org_id, _encode_vec(memory.embedding))
 
             async with tx.execute(
                 """
@@ -1167,6 +1447,77 @@ class SqliteStore:
             raise StoreError(f"insert_memory: row {rowid} disappeared after insert")
         return _row_to_memory(row)
 
+    async def insert_memories(
+        self, memories: Sequence["NewMemory"]
+    ) -> Sequence["StoredMemory"]:
+        """Insert many memories + their embeddings in one transaction.
+
+        Rows go in as multi-row ``INSERT``s of up to ``_BULK_INSERT_ROWS``
+        each (one statement per chunk instead of one per memory), then the
+        vec0 rows the same way. Returns the stored rows in input order.
+        """
+        if not memories:
+            return []
+        for memory in memories:
+            _check_embedding_dim(memory.embedding)
+        ids = [f"mem_{ULID()}" for _ in memories]
+        rows: list[Any] = []
+        async with self.transaction() as tx:
+            for start in range(0, len(memories), _BULK_INSERT_ROWS):
+                chunk = memories[start:start + _BULK_INSERT_ROWS]
+                chunk_ids = ids[start:start + _BULK_INSERT_ROWS]
+                params: list[Any] = []
+                for memory_id, memory in zip(chunk_ids, chunk):
+                    params.extend((
+                        memory_id,
+                        memory.org_id,
+                        memory.content,
+                        memory.context or "",
+                        json.dumps(list(memory.tags)),
+                        memory.source,
+                        memory.project,
+                        memory.expires_at.isoformat() if memory.expires_at else None,
+                        json.dumps(dict(memory.meta)),
+                        memory.scope,
+                        memory.user_id,
+                        memory.source_message_id,
+                    ))
+                try:
+                    await tx.execute(
+                        f"""
+                        INSERT INTO memories
+                            (id, org_id, content, context, tags, source,
+                             project, expires_at, meta, scope, user_id, source_message_id)
+                        VALUES {", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))}
+                        """,
+                        params,
+                    )
+                except aiosqlite.IntegrityError as e:
+                    if "source_message_id" in str(e):
+                        raise DuplicateSourceMessageError(
+                            *await _taken_source_key(tx, chunk)
+                        ) from e
+                    raise
+                placeholders = ", ".join("?" * len(chunk_ids))
+                async with tx.execute(
+                    f"""
+                    SELECT rowid, id, org_id, content, context, tags, source,
+                           project, created_at, updated_at, expires_at, upvotes,
+                           downvotes, meta, access_count,
+                           last_accessed_at, scope, visibility, user_id
+                    FROM memories WHERE id IN ({placeholders})
+                    """,
+                    chunk_ids,
+                ) as cur:
+                    by_id = {row["id"]: row for row in await cur.fetchall()}
+                chunk_rows = [by_id[memory_id] for memory_id in chunk_ids]
+                await self._insert_vectors(tx, [
+                    (row["rowid"], memory.org_id, _encode_vec(memory.embedding))
+                    for row, memory in zip(chunk_rows, chunk)
+                ])
+                rows.extend(chunk_rows)
+        return [_row_to_memory(row) for row in rows]
+
     async def get_memory(
         self, org_id: str, memory_id: str, *, requesting_user_id: Optional[str] = None
     ) -> Optional["StoredMemory"]:
@@ -1181,7 +1532,7 @@ class SqliteStore:
         where = ["id = ?", "org_id = ?", "(expires_at IS NULL OR expires_at > ?)"]
         bind: list = [memory_id, org_id, now_iso]
         _append_visibility(where, bind, requesting_user_id)
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"""
                 SELECT id, org_id, content, context, tags, source,
@@ -1196,6 +1547,27 @@ class SqliteStore:
                 row = await cur.fetchone()
         return _row_to_memory(row) if row else None
 
+    async def get_memory_by_source_id(
+        self, org_id: str, source: str, source_message_id: str
+    ) -> Optional["StoredMemory"]:
+        """The memory holding the ingest key ``(org_id, source,
+        source_message_id)`` (migration 032), expired or not — an index lookup.
+        Mirrors ``PostgresStore.get_memory_by_source_id``."""
+        async with self._read() as conn:
+            async with conn.execute(
+                """
+                SELECT id, org_id, content, context, tags, source,
+                       project, created_at, updated_at, expires_at, upvotes,
+                       downvotes, meta, access_count,
+                       last_accessed_at, scope, visibility, user_id
+                FROM memories
+                WHERE org_id = ? AND source = ? AND source_message_id = ?
+                """,
+                (org_id, source, source_message_id),
+            ) as cur:
+                row = await cur.fetchone()
+        return _row_to_memory(row) if row else None
+
     async def promote_memory(
         self, org_id: str, memory_id: str, *, promoted_by: Optional[str]
     ) -> Optional["StoredMemory"]:
@@ -1249,40 +1621,76 @@ class SqliteStore:
     async def delete_memory(
         self, org_id: str, memory_id: str, *, requesting_user_id: Optional[str] = None
     ) -> bool:
-        """Delete a memory and its companion vector inside one transaction.
+        """Delete a memory and what hangs off it; see ``delete_memories``.
 
-        The vec0 row is keyed by ``memory_vectors.memory_rowid`` which equals
-        the base table's rowid. We resolve the rowid up-front, then delete
-        the vector first followed by the base row (vec0 has no FK so order
-        is informational only — both succeed or both roll back).
-
-        Migration 026: the visibility predicate is applied to both the lookup
-        and the delete, so a row owned by a different user is treated as absent
+        Migration 026: a row owned by a different user is treated as absent
         (returns False) rather than deleted. No-op when requesting_user_id is None.
         """
+        deleted = await self.delete_memories(
+            org_id, [memory_id], requesting_user_id=requesting_user_id,
+        )
+        return bool(deleted)
+
+    async def delete_memories(
+        self,
+        org_id: str,
+        memory_ids: Sequence[str],
+        *,
+        requesting_user_id: Optional[str] = None,
+    ) -> list[str]:
+        """Delete many memories, ``_BULK_DELETE_ROWS`` per transaction.
+
+        Each chunk resolves its rowids with one ``SELECT … IN (…)`` (the
+        visibility predicate applied, as in ``delete_memory``) and removes
+        them with ``_delete_memory_rows``. Returns the ids actually deleted.
+        """
+        ids = list(dict.fromkeys(memory_ids))
         vis_where: list[str] = []
         vis_params: list[Any] = []
         _append_visibility(vis_where, vis_params, requesting_user_id, include_shared=False)
         vis_clause = (" AND " + " AND ".join(vis_where)) if vis_where else ""
-        async with self.transaction() as tx:
-            async with tx.execute(
-                f"SELECT rowid FROM memories WHERE id = ? AND org_id = ?{vis_clause}",
-                (memory_id, org_id, *vis_params),
-            ) as cur:
-                row = await cur.fetchone()
-            if row is None:
-                return False
-            rowid = row["rowid"]
+        deleted: list[str] = []
+        for start in range(0, len(ids), _BULK_DELETE_ROWS):
+            chunk = ids[start:start + _BULK_DELETE_ROWS]
+            placeholders = ",".join(["?"] * len(chunk))
+            async with self.transaction() as tx:
+                async with tx.execute(
+                    "SELECT rowid, id, org_id FROM memories "
+                    f"WHERE org_id = ? AND id IN ({placeholders}){vis_clause}",
+                    (org_id, *chunk, *vis_params),
+                ) as cur:
+                    rows = await cur.fetchall()
+                if rows:
+                    await self._delete_memory_rows(tx, rows)
+            deleted.extend(r["id"] for r in rows)
+        return deleted
+
+    async def _delete_memory_rows(self, tx, rows: Sequence[Any]) -> int:
+        """Delete memory ``rows`` (``rowid``, ``id``, ``org_id``) inside ``tx``.
+
+        vec0 rows and the relationships extracted from these memories have
+        no FK to ``memories``, so each gets one ``DELETE … IN (…)``;
+        ``entity_mentions`` and ``memory_supersessions`` follow through
+        ``ON DELETE CASCADE``. Returns the number of base rows removed.
+        """
+        rowids = [r["rowid"] for r in rows]
+        placeholders = ",".join(["?"] * len(rowids))
+        await self._delete_vectors(tx, f"IN ({placeholders})", rowids)
+        by_org: dict[str, list[str]] = {}
+        for r in rows:
+            by_org.setdefault(r["org_id"], []).append(r["id"])
+        for org_id, ids in by_org.items():
             await tx.execute(
-                "DELETE FROM memory_vectors WHERE memory_rowid = ?", (rowid,)
+                "DELETE FROM relationships WHERE org_id = ? "
+                f"AND source_memory_id IN ({','.join(['?'] * len(ids))})",
+                (org_id, *ids),
             )
-            cursor = await tx.execute(
-                f"DELETE FROM memories WHERE id = ? AND org_id = ?{vis_clause}",
-                (memory_id, org_id, *vis_params),
-            )
-            deleted = cursor.rowcount
-            await cursor.close()
-        return deleted == 1
+        cursor = await tx.execute(
+            f"DELETE FROM memories WHERE rowid IN ({placeholders})", tuple(rowids),
+        )
+        deleted = cursor.rowcount
+        await cursor.close()
+        return int(deleted) if deleted is not None else 0
 
     # ── MemoryOps: rest of the slice (Phase 3D) ───────────────────────
 
@@ -1422,12 +1830,15 @@ class SqliteStore:
                     "WHERE value = ?)"
                 )
                 params.append(tag)
+        # ``created_at`` is ``datetime('now')`` text ("YYYY-MM-DD HH:MM:SS");
+        # an ``isoformat()`` bound ("...T...") would sort after every row
+        # written the same day.
         if filter.since is not None:
             where.append(f"{prefix}created_at >= ?")
-            params.append(filter.since.isoformat())
+            params.append(self._to_iso(filter.since))
         if filter.until is not None:
             where.append(f"{prefix}created_at < ?")
-            params.append(filter.until.isoformat())
+            params.append(self._to_iso(filter.until))
         if text_query and filter.text_query is not None:
             where.append(f"({prefix}content LIKE ? OR {prefix}context LIKE ?)")
             pat = f"%{filter.text_query}%"
@@ -1458,7 +1869,7 @@ class SqliteStore:
         if filter.offset:
             sql += " OFFSET ?"
             params.append(filter.offset)
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_memory(r) for r in rows]
@@ -1466,10 +1877,12 @@ class SqliteStore:
     async def expire_memories(self) -> int:
         """Delete rows with ``expires_at < now()`` plus their vec0 companions.
 
-        SQLite has no ``DELETE … RETURNING`` cascade across vec0, and vec0
-        has no FK, so we resolve victim rowids inside the same
-        ``BEGIN IMMEDIATE`` transaction, delete the vec0 rows, then the
-        base rows. Returns the number of base-table rows removed.
+        Runs in chunks of ``_BULK_DELETE_ROWS``, one ``BEGIN IMMEDIATE``
+        transaction each, so a large backlog neither overflows SQLite's
+        host-parameter limit nor holds the write lock for the whole sweep.
+        Each chunk is picked through ``idx_memories_expires_at`` and removed
+        by ``_delete_memory_rows`` (vectors, sourced relationships, FK
+        cascades). Returns the number of base-table rows removed.
 
         ``expires_at`` is stored as Python-side ``isoformat()`` (with ``T``
         separator and ``+00:00`` suffix) by ``insert_memory``, while
@@ -1482,29 +1895,20 @@ class SqliteStore:
         the same format.
         """
         now_iso = datetime.now(timezone.utc).isoformat()
-        async with self.transaction() as tx:
-            async with tx.execute(
-                "SELECT rowid FROM memories "
-                "WHERE expires_at IS NOT NULL "
-                "  AND expires_at < ?",
-                (now_iso,),
-            ) as cur:
-                rows = await cur.fetchall()
-            if not rows:
-                return 0
-            rowids = [r["rowid"] for r in rows]
-            placeholders = ",".join(["?"] * len(rowids))
-            await tx.execute(
-                f"DELETE FROM memory_vectors WHERE memory_rowid IN ({placeholders})",
-                tuple(rowids),
-            )
-            cursor = await tx.execute(
-                f"DELETE FROM memories WHERE rowid IN ({placeholders})",
-                tuple(rowids),
-            )
-            deleted = cursor.rowcount
-            await cursor.close()
-        return int(deleted) if deleted is not None else 0
+        total = 0
+        while True:
+            async with self.transaction() as tx:
+                async with tx.execute(
+                    "SELECT rowid, id, org_id FROM memories "
+                    "WHERE expires_at IS NOT NULL "
+                    "  AND expires_at < ? LIMIT ?",
+                    (now_iso, _BULK_DELETE_ROWS),
+                ) as cur:
+                    rows = await cur.fetchall()
+                if rows:
+                    total += await self._delete_memory_rows(tx, rows)
+            if len(rows) < _BULK_DELETE_ROWS:
+                return total
 
     async def bump_access_counts(
         self,
@@ -1583,7 +1987,7 @@ class SqliteStore:
             "ORDER BY created_at DESC "
             "LIMIT ? OFFSET ?"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(count_sql, tuple(params)) as cur:
                 count_row = await cur.fetchone()
             total = int(count_row["n"]) if count_row else 0
@@ -1602,8 +2006,7 @@ class SqliteStore:
         Mirrors ``PostgresStore.list_memories_with_embeddings``: no LIMIT,
         ordered by ``created_at`` ASC, includes the embedding column. The
         SQLite embedding lives in the vec0 virtual table; we LEFT JOIN
-        through ``memory_rowid`` and use ``vec_to_json`` to convert the
-        binary vector back to a JSON-array string we then parse.
+        through ``memory_rowid`` and decode the raw float32 blob.
 
         ``LEFT JOIN`` so memories without an embedding (the vec0 row was
         deleted out-of-band, or the row was inserted via a path that
@@ -1614,24 +2017,21 @@ class SqliteStore:
             filter, text_query=True, min_reputation=True, alias="m",
         )
         where_sql = " AND ".join(where)
-        # ``vec_to_json(NULL)`` errors with "Input must have type BLOB or
-        # TEXT" — guard with CASE so LEFT JOIN misses surface as NULL.
         sql = (
             "SELECT m.id, m.org_id, m.content, m.context, m.tags, "
             "m.source, m.project, m.created_at, m.updated_at, "
             "m.expires_at, m.upvotes, m.downvotes, m.meta, "
-            "CASE WHEN v.embedding IS NULL THEN NULL "
-            "     ELSE vec_to_json(v.embedding) END AS embedding_json "
+            "v.embedding "
             "FROM memories m "
             "LEFT JOIN memory_vectors v ON v.memory_rowid = m.rowid "
             f"WHERE {where_sql} "
             "ORDER BY m.created_at"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return tuple(
-            _row_to_exported(r, _decode_vec_to_json(r["embedding_json"]))
+            _row_to_exported(r, _decode_vec(r["embedding"]))
             for r in rows
         )
 
@@ -1639,7 +2039,7 @@ class SqliteStore:
         self,
         params: "RecallParams",
     ) -> Sequence["ScoredMemory"]:
-        """Vec0 KNN ⨯ memories JOIN ⨯ score-decay ⨯ min_score filter.
+        """Tenant-partitioned vec0 KNN ⨯ memories filter ⨯ score-decay.
 
         Mirrors PG's ``recall_by_embedding``:
 
@@ -1651,25 +2051,26 @@ class SqliteStore:
         * PG's ``embedding <=> $vec`` (cosine distance) → vec0's
           ``distance`` column with ``distance_metric=cosine``. Both yield
           the same metric; ``similarity = 1 - distance``.
-        * The vec0 ``MATCH`` operator only allows the LIMIT to come
-          through the virtual table's own ``k = ?`` constraint, so we
-          fetch top-K from vec0 first, then JOIN ``memories`` and apply
-          downstream filters (org, project, expiry, min_score). We
-          slightly over-fetch from vec0 (max(k, limit*4)) to leave room
-          for the WHERE-clause filters to drop candidates without
-          starving the final result.
+        * ``memory_vectors`` is partitioned by ``org_id``, so the KNN only
+          ever walks the requesting tenant's vectors. The remaining filters
+          (project/scope, visibility, expiry) cannot be pushed into vec0, so
+          they run against ``memories`` for the KNN candidates. The vec0
+          ``MATCH`` only takes its LIMIT through ``k = ?``; we start at
+          ``limit * 4`` and grow ``k`` until ``limit`` rows qualify, the
+          partition (or the ``min_score`` band) is exhausted, or ``k`` hits
+          vec0's ceiling — after which we fall back to an exact filter-first
+          scan of the tenant's qualifying rows. Either way a caller gets
+          ``limit`` results whenever that many qualifying rows exist.
         * SQLite has no ``EXTRACT(EPOCH FROM …)``; we use
           ``(julianday('now') - julianday(col))`` which yields days as
           a float. ``LEAST`` → ``MIN``. ``power(0.5, x)`` → SQLite's
           ``pow(0.5, x)`` (alias since 3.35).
         """
         _check_embedding_dim(params.query_vec)
-        # Over-fetch from vec0 since post-filtering may drop candidates.
-        # 4x the limit is a generous floor; clamp to a sane upper bound.
-        k = max(params.limit, 1) * 4
-        # Build the post-vec0 WHERE clauses (PG path: org, project, expiry).
-        # Uses the same shape as ``_build_memory_filter_clauses`` for the
-        # subset of filters ``RecallParams`` actually exposes.
+        limit = max(params.limit, 1)
+        # Post-KNN WHERE clauses (PG path: org, project, expiry). Uses the
+        # same shape as ``_build_memory_filter_clauses`` for the subset of
+        # filters ``RecallParams`` actually exposes.
         where: list[str] = ["m.org_id = ?"]
         sql_params: list[Any] = [params.org_id]
         # Phase 6G: scope predicate. ``scope_mode='all'`` skips this entirely
@@ -1696,51 +2097,73 @@ class SqliteStore:
             where.append("(m.expires_at IS NULL OR m.expires_at > ?)")
             sql_params.append(now_iso)
 
-        # SQLite quirks: vec0's k must be a literal integer in some
-        # builds; passing it as a parameter is supported via the rowid
-        # virtual constraint syntax. We thread it as a bind param.
-        sql = f"""
+        select_sql = f"""
             SELECT
+                m.rowid AS rid,
                 m.id, m.org_id, m.content, m.context, m.tags,
                 m.source, m.project, m.created_at, m.updated_at, m.expires_at,
                 m.upvotes, m.downvotes, m.meta,
                 m.access_count, m.last_accessed_at, m.scope, m.visibility, m.user_id,
-                v.distance AS distance,
-                (
-                    (1.0 - v.distance)
-                    * pow(
-                        0.5,
-                        MIN(
-                            julianday('now') - julianday(m.created_at),
-                            COALESCE(
-                                julianday('now') - julianday(m.last_accessed_at),
-                                julianday('now') - julianday(m.created_at)
-                            )
-                        ) / {float(params.half_life_days)}
-                      )
-                ) AS score
-            FROM memory_vectors v
-            JOIN memories m ON m.rowid = v.memory_rowid
-            WHERE v.embedding MATCH ?
-              AND v.k = ?
-              AND {' AND '.join(where)}
-              AND (1.0 - v.distance) >= ?
-            ORDER BY score DESC
-            LIMIT ?
-        """
-        bind: list[Any] = [
-            repr(list(params.query_vec)),
-            k,
-            *sql_params,
-            params.min_score,
-            params.limit,
-        ]
-        async with self._acquire() as conn:
-            async with conn.execute(sql, tuple(bind)) as cur:
-                rows = await cur.fetchall()
+                pow(
+                    0.5,
+                    MIN(
+                        julianday('now') - julianday(m.created_at),
+                        COALESCE(
+                            julianday('now') - julianday(m.last_accessed_at),
+                            julianday('now') - julianday(m.created_at)
+                        )
+                    ) / {float(params.half_life_days)}
+                ) AS decay
+        """
+        query = _encode_vec(params.query_vec)
+        min_sim = params.min_score
+
+        async with self._read() as conn:
+            quantized = await self._quant_search_ready(conn)
+            k = limit * _RECALL_OVERFETCH
+            while True:
+                k = min(k, _VEC0_MAX_K)
+                knn, partition_exhausted = await self._knn(
+                    conn, query, params.query_vec, k, params.org_id, quantized,
+                )
+                similarity = {rid: 1.0 - d for rid, d in knn if 1.0 - d >= min_sim}
+                rows: list = []
+                if similarity:
+                    async with conn.execute(
+                        f"{select_sql} FROM memories m "
+                        "WHERE m.rowid IN (SELECT value FROM json_each(?)) "
+                        f"AND {' AND '.join(where)}",
+                        (json.dumps(list(similarity)), *sql_params),
+                    ) as cur:
+                        rows = await cur.fetchall()
+                # Stop when enough rows qualify, when vec0 returned the whole
+                # partition, or when the k-th neighbour already falls below
+                # min_score (vec0 yields rows in distance order).
+                exhausted = partition_exhausted or (bool(knn) and 1.0 - knn[-1][1] < min_sim)
+                if len(rows) >= limit or exhausted:
+                    scored_rows = [(r, similarity[r["rid"]]) for r in rows]
+                    break
+                if k >= _VEC0_MAX_K:
+                    # Highly selective filters: score the tenant's qualifying
+                    # rows exactly instead of widening the KNN any further.
+                    async with conn.execute(
+                        f"{select_sql}, "
+                        "(1.0 - vec_distance_cosine(v.embedding, ?)) AS similarity "
+                        "FROM memories m "
+                        "JOIN memory_vectors v ON v.memory_rowid = m.rowid "
+                        f"WHERE {' AND '.join(where)}",
+                        (query, *sql_params),
+                    ) as cur:
+                        rows = await cur.fetchall()
+                    scored_rows = [
+                        (r, float(r["similarity"])) for r in rows
+                        if float(r["similarity"]) >= min_sim
+                    ]
+                    break
+                k *= _RECALL_OVERFETCH
 
         scored: list[ScoredMemory] = []
-        for r in rows:
+        for r, sim in scored_rows:
             sm = _row_to_memory(r)
             scored.append(
                 ScoredMemory(
@@ -1762,10 +2185,112 @@ class SqliteStore:
                     scope=sm.scope,
                     visibility=sm.visibility,
                     user_id=sm.user_id,
-                    score=float(r["score"]),
+                    score=sim * float(r["decay"]),
+                )
+            )
+        scored.sort(key=lambda m: m.score, reverse=True)
+        return scored[:limit]
+
+    async def _knn(
+        self,
+        conn,
+        query: bytes,
+        query_vec: Sequence[float],
+        k: int,
+        org_id: str,
+        quantized: bool,
+    ) -> tuple[list[tuple[int, float]], bool]:
+        """The tenant's ``k`` nearest ``(rowid, cosine distance)`` pairs.
+
+        Returns the pairs in distance order plus whether the partition ran
+        out before ``k``. With ``quantized`` the candidates come from
+        ``memory_vectors_q`` (``k × rerank_factor`` of them) and are
+        re-ranked by the exact float distance, so the distances returned are
+        always exact.
+        """
+        if not quantized:
+            async with conn.execute(
+                "SELECT memory_rowid, distance FROM memory_vectors "
+                "WHERE embedding MATCH ? AND k = ? AND org_id = ?",
+                (query, k, org_id),
+            ) as cur:
+                knn = [(r[0], float(r[1])) for r in await cur.fetchall()]
+            return knn, len(knn) < k
+        mode = self._quant_table
+        qk = min(k * rerank_factor(mode), _VEC0_MAX_K)
+        # Join (not ``IN``) so the float lookups are rowid point reads.
+        async with conn.execute(
+            "SELECT q.memory_rowid, vec_distance_cosine(v.embedding, ?) AS distance "
+            "FROM (SELECT memory_rowid FROM memory_vectors_q "
+            f"      WHERE embedding MATCH {_QUANT_SQL_FN[mode]}(?) AND k = ? AND org_id = ?) q "
+            "JOIN memory_vectors v ON v.memory_rowid = q.memory_rowid "
+            "ORDER BY distance",
+            (query, quantize(query_vec, mode), qk, org_id),
+        ) as cur:
+            candidates = [(r[0], float(r[1])) for r in await cur.fetchall()]
+        return candidates[:k], len(candidates) < qk
+
+    async def backfill_quantized_vectors(
+        self, mode: Optional[str] = None, *, batch_size: int = 1000,
+    ) -> int:
+        """Build ``memory_vectors_q`` for ``mode`` and mark it searchable.
+
+        Inserts the quantized vector of every memory that has a float vector
+        but no quantized one yet (so it is resumable and cheap to re-run),
+        in ``batch_size`` transactions, then records ``mode`` in
+        ``vector_quantization``. Switching modes drops the old table first.
+        Returns the number of vectors quantized by this call.
+        """
+        mode = require_backend_mode(
+            normalize_mode(mode) or self._quantization, tuple(_QUANT_COLUMNS), "SqliteStore",
+        )
+        if mode is None:
+            raise ConfigError(
+                "backfill_quantized_vectors needs a mode (int8 or binary); "
+                "pass one or set LORE_VECTOR_QUANTIZATION"
+            )
+        self._quantization = mode
+        self._quant_ready = False
+        self._quant_checked_at = float("-inf")
+        async with self.transaction() as tx:
+            await self._init_quant_table(tx)
+        fn = _QUANT_SQL_FN[mode]
+        written = 0
+        last = 0
+        while True:
+            async with self._acquire() as conn:
+                async with conn.execute(
+                    "SELECT v.memory_rowid, v.org_id, v.embedding FROM memory_vectors v "
+                    "WHERE v.memory_rowid > ? "
+                    "AND NOT EXISTS (SELECT 1 FROM memory_vectors_q q "
+                    "                WHERE q.memory_rowid = v.memory_rowid) "
+                    "ORDER BY v.memory_rowid LIMIT ?",
+                    (last, batch_size),
+                ) as cur:
+                    batch = await cur.fetchall()
+            if not batch:
+                break
+            async with self.transaction() as tx:
+                await tx.executemany(
+                    "INSERT INTO memory_vectors_q(memory_rowid, org_id, embedding) "
+                    f"VALUES (?, ?, {fn}(?))",
+                    [
+                        (r[0], r[1], quantize(np.frombuffer(r[2], dtype="<f4"), mode))
+                        for r in batch
+                    ],
                 )
+            written += len(batch)
+            last = batch[-1][0]
+        async with self.transaction() as tx:
+            await tx.execute(
+                "INSERT INTO vector_quantization(mode, vectors, completed_at) "
+                "VALUES (?, (SELECT COUNT(*) FROM memory_vectors_q), datetime('now')) "
+                "ON CONFLICT (mode) DO UPDATE SET vectors = excluded.vectors, "
+                "completed_at = excluded.completed_at",
+                (mode,),
             )
-        return scored
+        self._quant_ready = True
+        return written
 
     async def upsert_memory_with_embedding(
         self,
@@ -1805,7 +2330,7 @@ class SqliteStore:
         encoded_meta = json.dumps(dict(meta))
         safe_context = context if context is not None else ""
         expires_iso = expires_at.isoformat() if expires_at is not None else None
-        embedding_repr = repr(list(embedding)) if embedding is not None else None
+        embedding_blob = _encode_vec(embedding) if embedding is not None else None
 
         async with self.transaction() as tx:
             async with tx.execute(
@@ -1841,12 +2366,8 @@ class SqliteStore:
                 )
                 rowid = cursor.lastrowid
                 await cursor.close()
-                if embedding_repr is not None:
-                    await tx.execute(
-                        "INSERT INTO memory_vectors(memory_rowid, embedding) "
-                        "VALUES (?, ?)",
-                        (rowid, embedding_repr),
-                    )
+                if embedding_blob is not None:
+                    await self._insert_vector(tx, rowid, org_id, embedding_blob)
                 return True
             # Existing row: silent no-op if the supplied org_id mismatches.
             if existing["org_id"] != org_id:
@@ -1884,16 +2405,9 @@ class SqliteStore:
             await cursor.close()
             rowid = existing["rowid"]
             # Refresh the vec0 companion to match the new embedding (if any).
-            await tx.execute(
-                "DELETE FROM memory_vectors WHERE memory_rowid = ?",
-                (rowid,),
-            )
-            if embedding_repr is not None:
-                await tx.execute(
-                    "INSERT INTO memory_vectors(memory_rowid, embedding) "
-                    "VALUES (?, ?)",
-                    (rowid, embedding_repr),
-                )
+            await self._delete_vectors(tx, "= ?", (rowid,))
+            if embedding_blob is not None:
+                await self._insert_vector(tx, rowid, org_id, embedding_blob)
             return False
 
     async def import_extracted_memory(
@@ -2025,6 +2539,50 @@ class SqliteStore:
             )
             await conn.commit()
 
+    async def record_access_batch(
+        self,
+        bumps: Mapping[Tuple[str, str], int],
+        events: Sequence["NewRetrievalEvent"],
+    ) -> None:
+        """Apply buffered access-count bumps and retrieval events in one
+        ``BEGIN IMMEDIATE`` transaction (one writer-lock acquisition, one
+        commit, busy retries).
+
+        Mirrors ``PostgresStore.record_access_batch``. The access columns are
+        outside the ``memories_fts_au`` trigger's column list (031), so the
+        bumps do not touch the FTS index.
+        """
+        if not bumps and not events:
+            return
+        async with self.transaction() as tx:
+            if bumps:
+                await tx.executemany(
+                    "UPDATE memories SET "
+                    "access_count = COALESCE(access_count, 0) + ?, "
+                    "last_accessed_at = datetime('now') "
+                    "WHERE id = ? AND org_id = ?",
+                    [(hits, mid, org) for (org, mid), hits in bumps.items()],
+                )
+            if events:
+                await tx.executemany(
+                    """
+                    INSERT INTO retrieval_events
+                        (org_id, query, results_count, scores, memory_ids,
+                         avg_score, max_score, min_score_threshold, query_time_ms,
+                         project, format)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            e.org_id, e.query, e.results_count,
+                            json.dumps(list(e.scores)), json.dumps(list(e.memory_ids)),
+                            e.avg_score, e.max_score, e.min_score_threshold,
+                            e.query_time_ms, e.project, e.format,
+                        )
+                        for e in events
+                    ],
+                )
+
     async def record_memory_access(
         self, org_id: str, memory_id: str
     ) -> Optional["StoredMemory"]:
@@ -2104,7 +2662,7 @@ class SqliteStore:
             f"WHERE {' AND '.join(where)} "
             "ORDER BY created_at DESC LIMIT ?"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return tuple(_row_to_memory(r) for r in rows)
@@ -2151,7 +2709,7 @@ class SqliteStore:
         where_sql = " AND ".join(where_parts)
         params_t = tuple(params)
 
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             # ── Summary stats ──────────────────────────────────────
             async with conn.execute(
                 f"""
@@ -2347,7 +2905,7 @@ class SqliteStore:
             "org_id = ? AND created_at >= datetime('now', "
             f"'-{window} minutes')"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if metric_sql.startswith("PCT::"):
                 pct = float(metric_sql.split("::", 1)[1])
                 async with conn.execute(
@@ -2419,7 +2977,7 @@ class SqliteStore:
             f"org_id = ? AND created_at >= datetime('now', '-{hours} hours')"
         )
 
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if metric_sql.startswith("PCT::"):
                 pct = float(metric_sql.split("::", 1)[1])
                 # Per-bucket CTE: rank rows within each bucket, then pick
@@ -2480,7 +3038,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_profile``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._PROFILE_COLS} FROM retrieval_profiles WHERE id = ?",
                 (profile_id,),
@@ -2495,7 +3053,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_profile_by_name``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._PROFILE_COLS} FROM retrieval_profiles "
                 "WHERE name = ? AND org_id = ?",
@@ -2510,7 +3068,7 @@ class SqliteStore:
         Mirrors ``PostgresStore.list_profiles`` — matches rows where
         ``org_id = ? OR org_id = '__global__'``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._PROFILE_COLS} FROM retrieval_profiles "
                 "WHERE org_id = ? OR org_id = '__global__' "
@@ -2679,7 +3237,7 @@ class SqliteStore:
         ordered so the org-owned row wins on ties (returns the org-owned
         match if present, otherwise the ``__global__`` preset).
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._PROFILE_COLS} FROM retrieval_profiles "
                 "WHERE name = ? AND (org_id = ? OR org_id = '__global__') "
@@ -2703,7 +3261,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_workspace``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._WORKSPACE_COLS} FROM workspaces "
                 "WHERE id = ? AND org_id = ?",
@@ -2731,7 +3289,7 @@ class SqliteStore:
                 "WHERE org_id = ? AND archived_at IS NULL ORDER BY name"
             )
             params = (org_id,)
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, params) as cur:
                 rows = await cur.fetchall()
         return tuple(_row_to_workspace(r) for r in rows)
@@ -2877,7 +3435,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_workspace_members``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._MEMBER_COLS} FROM workspace_members "
                 "WHERE workspace_id = ? ORDER BY invited_at",
@@ -2941,7 +3499,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_api_key``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._API_KEY_COLS} FROM api_keys WHERE id = ?",
                 (key_id,),
@@ -2954,7 +3512,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_api_keys``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._API_KEY_COLS} FROM api_keys "
                 "WHERE org_id = ? ORDER BY created_at",
@@ -3029,7 +3587,7 @@ class SqliteStore:
         Mirrors ``PostgresStore.count_active_root_keys`` — ``is_root`` is
         stored as INTEGER 1/0 in SQLite so the predicate uses ``= 1``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT COUNT(*) AS cnt FROM api_keys "
                 "WHERE org_id = ? AND is_root = 1 AND revoked_at IS NULL",
@@ -3044,7 +3602,7 @@ class SqliteStore:
         Hot path: every authenticated request lands here on cache miss.
         Mirrors ``PostgresStore.lookup_api_key_by_hash``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._API_KEY_COLS} FROM api_keys WHERE key_hash = ?",
                 (key_hash,),
@@ -3084,7 +3642,7 @@ class SqliteStore:
         DISTINCT FROM``), so the same predicate works for both
         ``workspace_id IS NULL`` and ``workspace_id = 'ws_x'`` cases.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._RECOMMENDATION_CONFIG_COLS} "
                 "FROM recommendation_config "
@@ -3230,14 +3788,14 @@ class SqliteStore:
         sql = (
             "SELECT m.id, m.content, m.meta, m.created_at, "
             "m.access_count, m.last_accessed_at, "
-            "vec_to_json(v.embedding) AS embedding_json "
+            "v.embedding "
             "FROM memories m "
             "INNER JOIN memory_vectors v ON v.memory_rowid = m.rowid "
             f"WHERE {' AND '.join(where)} "
             "ORDER BY m.created_at DESC "
             "LIMIT ?"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return tuple(_row_to_recommendation_candidate(r) for r in rows)
@@ -3294,7 +3852,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_conversation_job``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._CONVERSATION_JOB_COLS} FROM conversation_jobs "
                 "WHERE id = ? AND org_id = ?",
@@ -3445,7 +4003,7 @@ class SqliteStore:
             "ORDER BY created_at DESC "
             "LIMIT ?"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return tuple(_row_to_audit_entry(r) for r in rows)
@@ -3464,7 +4022,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_retention_policies``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._RETENTION_POLICY_COLS} FROM retention_policies "
                 "WHERE org_id = ? ORDER BY name",
@@ -3480,7 +4038,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_retention_policy``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._RETENTION_POLICY_COLS} FROM retention_policies "
                 "WHERE id = ? AND org_id = ?",
@@ -3616,7 +4174,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_latest_snapshot_for_policy``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT id, org_id, policy_id, name, path, size_bytes, memory_count, "
                 "encrypted, created_at "
@@ -3633,7 +4191,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.count_snapshots_for_policy``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT COUNT(*) AS c FROM snapshot_metadata WHERE policy_id = ?",
                 (policy_id,),
@@ -3693,7 +4251,7 @@ class SqliteStore:
         ``restore_drill_results`` to ``snapshot_metadata`` on snapshot id
         and filters by policy_id + org_id; newest first.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT r.id, r.org_id, r.snapshot_id, r.snapshot_name, r.started_at, "
                 "r.completed_at, r.recovery_time_ms, r.memories_restored, "
@@ -3715,7 +4273,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_latest_drill_result``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT id, org_id, snapshot_id, snapshot_name, started_at, "
                 "completed_at, recovery_time_ms, memories_restored, status, error, "
@@ -3741,7 +4299,7 @@ class SqliteStore:
         Mirrors ``PostgresStore.list_slo_definitions`` — preserves the
         multi-tenancy quirk where ``org_id=None`` skips the WHERE clause.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if org_id is not None:
                 async with conn.execute(
                     f"SELECT {self._SLO_DEFINITION_COLS} FROM slo_definitions "
@@ -3764,7 +4322,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_slo_definition``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._SLO_DEFINITION_COLS} FROM slo_definitions "
                 "WHERE id = ? AND org_id = ?",
@@ -3901,7 +4459,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_slo_alerts``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if slo_id is not None:
                 async with conn.execute(
                     "SELECT a.id, a.org_id, a.slo_id, a.metric_value, a.threshold, "
@@ -4066,7 +4624,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_agent_sharing_configs``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT agent_id, enabled, categories, updated_at "
                 "FROM agent_sharing_config "
@@ -4157,7 +4715,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.list_deny_rules``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT id, pattern, is_regex, reason, created_at "
                 "FROM deny_list_rules "
@@ -4267,7 +4825,7 @@ class SqliteStore:
             f"WHERE {' AND '.join(where)} "
             "ORDER BY created_at DESC LIMIT ?"
         )
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return tuple(
@@ -4313,7 +4871,7 @@ class SqliteStore:
         (post-migration 009 ``lessons`` is a view; aggregations remain
         correct on the base table).
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT COUNT(*) AS c FROM memories WHERE org_id = ?",
                 (org_id,),
@@ -4356,10 +4914,8 @@ class SqliteStore:
             ) as cur:
                 count_row = await cur.fetchone()
             deleted_lessons = int(count_row["c"]) if count_row else 0
-            await tx.execute(
-                "DELETE FROM memory_vectors WHERE memory_rowid IN ("
-                "SELECT rowid FROM memories WHERE org_id = ?)",
-                (org_id,),
+            await self._delete_vectors(
+                tx, "IN (SELECT rowid FROM memories WHERE org_id = ?)", (org_id,),
             )
             await tx.execute("DELETE FROM memories WHERE org_id = ?", (org_id,))
             await tx.execute("DELETE FROM sharing_audit WHERE org_id = ?", (org_id,))
@@ -4375,7 +4931,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_entity``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, name, entity_type, aliases, description, metadata,
@@ -4394,7 +4950,7 @@ class SqliteStore:
 
         Mirrors ``PostgresStore.get_entity_by_name``.
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, name, entity_type, aliases, description, metadata,
@@ -4408,6 +4964,31 @@ class SqliteStore:
                 row = await cur.fetchone()
         return _row_to_entity(row) if row else None
 
+    async def get_entities_by_names(
+        self, names: Sequence[str], org_id: str,
+    ) -> Sequence[StoredEntity]:
+        """Batched exact-name lookup; one ``IN (SELECT value FROM json_each(?))`` query.
+
+        Mirrors ``PostgresStore.get_entities_by_names`` (``name = ANY($2)``).
+        ``json_each`` keeps the statement text constant regardless of how
+        many names are passed, so it is prepared once.
+        """
+        if not names:
+            return []
+        async with self._read() as conn:
+            async with conn.execute(
+                """
+                SELECT id, org_id, name, entity_type, aliases, description, metadata,
+                       mention_count, first_seen_at, last_seen_at,
+                       created_at, updated_at
+                FROM entities
+                WHERE org_id = ? AND name IN (SELECT value FROM json_each(?))
+                """,
+                (org_id, json.dumps(list(names))),
+            ) as cur:
+                rows = await cur.fetchall()
+        return [_row_to_entity(r) for r in rows]
+
     async def find_entity_by_name_or_alias(
         self, name: str, org_id: str,
     ) -> Optional[StoredEntity]:
@@ -4429,7 +5010,7 @@ class SqliteStore:
         """
         # Pass 1: exact name (case-insensitive).
         lname = name.lower()
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, name, entity_type, aliases, description, metadata,
@@ -4448,7 +5029,7 @@ class SqliteStore:
         # Pass 2: scan aliases. Bounded by the entities table size,
         # which stays small in practice (a few hundred entries even
         # for very active sessions).
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, name, entity_type, aliases, description, metadata,
@@ -4501,7 +5082,7 @@ class SqliteStore:
             ORDER BY mention_count DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_entity(r) for r in rows]
@@ -4689,7 +5270,7 @@ class SqliteStore:
 
     async def get_mentions_for_memory(self, memory_id: str, org_id: str) -> Sequence[StoredMention]:
         """Mentions linking entities to a given memory, newest first."""
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, entity_id, memory_id, mention_type, confidence, created_at
@@ -4710,7 +5291,7 @@ class SqliteStore:
         limit: int = 100,
     ) -> Sequence[StoredMention]:
         """Mentions linking memories to a given entity, newest first."""
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, entity_id, memory_id, mention_type, confidence, created_at
@@ -4753,7 +5334,7 @@ class SqliteStore:
 
     async def count_memories_for_entity(self, entity_id: str, org_id: str) -> int:
         """Distinct memory count for an entity."""
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 "SELECT COUNT(DISTINCT memory_id) AS n FROM entity_mentions "
                 "WHERE entity_id = ? AND org_id = ?",
@@ -4828,7 +5409,7 @@ class SqliteStore:
             ORDER BY m.created_at DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_memory(r) for r in rows]
@@ -4837,7 +5418,7 @@ class SqliteStore:
 
     async def get_relationship(self, rel_id: str, org_id: str) -> Optional[StoredRelationship]:
         """Fetch a relationship by id, or None when missing."""
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, source_entity_id, target_entity_id, rel_type, weight,
@@ -4860,7 +5441,7 @@ class SqliteStore:
         rel_type: str,
     ) -> Optional[StoredRelationship]:
         """Active (valid_until IS NULL) edge for the (source, target, type) triple."""
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, source_entity_id, target_entity_id, rel_type, weight,
@@ -4904,7 +5485,7 @@ class SqliteStore:
             ORDER BY (weight IS NULL), weight DESC, created_at DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_relationship(r) for r in rows]
@@ -5160,7 +5741,7 @@ class SqliteStore:
             ORDER BY r.created_at DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [
@@ -5280,7 +5861,7 @@ class SqliteStore:
             WHERE {' AND '.join(where)}
             ORDER BY (weight IS NULL), weight DESC, created_at DESC
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_relationship(r) for r in rows]
@@ -5308,7 +5889,7 @@ class SqliteStore:
         cutoff_24h = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
         cutoff_7d = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
 
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT COUNT(*) AS n FROM memories {mem_where}",
                 tuple(mem_args),
@@ -5449,7 +6030,7 @@ class SqliteStore:
             GROUP BY bucket_date, mem_type
             ORDER BY bucket_date
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(proj_args)) as cur:
                 rows = await cur.fetchall()
         return [
@@ -5503,7 +6084,7 @@ class SqliteStore:
             ORDER BY m.created_at DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_memory(r) for r in rows]
@@ -5524,7 +6105,7 @@ class SqliteStore:
         translation in 3D's ``list_memories_paginated``.
         """
         like_pattern = f"%{query.lower()}%"
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, org_id, content, context, tags, source,
@@ -5628,7 +6209,7 @@ class SqliteStore:
             ORDER BY fts_rank DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(sql_params)) as cur:
                 rows = await cur.fetchall()
         return [(_row_to_memory(r), float(r["fts_rank"])) for r in rows]
@@ -5689,7 +6270,7 @@ class SqliteStore:
             LIMIT ?
         """
         params = (*params_tail, limit)
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, params) as cur:
                 rows = await cur.fetchall()
         return [(_row_to_memory(r), int(r["overlap_count"])) for r in rows]
@@ -5813,7 +6394,7 @@ class SqliteStore:
         resolve to the lexicographically-greater ULID (which is the more
         recent one — ULIDs are time-ordered).
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._DREAM_RUN_COLS} FROM dream_runs "
                 "WHERE org_id = ? ORDER BY started_at DESC, id DESC LIMIT 1",
@@ -5836,7 +6417,7 @@ class SqliteStore:
         if since.tzinfo is None:
             since = since.replace(tzinfo=timezone.utc)
         since_iso = since.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT COUNT(DISTINCT json_extract(meta, '$.session_id')) AS n
@@ -5850,6 +6431,38 @@ class SqliteStore:
                 row = await cur.fetchone()
         return int(row["n"]) if row and row["n"] is not None else 0
 
+    # ── ConsolidationOps ─────────────────────────────────────────────
+
+    async def get_consolidation_watermark(
+        self, org_id: str, project: Optional[str] = None,
+    ) -> Optional[datetime]:
+        """Mirrors ``PostgresStore.get_consolidation_watermark``."""
+        async with self._read() as conn:
+            async with conn.execute(
+                "SELECT watermark FROM consolidation_watermarks "
+                "WHERE org_id = ? AND project = ?",
+                (org_id, project or ""),
+            ) as cur:
+                row = await cur.fetchone()
+        return _parse_iso(row["watermark"]) if row else None
+
+    async def set_consolidation_watermark(
+        self, org_id: str, watermark: datetime, project: Optional[str] = None,
+    ) -> None:
+        """Upsert the watermark, stored in ``memories.created_at``'s shape."""
+        async with self._acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO consolidation_watermarks (org_id, project, watermark)
+                VALUES (?, ?, ?)
+                ON CONFLICT (org_id, project) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    updated_at = datetime('now')
+                """,
+                (org_id, project or "", self._to_iso(watermark)),
+            )
+            await conn.commit()
+
     # ── SupersessionOps (Phase 6F) ───────────────────────────────────
 
     @staticmethod
@@ -5890,7 +6503,7 @@ class SqliteStore:
         *,
         at: Optional[datetime] = None,
     ) -> bool:
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if at is None:
                 async with conn.execute(
                     """
@@ -5925,7 +6538,7 @@ class SqliteStore:
     async def are_superseded(
         self,
         memory_ids: "set[str]",
-        org_id: str,
+        org_id: Optional[str] = None,
         *,
         at: Optional[datetime] = None,
     ) -> "set[str]":
@@ -5945,11 +6558,11 @@ class SqliteStore:
                 "         ) AS rn"
                 "  FROM memory_supersessions"
                 f"  WHERE memory_id IN ({placeholders})"
-                "    AND memory_id IN (SELECT id FROM memories WHERE org_id = ?)"
+                "    AND (? IS NULL OR memory_id IN (SELECT id FROM memories WHERE org_id = ?))"
                 ") latest "
                 "WHERE rn = 1 AND superseded_by IS NOT NULL"
             )
-            params: tuple = tuple(ids) + (org_id,)
+            params: tuple = tuple(ids) + (org_id, org_id)
         else:
             sql = (
                 "SELECT memory_id FROM ("
@@ -5959,13 +6572,13 @@ class SqliteStore:
                 "         ) AS rn"
                 "  FROM memory_supersessions"
                 f"  WHERE memory_id IN ({placeholders})"
-                "    AND memory_id IN (SELECT id FROM memories WHERE org_id = ?)"
+                "    AND (? IS NULL OR memory_id IN (SELECT id FROM memories WHERE org_id = ?))"
                 "    AND ts <= ?"
                 ") latest "
                 "WHERE rn = 1 AND superseded_by IS NOT NULL"
             )
-            params = tuple(ids) + (org_id, self._to_iso(at))
-        async with self._acquire() as conn:
+            params = tuple(ids) + (org_id, org_id, self._to_iso(at))
+        async with self._read() as conn:
             async with conn.execute(sql, params) as cur:
                 rows = await cur.fetchall()
         return {r["memory_id"] for r in rows}
@@ -5974,7 +6587,7 @@ class SqliteStore:
         self,
         memory_id: str,
     ) -> Sequence[StoredSupersession]:
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, memory_id, superseded_by, reason, ts, agent
@@ -6002,7 +6615,7 @@ class SqliteStore:
         memory_id: str,
         org_id: str,
     ) -> Sequence[StoredSupersession]:
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, memory_id, superseded_by, reason, ts, agent
@@ -6084,7 +6697,7 @@ class SqliteStore:
             ORDER BY m.created_at DESC
             LIMIT ?
         """
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(sql, tuple(params)) as cur:
                 rows = await cur.fetchall()
         return [_row_to_memory(r) for r in rows]
@@ -6181,7 +6794,7 @@ class SqliteStore:
         *,
         at: Optional[datetime] = None,
     ) -> bool:
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             if at is None:
                 async with conn.execute(
                     """
@@ -6222,7 +6835,7 @@ class SqliteStore:
         relationship_id: str,
         org_id: str,
     ) -> Sequence[StoredRelationshipSupersession]:
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 """
                 SELECT id, relationship_id, superseded_by, reason, ts, agent
@@ -6268,7 +6881,7 @@ class SqliteStore:
         # Anchor lookup. We don't gate by ``expires_at`` here because the
         # caller expects a deterministic 404 vs 200 against the visible row;
         # if a row is expired it's already been swept by ``expire_memories``.
-        async with self._acquire() as conn:
+        async with self._read() as conn:
             async with conn.execute(
                 f"SELECT {self._MEMORY_COLS} FROM memories "
                 "WHERE id = ? AND org_id = ?",
@@ -6305,7 +6918,7 @@ class SqliteStore:
             )
             params = (org_id, anchor.project, anchor_id, anchor_ts_raw,
                       days_window, anchor_ts_raw, n)
-            async with self._acquire() as conn:
+            async with self._read() as conn:
                 async with conn.execute(sql, params) as cur:
                     rows = await cur.fetchall()
             return [_row_to_memory(r) for r in rows]
@@ -6393,6 +7006,30 @@ class _SqliteConnCtx:
         return None
 
 
+class _SqliteReaderCtx:
+    """``SqliteStore._read()``: check a reader out of the pool for one block."""
+
+    def __init__(self, store: "SqliteStore"):
+        self._store = store
+        self._pool: Optional[asyncio.Queue] = None
+        self._conn = None
+
+    async def __aenter__(self):
+        self._pool = self._store._idle_readers
+        if self._pool is None:
+            return await _SqliteConnCtx(self._store._conn).__aenter__()
+        self._conn = await self._pool.get()
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._conn is not None:
+            # Not returned to a pool that ``close()`` has since discarded.
+            if self._store._idle_readers is self._pool:
+                self._pool.put_nowait(self._conn)
+            self._conn = None
+        return None
+
+
 # ── Stub Store-protocol surface ───────────────────────────────────────
 # All Store methods are wired here as NotImplementedError stubs so that
 # Phase 3A can be merged without falsely advertising a complete backend.
@@ -26,6 +26,9 @@ class NewMemory:
     # the row is unowned and the per-user recall predicate never filters it.
     # New captures are 'private' by the column default; ``promote`` shares them.
     user_id: Optional[str] = None
+    # Migration 032: upstream message id from an ingest adapter (``source``).
+    # Unique per (org_id, source) when set; see ``get_memory_by_source_id``.
+    source_message_id: Optional[str] = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,153 @@
+"""Write-behind access tracking for ``GET /v1/retrieve``.
+
+Every retrieve used to fire two writes of its own — an ``access_count``
+bump for the returned memories and a ``retrieval_events`` row — each
+committing immediately. Under read-heavy load that turns reads into a
+stream of small write transactions competing for the writer lock (and, on
+SQLite before migration 031, into FTS index churn for every recalled row).
+
+:class:`AccessTracker` buffers both in memory: hits for the same memory
+are summed, events are queued, and the buffer is written with one
+``Store.record_access_batch`` call — one transaction — when the flush
+interval elapses or ``max_pending`` retrievals have accumulated. On
+shutdown, flushes already in flight are awaited and the rest of the buffer
+is written before the store closes; a crash loses at most one interval of
+access counts, which are analytics, not content.
+
+``LORE_ACCESS_FLUSH_INTERVAL`` (seconds, default 1) sets the interval; ``0``
+writes each retrieval's tracking immediately, in its own transaction.
+``LORE_ACCESS_FLUSH_MAX_PENDING`` (default 1000) bounds the buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from lore.persistence import Store
+    from lore.persistence.types import NewRetrievalEvent
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_FLUSH_INTERVAL = 1.0
+_DEFAULT_MAX_PENDING = 1000
+
+
+@dataclass
+class _Pending:
+    store: "Store"
+    bumps: "Counter[Tuple[str, str]]" = field(default_factory=Counter)
+    events: List["NewRetrievalEvent"] = field(default_factory=list)
+    retrievals: int = 0
+
+
+class AccessTracker:
+    """Buffers access-count bumps and retrieval events per store."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self._pending: Dict[int, _Pending] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def record(
+        self,
+        store: "Store",
+        org_id: str,
+        memory_ids: Sequence[str],
+        event: Optional["NewRetrievalEvent"] = None,
+    ) -> None:
+        """Buffer one retrieval's tracking. Must run on the event loop."""
+        pending = self._pending.get(id(store))
+        if pending is None:
+            pending = self._pending[id(store)] = _Pending(store)
+        for memory_id in memory_ids:
+            pending.bumps[(org_id, memory_id)] += 1
+        if event is not None:
+            pending.events.append(event)
+        pending.retrievals += 1
+
+        loop = asyncio.get_running_loop()
+        if self.flush_interval <= 0 or pending.retrievals >= self.max_pending:
+            self._spawn_flush(loop)
+        elif self._timer is None or self._timer_loop is not loop:
+            self._timer = loop.call_later(self.flush_interval, self._spawn_flush, loop)
+            self._timer_loop = loop
+
+    def pending(self) -> int:
+        """Retrievals buffered and not yet written."""
+        return sum(p.retrievals for p in self._pending.values())
+
+    async def flush(self) -> None:
+        """Write everything buffered so far; failures are logged and dropped."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batches, self._pending = list(self._pending.values()), {}
+        for batch in batches:
+            try:
+                await batch.store.record_access_batch(dict(batch.bumps), batch.events)
+            except Exception:
+                logger.warning(
+                    "Failed to flush access tracking for %d retrievals",
+                    batch.retrievals, exc_info=True,
+                )
+
+    async def drain(self) -> None:
+        """Wait for in-flight flushes, then write what is still buffered.
+
+        For shutdown: a timer- or ``max_pending``-started flush may still be
+        mid-write, and the store must outlive it.
+        """
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        await self.flush()
+
+    def _spawn_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+_tracker: Optional[AccessTracker] = None
+
+
+def get_access_tracker() -> AccessTracker:
+    """The process-wide tracker, configured from the environment on first use."""
+    global _tracker
+    if _tracker is None:
+        _tracker = AccessTracker(
+            flush_interval=_env_float("LORE_ACCESS_FLUSH_INTERVAL", _DEFAULT_FLUSH_INTERVAL),
+            max_pending=int(_env_float("LORE_ACCESS_FLUSH_MAX_PENDING", _DEFAULT_MAX_PENDING)),
+        )
+    return _tracker
+
+
+def set_access_tracker(tracker: Optional[AccessTracker]) -> None:
+    global _tracker
+    _tracker = tracker
+
+
+async def flush_access_tracking() -> None:
+    """Drain the process-wide tracker, if one was created (shutdown hook)."""
+    if _tracker is not None:
+        await _tracker.drain()
@@ -219,6 +219,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         scheduler_task.cancel()
     if idle_task is not None:
         idle_task.cancel()
+    from lore.server.access_tracking import flush_access_tracking
+    await flush_access_tracking()
     await close_store()
     if not is_sqlite:
         await close_pool()
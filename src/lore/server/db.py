@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -12,31 +14,105 @@ except ImportError:
     asyncpg = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
+    from lore.persistence.factory import PoolOptions
     from lore.persistence.protocol import Store
 
 logger = logging.getLogger(__name__)
 
-# Global connection pool
-_pool: Optional["asyncpg.Pool"] = None
 
+class InstrumentedPool:
+    """An asyncpg pool that records how long callers wait for a connection.
 
-async def get_pool() -> "asyncpg.Pool":
+    ``acquire()`` applies the configured acquire timeout and feeds the
+    ``lore_db_pool_*`` metrics; everything else is forwarded to the wrapped
+    pool. Only the ``async with pool.acquire() as conn`` form is supported,
+    which is the only one the server uses.
+    """
+
+    def __init__(self, pool: "asyncpg.Pool", *, acquire_timeout: Optional[float] = None):
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+        # Callers currently inside acquire() — still waiting for a connection.
+        self.waiting = 0
+
+    def acquire(self, *, timeout: Optional[float] = None) -> "_InstrumentedAcquire":
+        return _InstrumentedAcquire(
+            self, timeout if timeout is not None else self._acquire_timeout,
+        )
+
+    async def close(self) -> None:
+        # The Store built by init_store shares this pool, so close_store and
+        # close_pool both reach here; the second call is a no-op.
+        if not self._pool.is_closing():
+            await self._pool.close()
+
+    def __getattr__(self, name: str):
+        return getattr(self._pool, name)
+
+
+class _InstrumentedAcquire:
+    __slots__ = ("_owner", "_timeout", "_conn")
+
+    def __init__(self, owner: InstrumentedPool, timeout: Optional[float]):
+        self._owner = owner
+        self._timeout = timeout
+        self._conn = None
+
+    async def __aenter__(self):
+        from lore.server.metrics import db_pool_acquire_latency, db_pool_acquire_timeouts_total
+
+        owner = self._owner
+        owner.waiting += 1
+        start = time.perf_counter()
+        try:
+            self._conn = await owner._pool.acquire(timeout=self._timeout)
+        except asyncio.TimeoutError:
+            db_pool_acquire_timeouts_total.inc()
+            raise
+        finally:
+            owner.waiting -= 1
+        db_pool_acquire_latency.observe(time.perf_counter() - start)
+        return self._conn
+
+    async def __aexit__(self, *exc) -> None:
+        conn, self._conn = self._conn, None
+        await self._owner._pool.release(conn)
+
+
+# Global connection pool, shared by the raw-SQL routes/workers and the Store.
+_pool: Optional[InstrumentedPool] = None
+
+
+async def get_pool() -> InstrumentedPool:
     """Return the global connection pool. Raises if not initialized."""
     if _pool is None:
         raise RuntimeError("Database pool not initialized. Call init_pool() first.")
     return _pool
 
 
-async def init_pool(database_url: str) -> "asyncpg.Pool":
-    """Create and store the global connection pool."""
+async def init_pool(
+    database_url: str, options: "Optional[PoolOptions]" = None,
+) -> InstrumentedPool:
+    """Create and store the global connection pool.
+
+    Sized from ``options``, or from the ``LORE_DB_POOL_*`` environment
+    variables when omitted (see ``PoolOptions.from_env``).
+    """
     global _pool
     if asyncpg is None:
         raise ImportError(
             "asyncpg is required for the Lore server. "
             "Install it with: pip install lore-sdk[server]"
         )
-    _pool = await asyncpg.create_pool(database_url, min_size=2, max_size=10)
-    logger.info("Database connection pool created")
+    from lore.persistence.factory import PoolOptions, create_pg_pool
+
+    options = options or PoolOptions.from_env()
+    raw = await create_pg_pool(database_url, options)
+    _pool = InstrumentedPool(raw, acquire_timeout=options.acquire_timeout)
+    logger.info(
+        "Database connection pool created (min=%d, max=%d, acquire timeout=%s)",
+        options.min_size, options.max_size, options.acquire_timeout,
+    )
     return _pool
 
 
@@ -127,20 +203,33 @@ async def run_migrations(pool: "asyncpg.Pool", migrations_dir: str = "migrations
 
 
 # ── Store (new persistence abstraction) ───────────────────────────────────────
-# Coexists with _pool / init_pool / get_pool / close_pool above.
-# Other routes continue using get_pool() until they migrate in 1B–1G.
+# On Postgres the Store runs on the same pool as get_pool(), so one set of
+# connections (and one set of pool metrics) serves the whole server.
 
 _store: "Store | None" = None  # type: ignore[assignment]
 
 
 async def init_store(database_url: str) -> "Store":
-    """Create and store the global Store. Idempotent."""
+    """Create and store the global Store. Idempotent.
+
+    When ``init_pool`` already ran, a Postgres Store reuses that pool
+    rather than opening a second one.
+    """
     global _store
     from lore.persistence.factory import make_store
+    from lore.server.retrieve_cache import InvalidatingStore, get_retrieve_cache
 
     if _store is None:
-        _store = await make_store(database_url)
-        logger.info("Store initialized: %s", type(_store).__name__)
+        if _pool is not None:
+            # The pool may predate the migration that installs pgvector;
+            # recycle its connections so each one registers the vector codec.
+            await _pool.expire_connections()
+        store = await make_store(database_url, pool=_pool)
+        logger.info("Store initialized: %s", type(store).__name__)
+        # Track writes so GET /v1/retrieve can serve cached results until
+        # the org's data changes.
+        cache = get_retrieve_cache()
+        _store = InvalidatingStore(store, cache) if cache is not None else store
     return _store
 
 
@@ -19,6 +19,11 @@ class _Counter:
         key = tuple(kwargs.get(l, "") for l in self.labels)
         self._values[key] += amount
 
+    def set_total(self, value: float, **kwargs: str) -> None:
+        """Mirror a monotonically increasing total that is counted elsewhere."""
+        key = tuple(kwargs.get(l, "") for l in self.labels)
+        self._values[key] = value
+
     def collect(self) -> str:
         lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
         if not self._values:
@@ -109,6 +114,16 @@ embedding_latency = _Histogram("lore_embedding_latency_seconds", "Embedding gene
 vector_search_latency = _Histogram("lore_vector_search_latency_seconds", "Vector search latency")
 db_pool_size = _Gauge("lore_db_pool_size", "DB connection pool size")
 db_pool_available = _Gauge("lore_db_pool_available", "DB connections available in pool")
+db_pool_max_size = _Gauge("lore_db_pool_max_size", "Configured DB connection pool maximum")
+db_pool_in_use = _Gauge("lore_db_pool_in_use", "DB connections checked out of the pool")
+db_pool_waiters = _Gauge("lore_db_pool_waiters", "Callers waiting for a DB connection")
+db_pool_acquire_latency = _Histogram(
+    "lore_db_pool_acquire_seconds", "Time spent waiting for a DB connection from the pool",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, float("inf")),
+)
+db_pool_acquire_timeouts_total = _Counter(
+    "lore_db_pool_acquire_timeouts_total", "DB pool acquires that hit LORE_DB_POOL_ACQUIRE_TIMEOUT",
+)
 
 # ── Retrieval Metrics ─────────────────────────────────────────────
 
@@ -120,6 +135,29 @@ retrieve_max_score = _Histogram(
     "lore_retrieve_max_score", "Max score per retrieve query",
     buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, float("inf")),
 )
+retrieve_stage_latency = _Histogram(
+    "lore_retrieve_stage_latency_seconds",
+    "Hybrid retrieve latency per stage (vector, fts, graph, fuse, supersession, rescore)",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf")),
+)
+
+# ── Embedding Cache Metrics ───────────────────────────────────────
+
+embedding_cache_hits_total = _Counter(
+    "lore_embedding_cache_hits_total", "Embeddings served from the query-embedding cache", ["model"],
+)
+embedding_cache_misses_total = _Counter(
+    "lore_embedding_cache_misses_total", "Query-embedding cache lookups that ran inference", ["model"],
+)
+embedding_cache_size = _Gauge("lore_embedding_cache_size", "Entries in the query-embedding cache")
+embedding_batches_total = _Counter(
+    "lore_embedding_batches_total", "Batched inferences run by the shared embedding service",
+)
+embedding_batched_texts_total = _Counter(
+    "lore_embedding_batched_texts_total",
+    "Embed requests served by those batches (÷ batches = mean coalesced batch size)",
+)
 
 # ── HTTP RED Metrics ───────────────────────────────────────────────
 
@@ -138,8 +176,19 @@ ALL_METRICS = [
     retrieve_empty_total,
     retrieve_latency,
     retrieve_max_score,
+    retrieve_stage_latency,
+    embedding_cache_hits_total,
+    embedding_cache_misses_total,
+    embedding_cache_size,
+    embedding_batches_total,
+    embedding_batched_texts_total,
     db_pool_size,
     db_pool_available,
+    db_pool_max_size,
+    db_pool_in_use,
+    db_pool_waiters,
+    db_pool_acquire_latency,
+    db_pool_acquire_timeouts_total,
     http_requests_total,
     http_request_duration,
 ]
@@ -151,8 +200,33 @@ def collect_all() -> str:
     try:
         from lore.server.db import _pool
         if _pool is not None:
-            db_pool_size.set(float(_pool.get_size()))
-            db_pool_available.set(float(_pool.get_idle_size()))
+            size, idle = _pool.get_size(), _pool.get_idle_size()
+            db_pool_size.set(float(size))
+            db_pool_available.set(float(idle))
+            db_pool_max_size.set(float(_pool.get_max_size()))
+            db_pool_in_use.set(float(size - idle))
+            db_pool_waiters.set(float(_pool.waiting))
+    except Exception:
+        pass
+
+    # The cache counts lookups itself (it lives below the server layer);
+    # mirror its totals here.
+    try:
+        from lore.embed.cache import shared_embedding_cache
+        cache = shared_embedding_cache()
+        for model, (hits, misses) in cache.stats().items():
+            embedding_cache_hits_total.set_total(float(hits), model=model)
+            embedding_cache_misses_total.set_total(float(misses), model=model)
+        embedding_cache_size.set(float(len(cache)))
+    except Exception:
+        pass
+
+    try:
+        from lore.embed.batching import shared_service_stats
+        stats = shared_service_stats()
+        if stats is not None:
+            embedding_batches_total.set_total(float(stats["batches"]))
+            embedding_batched_texts_total.set_total(float(stats["texts"]))
     except Exception:
         pass
 
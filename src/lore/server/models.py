@@ -29,6 +29,9 @@ class LessonCreateRequest(BaseModel):
     # Phase 6G: project-vs-global discriminator. ``None`` (default) means
     # "default by meta.type at the service layer".
     scope: Optional[Literal["project", "global"]] = None
+    # Migration 032: upstream message id from an ingest adapter (``source``).
+    # A second lesson with the same (source, source_message_id) gets a 409.
+    source_message_id: Optional[str] = None
 
     @field_validator("embedding")
     @classmethod
@@ -173,6 +176,9 @@ class LessonSearchRequest(BaseModel):
     # ``(scope='global') OR (scope='project' AND project=:current)``
     # predicate; 'all' skips it entirely.
     scope: Literal["default", "all"] = "default"
+    # Record an access for every returned lesson as part of the search, so
+    # clients don't follow up with one POST /{id}/access per result.
+    record_access: bool = False
 
     @field_validator("embedding")
     @classmethod
@@ -192,6 +198,9 @@ class LessonSearchResponse(BaseModel):
     """Response for POST /v1/lessons/search."""
 
     lessons: List[LessonSearchResult]
+    # True when the request asked for ``record_access`` and the server
+    # recorded it; absent on servers that predate the flag.
+    access_recorded: bool = False
 
 
 # ── Memory Models (v0.9.0+) ──────────────────────────────────────
@@ -228,6 +237,24 @@ class MemoryCreateResponse(BaseModel):
     id: str
 
 
+class MemoryBulkCreateRequest(BaseModel):
+    """Request body for POST /v1/memories/bulk."""
+
+    memories: List[MemoryCreateRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class MemoryBulkCreateResponse(BaseModel):
+    """Response for POST /v1/memories/bulk: one id per request item, in order.
+
+    A near-duplicate item resolves to the id of the memory it folded into
+    (an existing one or an earlier item of the batch); ``created`` counts
+    the rows actually inserted.
+    """
+
+    ids: List[str]
+    created: int
+
+
 class MemoryResponse(BaseModel):
     """Single memory (no embedding)."""
 
@@ -0,0 +1,299 @@
+"""Write-invalidated result cache for ``GET /v1/retrieve``.
+
+Hook-driven agents fire the same retrieval on every prompt of a session
+while the underlying memories rarely change between calls. The route caches
+its full response per org, keyed by the request parameters plus the org's
+*write generation* — a counter bumped by :class:`InvalidatingStore` whenever
+a memory, graph or profile write goes through the store. A bump makes every
+older entry for that org unreachable, so invalidation is O(1) and never
+scans the cache. Writes whose org cannot be determined (e.g.
+``expire_memories``) bump a global generation that is part of every key.
+
+Entries also carry a TTL (``RETRIEVE_CACHE_TTL``, default 60s) which bounds
+staleness from things that are deliberately *not* treated as writes —
+access-count bumps, time-based decay, and out-of-band SQL.
+
+Backends mirror :mod:`lore.server.rate_limit`: ``memory`` (default,
+single-process LRU), ``redis`` (shared across workers, fail-open to a miss)
+and ``off``, selected by ``RETRIEVE_CACHE_BACKEND``.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAXSIZE = 1024
+_DEFAULT_TTL_SECONDS = 60.0
+
+# Store methods that change what /v1/retrieve can return. Access tracking
+# (bump_access_counts, record_memory_access, record_retrieval_event,
+# record_access_batch) is left out on purpose: every retrieve performs it,
+# and treating it as a write would invalidate the cache on every call.
+INVALIDATING_METHODS = frozenset({
+    "insert_memory", "insert_memories", "update_memory", "delete_memory",
+    "delete_memories", "promote_memory", "demote_memory", "expire_memories",
+    "vote_memory", "enrich_memory_meta",
+    "import_extracted_memory", "upsert_memory_with_embedding",
+    "record_supersession", "rate_lesson",
+    "upsert_entity", "delete_entity", "save_mention", "replace_memory_mentions",
+    "save_relationship", "replace_memory_relationships",
+    "update_relationship_status", "update_relationship_weight",
+    "expire_relationship", "supersede_relationship",
+    "record_relationship_supersession",
+    "create_profile", "update_profile", "delete_profile",
+})
+
+
+class RetrieveCacheBackend(Protocol):
+    """Interface for retrieve-cache backends."""
+
+    def generation(self, org_id: str) -> str:
+        """Opaque token that changes whenever ``org_id`` (or any org) is written."""
+        ...
+
+    def bump(self, org_id: Optional[str]) -> None:
+        """Invalidate ``org_id``'s entries; ``None`` invalidates every org."""
+        ...
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+
+    def put(self, key: str, value: Dict[str, Any]) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryRetrieveCache:
+    """In-process LRU of serialized responses with per-org generations."""
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self, org_id: str) -> str:
+        return f"{self._global_generation}.{self._generations.get(org_id, 0)}"
+
+    def bump(self, org_id: Optional[str]) -> None:
+        with self._lock:
+            if org_id is None:
+                self._global_generation += 1
+                self._entries.clear()
+            else:
+                self._generations[org_id] = self._generations.get(org_id, 0) + 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisRetrieveCache:
+    """Redis-backed cache shared by every worker.
+
+    Generations live in ``lore:retrieve:gen:{org}`` (``INCR``); responses in
+    ``lore:retrieve:res:{key}`` with ``SETEX``. Any Redis error degrades to a
+    cache miss — the route then simply runs the full retrieval.
+    """
+
+    _GLOBAL = "lore:retrieve:gen:*"
+
+    def __init__(self, redis_url: str, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._redis_url = redis_url
+        self._redis = None
+
+    def _get_redis(self):
+        if self._redis is None:
+            try:
+                import redis as redis_lib  # type: ignore[import-untyped]
+                self._redis = redis_lib.Redis.from_url(self._redis_url, socket_connect_timeout=2, socket_timeout=2)
+                self._redis.ping()
+            except Exception as exc:
+                logger.warning("Redis unavailable (%s), retrieve cache disabled", exc)
+                self._redis = None
+        return self._redis
+
+    def generation(self, org_id: str) -> str:
+        r = self._get_redis()
+        if r is None:
+            return ""
+        try:
+            global_gen, org_gen = r.mget(self._GLOBAL, f"lore:retrieve:gen:{org_id}")
+        except Exception as exc:
+            logger.warning("Redis error reading retrieve generation (%s)", exc)
+            self._redis = None
+            return ""
+        return f"{int(global_gen or 0)}.{int(org_gen or 0)}"
+
+    def bump(self, org_id: Optional[str]) -> None:
+        r = self._get_redis()
+        if r is None:
+            return
+        try:
+            r.incr(self._GLOBAL if org_id is None else f"lore:retrieve:gen:{org_id}")
+        except Exception as exc:
+            logger.warning("Redis error bumping retrieve generation (%s)", exc)
+            self._redis = None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        r = self._get_redis()
+        if r is None:
+            return None
+        try:
+            raw = r.get(f"lore:retrieve:res:{key}")
+        except Exception as exc:
+            logger.warning("Redis error reading retrieve cache (%s)", exc)
+            self._redis = None
+            return None
+        return json.loads(raw) if raw else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        r = self._get_redis()
+        if r is None:
+            return
+        try:
+            r.setex(f"lore:retrieve:res:{key}", max(1, int(self.ttl_seconds)), json.dumps(value))
+        except Exception as exc:
+            logger.warning("Redis error writing retrieve cache (%s)", exc)
+            self._redis = None
+
+    def clear(self) -> None:
+        r = self._get_redis()
+        if r:
+            try:
+                for key in r.scan_iter("lore:retrieve:res:*"):
+                    r.delete(key)
+            except Exception:
+                pass
+
+
+def make_key(org_id: str, generation: str, **params: Any) -> str:
+    """Stable cache key: the org, its generation, and every request parameter."""
+    return f"{org_id}:{generation}:{json.dumps(params, sort_keys=True, default=str)}"
+
+
+class InvalidatingStore:
+    """Store proxy that bumps the retrieve-cache generation after each write.
+
+    Every attribute is delegated to the wrapped store; methods listed in
+    :data:`INVALIDATING_METHODS` additionally bump the generation of the org
+    they wrote to once the write has completed (bumping *after* the write
+    means a retrieval racing with it can only cache under the old, now
+    unreachable, generation).
+    """
+
+    def __init__(self, store: Any, cache: Optional[RetrieveCacheBackend] = None) -> None:
+        self._inner = store
+        self._cache = cache
+
+    @property
+    def inner(self) -> Any:
+        return self._inner
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if name not in INVALIDATING_METHODS or not callable(attr):
+            return attr
+        return self._wrap(name, attr)
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await method(*args, **kwargs)
+            cache = self._cache or get_retrieve_cache()
+            if cache is not None:
+                cache.bump(_org_of(method, args, kwargs))
+            return result
+
+        return wrapper
+
+
+def _org_of(method: Callable[..., Any], args: tuple, kwargs: dict) -> Optional[str]:
+    """The org a store call writes to: an ``org_id`` argument, or the
+    ``org_id`` of a ``New*`` payload argument (or of every payload in a
+    list of them). ``None`` when unknown."""
+    if isinstance(kwargs.get("org_id"), str):
+        return kwargs["org_id"]
+    try:
+        bound = inspect.signature(method).bind_partial(*args, **kwargs)
+    except (TypeError, ValueError):
+        return None
+    org_id = bound.arguments.get("org_id")
+    if isinstance(org_id, str):
+        return org_id
+    for value in bound.arguments.values():
+        if isinstance(value, (list, tuple)):
+            orgs = {getattr(v, "org_id", None) for v in value}
+            if len(orgs) == 1:
+                value = value[0]
+        org_id = getattr(value, "org_id", None)
+        if isinstance(org_id, str):
+            return org_id
+    return None
+
+
+_backend: Optional[RetrieveCacheBackend] = None
+_configured = False
+
+
+def get_retrieve_cache() -> Optional[RetrieveCacheBackend]:
+    """The process-wide backend, configured from the environment on first use.
+
+    Returns ``None`` when ``RETRIEVE_CACHE_BACKEND=off``.
+    """
+    global _backend, _configured
+    if not _configured:
+        _configured = True
+        backend_type = os.environ.get("RETRIEVE_CACHE_BACKEND", "memory").lower()
+        ttl = float(os.environ.get("RETRIEVE_CACHE_TTL", _DEFAULT_TTL_SECONDS))
+        if backend_type == "off":
+            _backend = None
+            logger.info("Retrieve cache: disabled")
+        elif backend_type == "redis":
+            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+            _backend = RedisRetrieveCache(redis_url, ttl)
+            logger.info("Retrieve cache: Redis backend (%s)", redis_url)
+        else:
+            maxsize = int(os.environ.get("RETRIEVE_CACHE_SIZE", _DEFAULT_MAXSIZE))
+            _backend = MemoryRetrieveCache(maxsize, ttl)
+            logger.info("Retrieve cache: memory backend")
+    return _backend
+
+
+def set_retrieve_cache(backend: Optional[RetrieveCacheBackend]) -> None:
+    global _backend, _configured
+    _backend = backend
+    _configured = True
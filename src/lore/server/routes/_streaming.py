@@ -0,0 +1,88 @@
+"""Fast-path JSON and opt-in streaming for result-list routes.
+
+``/v1/retrieve`` and ``/v1/memories/search`` build their payloads as plain
+dicts and serialize them with :func:`pydantic_core.to_json` — the same
+encoder (and datetime format) Pydantic uses, minus constructing and
+re-validating a model per result. Their ``response_model`` stays declared for
+the OpenAPI schema; returning a :class:`Response` bypasses it at runtime.
+
+Streaming is opt-in, selected with ``?stream=ndjson|sse`` or an ``Accept``
+header of ``application/x-ndjson`` / ``text/event-stream``. A route yields
+``(event, data)`` pairs — one ``memory`` event per result as soon as it is
+ranked, then a final ``done`` summary — and each is written as:
+
+* NDJSON: ``{"event": "memory", "data": {...}}`` per line;
+* SSE: ``event: memory`` / ``data: {...}`` blocks.
+
+A failure after the response has started cannot change the status code, so
+it is reported as a last ``error`` event instead.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+
+logger = logging.getLogger(__name__)
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+Event = Tuple[str, Any]
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """Serialize ``payload`` (dicts, lists, datetimes …) straight to a response."""
+    return Response(
+        content=to_json(payload), status_code=status_code, media_type="application/json",
+    )
+
+
+def stream_mode(stream: Optional[str], accept: Optional[str]) -> Optional[str]:
+    """The requested streaming format, or ``None`` for a regular JSON body.
+
+    An explicit ``stream`` parameter wins over ``Accept``; an unknown value
+    is a 422.
+    """
+    if stream:
+        if stream not in STREAM_MEDIA_TYPES:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid stream '{stream}'. Must be one of: {', '.join(sorted(STREAM_MEDIA_TYPES))}",
+            )
+        return stream
+    if accept:
+        for mode, media_type in STREAM_MEDIA_TYPES.items():
+            if media_type in accept:
+                return mode
+    return None
+
+
+def encode_event(mode: str, event: str, data: Any) -> bytes:
+    if mode == "sse":
+        return b"event: " + event.encode() + b"\ndata: " + to_json(data) + b"\n\n"
+    return to_json({"event": event, "data": data}) + b"\n"
+
+
+def stream_events(events: AsyncIterator[Event], mode: str) -> StreamingResponse:
+    """Stream ``events`` in ``mode`` (``"ndjson"`` or ``"sse"``)."""
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            async for event, data in events:
+                yield encode_event(mode, event, data)
+        except Exception:
+            logger.exception("streamed response failed")
+            yield encode_event(mode, "error", {"detail": "Internal server error"})
+
+    headers = {"Cache-Control": "no-cache"}
+    if mode == "sse":
+        # Keep reverse proxies (nginx) from buffering the event stream.
+        headers["X-Accel-Buffering"] = "no"
+    return StreamingResponse(body(), media_type=STREAM_MEDIA_TYPES[mode], headers=headers)
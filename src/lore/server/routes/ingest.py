@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
@@ -222,7 +223,11 @@ async def ingest_single(req: IngestRequest, request: Request):
     project = req.project or key_data.get("project")
     pipeline = state.ingest_pipeline
 
-    result = pipeline.ingest(
+    # The pipeline embeds synchronously; run it off the event loop so
+    # concurrent ingests overlap (and their embeds coalesce in the shared
+    # embedding service) instead of queueing behind one another.
+    result = await asyncio.to_thread(
+        pipeline.ingest,
         adapter=adapter,
         payload=payload,
         project=project,
@@ -273,7 +278,8 @@ async def ingest_batch(req: BatchIngestRequest, request: Request):
     failed = 0
 
     for i, item in enumerate(req.items):
-        result = pipeline.ingest(
+        result = await asyncio.to_thread(
+            pipeline.ingest,
             adapter=adapter,
             payload=item,
             project=project,
@@ -354,7 +360,8 @@ async def ingest_webhook(adapter_name: str, request: Request):
     pipeline = state.ingest_pipeline
     project = key_data.get("project")
 
-    result = pipeline.ingest(
+    result = await asyncio.to_thread(
+        pipeline.ingest,
         adapter=adapter,
         payload=payload,
         project=project,
@@ -13,7 +13,8 @@ except ImportError:
 
 from lore.exceptions import SecretBlockedError
 from lore.persistence import ExportedMemory, Store, StoredMemory
-from lore.persistence.exceptions import StoreNotFoundError
+from lore.persistence.exceptions import DuplicateSourceMessageError, StoreNotFoundError
+from lore.server.access_tracking import get_access_tracker
 from lore.server.auth import AuthContext, get_auth_context, require_role
 from lore.server.db import get_store
 from lore.server.models import (
@@ -105,9 +106,12 @@ async def create_lesson(
             expires_at=body.expires_at,
             meta=body.meta,
             scope=body.scope,
+            source_message_id=body.source_message_id,
         )
     except SecretBlockedError as e:
         raise HTTPException(status_code=422, detail=f"Write blocked: contains a {e}")
+    except DuplicateSourceMessageError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     return LessonCreateResponse(id=lesson_id)
 
 
@@ -156,7 +160,11 @@ async def search_lessons(
         )
         for r in results
     ]
-    return LessonSearchResponse(lessons=lessons)
+    if body.record_access and lessons:
+        # Results are already visibility- and project-filtered for this key;
+        # the bump is buffered like /v1/retrieve's.
+        get_access_tracker().record(store, auth.org_id, [lesson.id for lesson in lessons])
+    return LessonSearchResponse(lessons=lessons, access_recorded=body.record_access)
 
 
 # ── Access tracking ────────────────────────────────────────────────
@@ -191,6 +199,28 @@ async def record_access(
 # ── Read ───────────────────────────────────────────────────────────
 
 
+@router.get("/by-source", response_model=LessonResponse)
+async def get_lesson_by_source(
+    source: str = Query(...),
+    source_message_id: str = Query(...),
+    auth: AuthContext = Depends(get_auth_context),
+    store: Store = Depends(get_store),
+) -> LessonResponse:
+    """Get the lesson ingested from ``source``'s message ``source_message_id``."""
+    try:
+        m = await lessons_service.get_by_source_id(
+            store,
+            org_id=auth.org_id,
+            source=source,
+            source_message_id=source_message_id,
+            project=auth.project,
+            requesting_user_id=auth.principal_id,
+        )
+    except StoreNotFoundError:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    return _to_lesson_response(m)
+
+
 @router.get("/{lesson_id}", response_model=LessonResponse)
 async def get_lesson(
     lesson_id: str,
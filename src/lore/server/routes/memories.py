@@ -9,32 +9,42 @@ import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 try:
-    from fastapi import APIRouter, Depends, HTTPException, Query
+    from fastapi import APIRouter, Depends, Header, HTTPException, Query
+    from fastapi.responses import Response
 except ImportError:
     raise ImportError("FastAPI is required. Install with: pip install lore-sdk[server]")
 
 from pydantic import BaseModel
 
+from lore.embed.base import embed_async, embed_batch_async
 from lore.exceptions import SecretBlockedError
 from lore.persistence.exceptions import StoreNotFoundError
 from lore.persistence.protocol import Store
 from lore.server.auth import AuthContext, get_auth_context, require_role
 from lore.server.db import get_store
 from lore.server.models import (
+    MemoryBulkCreateRequest,
+    MemoryBulkCreateResponse,
     MemoryCreateRequest,
     MemoryCreateResponse,
     MemoryListResponse,
     MemoryResponse,
     MemorySearchRequest,
     MemorySearchResponse,
-    MemorySearchResult,
     MemoryUpdateRequest,
 )
 from lore.server.routes._parsers import _parse_meta, _parse_tags
+from lore.server.routes._streaming import Event, json_response, stream_events, stream_mode
 from lore.services import memories as memories_service
+from lore.services.memories import (
+    MemoryInput,
+)
+from lore.services.memories import (
+    create_memories as _create_memories,
+)
 from lore.services.memories import (
     create_memory as _create_memory,
 )
@@ -57,6 +67,7 @@ from lore.services.memories import (
     vote_memory as _vote_memory,
 )
 from lore.services.provenance import build_memory_provenance
+from lore.services.reconciliation import WriteContext
 
 logger = logging.getLogger(__name__)
 
@@ -100,9 +111,11 @@ async def create_memory(
     store = await get_store()
 
     # Embedding stays at this layer for now — Phase 1B will factor it out.
-    from lore.server.routes.retrieve import _get_embedder
-    embedder = _get_embedder()
-    embedding = body.embedding if body.embedding else await asyncio.to_thread(embedder.embed, body.content)
+    from lore.server.routes.retrieve import _get_write_embedder
+    embedder = _get_write_embedder()
+    embedding = body.embedding if body.embedding else await embed_async(embedder, body.content)
+    # One neighbour search serves reconciliation and the contradiction check.
+    write_context = WriteContext(auth.org_id, embedding, user_id=auth.principal_id)
 
     try:
         stored = await _create_memory(
@@ -118,13 +131,80 @@ async def create_memory(
             meta=body.meta or {},
             scope=body.scope,
             user_id=auth.principal_id,  # migration 026: owner = the writing principal
+            write_context=write_context,
         )
     except SecretBlockedError as e:
         # Write-side redaction in block mode (LORE_REDACT_BLOCK).
         raise HTTPException(status_code=422, detail=f"Write blocked: contains a {e}")
 
-    # Fire-and-forget enrichment unchanged from before
-    enrich = body.enrich
+    _schedule_post_write(store, auth, stored, embedding, body.enrich, write_context)
+
+    return MemoryCreateResponse(id=stored.id)
+
+
+@router.post("/bulk", response_model=MemoryBulkCreateResponse, status_code=201)
+async def create_memories(
+    body: MemoryBulkCreateRequest,
+    auth: AuthContext = Depends(require_role("writer", "admin")),
+) -> MemoryBulkCreateResponse:
+    """Create many memories: one embedding batch, batch-aware reconciliation
+    and a single insert transaction (see ``services.memories.create_memories``)."""
+    store = await get_store()
+
+    from lore.server.routes.retrieve import _get_write_embedder
+    missing = [i for i, m in enumerate(body.memories) if not m.embedding]
+    embeddings = [m.embedding for m in body.memories]
+    if missing:
+        vecs = await embed_batch_async(
+            _get_write_embedder(), [body.memories[i].content for i in missing]
+        )
+        for i, vec in zip(missing, vecs):
+            embeddings[i] = vec
+
+    try:
+        results = await _create_memories(
+            store,
+            org_id=auth.org_id,
+            items=[
+                MemoryInput(
+                    content=m.content,
+                    embedding=embedding,
+                    context=m.context,
+                    tags=m.tags or [],
+                    source=m.source,
+                    project=auth.project or m.project,
+                    expires_at=m.expires_at,
+                    meta=m.meta or {},
+                    scope=m.scope,
+                )
+                for m, embedding in zip(body.memories, embeddings)
+            ],
+            user_id=auth.principal_id,
+        )
+    except SecretBlockedError as e:
+        raise HTTPException(status_code=422, detail=f"Write blocked: contains a {e}")
+
+    for m, embedding, result in zip(body.memories, embeddings, results):
+        if result.created:
+            _schedule_post_write(store, auth, result.memory, embedding, m.enrich)
+
+    return MemoryBulkCreateResponse(
+        ids=[r.memory.id for r in results],
+        created=sum(r.created for r in results),
+    )
+
+
+def _schedule_post_write(
+    store: Store,
+    auth: AuthContext,
+    stored,
+    embedding,
+    enrich: Optional[bool],
+    write_context: Optional[WriteContext] = None,
+) -> None:
+    """Fire-and-forget enrichment / graph extraction / contradiction checks
+    for a newly created memory."""
+    # Fire-and-forget enrichment: the request flag, else LORE_ENRICHMENT_ENABLED.
     if enrich is None:
         enrich = os.environ.get("LORE_ENRICHMENT_ENABLED", "").lower() in ("true", "1", "yes")
     if enrich:
@@ -153,10 +233,9 @@ async def create_memory(
         asyncio.create_task(contradiction_svc.detect_and_flag(
             store, org_id=auth.org_id, memory_id=stored.id,
             content=stored.content, embedding=embedding, owner_user_id=auth.principal_id,
+            context=write_context,
         ))
 
-    return MemoryCreateResponse(id=stored.id)
-
 
 # ── Search ─────────────────────────────────────────────────────────
 
@@ -164,9 +243,18 @@ async def create_memory(
 @router.post("/search", response_model=MemorySearchResponse)
 async def search_memories(
     body: MemorySearchRequest,
+    stream: Optional[str] = Query(
+        None,
+        description=(
+            "Stream results instead of one JSON body: 'ndjson' or 'sse'. "
+            "Emits a 'memory' event per result, then a 'done' event with the count."
+        ),
+    ),
+    accept: Optional[str] = Header(None),
     auth: AuthContext = Depends(get_auth_context),
-) -> MemorySearchResponse:
+) -> Response:
     """Semantic search with multiplicative scoring."""
+    mode = stream_mode(stream, accept)
     store = await get_store()
     # body.embedding is the pre-computed query vector (384-dim)
     results = await _search_memories(
@@ -179,27 +267,35 @@ async def search_memories(
         scope_mode=body.scope,
         requesting_user_id=auth.principal_id,
     )
-    return MemorySearchResponse(
-        memories=[
-            MemorySearchResult(
-                id=r.id,
-                content=r.content,
-                context=r.context,
-                tags=list(r.tags),
-                source=r.source,
-                project=r.project,
-                created_at=r.created_at,
-                updated_at=r.updated_at,
-                expires_at=r.expires_at,
-                upvotes=r.upvotes,
-                downvotes=r.downvotes,
-                meta=dict(r.meta),
-                scope=getattr(r, "scope", "project") or "project",
-                score=round(max(r.score, 0.0), 6),
-            )
-            for r in results
-        ]
-    )
+    # Plain ``MemorySearchResult``-shaped dicts; see routes._streaming.
+    memories = [
+        {
+            "id": r.id,
+            "content": r.content,
+            "context": r.context,
+            "tags": list(r.tags),
+            "source": r.source,
+            "project": r.project,
+            "created_at": r.created_at,
+            "updated_at": r.updated_at,
+            "expires_at": r.expires_at,
+            "upvotes": r.upvotes,
+            "downvotes": r.downvotes,
+            "meta": dict(r.meta),
+            "scope": getattr(r, "scope", "project") or "project",
+            "score": round(max(r.score, 0.0), 6),
+        }
+        for r in results
+    ]
+    if mode is not None:
+        return stream_events(_search_events(memories), mode)
+    return json_response({"memories": memories})
+
+
+async def _search_events(memories: List[Dict[str, Any]]) -> AsyncIterator[Event]:
+    for m in memories:
+        yield "memory", m
+    yield "done", {"count": len(memories)}
 
 
 # ── Access tracking ────────────────────────────────────────────────
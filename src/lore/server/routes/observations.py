@@ -16,6 +16,7 @@ try:
 except ImportError:
     raise ImportError("FastAPI is required. Install with: pip install lore-sdk[server]")
 
+from lore.embed.base import embed_async
 from lore.exceptions import SecretBlockedError
 from lore.persistence import NewObservation, StoredMemory
 from lore.persistence.protocol import Store
@@ -71,14 +72,14 @@ async def create_observation(
 ) -> ObservationCreateResponse:
     """Persist a structured observation."""
     # Embedding: title + narrative gives recall a slightly better surface
-    # than narrative alone. Computed on a worker thread to avoid blocking
-    # the event loop while the local ONNX model runs.
-    from lore.server.routes.retrieve import _get_embedder
+    # than narrative alone. Awaited through the shared embedding service so
+    # the event loop is never blocked while the local ONNX model runs.
+    from lore.server.routes.retrieve import _get_write_embedder
 
-    embedder = _get_embedder()
+    embedder = _get_write_embedder()
 
     async def _embed(text: str):
-        return await asyncio.to_thread(embedder.embed, text)
+        return await embed_async(embedder, text)
 
     obs = NewObservation(
         org_id=auth.org_id,
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 try:
-    from fastapi import APIRouter, Depends, HTTPException, Query
+    from fastapi import APIRouter, Depends, Header, HTTPException, Query
+    from fastapi.responses import Response
 except ImportError:
     raise ImportError("FastAPI is required. Install with: pip install lore-sdk[server]")
 
 from pydantic import BaseModel
 
+from lore.embed.base import embed_async
 from lore.persistence import StoredMemory
+from lore.server.access_tracking import get_access_tracker
 from lore.server.auth import AuthContext, get_auth_context
 from lore.server.db import get_store
+from lore.server.metrics import retrieve_stage_latency
+from lore.server.retrieve_cache import InvalidatingStore, get_retrieve_cache, make_key
+from lore.server.routes._streaming import Event, json_response, stream_events, stream_mode
 from lore.services import retrieve as retrieve_service
 from lore.services.retrieve import (
     HybridResult,  # noqa: F401  (re-exported for tests / external consumers)
@@ -70,6 +75,10 @@ class RetrieveResponse(BaseModel):
     # values "ok" | "empty" | "error".
     best_score: float = 0.0
     attempted: dict = {}
+    # Only populated when the request passes ``debug=true``: per-stage
+    # wall time of the hybrid pipeline (``timings_ms``) and whether the
+    # response came from the result cache.
+    debug: Optional[dict] = None
 
 
 # ── Embedder singleton ─────────────────────────────────────────────
@@ -78,45 +87,64 @@ _embedder = None
 
 
 def _get_embedder():
-    """Lazy-load the local embedder (ONNX MiniLM-L6-v2)."""
+    """The shared embedding service: query cache → micro-batcher → ONNX MiniLM-L6-v2.
+
+    Concurrent requests that miss the cache are coalesced into one batched
+    inference (see :mod:`lore.embed.batching`); await
+    :func:`lore.embed.base.embed_async` on it from route handlers.
+    """
     global _embedder
     if _embedder is None:
-        from lore.embed.local import LocalEmbedder
-        _embedder = LocalEmbedder()
+        from lore.embed.batching import shared_embedding_service
+        _embedder = shared_embedding_service()
     return _embedder
 
 
+def _get_write_embedder():
+    """Embedder for routes that store what they embed: the shared service
+    behind the persistent content-hash store, so identical content is never
+    inferred twice. A swapped-out ``_get_embedder`` is used as-is."""
+    embedder = _get_embedder()
+    if _embedder is not None and embedder is _embedder:
+        from lore.embed.batching import shared_write_embedding_service
+        return shared_write_embedding_service()
+    return embedder
+
+
 # ── Formatting ─────────────────────────────────────────────────────
+#
+# Results travel through the route as plain dicts shaped like
+# ``RetrieveMemory`` (see ``lore.server.routes._streaming``).
 
 
-def _format_xml(memories: List[RetrieveMemory], query: str) -> str:
+def _format_xml(memories: List[Dict[str, Any]], query: str) -> str:
     """Format memories as XML block."""
     if not memories:
         return ""
     lines = [f'<memories query="{query}">']
     for m in memories:
-        lines.append(f"  <memory id=\"{m.id}\" score=\"{m.score:.2f}\" type=\"{m.type}\">")
-        lines.append(f"    {m.content}")
+        lines.append(f"  <memory id=\"{m['id']}\" score=\"{m['score']:.2f}\" type=\"{m['type']}\">")
+        lines.append(f"    {m['content']}")
         lines.append("  </memory>")
     lines.append("</memories>")
     return "\n".join(lines)
 
 
-def _format_markdown(memories: List[RetrieveMemory], query: str) -> str:
+def _format_markdown(memories: List[Dict[str, Any]], query: str) -> str:
     """Format memories as Markdown list."""
     if not memories:
         return ""
     lines = [f"## Relevant Memories ({len(memories)})\n"]
     for m in memories:
-        lines.append(f"- **[{m.score:.2f}]** {m.content}")
+        lines.append(f"- **[{m['score']:.2f}]** {m['content']}")
     return "\n".join(lines)
 
 
-def _format_raw(memories: List[RetrieveMemory], query: str) -> str:
+def _format_raw(memories: List[Dict[str, Any]], query: str) -> str:
     """Format memories as plain newline-separated text."""
     if not memories:
         return ""
-    return "\n".join(m.content for m in memories)
+    return "\n".join(m["content"] for m in memories)
 
 
 _FORMATTERS = {
@@ -129,21 +157,42 @@ _FORMATTERS = {
 # ── Conversion helpers ─────────────────────────────────────────────
 
 
-def _stored_to_retrieve_memory(sm: StoredMemory) -> RetrieveMemory:
-    """Convert a persistence-layer StoredMemory to the route-layer RetrieveMemory."""
-    tags = list(sm.tags or [])
-    created_at = sm.created_at.isoformat() if hasattr(sm.created_at, "isoformat") else str(sm.created_at or "")
-    return RetrieveMemory(
-        id=sm.id,
-        content=f"[Session Context] {sm.content}",
-        type=(sm.meta or {}).get("type", "session_snapshot"),
-        tier=(sm.meta or {}).get("tier", "long"),
-        score=0.0,
-        created_at=created_at,
-        source=sm.source,
-        project=sm.project,
-        tags=tags,
-    )
+def _isoformat(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value or "")
+
+
+def _hybrid_to_dict(r: HybridResult) -> Dict[str, Any]:
+    """A fused result as a ``RetrieveMemory``-shaped dict."""
+    meta = r.memory.meta or {}
+    return {
+        "id": r.memory.id,
+        "content": r.memory.content,
+        "type": meta.get("type", "unknown"),
+        "tier": meta.get("tier", "long"),
+        "score": round(float(r.score), 4),
+        "created_at": _isoformat(r.memory.created_at),
+        "source": r.memory.source,
+        "project": r.memory.project,
+        "tags": list(r.memory.tags),
+        "signals": {k: round(float(v), 4) for k, v in r.signals.items()},
+    }
+
+
+def _stored_to_retrieve_memory(sm: StoredMemory) -> Dict[str, Any]:
+    """A session snapshot as a ``RetrieveMemory``-shaped dict."""
+    meta = sm.meta or {}
+    return {
+        "id": sm.id,
+        "content": f"[Session Context] {sm.content}",
+        "type": meta.get("type", "session_snapshot"),
+        "tier": meta.get("tier", "long"),
+        "score": 0.0,
+        "created_at": _isoformat(sm.created_at),
+        "source": sm.source,
+        "project": sm.project,
+        "tags": list(sm.tags or []),
+        "signals": None,
+    }
 
 
 # ── Route ──────────────────────────────────────────────────────────
@@ -170,8 +219,20 @@ async def retrieve(
             "'all' skips the predicate (cross-project search opt-in)."
         ),
     ),
+    debug: bool = Query(
+        False, description="Include per-stage timings in a 'debug' field",
+    ),
+    stream: Optional[str] = Query(
+        None,
+        description=(
+            "Stream results instead of one JSON body: 'ndjson' or 'sse'. "
+            "Emits a 'memory' event per result, then a 'done' event with "
+            "the remaining RetrieveResponse fields."
+        ),
+    ),
+    accept: Optional[str] = Header(None),
     auth: AuthContext = Depends(get_auth_context),
-) -> RetrieveResponse:
+) -> Response:
     """Retrieve relevant memories for a query.
 
     Returns semantically similar memories with formatted output
@@ -181,6 +242,7 @@ async def retrieve(
     override the default limit/min_score values.
     """
     start = time.monotonic()
+    mode = stream_mode(stream, accept)
 
     store = await get_store()
 
@@ -227,94 +289,187 @@ async def retrieve(
             detail=f"Invalid scope '{scope}'. Must be 'default' or 'all'.",
         )
 
-    # Embed the query
-    embedder = _get_embedder()
-    query_vec = embedder.embed(query)
-
     # Project scoping: auth key scope overrides query param
     effective_project = project
     if auth.project is not None:
         effective_project = auth.project
 
-    # Phase 6C hybrid path. ``hybrid_retrieve_with_report`` falls back to
-    # a default profile when ``resolved_profile`` is None and degrades
-    # each signal independently if the migration / extension isn't
-    # available — and surfaces ``best_score`` + per-retriever ``attempted``
-    # status so the caller can disambiguate "near miss" from "empty index".
-    report = await _hybrid_retrieve_with_report(
-        store,
-        org_id=auth.org_id,
-        query_text=query,
-        query_vec=query_vec,
-        limit=limit,
-        project=effective_project,
-        profile=resolved_profile,
-        min_score_override=min_score,
-        scope_mode=scope,
-        requesting_user_id=auth.principal_id,
-    )
-    hybrid_results = report.results
-
-    # Convert HybridResult dataclasses to RetrieveMemory pydantic models.
-    memories: List[RetrieveMemory] = [
-        RetrieveMemory(
-            id=r.memory.id,
-            content=r.memory.content,
-            type=(r.memory.meta or {}).get("type", "unknown"),
-            tier=(r.memory.meta or {}).get("tier", "long"),
-            score=round(float(r.score), 4),
-            created_at=r.memory.created_at.isoformat() if hasattr(r.memory.created_at, "isoformat") else str(r.memory.created_at),
-            source=r.memory.source,
-            project=r.memory.project,
-            tags=list(r.memory.tags),
-            signals={k: round(float(v), 4) for k, v in r.signals.items()},
+    # Result cache: only when the store reports its writes (see
+    # lore.server.retrieve_cache), otherwise a hit could outlive the data.
+    cache = get_retrieve_cache() if isinstance(store, InvalidatingStore) else None
+    cache_key = None
+    events: Optional[AsyncIterator[Event]] = None
+    if cache is not None:
+        cache_key = make_key(
+            auth.org_id, cache.generation(auth.org_id),
+            principal=auth.principal_id, query=query, limit=limit,
+            min_score=min_score, format=format, project=effective_project,
+            profile=profile, session=include_session_context, scope=scope,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            events = _cached_events(
+                cached, store, auth, query, min_score, format, effective_project,
+                start, debug,
+            )
+
+    if events is None:
+        # Embed the query
+        query_vec = await embed_async(_get_embedder(), query)
+
+        # Phase 6C hybrid path. ``hybrid_retrieve_with_report`` falls back to
+        # a default profile when ``resolved_profile`` is None and degrades
+        # each signal independently if the migration / extension isn't
+        # available — and surfaces ``best_score`` + per-retriever ``attempted``
+        # status so the caller can disambiguate "near miss" from "empty index".
+        report = await _hybrid_retrieve_with_report(
+            store,
+            org_id=auth.org_id,
+            query_text=query,
+            query_vec=query_vec,
+            limit=limit,
+            project=effective_project,
+            profile=resolved_profile,
+            min_score_override=min_score,
+            scope_mode=scope,
+            requesting_user_id=auth.principal_id,
+        )
+        for stage, ms in report.timings.items():
+            retrieve_stage_latency.observe(ms / 1000.0, stage=stage)
+        events = _retrieval_events(
+            report, store, auth, query, min_score, format, effective_project,
+            include_session_context, start, debug, cache, cache_key,
         )
-        for r in hybrid_results
-    ]
+
+    if mode is not None:
+        return stream_events(events, mode)
+    # Non-streaming: the same events, collected into one RetrieveResponse body.
+    memories: List[Dict[str, Any]] = []
+    summary: Dict[str, Any] = {}
+    async for event, data in events:
+        if event == "memory":
+            memories.append(data)
+        else:
+            summary = data
+    return json_response({"memories": memories, **summary})
+
+
+async def _retrieval_events(
+    report,
+    store,
+    auth: AuthContext,
+    query: str,
+    min_score: float,
+    fmt: str,
+    project: Optional[str],
+    include_session_context: bool,
+    start: float,
+    debug: bool,
+    cache,
+    cache_key: Optional[str],
+) -> AsyncIterator[Event]:
+    """Yield a ``memory`` event per fused result, then the ``done`` summary.
+
+    Session snapshots are looked up only after the ranked results have gone
+    out, and the summary (formatted block, timing, diagnostics) is built
+    from the full list, which is also what gets cached.
+    """
+    memories: List[Dict[str, Any]] = []
+    for r in report.results:
+        m = _hybrid_to_dict(r)
+        memories.append(m)
+        yield "memory", m
 
     # Auto-inject recent session snapshots (last 24h)
-    session_memories: List[RetrieveMemory] = []
     if include_session_context:
-        existing_ids = {m.id for m in memories}
         session_stored = await retrieve_service.recent_session_snapshots(
-            store, org_id=auth.org_id, project=effective_project,
-            exclude_ids=tuple(existing_ids), limit=3,
+            store, org_id=auth.org_id, project=project,
+            exclude_ids=tuple(m["id"] for m in memories), limit=3,
             requesting_user_id=auth.principal_id,
         )
-        session_memories = [_stored_to_retrieve_memory(sm) for sm in session_stored]
-        memories.extend(session_memories)
+        for sm in session_stored:
+            m = _stored_to_retrieve_memory(sm)
+            memories.append(m)
+            yield "memory", m
 
     # Phase 6C: render formatted output directly from the (possibly augmented)
     # memory list — the hybrid path no longer returns a pre-formatted blob.
-    formatter = _FORMATTERS[format]
-    formatted = formatter(memories, query)
+    formatted = _FORMATTERS[fmt](memories, query)
 
     elapsed_ms = round((time.monotonic() - start) * 1000, 2)
 
-    # Fire-and-forget: record analytics event and update Prometheus metrics
-    asyncio.create_task(retrieve_service.record_retrieval_event(
-        store,
-        org_id=auth.org_id,
-        query_text=query,
-        memory_ids=[m.id for m in memories],
-        scores=[m.score for m in memories],
-        min_score=min_score,
-        elapsed_ms=elapsed_ms,
-        fmt=format,
-        project=effective_project,
-    ))
-
-    # Fire-and-forget: bump access_count + recalculate importance for returned memories
-    if memories:
-        asyncio.create_task(retrieve_service.bump_access_counts(
-            store, auth.org_id, [m.id for m in memories],
-        ))
-
-    return RetrieveResponse(
-        memories=memories,
-        formatted=formatted,
-        count=len(memories),
-        query_time_ms=elapsed_ms,
-        best_score=round(float(report.best_score), 4),
-        attempted=dict(report.attempted),
+    _record_retrieval(store, auth, query, memories, min_score, elapsed_ms, fmt, project)
+
+    summary: Dict[str, Any] = {
+        "formatted": formatted,
+        "count": len(memories),
+        "query_time_ms": elapsed_ms,
+        "best_score": round(float(report.best_score), 4),
+        "attempted": dict(report.attempted),
+        "debug": None,
+    }
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, {"memories": memories, **summary})
+    if debug:
+        summary["debug"] = {
+            "cache": "miss" if cache is not None else "off",
+            "timings_ms": {k: round(v, 3) for k, v in report.timings.items()},
+        }
+    yield "done", summary
+
+
+async def _cached_events(
+    cached: Dict[str, Any],
+    store,
+    auth: AuthContext,
+    query: str,
+    min_score: float,
+    fmt: str,
+    project: Optional[str],
+    start: float,
+    debug: bool,
+) -> AsyncIterator[Event]:
+    """Replay a cached response as events (see ``_retrieval_events``)."""
+    memories = cached["memories"]
+    for m in memories:
+        yield "memory", m
+    summary = {k: v for k, v in cached.items() if k != "memories"}
+    summary["query_time_ms"] = round((time.monotonic() - start) * 1000, 2)
+    summary["debug"] = {"cache": "hit"} if debug else None
+    _record_retrieval(
+        store, auth, query, memories, min_score, summary["query_time_ms"], fmt, project,
     )
+    yield "done", summary
+
+
+def _record_retrieval(
+    store,
+    auth: AuthContext,
+    query: str,
+    memories: List[Dict[str, Any]],
+    min_score: float,
+    elapsed_ms: float,
+    fmt: str,
+    project: Optional[str],
+) -> None:
+    """Buffer the analytics event and access-count bump for a retrieval.
+
+    Runs for cache hits too, so analytics and importance see every call.
+    Metrics update now; the rows are written by the write-behind
+    :class:`~lore.server.access_tracking.AccessTracker`.
+    """
+    memory_ids = [m["id"] for m in memories]
+    try:
+        event = retrieve_service.retrieval_event(
+            org_id=auth.org_id,
+            query_text=query,
+            memory_ids=memory_ids,
+            scores=[m["score"] for m in memories],
+            min_score=min_score,
+            elapsed_ms=elapsed_ms,
+            fmt=fmt,
+            project=project,
+        )
+        get_access_tracker().record(store, auth.org_id, memory_ids, event)
+    except Exception:
+        logger.warning("Failed to record retrieval", exc_info=True)
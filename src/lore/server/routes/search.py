@@ -21,10 +21,10 @@ except ImportError:
 
 from pydantic import BaseModel
 
+from lore.embed.base import embed_async
 from lore.server._titles import memory_title
 from lore.server.auth import AuthContext, get_auth_context
 from lore.server.db import get_store
-from lore.server.routes.retrieve import _get_embedder
 from lore.services.retrieve import (
     HybridResult,
 )
@@ -115,8 +115,11 @@ async def search(
             detail=f"Invalid scope '{scope}'. Must be 'default' or 'all'.",
         )
 
-    embedder = _get_embedder()
-    query_vec = embedder.embed(query)
+    # Resolved per call (like the other routes) so the shared service can
+    # be swapped out.
+    from lore.server.routes.retrieve import _get_embedder
+
+    query_vec = await embed_async(_get_embedder(), query)
 
     # Project scoping: auth-key project always wins over a query-string override.
     effective_project = auth.project if auth.project is not None else project
@@ -17,7 +17,6 @@ no raw SQL lives here.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -28,6 +27,7 @@ try:
 except ImportError:
     raise ImportError("FastAPI is required. Install with: pip install lore-sdk[server]")
 
+from lore.embed.base import embed_async
 from lore.server.auth import AuthContext, get_auth_context, require_role
 from lore.server.db import get_store
 from lore.server.models import MemoryResponse
@@ -301,10 +301,10 @@ async def consolidate(
 
     # Embed the new memory's content. Lazy-import the embedder so test
     # environments without ONNX can monkeypatch the route to skip it.
-    from lore.server.routes.retrieve import _get_embedder
+    from lore.server.routes.retrieve import _get_write_embedder
 
-    embedder = _get_embedder()
-    embedding = await asyncio.to_thread(embedder.embed, body.content)
+    embedder = _get_write_embedder()
+    embedding = await embed_async(embedder, body.content)
 
     meta = {"type": body.type, "consolidated_from": list(deduped)}
     if body.reason:
@@ -26,6 +26,7 @@ async def policy_scheduler_loop(interval_seconds: int = 60) -> None:
 async def _enforce_policies() -> None:
     """Iterate active policies and enforce retention rules."""
     from lore.server.db import get_pool
+    from lore.server.retrieve_cache import get_retrieve_cache
 
     pool = await get_pool()
     async with pool.acquire() as conn:
@@ -59,6 +60,13 @@ async def _enforce_policies() -> None:
                         policy["org_id"], short_ttl,
                     )
 
+                if working_ttl is not None or short_ttl is not None:
+                    # Raw deletes bypass the store, so invalidate cached
+                    # /v1/retrieve results for this org explicitly.
+                    cache = get_retrieve_cache()
+                    if cache is not None:
+                        cache.bump(policy["org_id"])
+
                 # Prune excess snapshots
                 max_snaps = policy["max_snapshots"] or 50
                 excess = await conn.fetch(
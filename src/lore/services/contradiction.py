@@ -16,15 +16,22 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Callable, List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
 
-from lore.persistence import MemoryPatch, RecallParams, Store
+from lore.persistence import MemoryPatch, RecallParams, ScoredMemory, Store
+
+if TYPE_CHECKING:
+    from lore.services.reconciliation import WriteContext
 
 logger = logging.getLogger(__name__)
 
 # (contradicts, confidence in [0,1], short reason)
 ContradictionScorer = Callable[[str, str], Tuple[bool, float, str]]
 
+# Recency half-life the neighbor ranking uses (RecallParams' default).
+_HALF_LIFE_DAYS = 30
+
 
 def is_enabled() -> bool:
     return os.environ.get("LORE_CONTRADICTION_DETECTION", "").lower() in ("1", "true", "yes")
@@ -76,6 +83,28 @@ _PROMPT = (
 )
 
 
+def _by_recency(hits: Sequence[ScoredMemory], now: datetime) -> List[ScoredMemory]:
+    """Re-rank undecayed hits by ``recall_by_embedding``'s decayed score.
+
+    ``score * 0.5 ^ (days / half-life)``, counting days from the later of
+    creation and last access, so a shared context picks the neighbors the
+    write's own query would.
+    """
+
+    def decayed(hit: ScoredMemory) -> float:
+        ages = [now - _aware(hit.created_at)]
+        if hit.last_accessed_at is not None:
+            ages.append(now - _aware(hit.last_accessed_at))
+        days = max(min(ages).total_seconds(), 0.0) / 86400.0
+        return hit.score * 0.5 ** (days / _HALF_LIFE_DAYS)
+
+    return sorted(hits, key=decayed, reverse=True)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
 def _llm_scorer(a: str, b: str) -> Tuple[bool, float, str]:
     from lore.enrichment.llm import LLMClient
 
@@ -96,10 +125,15 @@ async def detect_and_flag(
     scorer: Optional[ContradictionScorer] = None,
     top_k: int = 5,
     min_similarity: float = 0.75,
+    context: Optional["WriteContext"] = None,
 ) -> Optional[List[str]]:
     """Find similar neighbors, score contradiction, and flag the memory if any
     disagree. Returns the conflicting ids (or None). **Never raises** — safe for
     fire-and-forget. The scorer runs in a thread (the default makes an LLM call).
+
+    With the write's ``context`` the neighbors are the ones reconciliation
+    already fetched instead of a second k-NN, re-ranked by the same recency
+    decay; at most ``top_k`` of them are scored.
     """
     try:
         scorer = scorer or _llm_scorer
@@ -107,16 +141,25 @@ async def detect_and_flag(
             # Scope recall to what the WRITER may see (migration-026 visibility):
             # never compare against — or disclose — another principal's private
             # memory. requesting_user_id=None only for unowned/solo writes.
-            neighbors = await store.recall_by_embedding(
-                RecallParams(
-                    org_id=org_id,
-                    query_vec=list(embedding),
-                    limit=top_k + 1,  # +1: the just-written memory is its own nearest neighbor
-                    min_score=min_similarity,
-                    scope_mode="all",
-                    requesting_user_id=owner_user_id,
+            if context is not None:
+                # Usually fetched before the insert (by reconciliation), so
+                # the new memory is only present when reconciliation is off.
+                shared = await context.neighbours(store, limit=top_k + 1, min_score=min_similarity)
+                neighbors = [
+                    n for n in _by_recency(shared, datetime.now(timezone.utc)) if n.id != memory_id
+                ][:top_k]
+            else:
+                neighbors = await store.recall_by_embedding(
+                    RecallParams(
+                        org_id=org_id,
+                        query_vec=list(embedding),
+                        limit=top_k + 1,  # +1: the just-written memory is its own nearest neighbor
+                        min_score=min_similarity,
+                        half_life_days=_HALF_LIFE_DAYS,
+                        scope_mode="all",
+                        requesting_user_id=owner_user_id,
+                    )
                 )
-            )
             min_conf = _min_confidence()
             conflicts: List[str] = []
             owners: dict[str, Optional[str]] = {}
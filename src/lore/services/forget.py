@@ -7,13 +7,13 @@ so the erasure is provable to an auditor/data subject. Competitors offer deletio
 but not a signed certificate.
 
 **Erasure scope (be precise — the cert must not over-promise):** deleting a
-``memories`` row cascades (FK) to its vector, ``entity_mentions`` and
-``memory_supersessions``. It does NOT yet scrub derived data that lacks a FK to
-``memories`` — knowledge-graph ``relationships`` (subject/predicate/object facts),
+``memories`` row also removes its vector, its ``entity_mentions`` and
+``memory_supersessions`` (FK cascade) and the knowledge-graph ``relationships``
+extracted from it (``Store.delete_memories``). It does NOT yet scrub
 ``recommendation_feedback``, the ``retrieval_analytics``/``conversation_jobs``
 JSON id lists, or any AgentLens cross-product event already emitted. Full
-graph/analytics cascade is a tracked follow-up; until then the cert attests
-exactly the ``memories`` rows it lists, no more.
+analytics cascade is a tracked follow-up; until then the cert attests exactly
+the ``memories`` rows it lists, no more.
 """
 
 from __future__ import annotations
@@ -30,6 +30,10 @@ from lore.persistence import MemoryFilter, Store
 
 logger = logging.getLogger(__name__)
 
+# Ids handed to one ``Store.delete_memories`` call. A failing batch is logged
+# and left out of the certificate; the others still go through.
+_DELETE_BATCH = 500
+
 
 def _canonical(obj: Any) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
@@ -104,8 +108,9 @@ async def forget_with_proof(
         the given ids within ``org_id`` with NO per-owner check (org-bounded);
         the cert records no subject. Treat as an admin-only path.
 
-    The cert covers the rows ACTUALLY removed (delete returned True). A
-    per-row delete failure is logged and excluded — the op is best-effort /
+    The cert covers the rows ACTUALLY removed (returned by
+    ``delete_memories``). Deletes run set-wise in batches of ``_DELETE_BATCH``;
+    a batch failure is logged and excluded — the op is best-effort /
     non-transactional, and ``deletedCount < requestedCount`` signals an
     incomplete erasure honestly.
     """
@@ -123,14 +128,19 @@ async def forget_with_proof(
         targets = [m.id for m in mems if m.user_id == user_id]
 
     deleted: List[str] = []
-    for mid in targets:
+    for start in range(0, len(targets), _DELETE_BATCH):
+        batch = targets[start:start + _DELETE_BATCH]
         try:
-            if await store.delete_memory(org_id, mid, requesting_user_id=requesting_user_id):
-                deleted.append(mid)
+            deleted.extend(
+                await store.delete_memories(org_id, batch, requesting_user_id=requesting_user_id)
+            )
         except Exception:
-            # Best-effort: a failed row is reported as not-deleted (the cert stays
-            # honest) rather than aborting and losing proof of what was erased.
-            logger.warning("forget_with_proof: delete failed for %s (org %s)", mid, org_id, exc_info=True)
+            # Best-effort: a failed batch is reported as not-deleted (the cert
+            # stays honest) rather than aborting and losing proof of what was erased.
+            logger.warning(
+                "forget_with_proof: delete failed for %d memories (org %s)",
+                len(batch), org_id, exc_info=True,
+            )
 
     return build_deletion_certificate(
         org_id=org_id,
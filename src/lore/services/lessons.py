@@ -73,6 +73,7 @@ async def create(
     expires_at: Optional[datetime],
     meta: Optional[Mapping[str, Any]],
     scope: Optional[str] = None,
+    source_message_id: Optional[str] = None,
 ) -> str:
     """Insert a lesson (memory) with field translation.
 
@@ -114,6 +115,7 @@ async def create(
         expires_at=expires_at,
         meta=meta_dict,
         scope=effective_scope,
+        source_message_id=source_message_id,
     )
     stored = await store.insert_memory(nm)
     return stored.id
@@ -248,6 +250,34 @@ async def get(
     return existing
 
 
+async def get_by_source_id(
+    store: Store,
+    *,
+    org_id: str,
+    source: str,
+    source_message_id: str,
+    project: Optional[str],
+    requesting_user_id: Optional[str] = None,
+) -> StoredMemory:
+    """Fetch the lesson holding an ingest key with ``get``'s scope checks.
+
+    Raises StoreNotFoundError when absent, out of the key's project, or
+    another user's private row.
+    """
+    existing = await store.get_memory_by_source_id(org_id, source, source_message_id)
+    if (
+        existing is None
+        or not _project_match(existing, project)
+        or (
+            requesting_user_id is not None
+            and existing.visibility == "private"
+            and existing.user_id not in (None, requesting_user_id)
+        )
+    ):
+        raise StoreNotFoundError("memories", source_message_id)
+    return existing
+
+
 async def update(
     store: Store,
     *,
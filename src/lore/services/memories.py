@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import logging
 import os
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from lore.emit.agentlens import emit_memory_event
 from lore.persistence import (
@@ -23,7 +24,13 @@ from lore.persistence import (
 )
 from lore.persistence.exceptions import StoreNotFoundError
 from lore.redact.write import get_write_redactor, redact_for_write
-from lore.services.reconciliation import reconcile_for_write
+from lore.services.reconciliation import (
+    PendingWrite,
+    ReconcileDecision,
+    WriteContext,
+    reconcile_batch_for_write,
+    reconcile_for_write,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,37 @@ def default_scope_for_type(t: Optional[str]) -> str:
     return "global" if (t or "") in GLOBAL_TYPES else "project"
 
 
+def _prepare_write(
+    content: str,
+    context: Optional[str],
+    tags: Sequence[str],
+    meta: Optional[Mapping[str, Any]],
+    scope: Optional[str],
+) -> Tuple[str, Optional[str], Dict[str, Any], Tuple[str, ...], str, Mapping[str, Any]]:
+    """Redact, normalize tags and default meta/scope for one incoming memory.
+
+    Returns ``(content, context, meta, tags, scope, redaction_meta)``.
+    """
+    # Write-side redaction (LORE_REDACT_* config): the single chokepoint every
+    # server/AsyncLore/internal write funnels through. Masks secrets/PII/
+    # denylisted terms + tags meta.redacted; raises SecretBlockedError only in
+    # block mode. ponytail: the caller-supplied embedding may reflect
+    # pre-redaction text — the secret value itself is never stored; re-embed in
+    # the caller if exact vector/text parity matters.
+    content, context, redaction_meta = redact_for_write(
+        get_write_redactor(), content, context
+    )
+    meta_dict = dict(meta or {})
+    meta_dict.update(redaction_meta)
+    normalized_tags = tuple(t.strip() for t in tags if t and t.strip())
+    effective_scope = (
+        scope
+        if scope is not None
+        else default_scope_for_type(meta_dict.get("type"))
+    )
+    return content, context, meta_dict, normalized_tags, effective_scope, redaction_meta
+
+
 async def create_memory(
     store: Store,
     *,
@@ -55,6 +93,7 @@ async def create_memory(
     meta: Optional[Mapping[str, Any]] = None,
     scope: Optional[str] = None,
     user_id: Optional[str] = None,
+    write_context: Optional[WriteContext] = None,
 ) -> StoredMemory:
     """Insert a memory. Tag normalization and meta defaulting happen here.
 
@@ -64,23 +103,12 @@ async def create_memory(
     (lesson/preference/pattern/convention) become 'global', everything else
     stays 'project'. Pass ``scope='project'`` or ``scope='global'`` to
     override the type-based default.
+
+    ``write_context`` (built for ``embedding``) lets reconciliation share its
+    neighbour search with the caller's post-write contradiction check.
     """
-    # Write-side redaction (LORE_REDACT_* config): the single chokepoint every
-    # server/AsyncLore/internal write funnels through. Masks secrets/PII/
-    # denylisted terms + tags meta.redacted; raises SecretBlockedError only in
-    # block mode. ponytail: the caller-supplied embedding may reflect
-    # pre-redaction text — the secret value itself is never stored; re-embed in
-    # the caller if exact vector/text parity matters.
-    content, context, redaction_meta = redact_for_write(
-        get_write_redactor(), content, context
-    )
-    meta_dict = dict(meta or {})
-    meta_dict.update(redaction_meta)
-    normalized_tags = tuple(t.strip() for t in tags if t and t.strip())
-    effective_scope = (
-        scope
-        if scope is not None
-        else default_scope_for_type(meta_dict.get("type"))
+    content, context, meta_dict, normalized_tags, effective_scope, redaction_meta = _prepare_write(
+        content, context, tags, meta, scope
     )
 
     # Write-time AUDN reconciliation (#66): fold near-duplicates / supersede stale
@@ -94,6 +122,7 @@ async def create_memory(
         mem_type=meta_dict.get("type"),
         project=project,
         user_id=user_id,
+        context=write_context,
     )
     if decision.action == "none" and decision.candidate is not None:
         # Re-read so callers get a canonical StoredMemory (recall yields a
@@ -135,54 +164,269 @@ async def create_memory(
         )
     )
     if decision.action == "delete" and decision.candidate is not None:
-        logger.info(
-            "reconcile Delete: supersede org=%s old=%s new=%s sim=%.3f",
-            org_id, decision.candidate.id, stored.id, decision.similarity,
+        await _supersede_on_write(
+            store, org_id, user_id, decision.candidate.id, stored.id, decision.similarity,
         )
-        # The insert above already committed. Record the supersession separately;
-        # if it fails, degrade to append-only (the new row stands, the old one is
-        # just not suppressed) rather than failing a write that already succeeded.
-        superseded_ok = False
-        try:
-            await store.record_supersession(
-                decision.candidate.id,
-                superseded_by=stored.id,
-                reason="write-time reconciliation",
-                agent="reconcile",
+    _emit_created(
+        org_id, user_id, stored.id, meta_dict, effective_scope, normalized_tags, project,
+        redaction_meta,
+    )
+    return stored
+
+
+@dataclass(frozen=True)
+class MemoryInput:
+    """One memory of a :func:`create_memories` call (``create_memory``'s kwargs)."""
+
+    content: str
+    embedding: Sequence[float]
+    context: Optional[str] = None
+    tags: Sequence[str] = ()
+    source: Optional[str] = None
+    project: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    meta: Optional[Mapping[str, Any]] = None
+    scope: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CreatedMemory:
+    """Outcome of one :func:`create_memories` item.
+
+    ``action`` is the reconcile decision: ``add`` / ``delete`` inserted a new
+    row; ``none`` / ``update`` resolved to an existing memory (possibly an
+    earlier item of the same batch).
+    """
+
+    memory: StoredMemory
+    action: str
+
+    @property
+    def created(self) -> bool:
+        return self.action in ("add", "delete")
+
+
+async def create_memories(
+    store: Store,
+    *,
+    org_id: str,
+    items: Sequence[MemoryInput],
+    user_id: Optional[str] = None,
+) -> List[CreatedMemory]:
+    """Bulk :func:`create_memory`: one result per item, in order.
+
+    Every item gets the same redaction / tag / scope handling. Reconciliation
+    runs against the store and the earlier items of the batch together (see
+    :func:`~lore.services.reconciliation.reconcile_batch_for_write`), so a
+    batch behaves like the same creates issued one by one — and every new
+    row is written by a single ``Store.insert_memories`` transaction.
+    Tag merges and supersessions of pre-existing memories follow the insert,
+    with the same best-effort handling as the single-item path. A "none" or
+    "update" target that no longer exists never fails the batch: the first
+    item aimed at it is inserted instead and the rest fold into that row.
+    """
+    prepared = [
+        _prepare_write(item.content, item.context, item.tags, item.meta, item.scope)
+        for item in items
+    ]
+    decisions = await reconcile_batch_for_write(
+        store,
+        org_id=org_id,
+        writes=[
+            PendingWrite(
+                embedding=item.embedding, tags=tags, mem_type=meta.get("type"),
+                project=item.project, scope=scope,
             )
-            superseded_ok = True
-        except Exception:
-            logger.warning(
-                "reconcile Delete: supersession failed org=%s old=%s new=%s; "
-                "kept both rows (append-only fallback)",
-                org_id, decision.candidate.id, stored.id, exc_info=True,
+            for item, (_, _, meta, tags, scope, _) in zip(items, prepared)
+        ],
+        user_id=user_id,
+    )
+
+    # Resolve pre-existing "none" / "update" targets first. A vanished
+    # candidate falls back to a plain insert, as in create_memory; the first
+    # item that targeted it takes its place, so later items of the batch
+    # fold into that one instead of inserting duplicates.
+    tags_by_index = [set(p[3]) for p in prepared]
+
+    def fold(i: int, into: int) -> None:
+        """Resolve item ``i`` to batch item ``into``, as a later create would."""
+        added = tags_by_index[i] - tags_by_index[into]
+        tags_by_index[into] |= added
+        decisions[i] = replace(
+            decisions[i], action="update" if added else "none", candidate=None, batch_index=into,
+        )
+
+    existing: Dict[str, StoredMemory] = {}
+    stand_ins: Dict[str, int] = {}
+    for i, decision in enumerate(decisions):
+        if decision.action not in ("none", "update") or decision.candidate is None:
+            continue
+        candidate_id = decision.candidate.id
+        if candidate_id in stand_ins:
+            fold(i, stand_ins[candidate_id])
+        elif candidate_id not in existing:
+            found = await store.get_memory(org_id, candidate_id, requesting_user_id=user_id)
+            if found is None:
+                stand_ins[candidate_id] = i
+                decisions[i] = ReconcileDecision("add", reason="candidate vanished")
+            else:
+                existing[found.id] = found
+
+    merged_tags: Dict[str, Set[str]] = {}
+    for i, decision in enumerate(decisions):
+        if decision.action != "update":
+            continue
+        if decision.batch_index is not None:
+            tags_by_index[decision.batch_index] |= tags_by_index[i]
+        elif decision.candidate is not None:
+            merged_tags.setdefault(
+                decision.candidate.id, set(decision.candidate.tags)
+            ).update(tags_by_index[i])
+
+    def new_memory(i: int) -> NewMemory:
+        content, context, meta_dict, normalized_tags, effective_scope, _ = prepared[i]
+        if tags_by_index[i] != set(normalized_tags):
+            # Later near-duplicates in the batch folded their tags in.
+            normalized_tags = tuple(sorted(tags_by_index[i]))
+            prepared[i] = prepared[i][:3] + (normalized_tags,) + prepared[i][4:]
+        return NewMemory(
+            org_id=org_id,
+            content=content,
+            embedding=items[i].embedding,
+            context=context,
+            tags=normalized_tags,
+            source=items[i].source,
+            project=items[i].project,
+            expires_at=items[i].expires_at,
+            meta=meta_dict,
+            scope=effective_scope,
+            user_id=user_id,
+        )
+
+    to_insert = [i for i, d in enumerate(decisions) if d.action in ("add", "delete")]
+    stored_by_index = dict(zip(
+        to_insert, await store.insert_memories([new_memory(i) for i in to_insert])
+    ))
+
+    late: List[int] = []
+    for memory_id, tags in merged_tags.items():
+        logger.info("reconcile Update: merge tags into org=%s candidate=%s", org_id, memory_id)
+        updated = await store.update_memory(
+            org_id, memory_id, MemoryPatch(tags=tuple(sorted(tags)))
+        )
+        if updated is not None:
+            existing[memory_id] = updated
+            continue
+        # Deleted since it was resolved above: the same fallback, after the fact.
+        folded = [
+            i for i, d in enumerate(decisions)
+            if d.action in ("none", "update")
+            and d.candidate is not None
+            and d.candidate.id == memory_id
+        ]
+        first = folded[0]
+        decisions[first] = ReconcileDecision("add", reason="candidate vanished")
+        for i in folded[1:]:
+            fold(i, first)
+        late.append(first)
+    if late:
+        stored_by_index.update(zip(late, await store.insert_memories([new_memory(i) for i in late])))
+
+    results: List[CreatedMemory] = []
+    for i, decision in enumerate(decisions):
+        if decision.batch_index is not None and decision.action in ("none", "update"):
+            results.append(CreatedMemory(stored_by_index[decision.batch_index], decision.action))
+            continue
+        if decision.action in ("none", "update"):
+            results.append(CreatedMemory(existing[decision.candidate.id], decision.action))
+            continue
+        stored = stored_by_index[i]
+        if decision.action == "delete":
+            old_id = (
+                stored_by_index[decision.batch_index].id
+                if decision.batch_index is not None
+                else decision.candidate.id
             )
-        # Emit OUTSIDE the try (only on success) so a future emit change can't be
-        # misattributed as a supersession failure. emit is infallible today.
-        if superseded_ok:
-            emit_memory_event(
-                "memory_superseded",
-                org_id=org_id,
-                agent_id=user_id,
-                memory_id=decision.candidate.id,
-                data={"supersededBy": stored.id, "reason": "write-time reconciliation", "agent": "reconcile"},
+            await _supersede_on_write(
+                store, org_id, user_id, old_id, stored.id, decision.similarity,
             )
+        _, _, meta_dict, normalized_tags, effective_scope, redaction_meta = prepared[i]
+        _emit_created(
+            org_id, user_id, stored.id, meta_dict, effective_scope, normalized_tags,
+            items[i].project, redaction_meta,
+        )
+        results.append(CreatedMemory(stored, decision.action))
+    return results
+
+
+async def _supersede_on_write(
+    store: Store,
+    org_id: str,
+    user_id: Optional[str],
+    old_id: str,
+    new_id: str,
+    similarity: float,
+) -> None:
+    """Record a reconcile Delete's supersession of ``old_id`` by ``new_id``."""
+    logger.info(
+        "reconcile Delete: supersede org=%s old=%s new=%s sim=%.3f",
+        org_id, old_id, new_id, similarity,
+    )
+    # The insert already committed. Record the supersession separately;
+    # if it fails, degrade to append-only (the new row stands, the old one is
+    # just not suppressed) rather than failing a write that already succeeded.
+    superseded_ok = False
+    try:
+        await store.record_supersession(
+            old_id,
+            superseded_by=new_id,
+            reason="write-time reconciliation",
+            agent="reconcile",
+        )
+        superseded_ok = True
+    except Exception:
+        logger.warning(
+            "reconcile Delete: supersession failed org=%s old=%s new=%s; "
+            "kept both rows (append-only fallback)",
+            org_id, old_id, new_id, exc_info=True,
+        )
+    # Emit OUTSIDE the try (only on success) so a future emit change can't be
+    # misattributed as a supersession failure. emit is infallible today.
+    if superseded_ok:
+        emit_memory_event(
+            "memory_superseded",
+            org_id=org_id,
+            agent_id=user_id,
+            memory_id=old_id,
+            data={"supersededBy": new_id, "reason": "write-time reconciliation", "agent": "reconcile"},
+        )
+
+
+def _emit_created(
+    org_id: str,
+    user_id: Optional[str],
+    memory_id: str,
+    meta: Mapping[str, Any],
+    scope: str,
+    tags: Sequence[str],
+    project: Optional[str],
+    redaction_meta: Optional[Mapping[str, Any]],
+) -> None:
     # Best-effort cross-product tamper-evident log (#78): never blocks/fails the write.
     emit_memory_event(
         "memory_created",
         org_id=org_id,
         agent_id=user_id,
-        memory_id=stored.id,
+        memory_id=memory_id,
         data={
-            "type": meta_dict.get("type"),
-            "scope": effective_scope,
-            "tags": list(normalized_tags),
+            "type": meta.get("type"),
+            "scope": scope,
+            "tags": list(tags),
             "project": project,
             "redacted": bool((redaction_meta or {}).get("redacted")),
             "redactedTypes": (redaction_meta or {}).get("redacted_types") or [],
         },
     )
-    return stored
 
 
 async def get_memory(
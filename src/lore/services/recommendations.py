@@ -141,12 +141,12 @@ async def recommend(
         return []
 
     try:
-        from lore.embed import LocalEmbedder
+        from lore.embed import shared_embedding_service
         from lore.recommend.engine import RecommendationEngine
 
         engine = RecommendationEngine(
             store=_CandidatesAdapter(candidates),
-            embedder=LocalEmbedder(),
+            embedder=shared_embedding_service(),
             aggressiveness=aggressiveness,
             max_suggestions=max_suggestions,
         )
@@ -21,13 +21,16 @@ append-only behavior.
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import logging
 import os
-from dataclasses import dataclass
-from typing import Literal, Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Set
 
-from lore.persistence import RecallParams, Store, StoredMemory
+import numpy as np
+
+from lore.persistence import RecallParams, ScoredMemory, Store, StoredMemory
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,13 @@ NO_RECONCILE_TYPES = frozenset({"observation"})
 
 Action = Literal["add", "update", "delete", "none"]
 
+# WriteContext's shared k-NN covers reconciliation (max_candidates after its
+# project/scope filter, over-fetched 4x; supersede band) and contradiction
+# detection (top_k + 1 at similarity >= 0.75) with their default settings.
+_SHARED_NEIGHBOUR_LIMIT = 24
+_SHARED_NEIGHBOUR_MIN_SCORE = 0.75
+_RECONCILE_OVERFETCH = 4
+
 
 @dataclass(frozen=True)
 class ReconcileConfig:
@@ -49,6 +59,9 @@ class ReconcileConfig:
     duplicate_threshold: float  # sim >= this (same type) → near-exact: Update or None
     supersede_threshold: float  # supersede_threshold <= sim < duplicate → Delete
     max_candidates: int
+    # Bulk writes: candidate k-NN queries in flight at once. Each holds a
+    # pool/reader connection, so keep it well below the pool size.
+    bulk_concurrency: int = 2
 
 
 def _flag(name: str, default: bool) -> bool:
@@ -79,6 +92,7 @@ def get_reconcile_config() -> ReconcileConfig:
         # memory revised — related-but-distinct knowledge stays as separate rows.
         supersede_threshold=_num("LORE_RECON_SUPERSEDE_THRESHOLD", 0.90, float),
         max_candidates=_num("LORE_RECON_MAX_CANDIDATES", 5, int),
+        bulk_concurrency=max(1, _num("LORE_RECON_BULK_CONCURRENCY", 2, int)),
     )
 
 
@@ -88,12 +102,78 @@ class ReconcileDecision:
     candidate: Optional[StoredMemory] = None
     similarity: float = 0.0
     reason: str = ""
+    # Bulk writes: the target is this earlier write of the same batch
+    # (not yet stored) rather than ``candidate``.
+    batch_index: Optional[int] = None
 
 
 def _same_type(a: Optional[str], b: Optional[str]) -> bool:
     return (a or None) == (b or None)
 
 
+def _in_scope(memory: StoredMemory, project: Optional[str]) -> bool:
+    """``recall_by_embedding``'s ``scope_mode='default'`` predicate."""
+    return _scope_matches(memory.scope, memory.project, project)
+
+
+def _scope_matches(scope: str, memory_project: Optional[str], project: Optional[str]) -> bool:
+    if project is None:
+        return scope == "global"
+    return scope == "global" or (scope == "project" and memory_project == project)
+
+
+@dataclass
+class WriteContext:
+    """One memory write's embedding and nearest neighbours.
+
+    Reconciliation and contradiction detection both need the memories
+    around the incoming vector. Passing the same context to both makes the
+    write cost one ``recall_by_embedding``: the first consumer runs it
+    (all scopes, no recency decay, the writer's visibility) and each one
+    filters the shared hits down to what its own query would have returned.
+    A consumer asking for more rows or a lower floor than the context was
+    built with triggers a wider search, which then serves everyone; one
+    whose filter leaves too few of a search cut at its limit runs its own
+    scoped query (see :meth:`complete_above`).
+    """
+
+    org_id: str
+    embedding: Sequence[float]
+    user_id: Optional[str] = None
+    limit: int = _SHARED_NEIGHBOUR_LIMIT
+    min_score: float = _SHARED_NEIGHBOUR_MIN_SCORE
+    _hits: Optional[List[ScoredMemory]] = field(default=None, repr=False)
+
+    async def neighbours(
+        self, store: Store, *, limit: int, min_score: float
+    ) -> List[ScoredMemory]:
+        """Neighbours scoring at least ``min_score``, best first (raw cosine)."""
+        if self._hits is None or limit > self.limit or min_score < self.min_score:
+            self.limit = max(self.limit, limit)
+            self.min_score = min(self.min_score, min_score)
+            self._hits = list(await store.recall_by_embedding(
+                RecallParams(
+                    org_id=self.org_id,
+                    query_vec=self.embedding,
+                    limit=self.limit,
+                    min_score=self.min_score,
+                    half_life_days=_NO_DECAY_HALF_LIFE,
+                    scope_mode="all",
+                    requesting_user_id=self.user_id,
+                )
+            ))
+        return [h for h in self._hits if h.score >= min_score]
+
+    def complete_above(self, min_score: float) -> bool:
+        """Whether every neighbour scoring at least ``min_score`` is in the hits.
+
+        False when the search filled its ``limit`` with rows at or above
+        ``min_score``: more of them may exist past the cut.
+        """
+        hits = self._hits or []
+        return len(hits) < self.limit or hits[-1].score < min_score
+
+
 async def reconcile_for_write(
     store: Store,
     *,
@@ -103,12 +183,16 @@ async def reconcile_for_write(
     mem_type: Optional[str],
     project: Optional[str],
     user_id: Optional[str],
+    context: Optional[WriteContext] = None,
 ) -> ReconcileDecision:
     """Decide the AUDN action for an incoming memory against existing ones.
 
     Returns ``Add`` when reconciliation is disabled, no candidate clears the
     supersede threshold, or no same-type candidate is found (fail-safe to the
     append-only default rather than a surprising merge).
+
+    With a ``context``, candidates come from its shared neighbour search
+    instead of a k-NN of their own.
     """
     cfg = get_reconcile_config()
     if not cfg.enabled:
@@ -124,23 +208,28 @@ async def reconcile_for_write(
 
     # Semantic k-NN over the same org/project/scope, visibility-gated to the
     # writer (shared memories + their own). min_score caps to the reconcile band.
-    candidates = await store.recall_by_embedding(
-        RecallParams(
-            org_id=org_id,
-            query_vec=embedding,
-            limit=max(cfg.max_candidates, 1),
-            min_score=cfg.supersede_threshold,
-            project=project,
-            half_life_days=_NO_DECAY_HALF_LIFE,
-            scope_mode="default",
-            requesting_user_id=user_id,
+    wanted = max(cfg.max_candidates, 1)
+    if context is not None:
+        neighbours = await context.neighbours(
+            store, limit=wanted * _RECONCILE_OVERFETCH, min_score=cfg.supersede_threshold,
+        )
+        candidates = [c for c in neighbours if _in_scope(c, project)][:wanted]
+        # The shared search spans every project: when it was cut at its
+        # limit, other projects' near-duplicates may have pushed an in-scope
+        # one out of it, so fall back to the scoped query.
+        if len(candidates) < wanted and not context.complete_above(cfg.supersede_threshold):
+            candidates = await _scoped_candidates(
+                store, cfg, org_id=org_id, embedding=embedding, project=project, user_id=user_id,
+            )
+    else:
+        candidates = await _scoped_candidates(
+            store, cfg, org_id=org_id, embedding=embedding, project=project, user_id=user_id,
         )
-    )
     if not candidates:
         return ReconcileDecision("add", reason="no near-duplicate candidate")
 
     # Don't reconcile against already-superseded rows.
-    superseded = await store.are_superseded({c.id for c in candidates})
+    superseded = await store.are_superseded({c.id for c in candidates}, org_id)
 
     # Highest-similarity (recall returns score-desc), same-type, live candidate that
     # the writer OWNS. Only reconciling your own memories avoids surprises with team
@@ -159,16 +248,188 @@ async def reconcile_for_write(
     if target is None:
         return ReconcileDecision("add", reason="no owned same-type candidate above threshold")
 
-    sim = float(target.score)
+    return _decide(cfg, tags, target.tags, float(target.score), candidate=target)
+
+
+async def _scoped_candidates(
+    store: Store,
+    cfg: ReconcileConfig,
+    *,
+    org_id: str,
+    embedding: Sequence[float],
+    project: Optional[str],
+    user_id: Optional[str],
+) -> Sequence[ScoredMemory]:
+    """Reconciliation's own k-NN: the write's project and scope only."""
+    return await store.recall_by_embedding(
+        RecallParams(
+            org_id=org_id,
+            query_vec=embedding,
+            limit=max(cfg.max_candidates, 1),
+            min_score=cfg.supersede_threshold,
+            project=project,
+            half_life_days=_NO_DECAY_HALF_LIFE,
+            scope_mode="default",
+            requesting_user_id=user_id,
+        )
+    )
+
+
+def _decide(
+    cfg: ReconcileConfig,
+    tags: Sequence[str],
+    target_tags: Iterable[str],
+    sim: float,
+    *,
+    candidate: Optional[StoredMemory] = None,
+    batch_index: Optional[int] = None,
+) -> ReconcileDecision:
+    """The AUDN action against the chosen (owned, same-type, live) target."""
     if sim >= cfg.duplicate_threshold:
         # Near-exact duplicate of the writer's own row: fold in any new tags, else
         # it's redundant → skip the write and return the existing row.
-        new_tags = {t for t in tags if t} - set(target.tags)
+        new_tags = {t for t in tags if t} - set(target_tags)
         if new_tags:
             return ReconcileDecision(
-                "update", target, sim, f"near-duplicate; merging {len(new_tags)} tag(s)"
+                "update", candidate, sim, f"near-duplicate; merging {len(new_tags)} tag(s)",
+                batch_index,
             )
-        return ReconcileDecision("none", target, sim, f"redundant near-duplicate (sim={sim:.3f})")
+        return ReconcileDecision(
+            "none", candidate, sim, f"redundant near-duplicate (sim={sim:.3f})", batch_index,
+        )
 
     # Strong but changed → the incoming row is the fresh truth; supersede the old.
-    return ReconcileDecision("delete", target, sim, f"supersedes prior version (sim={sim:.3f})")
+    return ReconcileDecision(
+        "delete", candidate, sim, f"supersedes prior version (sim={sim:.3f})", batch_index,
+    )
+
+
+@dataclass(frozen=True)
+class PendingWrite:
+    """One incoming memory of a bulk write, as reconciliation sees it."""
+
+    embedding: Sequence[float]
+    tags: Sequence[str] = ()
+    mem_type: Optional[str] = None
+    project: Optional[str] = None
+    # The scope the write will be stored with (after type defaulting).
+    scope: str = "project"
+
+
+async def reconcile_batch_for_write(
+    store: Store,
+    *,
+    org_id: str,
+    writes: Sequence[PendingWrite],
+    user_id: Optional[str],
+) -> List[ReconcileDecision]:
+    """:func:`reconcile_for_write` for a bulk write, one decision per write.
+
+    Each write is reconciled against the store *and* the writes before it
+    in the batch, as if they had been created one after another: a write
+    that near-duplicates an earlier batch item folds into it (``none`` /
+    ``update`` with ``batch_index`` set instead of ``candidate``), one in
+    the supersede band supersedes it (``delete``). The store side costs one
+    k-NN per write (at most ``bulk_concurrency`` in flight) and a single
+    ``are_superseded`` for all candidates; the batch side is one similarity
+    matrix.
+    """
+    cfg = get_reconcile_config()
+    decisions = [ReconcileDecision("add", reason="reconciliation disabled")] * len(writes)
+    if not cfg.enabled:
+        return decisions
+    eligible = [
+        i for i, w in enumerate(writes)
+        if w.mem_type not in NO_RECONCILE_TYPES and any(w.embedding)
+    ]
+    for i, w in enumerate(writes):
+        if w.mem_type in NO_RECONCILE_TYPES:
+            decisions[i] = ReconcileDecision("add", reason=f"type {w.mem_type!r} is append-only")
+        elif not any(w.embedding):
+            decisions[i] = ReconcileDecision("add", reason="degenerate embedding")
+    if not eligible:
+        return decisions
+
+    # One k-NN per write, but never more than ``bulk_concurrency`` at once:
+    # a 1000-item batch must not hold every pool connection and starve
+    # concurrent retrieves.
+    limiter = asyncio.Semaphore(cfg.bulk_concurrency)
+
+    async def candidates_for(w: PendingWrite) -> Sequence[ScoredMemory]:
+        async with limiter:
+            return await store.recall_by_embedding(
+                RecallParams(
+                    org_id=org_id,
+                    query_vec=w.embedding,
+                    limit=max(cfg.max_candidates, 1),
+                    min_score=cfg.supersede_threshold,
+                    project=w.project,
+                    half_life_days=_NO_DECAY_HALF_LIFE,
+                    scope_mode="default",
+                    requesting_user_id=user_id,
+                )
+            )
+
+    recalled = await asyncio.gather(*(candidates_for(writes[i]) for i in eligible))
+    candidate_ids = {c.id for candidates in recalled for c in candidates}
+    superseded = await store.are_superseded(candidate_ids, org_id) if candidate_ids else set()
+
+    vecs = np.asarray([writes[i].embedding for i in eligible], dtype=np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    sims = vecs @ vecs.T
+    # Per eligible position: inserted and not (yet) superseded by a later write.
+    live = np.zeros(len(eligible), dtype=bool)
+    batch_tags: Dict[int, Set[str]] = {}
+    store_tags: Dict[str, Set[str]] = {}
+
+    for pos, i in enumerate(eligible):
+        w = writes[i]
+        target = next(
+            (
+                c
+                for c in recalled[pos]
+                if c.id not in superseded
+                and _same_type(c.meta.get("type"), w.mem_type)
+                and c.user_id == user_id
+            ),
+            None,
+        )
+        best_sim = float(target.score) if target is not None else -1.0
+        best_pos: Optional[int] = None
+        # Earlier items this write's own k-NN would have seen had they
+        # been stored first: same type, and in scope for ``w.project``.
+        earlier = [
+            j for j in np.flatnonzero(live[:pos])
+            if _same_type(writes[eligible[j]].mem_type, w.mem_type)
+            and _scope_matches(
+                writes[eligible[j]].scope, writes[eligible[j]].project, w.project,
+            )
+        ]
+        if earlier:
+            j = max(earlier, key=lambda j: sims[pos, j])
+            if sims[pos, j] >= cfg.supersede_threshold and sims[pos, j] > best_sim:
+                best_sim, best_pos = float(sims[pos, j]), int(j)
+
+        if best_pos is not None:
+            decision = _decide(
+                cfg, w.tags, batch_tags[best_pos], best_sim, batch_index=eligible[best_pos],
+            )
+            if decision.action == "update":
+                batch_tags[best_pos] |= set(w.tags)
+            elif decision.action == "delete":
+                live[best_pos] = False
+        elif target is not None:
+            tags_so_far = set(target.tags) | store_tags.get(target.id, set())
+            decision = _decide(cfg, w.tags, tags_so_far, best_sim, candidate=target)
+            if decision.action == "update":
+                store_tags.setdefault(target.id, set()).update(w.tags)
+            elif decision.action == "delete":
+                superseded.add(target.id)
+        else:
+            decision = ReconcileDecision("add", reason="no owned same-type candidate above threshold")
+
+        if decision.action in ("add", "delete"):
+            live[pos] = True
+            batch_tags[pos] = set(w.tags)
+        decisions[i] = decision
+    return decisions
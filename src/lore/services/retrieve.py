@@ -11,13 +11,17 @@ back-compat (it delegates to ``recall_by_embedding``); the hybrid path is
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import math
 import os
 import re
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from lore.persistence import (
     NewRetrievalEvent,
@@ -64,11 +68,16 @@ class HybridRetrieveReport:
     per-retriever status (vector / fts / graph → ``"ok"`` /
     ``"empty"`` / ``"error"``) so silent degradation is visible
     instead of opaque.
+
+    ``timings`` holds per-stage wall time in milliseconds (``vector`` /
+    ``fts`` / ``graph`` branch round trips, ``fuse``, ``rescore``) so the
+    route can expose it in its debug payload and metrics.
     """
 
     results: Sequence[HybridResult]
     best_score: float
     attempted: Mapping[str, str]
+    timings: Mapping[str, float] = field(default_factory=dict)
 
 
 def _format_xml(memories: Sequence[ScoredMemory], query: str) -> str:
@@ -147,6 +156,53 @@ async def retrieve(
     return RetrieveOutput(memories=results, formatted=formatted, count=len(results))
 
 
+def retrieval_event(
+    *,
+    org_id: str,
+    query_text: str,
+    memory_ids: Sequence[str],
+    scores: Sequence[float],
+    min_score: float,
+    elapsed_ms: float,
+    fmt: str,
+    project: Optional[str],
+) -> NewRetrievalEvent:
+    """Update Prometheus metrics for a retrieval and build its analytics row."""
+    from lore.server.metrics import (
+        retrieve_empty_total,
+        retrieve_latency,
+        retrieve_max_score,
+        retrieve_queries_total,
+        retrieve_results_total,
+    )
+
+    retrieve_queries_total.inc()
+    retrieve_results_total.inc(amount=float(len(memory_ids)))
+    if not memory_ids:
+        retrieve_empty_total.inc()
+    retrieve_latency.observe(elapsed_ms / 1000.0)
+
+    max_sc = max(scores) if scores else 0.0
+    if scores:
+        retrieve_max_score.observe(max_sc)
+
+    avg_sc = sum(scores) / len(scores) if scores else None
+
+    return NewRetrievalEvent(
+        org_id=org_id,
+        query=query_text,
+        results_count=len(memory_ids),
+        scores=list(scores),
+        memory_ids=list(memory_ids),
+        avg_score=avg_sc,
+        max_score=max_sc if scores else None,
+        min_score_threshold=min_score,
+        query_time_ms=elapsed_ms,
+        project=project,
+        format=fmt,
+    )
+
+
 async def record_retrieval_event(
     store: Store,
     *,
@@ -161,38 +217,15 @@ async def record_retrieval_event(
 ) -> None:
     """Insert a retrieval_events row + update Prometheus metrics. Fire-and-forget."""
     try:
-        from lore.server.metrics import (
-            retrieve_empty_total,
-            retrieve_latency,
-            retrieve_max_score,
-            retrieve_queries_total,
-            retrieve_results_total,
-        )
-
-        retrieve_queries_total.inc()
-        retrieve_results_total.inc(amount=float(len(memory_ids)))
-        if not memory_ids:
-            retrieve_empty_total.inc()
-        retrieve_latency.observe(elapsed_ms / 1000.0)
-
-        max_sc = max(scores) if scores else 0.0
-        if scores:
-            retrieve_max_score.observe(max_sc)
-
-        avg_sc = sum(scores) / len(scores) if scores else None
-
-        event = NewRetrievalEvent(
+        event = retrieval_event(
             org_id=org_id,
-            query=query_text,
-            results_count=len(memory_ids),
-            scores=list(scores),
-            memory_ids=list(memory_ids),
-            avg_score=avg_sc,
-            max_score=max_sc if scores else None,
-            min_score_threshold=min_score,
-            query_time_ms=elapsed_ms,
+            query_text=query_text,
+            memory_ids=memory_ids,
+            scores=scores,
+            min_score=min_score,
+            elapsed_ms=elapsed_ms,
+            fmt=fmt,
             project=project,
-            format=fmt,
         )
         await store.record_retrieval_event(event)
     except Exception:
@@ -293,9 +326,27 @@ def _recency_signal(created_at: Optional[datetime], recency_bias: float) -> floa
     return math.exp(-age_days / recency_bias)
 
 
+def _recency_signals(
+    created_at: Sequence[Optional[datetime]], recency_bias: float, now: datetime,
+) -> np.ndarray:
+    """Vectorised :func:`_recency_signal` against one shared ``now``."""
+    if recency_bias is None or recency_bias <= 0:
+        return np.zeros(len(created_at))
+    now_ts = now.timestamp()
+    known = np.array([c is not None for c in created_at], dtype=bool)
+    ages = np.array([
+        0.0 if c is None
+        else now_ts - (c if c.tzinfo is not None else c.replace(tzinfo=timezone.utc)).timestamp()
+        for c in created_at
+    ], dtype=np.float64)
+    return np.where(known, np.exp(-np.maximum(ages, 0.0) / (86400.0 * recency_bias)), 0.0)
+
+
+@functools.lru_cache(maxsize=1)
 def _trust_recall_config() -> tuple[float, bool]:
-    """Trust-aware recall config (#79), read from env. Returns
-    ``(anon_weight, quarantine_anon)``.
+    """Trust-aware recall config (#79), read from env once. Returns
+    ``(anon_weight, quarantine_anon)`` (cached; call
+    ``_trust_recall_config.cache_clear()`` in tests after mutating env).
 
     Defaults are a NO-OP: ``anon_weight=1.0`` (no down-weight) and
     ``quarantine_anon=False`` — recall is byte-for-byte unchanged until an
@@ -316,6 +367,67 @@ def _trust_recall_config() -> tuple[float, bool]:
     return anon_weight, quarantine
 
 
+@dataclass(frozen=True)
+class _FusedColumns:
+    """Columnar RRF output: one row per unique memory, in fused-score order."""
+
+    memories: List[StoredMemory]
+    scores: np.ndarray  # normalised fused score, descending
+    raw: np.ndarray  # (n, n_sources) max raw score per source, 0 when absent
+
+
+def _rrf_fuse_columns(
+    sources: Sequence[Tuple[Sequence[Tuple[StoredMemory, float]], float]],
+    *,
+    k: int = _RRF_K,
+) -> _FusedColumns:
+    """Columnar core of :func:`_rrf_fuse`.
+
+    Candidates are mapped to row indices once; contributions and per-source
+    raw scores are then accumulated with ``np.bincount`` / ``np.maximum.at``
+    and ordered with a stable argsort, so ties keep first-seen order.
+    """
+    row_of: Dict[str, int] = {}
+    memories: List[StoredMemory] = []
+    columns: List[Tuple[np.ndarray, np.ndarray]] = []
+    for candidates, _weight in sources:
+        rows: List[int] = []
+        for memory, _raw_score in candidates:
+            row = row_of.get(memory.id)
+            if row is None:
+                row = row_of[memory.id] = len(memories)
+                memories.append(memory)
+            rows.append(row)
+        columns.append((
+            np.array(rows, dtype=np.intp),
+            np.fromiter((float(sc) for _m, sc in candidates), np.float64, len(candidates)),
+        ))
+
+    weights = np.array([max(0.0, float(w)) for _cands, w in sources], dtype=np.float64)
+    total_weight = float(weights.sum())
+    # Normalizer: top-rank-everywhere maps to 1.0. Avoid /0 when no weights set.
+    normalizer = (total_weight / (k + 1)) if total_weight > 0 else 1.0
+
+    n = len(memories)
+    fused = np.zeros(n, dtype=np.float64)
+    raw = np.zeros((n, len(sources)), dtype=np.float64)
+    for col, (rows_arr, raw_scores) in enumerate(columns):
+        if not rows_arr.size:
+            continue
+        contributions = weights[col] / (k + np.arange(1, rows_arr.size + 1, dtype=np.float64))
+        fused += np.bincount(rows_arr, weights=contributions, minlength=n)
+        # Take max in case a memory shows up twice in the same source
+        # (shouldn't happen, but defensive).
+        np.maximum.at(raw[:, col], rows_arr, raw_scores)
+
+    order = np.argsort(-fused, kind="stable")
+    return _FusedColumns(
+        memories=[memories[i] for i in order],
+        scores=fused[order] / normalizer,
+        raw=raw[order],
+    )
+
+
 def _rrf_fuse(
     sources: Sequence[Tuple[Sequence[Tuple[StoredMemory, float]], float]],
     *,
@@ -337,30 +449,20 @@ def _rrf_fuse(
     Returns the union of memories sorted by descending fused score, plus a
     per-signal breakdown. Signal keys are positional: ``signal_0``,
     ``signal_1``, ... The caller relabels them (vector / fts / graph)
-    because RRF itself is signal-agnostic.
+    because RRF itself is signal-agnostic. Only sources a memory appeared
+    in get a key. ``_hybrid_recall`` uses :func:`_rrf_fuse_columns`
+    directly and never materialises this per-row form.
     """
-    fused: Dict[str, float] = {}
-    by_id: Dict[str, StoredMemory] = {}
-    signals: Dict[str, Dict[str, float]] = {}
-    total_weight = sum(max(0.0, float(w)) for _cands, w in sources)
-    # Normalizer: top-rank-everywhere maps to 1.0. Avoid /0 when no weights set.
-    normalizer = (total_weight / (k + 1)) if total_weight > 0 else 1.0
-    for idx, (candidates, weight) in enumerate(sources):
-        signal_name = f"signal_{idx}"
-        w = max(0.0, float(weight))
-        for rank, (memory, raw_score) in enumerate(candidates):
-            mid = memory.id
-            contribution = w / (k + rank + 1)
-            fused[mid] = fused.get(mid, 0.0) + contribution
-            by_id.setdefault(mid, memory)
-            sigs = signals.setdefault(mid, {})
-            # Track the raw score per signal so the route can surface it.
-            # Take max in case the memory shows up twice in the same source
-            # (shouldn't happen, but defensive).
-            sigs[signal_name] = max(sigs.get(signal_name, 0.0), float(raw_score))
+    cols = _rrf_fuse_columns(sources, k=k)
+    present = [{m.id for m, _ in candidates} for candidates, _weight in sources]
     out: List[Tuple[StoredMemory, float, Dict[str, float]]] = []
-    for mid, score in sorted(fused.items(), key=lambda kv: kv[1], reverse=True):
-        out.append((by_id[mid], score / normalizer, signals[mid]))
+    for memory, score, raw_row in zip(cols.memories, cols.scores.tolist(), cols.raw.tolist()):
+        signals = {
+            f"signal_{idx}": raw_row[idx]
+            for idx in range(len(sources))
+            if memory.id in present[idx]
+        }
+        out.append((memory, score, signals))
     return out
 
 
@@ -405,9 +507,9 @@ async def _safe_graph_recall(
     """Extract entity ids from ``query`` (best-effort) and call ``recall_by_entities``.
 
     Punts to "no graph candidates" gracefully when no extractor is available
-    or the lookup raises. Phase 6C uses a simple tokeniser + ``get_entity_by_name``
-    lookup against the existing entities table — Phase 6D will swap in a
-    proper extractor.
+    or the lookup raises. Phase 6C uses a simple tokeniser + a single batched
+    ``get_entities_by_names`` lookup against the existing entities table —
+    Phase 6D will swap in a proper extractor.
     """
     if not hasattr(store, "recall_by_entities"):
         return []
@@ -431,20 +533,18 @@ async def _safe_graph_recall(
             seen.add(bg)
             candidates.append(bg)
     entity_ids: list[str] = []
-    if hasattr(store, "get_entity_by_name"):
-        for cand in candidates:
-            # Per-name lookups can legitimately miss; we don't want one
-            # failing entity-name lookup to mask an underlying
-            # ``recall_by_entities`` failure further down. Continue on
-            # individual misses; let real exceptions on the bulk recall
-            # surface to ``asyncio.gather`` so ``attempted["graph"]``
-            # reads "error" instead of "empty".
-            try:
-                ent = await store.get_entity_by_name(cand, org_id)
-            except Exception:
-                continue
-            if ent is not None:
-                entity_ids.append(ent.id)
+    if candidates and hasattr(store, "get_entities_by_names"):
+        # One round trip for every candidate name. A failing lookup must not
+        # mask an underlying ``recall_by_entities`` failure further down, so
+        # it degrades to "no graph candidates"; real exceptions on the bulk
+        # recall still surface to ``asyncio.gather`` so ``attempted["graph"]``
+        # reads "error" instead of "empty".
+        try:
+            entities = await store.get_entities_by_names(candidates, org_id)
+        except Exception:
+            entities = []
+        by_name = {ent.name: ent.id for ent in entities}
+        entity_ids = list(dict.fromkeys(by_name[c] for c in candidates if c in by_name))
     if not entity_ids:
         return []
     return await store.recall_by_entities(
@@ -502,8 +602,12 @@ async def _hybrid_recall(
         requesting_user_id=params.requesting_user_id,
     )
 
+    timings: Dict[str, float] = {}
     vec_raw, fts_raw, graph_raw = await asyncio.gather(
-        vec_task, fts_task, graph_task, return_exceptions=True
+        _timed(vec_task, timings, "vector"),
+        _timed(fts_task, timings, "fts"),
+        _timed(graph_task, timings, "graph"),
+        return_exceptions=True,
     )
 
     def _normalize(raw: Any) -> Sequence[Tuple[StoredMemory, float]]:
@@ -539,7 +643,8 @@ async def _hybrid_recall(
         (m, float(s)) for m, s in graph_list  # type: ignore[misc]
     ]
 
-    fused = _rrf_fuse(
+    t0 = time.perf_counter()
+    fused = _rrf_fuse_columns(
         sources=[
             (vec_pairs, max(0.0, profile.semantic_weight)),
             (fts_pairs, max(0.0, profile.fts_weight)),
@@ -547,17 +652,26 @@ async def _hybrid_recall(
         ],
         k=_RRF_K,
     )
+    timings["fuse"] = (time.perf_counter() - t0) * 1000
+
+    # Only the head of the fused list can reach the final page.
+    head = max(params.limit * 2, params.limit)
+    memories = fused.memories[:head]
 
     # Phase 6F: annotate the fused candidates with supersession state. Hard
     # filtering is the wrong call (explicit at_time queries still want to
     # see the row); instead we score-multiply by 0.1 so the natural
     # ``min_score`` filter downstream tends to drop them. Empty candidate
     # set short-circuits — no point in a round trip.
+    # Timed as its own stage so DB latency doesn't read as scoring time.
     superseded_set: set[str] = set()
-    if fused and hasattr(store, "are_superseded"):
-        candidate_ids = {memory.id for memory, *_ in fused}
+    timings["supersession"] = 0.0
+    if fused.memories and hasattr(store, "are_superseded"):
+        candidate_ids = {memory.id for memory in fused.memories}
         try:
-            superseded_set = await store.are_superseded(candidate_ids)
+            superseded_set = await _timed(
+                store.are_superseded(candidate_ids), timings, "supersession",
+            )
         except Exception:
             logger.warning(
                 "are_superseded failed; skipping supersession suppression",
@@ -565,54 +679,73 @@ async def _hybrid_recall(
             )
             superseded_set = set()
 
-    # Annotate with recency, multiplicative.
+    # Recency, supersession and provenance multipliers, one column each.
+    t0 = time.perf_counter()
     # Trust-aware recall (#79): provenance weighting / quarantine. No-op by default.
     anon_weight, quarantine_anon = _trust_recall_config()
-
-    annotated: list[HybridResult] = []
-    for memory, base_score, raw_signals in fused[: max(params.limit * 2, params.limit)]:
-        # Provenance = does the memory have an owning principal (user_id)? Writes
-        # with none (API-key/service ingest) are lower-provenance: quarantine
-        # them, or score-multiply by the configured anon weight.
-        attributed = bool(memory.user_id)
-        if quarantine_anon and not attributed:
-            continue
-        provenance_multiplier = 1.0 if attributed else anon_weight
-        recency = _recency_signal(memory.created_at, profile.recency_bias)
-        is_superseded = memory.id in superseded_set
-        supersession_multiplier = 0.1 if is_superseded else 1.0
-        # recency multiplier ∈ [1.0, 1.5].
-        final = (
-            base_score
-            * (1.0 + 0.5 * recency)
-            * supersession_multiplier
-            * provenance_multiplier
-        )
-        signals: Dict[str, float] = {
-            "vector": raw_signals.get("signal_0", 0.0),
-            "fts": raw_signals.get("signal_1", 0.0),
-            "graph": raw_signals.get("signal_2", 0.0),
-            "recency": recency,
-            # ``superseded``/``provenance`` land in signals so the route can
-            # surface them alongside the per-signal breakdown. Float (1.0/0.0)
-            # keeps the existing ``Mapping[str, float]`` shape from changing.
-            "superseded": 1.0 if is_superseded else 0.0,
-            "provenance": 1.0 if attributed else 0.0,
-        }
-        annotated.append(HybridResult(memory=memory, score=final, signals=signals))
+    recency = _recency_signals(
+        [m.created_at for m in memories], profile.recency_bias, datetime.now(timezone.utc),
+    )
+    # Provenance = does the memory have an owning principal (user_id)? Writes
+    # with none (API-key/service ingest) are lower-provenance: quarantine
+    # them, or score-multiply by the configured anon weight.
+    attributed = np.array([bool(m.user_id) for m in memories], dtype=bool)
+    superseded = np.array([m.id in superseded_set for m in memories], dtype=bool)
+    # recency multiplier ∈ [1.0, 1.5].
+    final = (
+        fused.scores[:head]
+        * (1.0 + 0.5 * recency)
+        * np.where(superseded, 0.1, 1.0)
+        * np.where(attributed, 1.0, anon_weight)
+    )
+    keep = np.ones(len(memories), dtype=bool)
+    if quarantine_anon:
+        keep &= attributed
 
     # Capture the pre-filter best score so the route can surface
     # "best match was 0.27 — try lowering min_score" on empty results.
-    best_score = max((r.score for r in annotated), default=0.0)
-    filtered = [r for r in annotated if r.score >= profile.min_score]
-    filtered.sort(key=lambda r: r.score, reverse=True)
+    best_score = float(final[keep].max()) if keep.any() else 0.0
+    passing = np.flatnonzero(keep & (final >= profile.min_score))
+    passing = passing[np.argsort(-final[passing], kind="stable")][: params.limit]
+
+    raw = fused.raw[:head]
+    results: list[HybridResult] = []
+    for i in passing.tolist():
+        is_superseded = bool(superseded[i])
+        results.append(HybridResult(
+            memory=memories[i],
+            score=float(final[i]),
+            signals={
+                "vector": float(raw[i, 0]),
+                "fts": float(raw[i, 1]),
+                "graph": float(raw[i, 2]),
+                "recency": float(recency[i]),
+                # ``superseded``/``provenance`` land in signals so the route can
+                # surface them alongside the per-signal breakdown. Float (1.0/0.0)
+                # keeps the existing ``Mapping[str, float]`` shape from changing.
+                "superseded": 1.0 if is_superseded else 0.0,
+                "provenance": 1.0 if attributed[i] else 0.0,
+            },
+        ))
+    timings["rescore"] = (time.perf_counter() - t0) * 1000
     return HybridRetrieveReport(
-        results=filtered[: params.limit],
+        results=results,
         best_score=best_score,
         attempted=attempted,
+        timings=timings,
     )
 
 
+async def _timed(aw: Awaitable[Any], timings: Dict[str, float], stage: str) -> Any:
+    """Await ``aw``, recording its wall time (ms) under ``timings[stage]``
+    whether it returns or raises."""
+    t0 = time.perf_counter()
+    try:
+        return await aw
+    finally:
+        timings[stage] = (time.perf_counter() - t0) * 1000
+
+
 async def hybrid_retrieve_with_report(
     store: Store,
     *,
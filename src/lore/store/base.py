@@ -67,6 +67,40 @@ class Store(ABC):
     def cleanup_expired(self) -> int:
         """Delete memories where expires_at < now. Returns count deleted."""
 
+    def write_generation(self) -> Optional[int]:
+        """A counter bumped by every memory write, or None when not tracked.
+
+        Client-side caches of the corpus (``Lore``'s recall vector index)
+        compare it to skip re-reading unchanged memories. Stores that return
+        None are re-read on every recall.
+        """
+        return None
+
+    def delete_many(self, memory_ids: List[str]) -> int:
+        """Delete several memories (and their facts). Returns how many existed.
+
+        Default calls ``delete`` per id; ``MemoryStore`` overrides it with one
+        pass over its indexes.
+        """
+        return sum(1 for memory_id in memory_ids if self.delete(memory_id))
+
+    def get_by_source_id(
+        self, source: str, source_message_id: str
+    ) -> Optional[Memory]:
+        """Get the memory ingested from ``source``'s message ``source_message_id``.
+
+        Default scans ``list()``; ``MemoryStore`` overrides it with a keyed
+        index and ``HttpStore`` with the server's unique-index lookup
+        (migration 032).
+        """
+        for memory in self.list(include_archived=True):
+            if (
+                memory.source == source
+                and memory.source_message_id == source_message_id
+            ):
+                return memory
+        return None
+
     # ------------------------------------------------------------------
     # Visibility: promote / demote (migration 026)
     # ------------------------------------------------------------------
@@ -169,6 +203,11 @@ class Store(ABC):
     def delete_relationship(self, rel_id: str) -> None:
         pass
 
+    def delete_relationships_for_memories(self, memory_ids: List[str]) -> int:
+        """Delete relationships whose ``source_memory_id`` is in ``memory_ids``.
+        Returns count deleted."""
+        return 0
+
     def get_relationships_from(
         self, entity_ids: List[str], active_only: bool = True
     ) -> List[Relationship]:
@@ -10,7 +10,11 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-from lore.exceptions import LoreAuthError, LoreConnectionError
+from lore.exceptions import (
+    DuplicateSourceMessageError,
+    LoreAuthError,
+    LoreConnectionError,
+)
 from lore.store.base import Store
 from lore.types import Memory, RecallResult
 
@@ -172,6 +176,8 @@ class HttpStore(Store):
         # lets the server apply its type-based default.
         if getattr(memory, "scope", None) is not None:
             payload["scope"] = memory.scope
+        if memory.source_message_id is not None:
+            payload["source_message_id"] = memory.source_message_id
 
         return payload
 
@@ -232,7 +238,16 @@ class HttpStore(Store):
 
     def save(self, memory: Memory) -> None:
         payload = self._memory_to_lesson(memory)
-        resp = self._request("POST", "/v1/lessons", json=payload)
+        try:
+            resp = self._request("POST", "/v1/lessons", json=payload)
+        except httpx.HTTPStatusError as e:
+            # 409: the (source, source_message_id) key is taken, possibly by
+            # a memory in a project this key cannot read.
+            if e.response.status_code == 409 and memory.source_message_id is not None:
+                raise DuplicateSourceMessageError(
+                    memory.source or "", memory.source_message_id
+                ) from e
+            raise
         data = resp.json()
         memory.id = data.get("id", memory.id)
 
@@ -242,6 +257,20 @@ class HttpStore(Store):
             return None
         return self._lesson_to_memory(resp.json())
 
+    def get_by_source_id(
+        self, source: str, source_message_id: str
+    ) -> Optional[Memory]:
+        resp = self._request(
+            "GET",
+            "/v1/lessons/by-source",
+            params={"source": source, "source_message_id": source_message_id},
+        )
+        if resp.status_code == 404:
+            return None
+        memory = self._lesson_to_memory(resp.json())
+        memory.source_message_id = source_message_id
+        return memory
+
     def list(
         self,
         project: Optional[str] = None,
@@ -378,6 +407,8 @@ class HttpStore(Store):
         # behaviour, so older servers still parse the body cleanly.
         if scope_mode != "default":
             payload["scope"] = scope_mode
+        # The server records access for the results as part of the search.
+        payload["record_access"] = True
 
         resp = self._request("POST", "/v1/lessons/search", json=payload)
         data = resp.json()
@@ -386,12 +417,14 @@ class HttpStore(Store):
             memory = self._lesson_to_memory(item)
             results.append(RecallResult(memory=memory, score=item.get("score", 0.0)))
 
-        # Record access for returned results (fire-and-forget, best effort)
-        for r in results:
-            try:
-                self._request("POST", f"/v1/lessons/{r.memory.id}/access")
-            except Exception:
-                pass
+        # Servers that predate ``record_access`` ignore it: record access per
+        # result the old way (best effort).
+        if results and not data.get("access_recorded"):
+            for r in results:
+                try:
+                    self._request("POST", f"/v1/lessons/{r.memory.id}/access")
+                except Exception:
+                    pass
 
         return results
 
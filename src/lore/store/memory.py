@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
+from lore.exceptions import DuplicateSourceMessageError
 from lore.store.base import Store
 from lore.types import (
     ConflictEntry,
@@ -24,19 +25,31 @@ class MemoryStore(Store):
     def __init__(self) -> None:
         self._memories: Dict[str, Memory] = {}
         self._facts: Dict[str, Fact] = {}
+        # memory_id -> fact ids, so deletes don't scan every fact.
+        self._fact_ids_by_memory: Dict[str, Set[str]] = {}
+        # (source, source_message_id) -> memory id; the ingest key is unique.
+        self._ids_by_source: Dict[Tuple[str, str], str] = {}
         self._conflict_log: List[ConflictEntry] = []
         self._entities: Dict[str, Entity] = {}
         self._relationships: Dict[str, Relationship] = {}
         self._entity_mentions: List[EntityMention] = []
         self._consolidation_log: List[ConsolidationLogEntry] = []
         self._rejected_patterns: List[RejectedPattern] = []
+        # Bumped by every memory write; see ``Store.write_generation``.
+        self._generation = 0
 
     def close(self) -> None:
         """No-op for in-memory store."""
         pass
 
+    def write_generation(self) -> int:
+        return self._generation
+
     def save(self, memory: Memory) -> None:
+        self._check_source_key(memory)
+        self._reindex_source(self._memories.get(memory.id), memory)
         self._memories[memory.id] = memory
+        self._generation += 1
 
     def get(self, memory_id: str) -> Optional[Memory]:
         return self._memories.get(memory_id)
@@ -69,17 +82,53 @@ class MemoryStore(Store):
     def update(self, memory: Memory) -> bool:
         if memory.id not in self._memories:
             return False
+        self._check_source_key(memory)
+        self._reindex_source(self._memories[memory.id], memory)
         self._memories[memory.id] = memory
+        self._generation += 1
         return True
 
     def delete(self, memory_id: str) -> bool:
-        existed = self._memories.pop(memory_id, None) is not None
-        if existed:
-            # Cascade: remove facts for this memory
-            to_remove = [fid for fid, f in self._facts.items() if f.memory_id == memory_id]
-            for fid in to_remove:
-                del self._facts[fid]
-        return existed
+        return self.delete_many([memory_id]) == 1
+
+    def delete_many(self, memory_ids: List[str]) -> int:
+        gone = set()
+        for memory_id in memory_ids:
+            memory = self._memories.pop(memory_id, None)
+            if memory is not None:
+                gone.add(memory_id)
+                self._reindex_source(memory, None)
+                # Cascade: remove facts for this memory
+                for fid in self._fact_ids_by_memory.pop(memory_id, ()):
+                    self._facts.pop(fid, None)
+        if gone:
+            self._generation += 1
+            # Cascade: entity mentions (FK ON DELETE CASCADE in the SQL stores)
+            self._entity_mentions = [
+                m for m in self._entity_mentions if m.memory_id not in gone
+            ]
+        return len(gone)
+
+    def get_by_source_id(
+        self, source: str, source_message_id: str
+    ) -> Optional[Memory]:
+        memory_id = self._ids_by_source.get((source, source_message_id))
+        return self._memories.get(memory_id) if memory_id is not None else None
+
+    def _check_source_key(self, memory: Memory) -> None:
+        key = _source_key(memory)
+        if key is not None and self._ids_by_source.get(key, memory.id) != memory.id:
+            raise DuplicateSourceMessageError(*key)
+
+    def _reindex_source(
+        self, previous: Optional[Memory], current: Optional[Memory]
+    ) -> None:
+        old_key = _source_key(previous) if previous is not None else None
+        if old_key is not None and self._ids_by_source.get(old_key) == previous.id:
+            del self._ids_by_source[old_key]
+        new_key = _source_key(current) if current is not None else None
+        if new_key is not None:
+            self._ids_by_source[new_key] = current.id
 
     def count(
         self,
@@ -103,19 +152,21 @@ class MemoryStore(Store):
             if m.expires_at is not None
             and datetime.fromisoformat(m.expires_at) < now
         ]
-        for mid in expired_ids:
-            del self._memories[mid]
-        return len(expired_ids)
+        return self.delete_many(expired_ids)
 
     # ------------------------------------------------------------------
     # Fact + conflict CRUD
     # ------------------------------------------------------------------
 
     def save_fact(self, fact: Fact) -> None:
+        previous = self._facts.get(fact.id)
+        if previous is not None and previous.memory_id != fact.memory_id:
+            self._fact_ids_by_memory.get(previous.memory_id, set()).discard(fact.id)
         self._facts[fact.id] = fact
+        self._fact_ids_by_memory.setdefault(fact.memory_id, set()).add(fact.id)
 
     def get_facts(self, memory_id: str) -> List[Fact]:
-        facts = [f for f in self._facts.values() if f.memory_id == memory_id]
+        facts = [self._facts[fid] for fid in self._fact_ids_by_memory.get(memory_id, ())]
         facts.sort(key=lambda f: f.extracted_at)
         return facts
 
@@ -236,6 +287,15 @@ class MemoryStore(Store):
     def delete_relationship(self, rel_id: str) -> None:
         self._relationships.pop(rel_id, None)
 
+    def delete_relationships_for_memories(self, memory_ids: List[str]) -> int:
+        id_set = set(memory_ids)
+        to_remove = [
+            rid for rid, r in self._relationships.items() if r.source_memory_id in id_set
+        ]
+        for rid in to_remove:
+            del self._relationships[rid]
+        return len(to_remove)
+
     def get_relationships_from(
         self, entity_ids: List[str], active_only: bool = True
     ) -> List[Relationship]:
@@ -435,3 +495,9 @@ class MemoryStore(Store):
 
     def list_rejected_patterns(self, limit: int = 100) -> List[RejectedPattern]:
         return list(self._rejected_patterns[:limit])
+
+
+def _source_key(memory: Memory) -> Optional[Tuple[str, str]]:
+    if memory.source is None or memory.source_message_id is None:
+        return None
+    return (memory.source, memory.source_message_id)
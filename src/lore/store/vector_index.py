@@ -0,0 +1,414 @@
+"""In-memory vector index for client-side recall over local stores.
+
+``Lore._recall_local`` used to ``struct.unpack`` every stored embedding and
+recompute its norm on each query, so recall latency was dominated by
+deserialisation rather than math. ``VectorIndex`` keeps the raw float32
+vectors in one contiguous matrix (plus a cached norm column) that is
+maintained incrementally by ``remember`` / ``forget`` / ``update``; a query
+is then a single matrix-vector product over the whole corpus.
+
+Each row also carries the memory it was built from and the columns recall
+filters on (project, type, tier, owner, archived, expiry, creation time,
+tags, embedding model), so :meth:`select` answers a recall's filters with
+a few vectorised comparisons instead of a ``Store.list`` of the corpus.
+
+The index is a cache, never the source of truth: ``sync`` compares each
+candidate's stored embedding bytes against the indexed row (identity first,
+byte-equality second) and re-indexes anything that drifted. ``generation``
+records the store write generation (``Store.write_generation``) the rows
+were last reconciled against; when the store reports a different one, a
+write bypassed ``Lore`` (consolidation, another caller) and the owner
+re-syncs from the store. Optionally the matrix is persisted as ``.npy``
+next to a database file and re-opened memory-mapped, so a cold start does
+not need to deserialise the corpus either (the filter columns are rebuilt
+by the first re-sync).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from lore.types import Memory
+
+logger = logging.getLogger(__name__)
+
+_MIN_CAPACITY = 64
+# Filter columns holding interned string codes (-1 = value not set).
+_CODED = ("project", "type", "tier", "user_id")
+
+
+def _epoch(value: Optional[str]) -> Optional[float]:
+    """ISO 8601 → POSIX seconds (naive = UTC); None when unset or unparsable."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class VectorIndex:
+    """Contiguous float32 matrix of embeddings keyed by memory id.
+
+    Rows are appended in amortised O(1) (capacity doubles) and deleted by
+    swapping the last row into the hole, so the live rows are always
+    ``matrix[:len(self)]`` and a query never has to skip tombstones.
+    """
+
+    def __init__(self, dim: int, *, path: Optional[str] = None) -> None:
+        self.dim = dim
+        self.path = path
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # memory id -> the embedding bytes object the row was built from.
+        # Lets ``sync`` short-circuit on identity for stores that hand back
+        # the same object (MemoryStore) without a byte comparison.
+        self._sources: Dict[str, bytes] = {}
+        self._dirty = False
+        # Per-row memory and filter columns, parallel to ``_ids``. Rows
+        # added without a memory (or loaded from disk) have ``known`` unset
+        # and are never selected until a sync supplies one.
+        self._memories: List[Optional["Memory"]] = []
+        self._tags: List[FrozenSet[str]] = []
+        self._codes: Dict[str, Dict[Optional[str], int]] = {c: {} for c in _CODED}
+        self._cols: Dict[str, np.ndarray] = self._empty_columns(0)
+        self.generation: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._rows
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _empty_columns(capacity: int) -> Dict[str, np.ndarray]:
+        cols = {c: np.full(capacity, -1, dtype=np.int32) for c in _CODED}
+        cols["known"] = np.zeros(capacity, dtype=bool)
+        cols["archived"] = np.zeros(capacity, dtype=bool)
+        cols["is_code"] = np.zeros(capacity, dtype=bool)
+        cols["expires"] = np.full(capacity, np.inf)
+        cols["created"] = np.full(capacity, np.nan)
+        return cols
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if needed <= capacity and self._matrix.flags.writeable:
+            return
+        new_capacity = max(_MIN_CAPACITY, capacity)
+        while new_capacity < needed:
+            new_capacity *= 2
+        n = len(self._ids)
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        matrix[:n] = self._matrix[:n]
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[:n] = self._norms[:n]
+        cols = self._empty_columns(new_capacity)
+        for name, col in cols.items():
+            col[:n] = self._cols[name][:n]
+        self._matrix = matrix
+        self._norms = norms
+        self._cols = cols
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def _set_memory(self, row: int, memory: "Memory") -> None:
+        meta = memory.metadata or {}
+        cols = self._cols
+        cols["project"][row] = self._code("project", memory.project)
+        cols["type"][row] = self._code("type", memory.type)
+        cols["tier"][row] = self._code("tier", memory.tier)
+        cols["user_id"][row] = self._code("user_id", meta.get("user_id"))
+        cols["known"][row] = True
+        cols["archived"][row] = bool(memory.archived)
+        cols["is_code"][row] = meta.get("embed_model", "prose") == "code"
+        expires = _epoch(memory.expires_at)
+        cols["expires"][row] = math.inf if expires is None else expires
+        created = _epoch(memory.created_at)
+        cols["created"][row] = math.nan if created is None else created
+        self._memories[row] = memory
+        self._tags[row] = frozenset(memory.tags or ())
+
+    def upsert(
+        self, memory_id: str, embedding: bytes, memory: Optional["Memory"] = None,
+    ) -> bool:
+        """Index (or re-index) ``memory_id``. Returns False if the blob is unusable.
+
+        With ``memory``, its filter columns are (re)recorded as well; without
+        one, a new row stays unselectable until a sync supplies it.
+        """
+        vec = np.frombuffer(embedding, dtype=np.float32)
+        if vec.shape[0] != self.dim:
+            self.remove(memory_id)
+            return False
+        row = self._rows.get(memory_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(memory_id)
+            self._rows[memory_id] = row
+            self._memories.append(None)
+            self._tags.append(frozenset())
+            self._cols["known"][row] = False
+        elif not self._matrix.flags.writeable:
+            self._ensure_capacity(len(self._ids))
+        self._matrix[row] = vec
+        self._norms[row] = max(float(np.linalg.norm(vec)), 1e-9)
+        self._sources[memory_id] = embedding
+        if memory is not None:
+            self._set_memory(row, memory)
+        self._dirty = True
+        return True
+
+    def refresh(self, memory: "Memory") -> bool:
+        """Re-record ``memory``'s filter columns if it is indexed.
+
+        For writes that keep the embedding (votes, enrichment, access
+        tracking). A changed embedding needs :meth:`upsert`.
+        """
+        row = self._rows.get(memory.id)
+        if row is None:
+            return False
+        self._set_memory(row, memory)
+        return True
+
+    def remove(self, memory_id: str) -> bool:
+        """Drop ``memory_id`` from the index. Returns True if it was indexed."""
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        self._sources.pop(memory_id, None)
+        if not self._matrix.flags.writeable:
+            self._ensure_capacity(len(self._ids))
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._norms[row] = self._norms[last]
+            for col in self._cols.values():
+                col[row] = col[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            self._memories[row] = self._memories[last]
+            self._tags[row] = self._tags[last]
+        self._ids.pop()
+        self._memories.pop()
+        self._tags.pop()
+        self._dirty = True
+        return True
+
+    def retain(self, memory_ids: Iterable[str]) -> int:
+        """Drop every row whose id is not in ``memory_ids``. Returns rows dropped."""
+        live = set(memory_ids)
+        stale = [mid for mid in self._ids if mid not in live]
+        for mid in stale:
+            self.remove(mid)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._ids = []
+        self._rows = {}
+        self._sources = {}
+        self._memories = []
+        self._tags = []
+        self._cols = self._empty_columns(0)
+        self.generation = None
+        self._dirty = True
+
+    def sync(
+        self, memory_id: str, embedding: bytes, memory: Optional["Memory"] = None,
+    ) -> Optional[int]:
+        """Make sure ``memory_id``'s row matches ``embedding``; return its row.
+
+        With ``memory``, its filter columns are re-recorded too. Returns None
+        when the embedding cannot be indexed (wrong dimension).
+        """
+        row = self._rows.get(memory_id)
+        if row is not None:
+            source = self._sources.get(memory_id)
+            if source is embedding or self._matrix[row].tobytes() == embedding:
+                self._sources[memory_id] = embedding
+                if memory is not None:
+                    self._set_memory(row, memory)
+                return row
+        if not self.upsert(memory_id, embedding, memory):
+            return None
+        return self._rows[memory_id]
+
+    def rows_for(self, memories: Iterable["Memory"]) -> np.ndarray:
+        """Row numbers for ``memories``, syncing their rows on the way.
+
+        Every memory must carry an embedding. Memories whose embedding cannot
+        be indexed map to ``-1``.
+        """
+        ids: List[str] = []
+        source = self._sources.get
+        for m in memories:
+            mid = m.id
+            # Fast path: the row was built from this very bytes object.
+            if source(mid) is not m.embedding or self._memories[self._rows[mid]] is not m:
+                self.sync(mid, m.embedding, m)
+            ids.append(mid)
+        # Looked up after syncing: a removal during sync may have moved rows.
+        get = self._rows.get
+        return np.fromiter((get(mid, -1) for mid in ids), dtype=np.int64, count=len(ids))
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def memory(self, row: int) -> "Memory":
+        """The memory ``row`` was last synced from."""
+        return self._memories[row]  # type: ignore[return-value]
+
+    def is_code(self, rows: np.ndarray) -> np.ndarray:
+        """Whether each of ``rows`` was embedded by the code model."""
+        return self._cols["is_code"][rows]
+
+    def select(
+        self,
+        *,
+        now: float,
+        project: Optional[str] = None,
+        type: Optional[str] = None,
+        tier: Optional[str] = None,
+        user_id: Optional[str] = None,
+        created_from: Optional[float] = None,
+        created_to: Optional[float] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """Rows recall may score, in row order.
+
+        Live (not archived, not expired at ``now``) memories matching every
+        given filter; ``None`` means no filter. Times are POSIX seconds;
+        with a time bound, rows without a creation time are excluded.
+        """
+        n = len(self._ids)
+        cols = self._cols
+        mask = cols["known"][:n] & ~cols["archived"][:n] & (cols["expires"][:n] > now)
+        for column, value in (("project", project), ("type", type), ("tier", tier), ("user_id", user_id)):
+            if value is None:
+                continue
+            code = self._codes[column].get(value)
+            if code is None:
+                return np.zeros(0, dtype=np.int64)
+            mask &= cols[column][:n] == code
+        created = cols["created"][:n]
+        if created_from is not None:
+            mask &= created >= created_from
+        if created_to is not None:
+            mask &= created <= created_to
+        rows = np.flatnonzero(mask)
+        if tags and rows.size:
+            # Set containment has no vector form; only rows left after the
+            # columnar filters are checked.
+            wanted = frozenset(tags)
+            keep = np.fromiter(
+                (wanted <= self._tags[r] for r in rows.tolist()), dtype=bool, count=rows.size,
+            )
+            rows = rows[keep]
+        return rows
+
+    def cosine(self, query: Sequence[float], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of ``query`` against ``rows`` (default: all rows).
+
+        Scores the whole live matrix in one product and then gathers, which
+        is cheaper than copying a fancy-indexed sub-matrix for large corpora.
+        """
+        q = np.asarray(query, dtype=np.float32)
+        q = q / max(float(np.linalg.norm(q)), 1e-9)
+        n = len(self._ids)
+        scores = (self._matrix[:n] @ q) / self._norms[:n]
+        if rows is None:
+            return scores
+        out = np.zeros(len(rows), dtype=np.float32)
+        valid = rows >= 0
+        out[valid] = scores[rows[valid]]
+        return out
+
+    def top_k(self, query: Sequence[float], k: int) -> List[tuple]:
+        """Return the ``k`` most similar ``(memory_id, cosine)`` pairs."""
+        n = len(self._ids)
+        if n == 0 or k <= 0:
+            return []
+        scores = self.cosine(query)
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[i], float(scores[i])) for i in top]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Persist the live rows to ``<path>.npy`` + ``<path>.ids.json``."""
+        path = path or self.path
+        if path is None:
+            return
+        n = len(self._ids)
+        tmp = f"{path}.tmp.npy"
+        np.save(tmp, np.ascontiguousarray(self._matrix[:n]))
+        os.replace(tmp, f"{path}.npy")
+        with open(f"{path}.ids.json.tmp", "w") as f:
+            json.dump(self._ids, f)
+        os.replace(f"{path}.ids.json.tmp", f"{path}.ids.json")
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Persist if a path is configured and rows changed since the last save."""
+        if self.path is not None and self._dirty:
+            try:
+                self.save()
+            except OSError:
+                logger.warning("Failed to persist vector index to %s", self.path, exc_info=True)
+
+    @classmethod
+    def load(cls, path: str, dim: int, *, mmap: bool = True) -> "VectorIndex":
+        """Open an index written by :meth:`save`.
+
+        With ``mmap=True`` the matrix is mapped read-only and only copied into
+        process memory on the first mutation. A missing or mismatched file
+        yields an empty index (it is rebuilt lazily by ``sync``).
+        """
+        index = cls(dim, path=path)
+        try:
+            with open(f"{path}.ids.json") as f:
+                ids = json.load(f)
+            matrix = np.load(f"{path}.npy", mmap_mode="r" if mmap else None)
+        except (OSError, ValueError):
+            return index
+        if matrix.ndim != 2 or matrix.shape != (len(ids), dim) or matrix.dtype != np.float32:
+            logger.warning("Ignoring vector index at %s: shape/dtype mismatch", path)
+            return index
+        index._matrix = matrix
+        index._norms = np.clip(np.linalg.norm(matrix, axis=1), 1e-9, None).astype(np.float32)
+        index._ids = list(ids)
+        index._rows = {mid: i for i, mid in enumerate(ids)}
+        index._memories = [None] * len(ids)
+        index._tags = [frozenset()] * len(ids)
+        index._cols = cls._empty_columns(len(ids))
+        return index
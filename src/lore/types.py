@@ -123,6 +123,9 @@ class Memory:
     # memory is only visible inside its repo; 'global' means it surfaces in
     # every project (universal lessons, language gotchas, framework patterns).
     scope: Optional[str] = None
+    # Migration 032: upstream message id from the ingest adapter named by
+    # ``source``; unique per (org, source). See ``Store.get_by_source_id``.
+    source_message_id: Optional[str] = None
 
 
 @dataclass
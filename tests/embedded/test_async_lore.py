@@ -590,6 +590,67 @@ class TestAsyncLoreConsolidationAndMaintenance:
             assert log[0].strategy == "deduplicate"
             assert log[0].consolidated_memory_id == consolidated[0].id
 
+    @pytest.mark.asyncio
+    async def test_consolidate_moves_watermark_only_on_real_runs(self):
+        from lore import AsyncLore
+
+        async with AsyncLore("sqlite:///:memory:", embed=_stub_embed) as lore:
+            store = lore._require_store()
+            await lore.remember("anything")
+            await lore.consolidate(dry_run=True)
+            assert await store.get_consolidation_watermark(lore.org_id) is None
+            await lore.consolidate(dry_run=False)
+            assert await store.get_consolidation_watermark(lore.org_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_incremental_consolidate_skips_settled_memories(self):
+        """Pairs older than the watermark are only revisited by ``full=True``."""
+        from datetime import datetime, timedelta, timezone
+
+        from lore import AsyncLore
+
+        async with AsyncLore("sqlite:///:memory:", embed=_stub_embed) as lore:
+            vec = _stub_embed("dup")
+            await lore.remember("dup A", embedding=vec)
+            await lore.remember("dup B", embedding=vec)
+            store = lore._require_store()
+            await store.set_consolidation_watermark(
+                lore.org_id, datetime.now(timezone.utc) + timedelta(hours=1),
+            )
+
+            report = await lore.consolidate(dry_run=True)
+            assert report.groups_found == 0
+            report = await lore.consolidate(dry_run=True, full=True)
+            assert report.groups_found == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_consolidate_matches_new_against_old(self):
+        """A new memory is grouped with an older duplicate via the vector index."""
+        from datetime import datetime, timedelta, timezone
+
+        from lore import AsyncLore
+
+        async with AsyncLore("sqlite:///:memory:", embed=_stub_embed) as lore:
+            vec = _stub_embed("dup")
+            old = await lore.remember("old dup", embedding=vec)
+            store = lore._require_store()
+            await store._conn.execute(
+                "UPDATE memories SET created_at = datetime('now', '-1 day') WHERE id = ?",
+                (old.id,),
+            )
+            await store._conn.commit()
+            await store.set_consolidation_watermark(
+                lore.org_id, datetime.now(timezone.utc) - timedelta(hours=1),
+            )
+            new = await lore.remember("new dup", embedding=vec)
+            await lore.remember("unrelated", embedding=_stub_embed("other"))
+
+            report = await lore.consolidate(dry_run=False)
+            assert report.groups_found == 1
+            assert report.memories_consolidated == 2
+            remaining = {m.id for m in await lore.list_memories(limit=100)}
+            assert old.id not in remaining and new.id not in remaining
+
     @pytest.mark.asyncio
     async def test_get_consolidation_log_empty_when_nothing_consolidated(self):
         from lore import AsyncLore
@@ -220,6 +220,44 @@ async def test_bump_access_counts_org_isolation(store: Store):
     assert after.access_count == 0
 
 
+# ── record_access_batch tests ──────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_record_access_batch_applies_bumps_and_events(store: Store):
+    hot = await _insert_memory(store, org_id="org-rab1", content="hot")
+    cold = await _insert_memory(store, org_id="org-rab1", content="cold")
+    event = NewRetrievalEvent(
+        org_id="org-rab1",
+        query="batched",
+        results_count=1,
+        scores=[0.9],
+        memory_ids=[hot],
+        avg_score=0.9,
+        max_score=0.9,
+        min_score_threshold=0.3,
+        query_time_ms=3.0,
+    )
+
+    await store.record_access_batch(
+        {("org-rab1", hot): 3, ("org-rab1", cold): 1, ("org-other", hot): 5},
+        [event, event],
+    )
+
+    after_hot = await store.get_memory("org-rab1", hot)
+    after_cold = await store.get_memory("org-rab1", cold)
+    assert after_hot is not None and after_cold is not None
+    assert after_hot.access_count == 3
+    assert after_hot.last_accessed_at is not None
+    assert after_cold.access_count == 1
+    assert await _count_retrieval_events(store, "org-rab1") == 2
+
+
+@pytest.mark.asyncio
+async def test_record_access_batch_empty_is_noop(store: Store):
+    await store.record_access_batch({}, [])
+
+
 # ── snapshot seed helper ───────────────────────────────────────────────────────
 
 
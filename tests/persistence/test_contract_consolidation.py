@@ -0,0 +1,62 @@
+"""Contract tests for the ConsolidationOps slice of Store.
+
+Covers the per-(org, project) watermark that incremental consolidation
+keeps, and the ``MemoryFilter.since`` window it reads new memories with.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+import pytest
+
+from lore.persistence import MemoryFilter, NewMemory, Store
+
+
+def _vec(seed: int) -> Sequence[float]:
+    return [((seed + i * 7) % 100) / 100.0 for i in range(384)]
+
+
+@pytest.mark.asyncio
+async def test_watermark_absent_until_set(store: Store):
+    assert await store.get_consolidation_watermark("solo") is None
+    assert await store.get_consolidation_watermark("solo", "lore") is None
+
+
+@pytest.mark.asyncio
+async def test_watermark_round_trip_and_replace(store: Store):
+    first = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+    second = first + timedelta(hours=6)
+    await store.set_consolidation_watermark("solo", first)
+    assert await store.get_consolidation_watermark("solo") == first
+
+    await store.set_consolidation_watermark("solo", second)
+    assert await store.get_consolidation_watermark("solo") == second
+
+
+@pytest.mark.asyncio
+async def test_watermark_is_per_project(store: Store):
+    at = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+    await store.set_consolidation_watermark("solo", at, "lore")
+    assert await store.get_consolidation_watermark("solo", "lore") == at
+    assert await store.get_consolidation_watermark("solo") is None
+    assert await store.get_consolidation_watermark("solo", "other") is None
+
+
+@pytest.mark.asyncio
+async def test_since_filter_includes_rows_written_today(store: Store):
+    before = datetime.now(timezone.utc) - timedelta(minutes=1)
+    m = await store.insert_memory(
+        NewMemory(org_id="solo", content="written after the watermark", embedding=_vec(3))
+    )
+    rows = await store.list_memories_with_embeddings(
+        MemoryFilter(org_id="solo", since=before)
+    )
+    assert m.id in {r.id for r in rows}
+
+    later = datetime.now(timezone.utc) + timedelta(minutes=1)
+    rows = await store.list_memories_with_embeddings(
+        MemoryFilter(org_id="solo", since=later)
+    )
+    assert m.id not in {r.id for r in rows}
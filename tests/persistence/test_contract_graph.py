@@ -127,6 +127,15 @@ async def test_get_entity_by_name_returns_none_when_missing(store: Store):
     assert (await store.get_entity_by_name("nonexistent", ORG)) is None
 
 
+@pytest.mark.asyncio
+async def test_get_entities_by_names_batches_exact_matches(store: Store):
+    a = await store.upsert_entity(NewEntity(org_id=ORG, name="Redis", entity_type="db"))
+    b = await store.upsert_entity(NewEntity(org_id=ORG, name="celery", entity_type="library"))
+    got = await store.get_entities_by_names(["Redis", "redis", "celery", "nope"], ORG)
+    assert sorted(e.id for e in got) == sorted([a.id, b.id])
+    assert list(await store.get_entities_by_names([], ORG)) == []
+
+
 @pytest.mark.asyncio
 async def test_list_entities_returns_all_when_unfiltered(store: Store):
     await store.upsert_entity(NewEntity(org_id=ORG, name="a", entity_type="x"))
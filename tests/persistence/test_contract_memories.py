@@ -20,7 +20,11 @@ from lore.persistence import (
     Store,
     StoredMemory,
 )
-from lore.persistence.exceptions import StoreNotFoundError
+from lore.persistence.exceptions import (
+    DuplicateSourceMessageError,
+    EmbeddingDimMismatch,
+    StoreNotFoundError,
+)
 
 
 def _vec(seed: int) -> Sequence[float]:
@@ -52,6 +56,81 @@ async def test_insert_and_get_round_trip(store: Store):
     assert fetched.content == nm.content
 
 
+@pytest.mark.asyncio
+async def test_insert_memories_round_trip_in_order(store: Store, monkeypatch):
+    import sys
+
+    # Small chunks so the batch spans several multi-row INSERTs.
+    monkeypatch.setattr(sys.modules[type(store).__module__], "_BULK_INSERT_ROWS", 2)
+    batch = [
+        NewMemory(
+            org_id="solo", content=f"bulk {i}", embedding=_vec(40 + i),
+            tags=(f"t{i}",), project="lore", meta={"type": "note"},
+        )
+        for i in range(5)
+    ]
+    inserted = await store.insert_memories(batch)
+    assert [m.content for m in inserted] == [f"bulk {i}" for i in range(5)]
+    assert [tuple(m.tags) for m in inserted] == [(f"t{i}",) for i in range(5)]
+    assert len({m.id for m in inserted}) == 5
+
+    fetched = await store.get_memory("solo", inserted[3].id)
+    assert fetched is not None and fetched.content == "bulk 3"
+    hits = await store.recall_by_embedding(
+        RecallParams(org_id="solo", query_vec=_vec(44), limit=1, min_score=0.0, project="lore")
+    )
+    assert hits[0].id == inserted[4].id
+    assert await store.insert_memories([]) == []
+
+
+@pytest.mark.asyncio
+async def test_insert_memories_is_all_or_nothing(store: Store):
+    batch = [
+        NewMemory(org_id="solo", content="fine", embedding=_vec(50)),
+        NewMemory(org_id="solo", content="bad dim", embedding=[0.1] * 3),
+    ]
+    with pytest.raises(EmbeddingDimMismatch):
+        await store.insert_memories(batch)
+    assert await store.list_memories(MemoryFilter(org_id="solo")) == []
+
+
+@pytest.mark.asyncio
+async def test_source_message_id_is_unique_per_org_and_source(store: Store):
+    first = await store.insert_memory(
+        NewMemory(org_id="solo", content="slack msg", embedding=_vec(60),
+                  source="slack", source_message_id="ts-1")
+    )
+    # Same upstream id from another adapter or another org is a different key.
+    await store.insert_memory(
+        NewMemory(org_id="solo", content="tg msg", embedding=_vec(61),
+                  source="telegram", source_message_id="ts-1")
+    )
+    await store.insert_memory(
+        NewMemory(org_id="org_b", content="slack msg", embedding=_vec(62),
+                  source="slack", source_message_id="ts-1")
+    )
+
+    found = await store.get_memory_by_source_id("solo", "slack", "ts-1")
+    assert found is not None and found.id == first.id
+    assert await store.get_memory_by_source_id("solo", "slack", "ts-2") is None
+
+    with pytest.raises(DuplicateSourceMessageError) as exc_info:
+        await store.insert_memory(
+            NewMemory(org_id="solo", content="again", embedding=_vec(63),
+                      source="slack", source_message_id="ts-1")
+        )
+    assert exc_info.value.source_message_id == "ts-1"
+
+    with pytest.raises(DuplicateSourceMessageError):
+        await store.insert_memories([
+            NewMemory(org_id="solo", content="new", embedding=_vec(64),
+                      source="slack", source_message_id="ts-3"),
+            NewMemory(org_id="solo", content="dup", embedding=_vec(65),
+                      source="slack", source_message_id="ts-3"),
+        ])
+    assert await store.get_memory_by_source_id("solo", "slack", "ts-3") is None
+
+
 @pytest.mark.asyncio
 async def test_get_returns_none_when_missing(store: Store):
     assert await store.get_memory("solo", "mem_does_not_exist") is None
@@ -107,6 +186,53 @@ async def test_delete_returns_false_when_missing(store: Store):
     assert (await store.delete_memory("solo", "mem_missing")) is False
 
 
+@pytest.mark.asyncio
+async def test_delete_memories_in_chunks_with_graph_cascade(store: Store, monkeypatch):
+    import sys
+
+    from lore.persistence.types import NewEntity, NewMention, NewRelationship
+
+    # Small chunks so the delete spans several transactions.
+    monkeypatch.setattr(sys.modules[type(store).__module__], "_BULK_DELETE_ROWS", 2)
+    mems = await store.insert_memories([
+        NewMemory(org_id="solo", content=f"gone {i}", embedding=_vec(60 + i)) for i in range(5)
+    ])
+    keep = await store.insert_memory(NewMemory(org_id="solo", content="kept", embedding=_vec(70)))
+    a = await store.upsert_entity(NewEntity(org_id="solo", name="a", entity_type="x"))
+    b = await store.upsert_entity(NewEntity(org_id="solo", name="b", entity_type="x"))
+    await store.save_mention(NewMention(org_id="solo", entity_id=a.id, memory_id=mems[0].id))
+    sourced = await store.save_relationship(NewRelationship(
+        org_id="solo", source_entity_id=a.id, target_entity_id=b.id,
+        rel_type="uses", source_memory_id=mems[0].id,
+    ))
+    other = await store.save_relationship(NewRelationship(
+        org_id="solo", source_entity_id=b.id, target_entity_id=a.id,
+        rel_type="uses", source_memory_id=keep.id,
+    ))
+
+    doomed = [m.id for m in mems] + ["mem_missing"]
+    deleted = await store.delete_memories("solo", doomed)
+    assert sorted(deleted) == sorted(m.id for m in mems)
+    for m in mems:
+        assert await store.get_memory("solo", m.id) is None
+    assert await store.get_memory("solo", keep.id) is not None
+    assert await store.get_mentions_for_memory(mems[0].id, "solo") == []
+    assert await store.get_relationship(sourced.id, "solo") is None
+    assert await store.get_relationship(other.id, "solo") is not None
+    hits = await store.recall_by_embedding(
+        RecallParams(org_id="solo", query_vec=_vec(60), limit=10, min_score=-1.0)
+    )
+    assert [h.id for h in hits] == [keep.id]
+    assert await store.delete_memories("solo", []) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_memories_is_org_scoped(store: Store):
+    m = await store.insert_memory(NewMemory(org_id="solo", content="mine", embedding=_vec(71)))
+    assert await store.delete_memories("other_org", [m.id]) == []
+    assert await store.get_memory("solo", m.id) is not None
+
+
 @pytest.mark.asyncio
 async def test_list_memories_filters_by_project(store: Store):
     await store.insert_memory(
@@ -225,6 +351,21 @@ async def test_expire_memories_deletes_past_expiry(store: Store):
     assert (await store.get_memory("solo", keep.id)) is not None
 
 
+@pytest.mark.asyncio
+async def test_expire_memories_sweeps_every_chunk(store: Store, monkeypatch):
+    import sys
+
+    monkeypatch.setattr(sys.modules[type(store).__module__], "_BULK_DELETE_ROWS", 2)
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    expired = await store.insert_memories([
+        NewMemory(org_id="solo", content=f"old {i}", embedding=_vec(80 + i), expires_at=past)
+        for i in range(5)
+    ])
+    assert await store.expire_memories() >= 5
+    for m in expired:
+        assert await store.get_memory("solo", m.id) is None
+
+
 @pytest.mark.asyncio
 async def test_bump_access_counts_increments(store: Store):
     m = await store.insert_memory(
@@ -111,3 +111,29 @@ async def test_below_confidence_threshold_not_flagged(store, monkeypatch):
         owner_user_id="y", scorer=lambda _x, _y: (True, 0.5, "weak"), min_similarity=0.05,
     )
     assert res is None
+
+
+@pytest.mark.asyncio
+async def test_shared_context_scores_top_k_neighbors(store):
+    from lore.services.reconciliation import WriteContext
+
+    for i in range(4):
+        await store.insert_memory(
+            NewMemory(org_id="solo", content=f"claim {i}", embedding=_vec(0.001 * i), user_id="alice")
+        )
+    ctx = WriteContext("solo", _vec(0.01), user_id="alice")
+    await ctx.neighbours(store, limit=3, min_score=0.05)  # reconciliation, before the insert
+    new = await store.insert_memory(
+        NewMemory(org_id="solo", content="new claim", embedding=_vec(0.01), user_id="alice")
+    )
+    scored = []
+
+    def counting(a, b):
+        scored.append(b)
+        return (False, 0.0, "")
+
+    await detect_and_flag(
+        store, org_id="solo", memory_id=new.id, content=new.content, embedding=_vec(0.01),
+        owner_user_id="alice", scorer=counting, top_k=2, min_similarity=0.05, context=ctx,
+    )
+    assert len(scored) == 2
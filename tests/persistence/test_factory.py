@@ -49,3 +49,47 @@ async def test_sqlite_scheme_returns_sqlite_store(tmp_path):
         assert isinstance(store, SqliteStore)
     finally:
         await store.close()
+
+
+def test_pool_options_default_to_previous_sizing(monkeypatch):
+    from lore.persistence.factory import PoolOptions
+
+    for name in ("LORE_DB_POOL_MIN_SIZE", "LORE_DB_POOL_MAX_SIZE",
+                 "LORE_DB_POOL_ACQUIRE_TIMEOUT", "LORE_DB_STATEMENT_CACHE_SIZE",
+                 "LORE_DB_POOL_MAX_INACTIVE_LIFETIME"):
+        monkeypatch.delenv(name, raising=False)
+    opts = PoolOptions.from_env()
+    assert (opts.min_size, opts.max_size, opts.acquire_timeout) == (2, 10, None)
+    assert opts.create_pool_kwargs() == {
+        "min_size": 2,
+        "max_size": 10,
+        "statement_cache_size": 100,
+        "max_inactive_connection_lifetime": 300.0,
+    }
+
+
+def test_pool_options_from_env(monkeypatch):
+    from lore.persistence.factory import PoolOptions
+
+    monkeypatch.setenv("LORE_DB_POOL_MIN_SIZE", "4")
+    monkeypatch.setenv("LORE_DB_POOL_MAX_SIZE", "32")
+    monkeypatch.setenv("LORE_DB_POOL_ACQUIRE_TIMEOUT", "2.5")
+    monkeypatch.setenv("LORE_DB_STATEMENT_CACHE_SIZE", "0")
+    monkeypatch.setenv("LORE_DB_POOL_MAX_INACTIVE_LIFETIME", "60")
+    opts = PoolOptions.from_env()
+    assert opts == PoolOptions(
+        min_size=4, max_size=32, statement_cache_size=0,
+        acquire_timeout=2.5, max_inactive_connection_lifetime=60.0,
+    )
+
+
+def test_pool_options_ignore_invalid_values(monkeypatch):
+    from lore.persistence.factory import PoolOptions
+
+    monkeypatch.setenv("LORE_DB_POOL_MAX_SIZE", "lots")
+    monkeypatch.setenv("LORE_DB_POOL_MIN_SIZE", "50")
+    monkeypatch.setenv("LORE_DB_POOL_ACQUIRE_TIMEOUT", "-1")
+    opts = PoolOptions.from_env()
+    assert opts.max_size == 10
+    assert opts.min_size == 10  # clamped to max_size
+    assert opts.acquire_timeout is None
@@ -42,6 +42,7 @@ async def test_graph_reads_are_org_isolated(store):
     ea = await store.get_entity_by_name("Acme", "orgA")
     eb = await store.get_entity_by_name("Acme", "orgB")
     assert ea and eb and ea.id == a["acme"] and eb.id == b["acme"] and ea.id != eb.id  # coexist, isolated
+    assert [e.id for e in await store.get_entities_by_names(["Acme"], "orgA")] == [a["acme"]]
     assert (await store.find_entity_by_name_or_alias("Acme", "orgA")).id == a["acme"]
     la = await store.list_entities("orgA")
     assert len(la) == 2 and all(e.id not in (b["acme"], b["two"]) for e in la)
@@ -87,7 +88,8 @@ async def test_graph_writes_are_org_isolated(store):
 # must carry an org_id parameter. If a future method is added without one, this
 # fails — preventing a silent reintroduction of the cross-tenant leak.
 _GRAPH_METHODS_REQUIRING_ORG_ID = {
-    "get_entity", "get_entity_by_name", "find_entity_by_name_or_alias", "list_entities",
+    "get_entity", "get_entity_by_name", "get_entities_by_names",
+    "find_entity_by_name_or_alias", "list_entities",
     "get_mentions_for_memory", "get_mentions_for_entity", "count_memories_for_entity",
     "get_relationship", "get_active_relationship", "list_relationships_for_entity",
     "list_pending_relationships", "query_relationships", "get_memories_by_entities",
@@ -0,0 +1,117 @@
+"""PostgresStore.recall_by_embedding — two-stage ANN query shape.
+
+Runs against a recording fake connection (no database): the candidate stage
+must be an index-servable ``ORDER BY distance LIMIT n`` scan, ``ef_search``
+is applied with ``SET LOCAL``, and a starved candidate set falls back to an
+exact scan.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from lore.persistence.postgres import EMBED_DIM, PostgresStore  # noqa: E402
+from lore.persistence.types import RecallParams  # noqa: E402
+
+
+def _row(i: int, similarity: float, score: float) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": f"mem_{i}", "org_id": "org_a", "content": f"c{i}", "context": "",
+        "tags": "[]", "source": None, "project": None, "created_at": now,
+        "updated_at": now, "expires_at": None, "upvotes": 0, "downvotes": 0,
+        "meta": "{}", "access_count": 0, "last_accessed_at": None,
+        "scope": "global", "visibility": "shared", "user_id": None,
+        "score": score, "similarity": similarity,
+    }
+
+
+class _FakeConn:
+    def __init__(self, *results):
+        self._results = list(results)
+        self.executed: list[str] = []
+        self.fetched: list[str] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql, *args):
+        self.executed.append(sql)
+
+    async def fetch(self, sql, *args):
+        self.fetched.append(sql)
+        return self._results.pop(0)
+
+
+def _params(**kw) -> RecallParams:
+    return RecallParams(org_id="org_a", query_vec=[0.1] * EMBED_DIM, **kw)
+
+
+@pytest.mark.asyncio
+async def test_candidate_stage_orders_by_distance(monkeypatch):
+    monkeypatch.delenv("LORE_HNSW_EF_SEARCH", raising=False)
+    conn = _FakeConn([_row(1, 0.9, 0.8), _row(2, 0.95, 0.7), _row(3, 0.1, 0.05)])
+    store = PostgresStore.from_connection(conn)
+    got = await store.recall_by_embedding(_params(limit=2, min_score=0.3))
+    assert [m.id for m in got] == ["mem_1", "mem_2"]
+    assert len(conn.fetched) == 1
+    sql = " ".join(conn.fetched[0].split())
+    assert "ORDER BY distance LIMIT $" in sql
+    assert conn.executed == ["SET LOCAL hnsw.ef_search = 40"]
+
+
+@pytest.mark.asyncio
+async def test_ef_search_is_configurable(monkeypatch):
+    monkeypatch.setenv("LORE_HNSW_EF_SEARCH", "200")
+    conn = _FakeConn([_row(1, 0.9, 0.9)])
+    await PostgresStore.from_connection(conn).recall_by_embedding(_params(limit=1))
+    assert conn.executed == ["SET LOCAL hnsw.ef_search = 200"]
+
+    conn = _FakeConn([_row(1, 0.9, 0.9)])
+    await PostgresStore(conn=conn, hnsw_ef_search=64).recall_by_embedding(_params(limit=1))
+    assert conn.executed == ["SET LOCAL hnsw.ef_search = 64"]
+
+
+@pytest.mark.asyncio
+async def test_starved_candidates_fall_back_to_exact_scan(monkeypatch):
+    monkeypatch.delenv("LORE_HNSW_EF_SEARCH", raising=False)
+    conn = _FakeConn([_row(1, 0.9, 0.9)], [_row(1, 0.9, 0.9), _row(2, 0.8, 0.8)])
+    got = await PostgresStore.from_connection(conn).recall_by_embedding(_params(limit=2))
+    assert [m.id for m in got] == ["mem_1", "mem_2"]
+    assert len(conn.fetched) == 2
+    assert "ORDER BY distance + 0" in conn.fetched[1]
+
+
+def _index(name: str, method: str, definition: str, valid: bool = True) -> dict:
+    return {
+        "name": name, "method": method, "valid": valid,
+        "indexdef": f"CREATE INDEX {name} ON public.memories USING {method} {definition}",
+    }
+
+
+@pytest.mark.asyncio
+async def test_build_vector_index_replaces_ivfflat_concurrently():
+    conn = _FakeConn([
+        _index("idx_memories_embedding_hnsw", "hnsw", "(embedding vector_cosine_ops)", valid=False),
+        _index("idx_memories_embedding_ivf", "ivfflat", "(embedding vector_cosine_ops)"),
+        _index("idx_memories_embedding_bq_hnsw", "hnsw", "((binary_quantize(embedding)))"),
+    ])
+    dropped = await PostgresStore.from_connection(conn).build_vector_index()
+    assert dropped == ["idx_memories_embedding_ivf"]
+    # The interrupted build is redone; every statement avoids a write lock.
+    assert conn.executed == [
+        'DROP INDEX CONCURRENTLY IF EXISTS "idx_memories_embedding_hnsw"',
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_memories_embedding_hnsw "
+        "ON memories USING hnsw (embedding vector_cosine_ops)",
+        'DROP INDEX CONCURRENTLY IF EXISTS "idx_memories_embedding_ivf"',
+    ]
+
+    conn = _FakeConn([_index("idx_memories_embedding", "hnsw", "(embedding vector_cosine_ops)")])
+    assert await PostgresStore.from_connection(conn).build_vector_index() == []
+    assert conn.executed == []
@@ -12,9 +12,12 @@ from lore.persistence import Store
 
 REQUIRED_MEMORY_OPS = {
     "insert_memory",
+    "insert_memories",
+    "get_memory_by_source_id",
     "get_memory",
     "update_memory",
     "delete_memory",
+    "delete_memories",
     "list_memories",
     "list_memories_paginated",
     "list_memories_with_embeddings",
@@ -30,6 +33,7 @@ REQUIRED_MEMORY_OPS = {
 REQUIRED_GRAPH_OPS = {
     "get_entity",
     "get_entity_by_name",
+    "get_entities_by_names",
     "list_entities",
     "upsert_entity",
     "update_entity_counts",
@@ -163,6 +167,7 @@ def test_auth_ops_are_async():
 REQUIRED_ANALYTICS_OPS = {
     "record_retrieval_event",
     "bump_access_counts",
+    "record_access_batch",
     "record_memory_access",
     "list_recent_session_snapshots",
     "compute_retrieval_analytics",
@@ -328,3 +333,23 @@ def test_sharing_ops_are_async():
         assert inspect.iscoroutinefunction(method), (
             f"Store.{name} must be async"
         )
+
+
+REQUIRED_CONSOLIDATION_OPS = {
+    "get_consolidation_watermark",
+    "set_consolidation_watermark",
+}
+
+
+def test_store_declares_consolidation_ops():
+    members = {name for name, _ in inspect.getmembers(Store)}
+    missing = REQUIRED_CONSOLIDATION_OPS - members
+    assert not missing, f"Store missing ConsolidationOps methods: {missing}"
+
+
+def test_consolidation_ops_are_async():
+    for name in REQUIRED_CONSOLIDATION_OPS:
+        method = getattr(Store, name)
+        assert inspect.iscoroutinefunction(method), (
+            f"Store.{name} must be async"
+        )
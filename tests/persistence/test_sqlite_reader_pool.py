@@ -0,0 +1,113 @@
+"""SqliteStore reader pool — ``query_only`` readers next to a single writer.
+
+File-backed stores serve reads (``_read()``) from a pool of read-only
+connections so WAL readers run concurrently; writes and ``transaction()``
+stay on the one writer connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("sqlite_vec")
+
+
+def _vec(seed: int) -> list[float]:
+    from lore.persistence.sqlite import EMBED_DIM
+
+    return [((seed + i * 7) % 100) / 100.0 for i in range(EMBED_DIM)]
+
+
+async def _open(tmp_path: Path, **kwargs):
+    from lore.persistence.sqlite import SqliteStore
+
+    store = await SqliteStore.open(f"sqlite:///{tmp_path / 'pool.db'}", **kwargs)
+    await store._conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES ('org_a', 'a')")
+    await store._conn.commit()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_reads_see_committed_writes(tmp_path):
+    from lore.persistence import NewMemory
+
+    store = await _open(tmp_path, readers=2)
+    try:
+        assert len(store._readers) == 2
+        inserted = await store.insert_memory(
+            NewMemory(org_id="org_a", content="pooled", embedding=_vec(1))
+        )
+        fetched = await store.get_memory("org_a", inserted.id)
+        assert fetched is not None and fetched.content == "pooled"
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_readers_are_query_only(tmp_path):
+    import aiosqlite
+
+    store = await _open(tmp_path, readers=1)
+    try:
+        async with store._read() as conn:
+            assert conn is not store._conn
+            with pytest.raises(aiosqlite.OperationalError):
+                await conn.execute("INSERT INTO orgs (id, name) VALUES ('x', 'x')")
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_use_distinct_connections(tmp_path):
+    store = await _open(tmp_path, readers=3)
+    try:
+        seen = []
+
+        async def borrow():
+            async with store._read() as conn:
+                seen.append(conn)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(borrow() for _ in range(3)))
+        assert len({id(c) for c in seen}) == 3
+        assert store._idle_readers.qsize() == 3
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_without_readers_reads_use_the_writer(tmp_path, monkeypatch):
+    monkeypatch.setenv("LORE_SQLITE_READERS", "0")
+    store = await _open(tmp_path)
+    try:
+        assert store._readers == []
+        async with store._read() as conn:
+            assert conn is store._conn
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_database_has_no_readers():
+    from lore.persistence.sqlite import SqliteStore
+
+    store = await SqliteStore.open("sqlite:///:memory:", readers=4)
+    try:
+        assert store._readers == []
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_readers(tmp_path):
+    store = await _open(tmp_path, readers=2)
+    readers = list(store._readers)
+    await store.close()
+    assert store._readers == [] and store._idle_readers is None
+    for reader in readers:
+        with pytest.raises(ValueError):
+            await reader.execute("SELECT 1")
@@ -0,0 +1,150 @@
+"""SqliteStore.recall_by_embedding — tenant-partitioned KNN + adaptive over-fetch.
+
+``memory_vectors`` is partitioned by ``org_id`` and the KNN grows ``k`` until
+``limit`` rows survive the post-KNN filters (project/scope, visibility,
+expiry), falling back to an exact filter-first scan at vec0's ``k`` ceiling.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("sqlite_vec")
+
+
+def _vec(i: int, j: int = 1, w: float = 0.0) -> list[float]:
+    from lore.persistence.sqlite import EMBED_DIM
+
+    v = [0.0] * EMBED_DIM
+    v[0] = 1.0
+    v[i] = w
+    v[j] += 0.01
+    return v
+
+
+async def _open(tmp_path: Path, name: str = "recall.db"):
+    from lore.persistence.sqlite import SqliteStore
+
+    store = await SqliteStore.open(f"sqlite:///{tmp_path / name}")
+    for org_id in ("org_a", "org_b"):
+        await store._conn.execute(
+            "INSERT OR IGNORE INTO orgs (id, name) VALUES (?, ?)", (org_id, org_id)
+        )
+    await store._conn.commit()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_small_tenant_gets_full_limit(tmp_path: Path):
+    from lore.persistence.types import NewMemory, RecallParams
+
+    store = await _open(tmp_path)
+    try:
+        # The big tenant's vectors are all closer to the query than the small one's.
+        for i in range(60):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"a{i}", embedding=_vec(2, w=0.01), scope="global",
+            ))
+        for i in range(5):
+            await store.insert_memory(NewMemory(
+                org_id="org_b", content=f"b{i}", embedding=_vec(3, w=0.3), scope="global",
+            ))
+        got = await store.recall_by_embedding(
+            RecallParams(org_id="org_b", query_vec=_vec(2), limit=5, min_score=0.0)
+        )
+        assert sorted(m.content for m in got) == [f"b{i}" for i in range(5)]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_selective_filter_grows_k(tmp_path: Path):
+    from lore.persistence.types import NewMemory, RecallParams
+
+    store = await _open(tmp_path)
+    try:
+        for i in range(100):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"noise{i}", embedding=_vec(2, w=0.01), project="p1",
+            ))
+        for i in range(3):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"hit{i}", embedding=_vec(3, w=0.5), project="p2",
+            ))
+        got = await store.recall_by_embedding(
+            RecallParams(org_id="org_a", query_vec=_vec(2), limit=3, min_score=0.0, project="p2")
+        )
+        assert sorted(m.content for m in got) == ["hit0", "hit1", "hit2"]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_exact_fallback_at_k_ceiling(tmp_path: Path, monkeypatch):
+    import lore.persistence.sqlite as sqlite_mod
+    from lore.persistence.types import NewMemory, RecallParams
+
+    monkeypatch.setattr(sqlite_mod, "_VEC0_MAX_K", 16)
+    store = await _open(tmp_path)
+    try:
+        for i in range(50):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"noise{i}", embedding=_vec(2, w=0.01), project="p1",
+            ))
+        for i in range(4):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"hit{i}", embedding=_vec(3, w=0.2 * (i + 1)), project="p2",
+            ))
+        got = await store.recall_by_embedding(
+            RecallParams(org_id="org_a", query_vec=_vec(2), limit=2, min_score=0.0, project="p2")
+        )
+        # Best-scored first: the smallest off-axis weight is closest to the query.
+        assert [m.content for m in got] == ["hit0", "hit1"]
+        assert got[0].score >= got[1].score
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_legacy_unpartitioned_table_is_rebuilt(tmp_path: Path):
+    from lore.persistence.sqlite import EMBED_DIM, SqliteStore
+    from lore.persistence.types import NewMemory, RecallParams
+
+    store = await _open(tmp_path, "legacy.db")
+    try:
+        mem = await store.insert_memory(NewMemory(
+            org_id="org_a", content="kept", embedding=_vec(2), scope="global",
+        ))
+        conn = store._conn
+        async with conn.execute("SELECT vec_to_json(embedding) AS e FROM memory_vectors") as cur:
+            emb = (await cur.fetchone())["e"]
+        # Recreate the pre-partition schema holding the same vector.
+        await conn.execute("DROP TABLE memory_vectors")
+        await conn.execute(
+            "CREATE VIRTUAL TABLE memory_vectors USING vec0("
+            f"memory_rowid INTEGER PRIMARY KEY, embedding FLOAT[{EMBED_DIM}] distance_metric=cosine)"
+        )
+        await conn.execute(
+            "INSERT INTO memory_vectors(memory_rowid, embedding) "
+            "SELECT rowid, ? FROM memories WHERE id = ?",
+            (emb, mem.id),
+        )
+        await conn.commit()
+    finally:
+        await store.close()
+
+    store = await SqliteStore.open(f"sqlite:///{tmp_path / 'legacy.db'}")
+    try:
+        async with store._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'memory_vectors'"
+        ) as cur:
+            assert "partition key" in (await cur.fetchone())["sql"]
+        got = await store.recall_by_embedding(
+            RecallParams(org_id="org_a", query_vec=_vec(2), limit=5, min_score=0.0)
+        )
+        assert [m.id for m in got] == [mem.id]
+    finally:
+        await store.close()
@@ -0,0 +1,214 @@
+"""Opt-in quantized candidate search with exact float re-ranking.
+
+``LORE_VECTOR_QUANTIZATION=int8|halfvec|binary`` makes ``recall_by_embedding`` draw
+its KNN candidates from a quantized copy of the embeddings and re-rank them by
+the exact cosine distance — but only once ``backfill_quantized_vectors``
+(``lore quantize-vectors``) has recorded the mode as complete.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from lore.persistence.exceptions import ConfigError
+from lore.persistence.quantization import (
+    normalize_mode,
+    quantize_binary,
+    quantize_int8,
+    require_backend_mode,
+)
+
+
+def test_normalize_mode():
+    assert normalize_mode(None) is None
+    assert normalize_mode("off") is None
+    assert normalize_mode(" INT8 ") == "int8"
+    assert normalize_mode("halfvec") == "halfvec"
+    with pytest.raises(ValueError):
+        normalize_mode("int4")
+
+
+def test_require_backend_mode_rejects_unsupported():
+    assert require_backend_mode(None, ("binary",), "PostgresStore") is None
+    assert require_backend_mode("binary", ("halfvec", "binary"), "PostgresStore") == "binary"
+    with pytest.raises(ConfigError, match="PostgresStore does not support .*'int8'"):
+        require_backend_mode("int8", ("halfvec", "binary"), "PostgresStore")
+
+
+def test_quantize_int8_uses_full_range():
+    out = np.frombuffer(quantize_int8([0.5, -0.25, 0.0, 0.1]), dtype=np.int8)
+    assert out.tolist() == [127, -64, 0, 25]
+    assert quantize_int8([0.0, 0.0]) == b"\x00\x00"
+
+
+def test_quantize_binary_packs_sign_bits():
+    assert quantize_binary([1.0, -1.0, 0.5, 0.0, 0.2, -0.3, 0.1, 0.9]) == bytes([0b10101011])
+
+
+# ── SqliteStore ──────────────────────────────────────────────────────
+
+
+def _unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    from lore.persistence.sqlite import EMBED_DIM
+
+    rng = np.random.default_rng(seed)
+    vecs = rng.standard_normal((n, EMBED_DIM)).astype(np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+async def _open(tmp_path: Path, mode):
+    from lore.persistence.sqlite import SqliteStore
+
+    store = await SqliteStore.open(
+        f"sqlite:///{tmp_path / 'quant.db'}", vector_quantization=mode,
+    )
+    await store._conn.execute("INSERT OR IGNORE INTO orgs (id, name) VALUES ('org_a', 'a')")
+    await store._conn.commit()
+    return store
+
+
+async def _count(store, table: str) -> int:
+    async with store._conn.execute(f"SELECT COUNT(*) FROM {table}") as cur:
+        return (await cur.fetchone())[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["int8", "binary"])
+async def test_sqlite_quantized_recall_matches_float(tmp_path: Path, mode: str):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore.persistence.types import NewMemory, RecallParams
+
+    store = await _open(tmp_path, mode)
+    try:
+        vecs = _unit_vectors(201)
+        for i, v in enumerate(vecs[:200]):
+            await store.insert_memory(NewMemory(
+                org_id="org_a", content=f"m{i}", embedding=v.tolist(), scope="global",
+            ))
+        params = RecallParams(
+            org_id="org_a", query_vec=vecs[200].tolist(), limit=5, min_score=-1.0,
+        )
+        baseline = [(m.id, round(m.score, 5)) for m in await store.recall_by_embedding(params)]
+        # Quantized rows are maintained on write, but not searched before the
+        # backfill records the mode as complete.
+        assert await _count(store, "memory_vectors_q") == 200
+        assert not await store._quant_search_ready(store._conn)
+
+        assert await store.backfill_quantized_vectors() == 0
+        assert await store._quant_search_ready(store._conn)
+        quantized = [(m.id, round(m.score, 5)) for m in await store.recall_by_embedding(params)]
+        # Exact re-ranking: same top hits with the same (float) scores.
+        assert quantized == baseline
+
+        victim = baseline[0][0]
+        assert await store.delete_memory("org_a", victim)
+        assert await _count(store, "memory_vectors_q") == 199
+        assert victim not in {m.id for m in await store.recall_by_embedding(params)}
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backfill_existing_store_and_switch_mode(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore.persistence.sqlite import SqliteStore
+    from lore.persistence.types import NewMemory
+
+    store = await _open(tmp_path, None)
+    try:
+        for i, v in enumerate(_unit_vectors(30)):
+            await store.insert_memory(NewMemory(org_id="org_a", content=f"m{i}", embedding=v.tolist()))
+        assert await store.backfill_quantized_vectors("int8", batch_size=7) == 30
+        assert await store.backfill_quantized_vectors("int8") == 0
+    finally:
+        await store.close()
+
+    store = await SqliteStore.open(
+        f"sqlite:///{tmp_path / 'quant.db'}", vector_quantization="binary",
+    )
+    try:
+        # A table built for another mode is dropped along with its readiness row.
+        assert await _count(store, "memory_vectors_q") == 0
+        assert not await store._quant_search_ready(store._conn)
+        assert await store.backfill_quantized_vectors() == 30
+        async with store._conn.execute("SELECT mode, vectors FROM vector_quantization") as cur:
+            assert [tuple(r) for r in await cur.fetchall()] == [("binary", 30)]
+    finally:
+        await store.close()
+
+
+def test_sqlite_rejects_halfvec(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore.persistence.sqlite import SqliteStore
+
+    with pytest.raises(ConfigError, match="int8"):
+        SqliteStore(db_path=str(tmp_path / "q.db"), vector_quantization="halfvec")
+
+
+# ── PostgresStore ────────────────────────────────────────────────────
+
+
+class _FakeConn:
+    """Records SQL; ``vector_quantization`` reports the mode as built."""
+
+    def __init__(self):
+        self.fetched: list[str] = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, sql, *args):
+        pass
+
+    async def fetchval(self, sql, *args):
+        return 1
+
+    async def fetch(self, sql, *args):
+        self.fetched.append(" ".join(sql.split()))
+        return []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode, order",
+    [
+        ("binary", "binary_quantize(embedding)::bit(384) <~> binary_quantize($2::vector)"),
+        ("halfvec", "embedding::halfvec(384) <=> $2::vector::halfvec(384)"),
+    ],
+)
+async def test_postgres_quantized_recall_reranks_exactly(mode: str, order: str):
+    pytest.importorskip("asyncpg")
+    from lore.persistence.postgres import PostgresStore
+    from lore.persistence.types import RecallParams
+
+    conn = _FakeConn()
+    store = PostgresStore(conn=conn, vector_quantization=mode)
+    await store.recall_by_embedding(
+        RecallParams(org_id="org_a", query_vec=[0.1] * 384, limit=5)
+    )
+    quantized, exact = conn.fetched  # no rows → exact fallback scan
+    # The quantized index picks the candidates; the exact distance ranks them.
+    assert f"ORDER BY {order} LIMIT $4" in quantized
+    assert quantized.index("embedding <=> $2::vector AS distance") < quantized.index(order)
+    assert "<~>" not in exact and "halfvec" not in exact
+
+
+@pytest.mark.parametrize("mode", ["int8", " INT8 "])
+def test_postgres_rejects_int8(mode: str, monkeypatch):
+    pytest.importorskip("asyncpg")
+    from lore.persistence.postgres import PostgresStore
+
+    # pgvector has no int8 type; the store must not quietly serve fp16.
+    with pytest.raises(ConfigError, match="halfvec"):
+        PostgresStore(conn=_FakeConn(), vector_quantization=mode)
+    monkeypatch.setenv("LORE_VECTOR_QUANTIZATION", mode)
+    with pytest.raises(ConfigError):
+        PostgresStore(conn=_FakeConn())
@@ -0,0 +1,57 @@
+"""Binary float32 vector transport for the SQLite and Postgres stores."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def test_pgvector_binary_codec_round_trip():
+    pytest.importorskip("asyncpg")
+    from lore.persistence.postgres import _decode_vector, _encode_vector
+
+    vec = np.linspace(-1.0, 1.0, 384, dtype=np.float32)
+    data = _encode_vector(vec)
+    # int16 dim + int16 unused + 384 big-endian float4.
+    assert len(data) == 4 + 384 * 4
+    assert data[:4] == b"\x01\x80\x00\x00"
+    out = _decode_vector(data)
+    assert out.dtype == np.float32
+    assert np.array_equal(out, vec)
+    # The text literal is still accepted on the way in.
+    assert _encode_vector("[0.5, -2.0]") == _encode_vector([0.5, -2.0])
+
+
+def test_pgvector_rows_normalise_to_float_lists():
+    pytest.importorskip("asyncpg")
+    from lore.persistence.postgres import _embedding_from_row
+
+    assert _embedding_from_row(np.array([0.5, 1.0], dtype=np.float32)) == [0.5, 1.0]
+    assert _embedding_from_row("[0.5,1]") == [0.5, 1.0]
+    assert _embedding_from_row("[]") is None
+    assert _embedding_from_row(None) is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_stores_and_returns_float32_blobs(tmp_path: Path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore.persistence.sqlite import EMBED_DIM, SqliteStore
+    from lore.persistence.types import MemoryFilter, NewMemory
+
+    store = await SqliteStore.open(f"sqlite:///{tmp_path / 'blob.db'}")
+    try:
+        await store._conn.execute("INSERT INTO orgs (id, name) VALUES ('org_a', 'a')")
+        await store._conn.commit()
+        vec = [((i % 7) - 3) / 8 for i in range(EMBED_DIM)]  # exactly representable
+        await store.insert_memory(NewMemory(org_id="org_a", content="x", embedding=vec))
+        async with store._conn.execute("SELECT embedding FROM memory_vectors") as cur:
+            raw = (await cur.fetchone())["embedding"]
+        assert raw == np.asarray(vec, dtype="<f4").tobytes()
+        (row,) = await store.list_memories_with_embeddings(MemoryFilter(org_id="org_a"))
+        assert isinstance(row.embedding, list)
+        assert row.embedding == vec
+    finally:
+        await store.close()
@@ -0,0 +1,124 @@
+"""Tests for write-behind access tracking on /v1/retrieve."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from lore.persistence.types import NewRetrievalEvent
+from lore.server.access_tracking import AccessTracker
+
+
+def _event(org_id: str = "org_a") -> NewRetrievalEvent:
+    return NewRetrievalEvent(
+        org_id=org_id, query="q", results_count=1, scores=[0.9], memory_ids=["m1"],
+        avg_score=0.9, max_score=0.9, min_score_threshold=0.3, query_time_ms=1.0,
+    )
+
+
+class _RecordingStore:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches = []
+        self.fail = fail
+
+    async def record_access_batch(self, bumps, events):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append((bumps, list(events)))
+
+
+class TestAccessTracker:
+    @pytest.mark.asyncio
+    async def test_retrievals_coalesce_into_one_batch(self) -> None:
+        store = _RecordingStore()
+        tracker = AccessTracker(flush_interval=0.05)
+        tracker.record(store, "org_a", ["m1", "m2"], _event())
+        tracker.record(store, "org_a", ["m1"], _event())
+        tracker.record(store, "org_b", ["m1"], _event("org_b"))
+        assert store.batches == []
+        assert tracker.pending() == 3
+
+        await asyncio.sleep(0.15)
+        assert len(store.batches) == 1
+        bumps, events = store.batches[0]
+        assert bumps == {("org_a", "m1"): 2, ("org_a", "m2"): 1, ("org_b", "m1"): 1}
+        assert len(events) == 3
+        assert tracker.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_max_pending_flushes_early(self) -> None:
+        store = _RecordingStore()
+        tracker = AccessTracker(flush_interval=60, max_pending=2)
+        tracker.record(store, "org_a", ["m1"], _event())
+        tracker.record(store, "org_a", ["m1"], _event())
+        await asyncio.sleep(0)
+        assert store.batches == [({("org_a", "m1"): 2}, [_event(), _event()])]
+
+    @pytest.mark.asyncio
+    async def test_explicit_flush_and_failures_are_dropped(self) -> None:
+        store = _RecordingStore(fail=True)
+        tracker = AccessTracker(flush_interval=60)
+        tracker.record(store, "org_a", ["m1"], _event())
+        await tracker.flush()  # logged, not raised
+        assert tracker.pending() == 0
+
+        store.fail = False
+        tracker.record(store, "org_a", ["m2"])
+        await tracker.flush()
+        assert store.batches == [({("org_a", "m2"): 1}, [])]
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_in_flight_flushes(self) -> None:
+        release = asyncio.Event()
+
+        class _SlowStore(_RecordingStore):
+            async def record_access_batch(self, bumps, events):
+                await release.wait()
+                await super().record_access_batch(bumps, events)
+
+        store = _SlowStore()
+        tracker = AccessTracker(flush_interval=60, max_pending=1)
+        tracker.record(store, "org_a", ["m1"])  # spawns a flush that blocks
+        await asyncio.sleep(0)
+        tracker.record(store, "org_a", ["m2"])
+        drained = asyncio.create_task(tracker.drain())
+        await asyncio.sleep(0)
+        assert not drained.done()
+
+        release.set()
+        await drained
+        assert [bumps for bumps, _ in store.batches] == [
+            {("org_a", "m1"): 1}, {("org_a", "m2"): 1},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_access_bumps_leave_the_fts_index_alone(tmp_path: Path) -> None:
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore.persistence.sqlite import SqliteStore
+    from lore.persistence.types import MemoryPatch, NewMemory
+
+    store = await SqliteStore.open(f"sqlite:///{tmp_path / 'lore.db'}")
+    try:
+        async with store._acquire() as conn:
+            async with conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'memories_fts_au'"
+            ) as cur:
+                trigger_sql = (await cur.fetchone())["sql"]
+        assert "UPDATE OF content, context" in trigger_sql
+
+        m = await store.insert_memory(
+            NewMemory(org_id="solo", content="rotate the signing keys", embedding=[0.1] * 384)
+        )
+        await store.record_access_batch({("solo", m.id): 2}, [])
+        assert [hit.id for hit, _ in await store.recall_by_text("solo", "signing", limit=5, scope_mode="all")] == [m.id]
+
+        # Content edits still re-index.
+        await store.update_memory("solo", m.id, MemoryPatch(content="rotate the deploy tokens"))
+        assert await store.recall_by_text("solo", "signing", limit=5, scope_mode="all") == []
+        assert [hit.id for hit, _ in await store.recall_by_text("solo", "tokens", limit=5, scope_mode="all")] == [m.id]
+    finally:
+        await store.close()
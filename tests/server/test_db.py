@@ -18,3 +18,67 @@ async def test_get_pool_raises_when_not_initialized():
             await get_pool()
     finally:
         db_module._pool = old_pool
+
+
+class _FakePool:
+    """Just enough of asyncpg.Pool for InstrumentedPool."""
+
+    def __init__(self, size: int = 1):
+        import asyncio
+
+        self._free = asyncio.Queue()
+        for i in range(size):
+            self._free.put_nowait(f"conn-{i}")
+        self.timeouts = []
+
+    async def acquire(self, *, timeout=None):
+        import asyncio
+
+        self.timeouts.append(timeout)
+        return await asyncio.wait_for(self._free.get(), timeout)
+
+    async def release(self, conn):
+        self._free.put_nowait(conn)
+
+    def get_max_size(self):
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_counts_waiters_and_latency():
+    import asyncio
+
+    from lore.server.db import InstrumentedPool
+    from lore.server.metrics import db_pool_acquire_latency
+
+    pool = InstrumentedPool(_FakePool(size=1))
+    before = len(db_pool_acquire_latency._observations[()])
+
+    async with pool.acquire() as conn:
+        assert conn == "conn-0"
+        waiter = asyncio.create_task(pool.acquire().__aenter__())
+        await asyncio.sleep(0.01)
+        assert pool.waiting == 1
+    assert await waiter == "conn-0"
+    assert pool.waiting == 0
+    assert len(db_pool_acquire_latency._observations[()]) == before + 2
+    # Unknown attributes fall through to the wrapped pool.
+    assert pool.get_max_size() == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_applies_acquire_timeout():
+    import asyncio
+
+    from lore.server.db import InstrumentedPool
+    from lore.server.metrics import db_pool_acquire_timeouts_total
+
+    fake = _FakePool(size=0)
+    pool = InstrumentedPool(fake, acquire_timeout=0.01)
+    before = db_pool_acquire_timeouts_total._values[()]
+    with pytest.raises(asyncio.TimeoutError):
+        async with pool.acquire():
+            pass
+    assert fake.timeouts == [0.01]
+    assert db_pool_acquire_timeouts_total._values[()] == before + 1
+    assert pool.waiting == 0
@@ -233,6 +233,37 @@ def test_post_search_returns_results(client, monkeypatch):
     assert item["resolution"] == result["context"]
 
 
+def test_post_search_records_access_when_asked(client, monkeypatch):
+    """record_access=true buffers one access bump for every returned lesson."""
+    from lore.server.access_tracking import AccessTracker, set_access_tracker
+
+    test_client, lessons_service, mock_auth = client
+    monkeypatch.setattr(
+        lessons_service,
+        "search",
+        AsyncMock(return_value=[
+            _make_search_result_dict(memory_id="mem-a", score=0.9),
+            _make_search_result_dict(memory_id="mem-b", score=0.8),
+        ]),
+    )
+    tracker = AccessTracker(flush_interval=60)
+    set_access_tracker(tracker)
+    try:
+        plain = test_client.post("/v1/lessons/search", json={"embedding": [0.1] * 384})
+        assert plain.json()["access_recorded"] is False
+        assert tracker.pending() == 0
+
+        resp = test_client.post(
+            "/v1/lessons/search",
+            json={"embedding": [0.1] * 384, "record_access": True},
+        )
+        assert resp.json()["access_recorded"] is True
+        (pending,) = tracker._pending.values()
+        assert dict(pending.bumps) == {(mock_auth.org_id, "mem-a"): 1, (mock_auth.org_id, "mem-b"): 1}
+    finally:
+        set_access_tracker(None)
+
+
 # ── access ────────────────────────────────────────────────────────────────────
 
 
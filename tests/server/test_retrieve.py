@@ -407,3 +407,134 @@ async def test_retrieve_xml_format_structure(client):
     # Phase 6C: hybrid score replaces raw cosine — assert format/structure only.
     assert "score=" in formatted
     assert "</memories>" in formatted
+
+
+@pytest.mark.asyncio
+async def test_retrieve_cache_hit_until_write(client):
+    """Repeated retrieves are served from cache until the org is written to."""
+    from lore.persistence.types import NewMemory
+    from lore.server import retrieve_cache
+    from lore.server.retrieve_cache import InvalidatingStore, MemoryRetrieveCache
+
+    cache = MemoryRetrieveCache()
+    saved = (retrieve_cache._backend, retrieve_cache._configured)
+    retrieve_cache.set_retrieve_cache(cache)
+    inner = _make_fake_store([_scored_memory("mem-001", "User prefers dark mode", 0.85)])
+    inner.insert_memory = AsyncMock(return_value=None)
+    store = InvalidatingStore(inner, cache)
+    auth_store = _make_auth_store()
+
+    async def _fake_get_store():
+        return store
+
+    async def _get():
+        resp = await client.get(
+            "/v1/retrieve",
+            params={"query": "preferences", "min_score": 0.0, "include_session_context": False},
+            headers=HEADERS,
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    try:
+        with patch("lore.server.routes.retrieve.get_store", _fake_get_store), \
+             patch("lore.server.auth.get_store", return_value=auth_store):
+            first = await _get()
+            second = await _get()
+            assert inner.recall_by_embedding.await_count == 1
+            assert second["memories"] == first["memories"]
+
+            await store.insert_memory(NewMemory(org_id=ORG_ID, content="new", embedding=None))
+            await _get()
+            assert inner.recall_by_embedding.await_count == 2
+    finally:
+        retrieve_cache._backend, retrieve_cache._configured = saved
+
+
+@pytest.mark.asyncio
+async def test_retrieve_debug_exposes_stage_timings(client):
+    """debug=true adds per-stage timings; without it the field stays null."""
+    fake_store = _make_fake_store([_scored_memory("mem-001", "User prefers dark mode", 0.85)])
+    auth_store = _make_auth_store()
+
+    async def _fake_get_store():
+        return fake_store
+
+    with patch("lore.server.routes.retrieve.get_store", _fake_get_store), \
+         patch("lore.server.auth.get_store", return_value=auth_store):
+        plain = await client.get(
+            "/v1/retrieve", params={"query": "preferences", "min_score": 0.0}, headers=HEADERS,
+        )
+        debug = await client.get(
+            "/v1/retrieve",
+            params={"query": "preferences", "min_score": 0.0, "debug": True},
+            headers=HEADERS,
+        )
+
+    assert plain.json()["debug"] is None
+    payload = debug.json()["debug"]
+    assert set(payload["timings_ms"]) == {"vector", "fts", "graph", "fuse", "supersession", "rescore"}
+
+
+@pytest.mark.asyncio
+async def test_retrieve_streams_ndjson(client):
+    """stream=ndjson emits one memory event per result, then a done summary."""
+    import json
+
+    scored = [
+        _scored_memory("mem-001", "User prefers dark mode", 0.85),
+        _scored_memory("mem-002", "User uses VS Code", 0.72),
+    ]
+    fake_store = _make_fake_store(scored)
+    auth_store = _make_auth_store()
+
+    async def _fake_get_store():
+        return fake_store
+
+    params = {"query": "preferences", "min_score": 0.0, "include_session_context": False}
+    with patch("lore.server.routes.retrieve.get_store", _fake_get_store), \
+         patch("lore.server.auth.get_store", return_value=auth_store):
+        plain = (await client.get("/v1/retrieve", params=params, headers=HEADERS)).json()
+        resp = await client.get(
+            "/v1/retrieve", params={**params, "stream": "ndjson"}, headers=HEADERS,
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert [e["event"] for e in events] == ["memory", "memory", "done"]
+    assert [e["data"] for e in events[:2]] == plain["memories"]
+    done = events[-1]["data"]
+    assert done["count"] == 2
+    assert done["formatted"] == plain["formatted"]
+    assert set(done) == set(plain) - {"memories"}
+    # The fast-path body is exactly what the declared response model emits.
+    from lore.server.routes.retrieve import RetrieveResponse
+    assert RetrieveResponse.model_validate(plain).model_dump(mode="json") == plain
+
+
+@pytest.mark.asyncio
+async def test_retrieve_streams_sse_from_accept_header(client):
+    """Accept: text/event-stream selects SSE framing."""
+    fake_store = _make_fake_store([_scored_memory("mem-001", "User prefers dark mode", 0.85)])
+    auth_store = _make_auth_store()
+
+    async def _fake_get_store():
+        return fake_store
+
+    with patch("lore.server.routes.retrieve.get_store", _fake_get_store), \
+         patch("lore.server.auth.get_store", return_value=auth_store):
+        resp = await client.get(
+            "/v1/retrieve",
+            params={"query": "preferences", "min_score": 0.0, "include_session_context": False},
+            headers={**HEADERS, "Accept": "text/event-stream"},
+        )
+        bad = await client.get(
+            "/v1/retrieve", params={"query": "preferences", "stream": "xml"}, headers=HEADERS,
+        )
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in resp.text.split("\n\n") if b]
+    assert [b.splitlines()[0] for b in blocks] == ["event: memory", "event: done"]
+    assert blocks[0].splitlines()[1].startswith('data: {"id":"mem-001"')
+    assert bad.status_code == 422
@@ -0,0 +1,99 @@
+"""Tests for the write-invalidated /v1/retrieve result cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from lore.persistence.types import NewMemory
+from lore.server.retrieve_cache import InvalidatingStore, MemoryRetrieveCache, make_key
+
+
+def _key(cache: MemoryRetrieveCache, org_id: str, query: str = "q") -> str:
+    return make_key(org_id, cache.generation(org_id), query=query)
+
+
+class TestMemoryRetrieveCache:
+    def test_bump_invalidates_only_that_org(self) -> None:
+        cache = MemoryRetrieveCache()
+        cache.put(_key(cache, "org_a"), {"count": 1})
+        cache.put(_key(cache, "org_b"), {"count": 2})
+        cache.bump("org_a")
+        assert cache.get(_key(cache, "org_a")) is None
+        assert cache.get(_key(cache, "org_b")) == {"count": 2}
+
+    def test_global_bump_invalidates_every_org(self) -> None:
+        cache = MemoryRetrieveCache()
+        cache.put(_key(cache, "org_a"), {"count": 1})
+        cache.bump(None)
+        assert cache.get(_key(cache, "org_a")) is None
+
+    def test_ttl_and_lru_bounds(self) -> None:
+        cache = MemoryRetrieveCache(maxsize=2, ttl_seconds=0)
+        cache.put(_key(cache, "org_a"), {"count": 1})
+        assert cache.get(_key(cache, "org_a")) is None
+
+        cache = MemoryRetrieveCache(maxsize=2)
+        for q in ("a", "b", "c"):
+            cache.put(_key(cache, "org_a", q), {"q": q})
+        assert cache.get(_key(cache, "org_a", "a")) is None
+        assert cache.get(_key(cache, "org_a", "c")) == {"q": "c"}
+
+
+class _FakeStore:
+    """Real signatures, so the proxy can find the written org."""
+
+    async def insert_memory(self, memory):
+        return "stored"
+
+    async def insert_memories(self, memories):
+        return ["stored"] * len(memories)
+
+    async def delete_memory(self, org_id, memory_id, *, requesting_user_id=None):
+        return True
+
+    async def expire_memories(self):
+        return 0
+
+    async def recall_by_embedding(self, params):
+        return []
+
+    async def bump_access_counts(self, org_id, memory_ids):
+        return None
+
+
+class TestInvalidatingStore:
+    @pytest.mark.asyncio
+    async def test_writes_bump_the_written_org(self) -> None:
+        cache = MemoryRetrieveCache()
+        store = InvalidatingStore(_FakeStore(), cache)
+
+        before = cache.generation("org_a")
+        assert await store.insert_memory(NewMemory(org_id="org_a", content="x", embedding=None)) == "stored"
+        after_insert = cache.generation("org_a")
+        assert after_insert != before
+        await store.delete_memory("org_a", "mem_1")
+        assert cache.generation("org_a") != after_insert
+        assert cache.generation("org_b") == "0.0"
+
+        await store.expire_memories()
+        assert cache.generation("org_b") == "1.0"
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_bumps_its_org(self) -> None:
+        cache = MemoryRetrieveCache()
+        store = InvalidatingStore(_FakeStore(), cache)
+
+        await store.insert_memories([
+            NewMemory(org_id="org_a", content=c, embedding=None) for c in ("x", "y")
+        ])
+        assert cache.generation("org_a") == "0.1"
+        assert cache.generation("org_b") == "0.0"
+
+    @pytest.mark.asyncio
+    async def test_reads_and_access_tracking_do_not_bump(self) -> None:
+        cache = MemoryRetrieveCache()
+        store = InvalidatingStore(_FakeStore(), cache)
+
+        await store.recall_by_embedding(object())
+        await store.bump_access_counts("org_a", ["mem_1"])
+        assert cache.generation("org_a") == "0.0"
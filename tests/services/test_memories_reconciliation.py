@@ -13,7 +13,7 @@ from typing import Sequence
 
 import pytest
 
-from lore.services.memories import create_memory, list_memories
+from lore.services.memories import MemoryInput, create_memories, create_memory, list_memories
 from lore.services.reconciliation import get_reconcile_config
 
 DIM = 384
@@ -141,3 +141,184 @@ async def test_reconciliation_disabled_appends(store):
     b = await create_memory(store, org_id="solo", project="proj", user_id="alice",
                             meta={"type": "note"}, content="same content", embedding=E0, tags=())
     assert b.id != a.id and await _count(store) == 2, "disabled reconciliation must append"
+
+
+# ── Bulk writes (create_memories) ───────────────────────────────────
+
+
+def _item(content, embedding, tags=(), mem_type="note"):
+    return MemoryInput(content=content, embedding=embedding, tags=tags, project="proj",
+                       meta={"type": mem_type})
+
+
+@pytest.mark.asyncio
+async def test_bulk_reconciles_within_the_batch(store, recon_on):
+    results = await create_memories(store, org_id="solo", user_id="alice", items=[
+        _item("v1 of the thing", E0, ("a",)),
+        _item("v1 of the thing", E0, ("a", "b")),    # near-exact + new tag → Update item 0
+        _item("v1 of the thing", E0, ("a",)),        # redundant → None
+        _item("v2 of the thing, revised", NEAR),     # supersede band → Delete item 0
+        _item("unrelated", FAR),
+    ])
+    assert [r.action for r in results] == ["add", "update", "none", "delete", "add"]
+    first = results[0].memory
+    assert results[1].memory.id == results[2].memory.id == first.id
+    assert set(first.tags) == {"a", "b"}, "tags folded in before the insert"
+    assert await _count(store) == 3
+    assert await store.is_superseded(first.id, "solo")
+    assert not await store.is_superseded(results[3].memory.id, "solo")
+
+
+@pytest.mark.asyncio
+async def test_bulk_reconciles_against_the_store(store, recon_on):
+    old = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                              meta={"type": "note"}, content="stored", embedding=E0, tags=("a",))
+    results = await create_memories(store, org_id="solo", user_id="alice", items=[
+        _item("stored", E0, ("b",)),
+        _item("stored", E0, ("c",)),
+        _item("typed differently", E0, mem_type="fact"),
+    ])
+    assert [r.action for r in results] == ["update", "update", "add"]
+    assert results[0].memory.id == results[1].memory.id == old.id
+    assert set(results[1].memory.tags) == {"a", "b", "c"}
+    assert await _count(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_applies_the_single_write_scope_rule(store, recon_on):
+    # project=None sees only global rows, so two project-scoped duplicates
+    # without a project both land — exactly as when created one by one.
+    unscoped = MemoryInput(content="no project", embedding=E0, meta={"type": "note"})
+    results = await create_memories(store, org_id="solo", user_id="alice",
+                                    items=[unscoped, unscoped])
+    assert [r.action for r in results] == ["add", "add"]
+
+    # A global item is in scope for any project's write.
+    shared = MemoryInput(content="global rule", embedding=FAR, meta={"type": "note"},
+                         scope="global")
+    results = await create_memories(store, org_id="solo", user_id="alice",
+                                    items=[shared, _item("global rule", FAR)])
+    assert [r.action for r in results] == ["add", "none"]
+    assert results[1].memory.id == results[0].memory.id
+
+
+@pytest.mark.asyncio
+async def test_bulk_without_reconciliation_appends_everything(store):
+    results = await create_memories(store, org_id="solo", user_id="alice",
+                                    items=[_item("same", E0), _item("same", E0)])
+    assert [r.action for r in results] == ["add", "add"]
+    assert results[0].memory.id != results[1].memory.id
+    assert await _count(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_context_shares_one_knn_with_contradiction_check(store, recon_on, monkeypatch):
+    from lore.services.contradiction import _reset_semaphore, detect_and_flag
+    from lore.services.reconciliation import WriteContext
+
+    old = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                              meta={"type": "note"}, content="v1", embedding=E0)
+    calls = []
+    real_recall = store.recall_by_embedding
+
+    async def counting_recall(params):
+        calls.append(params)
+        return await real_recall(params)
+
+    monkeypatch.setattr(store, "recall_by_embedding", counting_recall)
+    _reset_semaphore()
+    ctx = WriteContext("solo", NEAR, user_id="alice")
+    new = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                              meta={"type": "note"}, content="v2", embedding=NEAR,
+                              write_context=ctx)
+    assert new.id != old.id  # supersede band → Delete: fresh row
+    assert await store.are_superseded({old.id}, "solo") == {old.id}
+
+    conflicts = await detect_and_flag(
+        store, org_id="solo", memory_id=new.id, content=new.content, embedding=NEAR,
+        owner_user_id="alice", scorer=lambda a, b: (True, 0.9, "changed"), context=ctx,
+    )
+    _reset_semaphore()
+    assert conflicts == [old.id]
+    assert len(calls) == 1, "reconciliation and contradiction share the write's k-NN"
+
+
+@pytest.mark.asyncio
+async def test_write_context_falls_back_when_other_projects_fill_the_shared_knn(store, recon_on):
+    from lore.services.reconciliation import _SHARED_NEIGHBOUR_LIMIT, WriteContext
+
+    target = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                                 meta={"type": "note"}, content="v1", embedding=NEAR)
+    # Closer to the incoming vector than the in-scope target, but in other projects.
+    for i in range(_SHARED_NEIGHBOUR_LIMIT):
+        await create_memory(store, org_id="solo", project=f"other-{i}", user_id="alice",
+                            meta={"type": "note"}, content=f"elsewhere {i}", embedding=E0)
+
+    ctx = WriteContext("solo", E0, user_id="alice")
+    new = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                              meta={"type": "note"}, content="v2", embedding=E0,
+                              write_context=ctx)
+    assert new.id != target.id
+    assert await store.are_superseded({target.id}, "solo") == {target.id}
+
+
+@pytest.mark.asyncio
+async def test_bulk_bounds_concurrent_candidate_searches(store, recon_on, monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("LORE_RECON_BULK_CONCURRENCY", "2")
+    get_reconcile_config.cache_clear()
+    in_flight = peak = 0
+    real_recall = store.recall_by_embedding
+
+    async def tracking_recall(params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await real_recall(params)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(store, "recall_by_embedding", tracking_recall)
+    items = [_item(f"item {i}", _unit((i, 1.0))) for i in range(10)]
+    results = await create_memories(store, org_id="solo", user_id="alice", items=items)
+    assert [r.action for r in results] == ["add"] * 10
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_vanished_target_falls_back_to_one_insert(store, recon_on, monkeypatch):
+    await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                        meta={"type": "note"}, content="same", embedding=E0, tags=("a",))
+
+    async def gone(*args, **kwargs):
+        return None
+
+    # Deleted between reconciliation and the write.
+    monkeypatch.setattr(store, "get_memory", gone)
+    results = await create_memories(store, org_id="solo", user_id="alice", items=[
+        _item("same", E0, ("a", "b")), _item("same", E0, ("a", "c")), _item("same", E0, ("a",)),
+    ])
+    assert [r.action for r in results] == ["add", "update", "none"]
+    assert len({r.memory.id for r in results}) == 1
+    assert set(results[0].memory.tags) == {"a", "b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_target_deleted_before_merge_inserts_instead(store, recon_on, monkeypatch):
+    old = await create_memory(store, org_id="solo", project="proj", user_id="alice",
+                              meta={"type": "note"}, content="same", embedding=E0, tags=("a",))
+
+    async def gone(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(store, "update_memory", gone)
+    results = await create_memories(store, org_id="solo", user_id="alice", items=[
+        _item("same", E0, ("a", "b")), _item("same", E0, ("a", "c")),
+    ])
+    assert [r.action for r in results] == ["add", "update"]
+    assert results[0].memory.id == results[1].memory.id != old.id
+    assert set(results[0].memory.tags) == {"a", "b", "c"}
+    assert await _count(store) == 2
@@ -334,8 +334,8 @@ class _FakeStore:
     async def recall_by_entities(self, *args, **kwargs):
         return []
 
-    async def get_entity_by_name(self, *args, **kwargs):
-        return None
+    async def get_entities_by_names(self, *args, **kwargs):
+        return []
 
     async def are_superseded(self, ids, *, at=None):
         return self._superseded & set(ids)
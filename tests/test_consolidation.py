@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List
 
 import numpy as np
+import pytest
 
 from lore.consolidation import ConsolidationEngine
 from lore.store.memory import MemoryStore
@@ -296,20 +297,19 @@ class TestCandidateIdentification:
         assert len(candidates) == 1
         assert candidates[0].id == "m1"
 
-    def test_batch_size_processing(self):
-        """Candidates are processed in batches of batch_size."""
+    def test_duplicates_found_across_batches(self):
+        """Dedup spans every candidate, not just pairs inside one batch."""
         store = MemoryStore()
         vec = [0.5] * 384
         # Create 5 duplicate memories
         for i in range(5):
             store.save(_make_memory(f"m{i}", embedding=_embed(vec), created_at=_old_iso(700000)))
 
-        # batch_size=2 means batches of [m0,m1], [m2,m3], [m4]
-        # Duplicates within a batch will be found, but cross-batch won't
+        # batch_size=2 used to split these into [m0,m1], [m2,m3], [m4]
         engine = _make_engine(store, config={"batch_size": 2})
         result = asyncio.run(engine.consolidate(dry_run=True))
-        # With batch_size=2 we get groups from pairs within each batch
-        assert result.groups_found >= 2  # At least 2 pairs from batches
+        assert result.groups_found == 1
+        assert result.groups[0]["memory_count"] == 5
 
 
 # ---------------------------------------------------------------------------
@@ -795,6 +795,174 @@ class TestFullPipeline:
         assert lore._consolidation_engine._config["dedup_threshold"] == 0.90
 
 
+# ---------------------------------------------------------------------------
+# S11: Incremental Runs and Scheduling
+# ---------------------------------------------------------------------------
+
+class TestIncrementalConsolidation:
+    def test_second_run_skips_settled_candidates(self):
+        store = MemoryStore()
+        vec = [0.5] * 384
+        store.save(_make_memory("m1", embedding=_embed(vec), created_at=_old_iso(700000)))
+        store.save(_make_memory("m2", embedding=_embed(vec), created_at=_old_iso(700000)))
+
+        engine = _make_engine(store)
+        # Pretend a run finished just now without merging them.
+        engine._watermarks[(None, None, "all")] = datetime.now(timezone.utc)
+
+        assert asyncio.run(engine.consolidate(dry_run=True)).groups_found == 0
+        assert asyncio.run(engine.consolidate(dry_run=True, full=True)).groups_found == 1
+
+    def test_newly_eligible_memory_groups_with_settled_one(self):
+        store = MemoryStore()
+        vec = [0.5] * 384
+        store.save(_make_memory("old", embedding=_embed(vec), created_at=_old_iso(900000)))
+        # Crossed the 7-day short-tier age after the last run (two days ago).
+        store.save(_make_memory("new", embedding=_embed(vec), created_at=_old_iso(604800 + 3600)))
+        other = [1.0] + [0.0] * 383
+        store.save(_make_memory("o1", embedding=_embed(other), created_at=_old_iso(900000)))
+        store.save(_make_memory("o2", embedding=_embed(other), created_at=_old_iso(900000)))
+
+        engine = _make_engine(store)
+        engine._watermarks[(None, None, "all")] = datetime.now(timezone.utc) - timedelta(days=2)
+        result = asyncio.run(engine.consolidate(dry_run=True))
+        assert result.groups_found == 1
+        assert set(result.groups[0]["memory_ids"]) == {"old", "new"}
+
+    def test_incremental_run_reads_recent_memories_and_uses_the_index(self):
+        from lore.store.vector_index import VectorIndex
+
+        store = MemoryStore()
+        vec = [0.5] * 384
+        other = [1.0] + [0.0] * 383
+        memories = [
+            _make_memory("old", embedding=_embed(vec), created_at=_old_iso(900000)),
+            _make_memory("new", embedding=_embed(vec), created_at=_old_iso(604800 + 3600)),
+            _make_memory("o1", embedding=_embed(other), created_at=_old_iso(900000)),
+            _make_memory("o2", embedding=_embed(other), created_at=_old_iso(900000)),
+        ]
+        index = VectorIndex(384)
+        for m in memories:
+            store.save(m)
+            index.upsert(m.id, m.embedding, m)
+
+        list_calls = []
+        original_list = store.list
+
+        def spy_list(**kwargs):
+            list_calls.append(kwargs)
+            return original_list(**kwargs)
+
+        store.list = spy_list
+        engine = ConsolidationEngine(
+            store=store, embedder=FakeEmbedder(), vector_index=lambda dim: index,
+        )
+        engine._watermarks[(None, None, "all")] = datetime.now(timezone.utc) - timedelta(days=2)
+        result = asyncio.run(engine.consolidate(dry_run=True))
+
+        assert result.groups_found == 1
+        assert set(result.groups[0]["memory_ids"]) == {"old", "new"}
+        assert list_calls and all(call.get("since") for call in list_calls)
+
+    def test_incremental_entity_group_pulls_in_older_mentions(self):
+        store = MemoryStore()
+        ids = ["a", "b", "fresh"]
+        for mid in ids:
+            age = 604800 + 3600 if mid == "fresh" else 900000
+            store.save(_make_memory(mid, embedding=None, created_at=_old_iso(age)))
+            store.save_entity_mention(EntityMention(
+                id=f"em-{mid}", entity_id="e1", memory_id=mid,
+                mention_type="explicit", confidence=1.0, created_at=_now_iso(),
+            ))
+
+        engine = _make_engine(store, llm=FakeLLM())
+        engine._watermarks[(None, None, "all")] = datetime.now(timezone.utc) - timedelta(days=2)
+        result = asyncio.run(engine.consolidate(dry_run=True))
+        assert result.groups_found == 1
+        assert set(result.groups[0]["memory_ids"]) == set(ids)
+
+    def test_watermark_moves_only_after_clean_real_run(self):
+        store = MemoryStore()
+        vec = [0.5] * 384
+        store.save(_make_memory("m1", embedding=_embed(vec), created_at=_old_iso(700000)))
+        store.save(_make_memory("m2", embedding=_embed(vec), created_at=_old_iso(700000)))
+        engine = _make_engine(store)
+
+        asyncio.run(engine.consolidate(dry_run=True))
+        assert engine._watermarks == {}
+
+        async def failing_process(group, strategy, result):
+            raise RuntimeError("Simulated failure")
+
+        engine._process_group = failing_process
+        asyncio.run(engine.consolidate(dry_run=False))
+        assert engine._watermarks == {}
+
+        del engine._process_group
+        asyncio.run(engine.consolidate(dry_run=False))
+        assert (None, None, "all") in engine._watermarks
+
+
+class TestConsolidationScheduler:
+    def test_fixed_interval_by_default(self):
+        from lore.consolidation import ConsolidationScheduler
+
+        store = MemoryStore()
+        store.save(_make_memory("m1", created_at=_old_iso(604800 + 60)))
+        scheduler = ConsolidationScheduler(_make_engine(store), interval="hourly")
+        scheduler._since -= timedelta(minutes=2)
+        assert scheduler.pending_eligible == 1
+        assert not scheduler._due()
+
+    def test_runs_once_enough_memories_became_eligible(self):
+        from lore.consolidation import ConsolidationScheduler
+
+        store = MemoryStore()
+        engine = _make_engine(store)
+        scheduler = ConsolidationScheduler(engine, interval="daily", min_eligible=2)
+        # Crossed the 7-day short-tier age a minute ago, i.e. after start.
+        scheduler._since -= timedelta(minutes=2)
+        store.save(_make_memory("m1", created_at=_old_iso(604800 + 60)))
+        assert not scheduler._due()
+        store.save(_make_memory("m2", created_at=_old_iso(604800 + 60)))
+        assert scheduler._due()
+
+        asyncio.run(scheduler._run_once())
+        assert scheduler.pending_eligible == 0
+        assert not scheduler._due()
+
+    def test_fresh_writes_do_not_count(self):
+        from lore.consolidation import ConsolidationScheduler
+
+        store = MemoryStore()
+        scheduler = ConsolidationScheduler(_make_engine(store), min_eligible=1)
+        for i in range(5):
+            store.save(_make_memory(f"m{i}", created_at=_now_iso()))
+        # Eligible long ago, before the scheduler started: not new either.
+        store.save(_make_memory("old", created_at=_old_iso(900000)))
+        assert scheduler.pending_eligible == 0
+        assert not scheduler._due()
+
+    def test_rejects_non_positive_min_eligible(self):
+        from lore.consolidation import ConsolidationScheduler
+
+        with pytest.raises(ValueError):
+            ConsolidationScheduler(_make_engine(), min_eligible=0)
+
+    def test_lore_wires_min_eligible(self):
+        from lore.lore import Lore
+
+        lore = Lore(
+            store=MemoryStore(),
+            embedding_fn=lambda text: [0.1] * 384,
+            consolidation_schedule="daily",
+            consolidation_min_eligible=10,
+        )
+        lore.remember("one")
+        assert lore._consolidation_scheduler._min_eligible == 10
+        assert lore._consolidation_scheduler.pending_eligible == 0
+
+
 # ---------------------------------------------------------------------------
 # S12: Stats Integration
 # ---------------------------------------------------------------------------
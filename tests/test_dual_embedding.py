@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import List
 
@@ -9,7 +10,7 @@ import pytest
 
 from lore import Lore
 from lore.embed.base import Embedder
-from lore.embed.router import EmbeddingRouter, detect_content_type
+from lore.embed.router import EmbeddingRouter, detect_content_type, detect_content_types
 from lore.store.memory import MemoryStore
 
 _DIM = 384
@@ -79,6 +80,10 @@ class TestDetectContentType:
         text = "Here is how to fix it:\n```python\ndef fix():\n    pass\n```"
         assert detect_content_type(text) == "code"
 
+    def test_batch_matches_single(self) -> None:
+        texts = self.CODE_SNIPPETS + self.PROSE_SNIPPETS
+        assert detect_content_types(texts) == [detect_content_type(t) for t in texts]
+
 
 # ---------------------------------------------------------------------------
 # Fake embedders for unit tests
@@ -156,9 +161,65 @@ class TestEmbeddingRouter:
         vec = router.embed('def foo():\n    x = bar()\n    return x\n')
         assert vec[0] == pytest.approx(0.1)
 
+    def test_wrapped_fallback_embeds_each_text_once(self) -> None:
+        from lore.embed.cache import CachedEmbedder, EmbeddingCache
+
+        calls: List[str] = []
+
+        class Counting(FakeProseEmbedder):
+            def embed(self, text: str) -> List[float]:
+                calls.append(text)
+                return super().embed(text)
+
+            def embed_batch(self, texts: List[str]) -> List[List[float]]:
+                calls.extend(texts)
+                return super().embed_batch(texts)
+
+        model = Counting()
+        # Separately wrapped, as a failed code-model load used to leave it.
+        router = EmbeddingRouter(
+            prose_embedder=CachedEmbedder(model, EmbeddingCache()),
+            code_embedder=CachedEmbedder(model, EmbeddingCache()),
+        )
+        vecs = router.embed_query_dual("search query")
+        assert vecs["prose"] == vecs["code"]
+        router.embed_batch(["Retry on 429.", "import os\nos.getcwd()\n"])
+        assert calls == ["search query", "Retry on 429.", "import os\nos.getcwd()\n"]
+        assert router._helper is None
+
     def test_implements_embedder_protocol(self, router: EmbeddingRouter) -> None:
         assert isinstance(router, Embedder)
 
+    def test_embed_with_model_returns_the_tag(self, router: EmbeddingRouter) -> None:
+        vec, model = router.embed_with_model('def foo():\n    x = bar()\n    return x\n')
+        assert (vec[0], model) == (pytest.approx(0.9), "code")
+        vecs, models = router.embed_batch_with_models(["Retry on 429.", "import os\nos.getcwd()\n"])
+        assert models == ["prose", "code"]
+        assert [v[0] for v in vecs] == [pytest.approx(0.1), pytest.approx(0.9)]
+
+    def test_last_embed_model_is_per_thread(self, router: EmbeddingRouter) -> None:
+        router.embed("Plain prose about deploys.")
+        worker = threading.Thread(target=router.embed, args=('def f():\n    return g()\n',))
+        worker.start()
+        worker.join()
+        assert router.last_embed_model == "prose"
+
+    def test_dual_query_runs_models_concurrently(self) -> None:
+        class Slow(FakeCodeEmbedder):
+            def embed(self, text: str) -> List[float]:
+                time.sleep(0.2)
+                return super().embed(text)
+
+        router = EmbeddingRouter(prose_embedder=Slow(), code_embedder=Slow())
+        try:
+            start = time.perf_counter()
+            vecs = router.embed_query_dual("query")
+            elapsed = time.perf_counter() - start
+        finally:
+            router.close()
+        assert set(vecs) == {"prose", "code"}
+        assert elapsed < 0.35
+
 
 # ---------------------------------------------------------------------------
 # F3-S3 / S4: Lore integration with dual embedding
@@ -181,6 +242,17 @@ class TestLoreDualEmbedding:
             redact=False,
         )
 
+    def test_code_model_fallback_shares_the_prose_embedder(self, monkeypatch) -> None:
+        import lore.lore as lore_module
+
+        monkeypatch.setattr(lore_module, "LocalEmbedder", FakeProseEmbedder)
+        monkeypatch.setattr(
+            lore_module, "make_code_embedder", lambda fallback=None: fallback,
+        )
+        lore = Lore(store=MemoryStore(), dual_embedding=True, redact=False)
+        assert lore._embedder._code is lore._embedder._prose
+        assert lore._write_embedder._code is lore._write_embedder._prose
+
     def test_remember_stores_embed_model_prose(self, lore_dual: Lore) -> None:
         mid = lore_dual.remember("Always use retries for flaky networks.")
         mem = lore_dual.get(mid)
@@ -0,0 +1,183 @@
+"""Tests for the micro-batching embedding service and async embedding."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from lore.embed.base import Embedder, embed_async, inference_executor
+from lore.embed.batching import BatchingEmbedder
+from lore.embed.cache import CachedEmbedder, EmbeddingCache
+
+
+class _RecordingEmbedder(Embedder):
+    """Records each ``embed_batch`` call; the first one blocks on ``gate``."""
+
+    model_id = "recording"
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def embed(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        self.started.set()
+        self.gate.wait(5)
+        if "boom" in texts:
+            raise RuntimeError("inference failed")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+class TestBatchingEmbedder:
+    def test_requests_queued_behind_a_run_share_one_batch(self) -> None:
+        inner = _RecordingEmbedder()
+        batcher = BatchingEmbedder(inner, max_batch=8, max_wait_ms=0)
+        try:
+            first = batcher.submit("first")
+            assert inner.started.wait(5)
+            # Arrive while inference for "first" is running.
+            futures = [batcher.submit(t) for t in ("a", "bb", "a", "ccc")]
+            inner.gate.set()
+            assert first.result(5) == [5.0, 1.0]
+            assert [f.result(5) for f in futures] == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+            # Duplicates within a batch are embedded once.
+            assert inner.batches == [["first"], ["a", "bb", "ccc"]]
+            assert batcher.stats() == {"batches": 2, "texts": 5}
+        finally:
+            batcher.close()
+
+    def test_max_batch_caps_coalescing(self) -> None:
+        inner = _RecordingEmbedder()
+        inner.gate.set()
+        batcher = BatchingEmbedder(inner, max_batch=2, max_wait_ms=50)
+        try:
+            assert batcher.embed_batch(["a", "b", "c", "d", "e"]) == [[1.0, 1.0]] * 5
+            assert all(len(b) <= 2 for b in inner.batches)
+        finally:
+            batcher.close()
+
+    def test_failure_reaches_every_caller_in_the_batch(self) -> None:
+        inner = _RecordingEmbedder()
+        batcher = BatchingEmbedder(inner, max_wait_ms=0)
+        try:
+            blocker = batcher.submit("x")
+            assert inner.started.wait(5)
+            futures = [batcher.submit("boom"), batcher.submit("fine")]
+            inner.gate.set()
+            blocker.result(5)
+            for f in futures:
+                with pytest.raises(RuntimeError, match="inference failed"):
+                    f.result(5)
+            # The worker survives a failed batch.
+            assert batcher.embed("ok") == [2.0, 1.0]
+        finally:
+            batcher.close()
+
+    def test_closed_rejects_new_work(self) -> None:
+        batcher = BatchingEmbedder(_RecordingEmbedder())
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit("late")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_callers_coalesce(self) -> None:
+        inner = _RecordingEmbedder()
+        inner.gate.set()
+        batcher = BatchingEmbedder(inner, max_batch=64, max_wait_ms=20)
+        embedder = CachedEmbedder(batcher, EmbeddingCache(0))
+        try:
+            texts = [f"q{i}" for i in range(10)]
+            results = await asyncio.gather(*(embed_async(embedder, t) for t in texts))
+            assert results == [[2.0, 1.0]] * 10
+            # The first request may start alone; the rest coalesce behind it.
+            assert len(inner.batches) <= 2
+            assert sorted(t for b in inner.batches for t in b) == sorted(texts)
+        finally:
+            batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_embed_async_falls_back_to_a_thread() -> None:
+    from unittest.mock import MagicMock
+
+    embedder = MagicMock()
+    embedder.embed.return_value = [0.5]
+    assert await embed_async(embedder, "q") == [0.5]
+
+
+class _SlowEmbedder(Embedder):
+    """Stands in for ONNX inference: blocks its thread (GIL released) per call."""
+
+    def __init__(self) -> None:
+        self.threads: List[str] = []
+
+    def embed(self, text: str) -> List[float]:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(0.15)
+        return [1.0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed(t) for t in texts]
+
+
+async def _max_loop_lag(work) -> float:
+    """Run ``work`` while ticking every 5 ms; the worst tick overshoot (s)."""
+    loop = asyncio.get_running_loop()
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            t = loop.time()
+            await asyncio.sleep(0.005)
+            lags.append(loop.time() - t - 0.005)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        await work
+    finally:
+        done.set()
+        await task
+    return max(lags)
+
+
+@pytest.mark.asyncio
+async def test_aembed_runs_on_the_bounded_inference_executor() -> None:
+    embedder = _SlowEmbedder()
+    lag = await _max_loop_lag(asyncio.gather(*(embedder.aembed(f"t{i}") for i in range(4))))
+    # Inline inference would stall the loop for 150 ms per call.
+    assert lag < 0.1
+    assert all(name.startswith("lore-embed") for name in embedder.threads)
+    assert len(set(embedder.threads)) <= inference_executor()._max_workers
+
+
+@pytest.mark.asyncio
+async def test_async_lore_embedding_keeps_the_loop_responsive() -> None:
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("sqlite_vec")
+    from lore import AsyncLore
+
+    embedder = _SlowEmbedder()
+
+    def slow_embed(text: str) -> List[float]:
+        embedder.embed(text)
+        return [0.01] * 384
+
+    async with AsyncLore("sqlite:///:memory:", embed=slow_embed) as lore:
+
+        async def remember_all() -> None:
+            for i in range(3):
+                await lore.remember(f"m{i}")
+
+        lag = await _max_loop_lag(remember_all())
+    assert lag < 0.1
+    assert len(embedder.threads) == 3
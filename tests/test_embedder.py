@@ -5,6 +5,7 @@ from __future__ import annotations
 import time
 from typing import List
 
+import numpy as np
 import pytest
 
 from lore import Lore
@@ -74,6 +75,86 @@ class TestLocalEmbedder:
         assert elapsed_ms < 200, f"Embedding took {elapsed_ms:.1f}ms (>200ms)"
 
 
+class _FakeEncoding:
+    def __init__(self, n: int) -> None:
+        self.ids = list(range(1, n + 1))
+
+
+class _FakeTokenizer:
+    """Tokenizes a text to ``len(text.split())`` ids, unpadded."""
+
+    def encode_batch(self, texts: List[str]) -> List[_FakeEncoding]:
+        return [_FakeEncoding(len(t.split())) for t in texts]
+
+
+class _FakeInput:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class _FakeSession:
+    """Token embedding ``[id, 1]``: a text's pooled, normalised vector
+    identifies its token count. Records the shape of each run."""
+
+    def __init__(self) -> None:
+        self.shapes: List[tuple] = []
+        self.get_inputs_calls = 0
+
+    def get_inputs(self) -> List[_FakeInput]:
+        self.get_inputs_calls += 1
+        return [_FakeInput("input_ids"), _FakeInput("attention_mask"), _FakeInput("token_type_ids")]
+
+    def run(self, _outputs, inputs):
+        ids = inputs["input_ids"]
+        assert inputs["token_type_ids"].shape == ids.shape
+        self.shapes.append(ids.shape)
+        return [np.stack([ids, np.ones_like(ids)], axis=2).astype(np.float32)]
+
+
+class TestLocalEmbedderDynamicPadding:
+    """Length-bucketed batching, without the model download."""
+
+    @pytest.fixture()
+    def embedder(self) -> LocalEmbedder:
+        embedder = LocalEmbedder(batch_size=2)
+        session = _FakeSession()
+        embedder._session = session
+        embedder._tokenizer = _FakeTokenizer()
+        embedder._wants_token_type_ids = any(
+            i.name == "token_type_ids" for i in session.get_inputs()
+        )
+        return embedder
+
+    def test_buckets_pad_to_their_longest_member(self, embedder: LocalEmbedder) -> None:
+        texts = ["w " * 9, "w", "w " * 3, "w w", "w " * 20]
+        embedder.embed_batch(texts)
+        # Sorted by length (1, 2, 3, 9, 20) into buckets of two.
+        assert embedder._session.shapes == [(2, 2), (2, 9), (1, 20)]
+
+    def test_results_keep_input_order(self, embedder: LocalEmbedder) -> None:
+        texts = ["w " * 9, "w", "w " * 3, "w w", "w " * 20]
+        results = embedder.embed_batch(texts)
+        # Padding is masked out: each result equals embedding the text alone.
+        assert results == [embedder.embed(t) for t in texts]
+        assert len({tuple(v) for v in results}) == len(texts)
+
+    def test_input_metadata_resolved_once(self, embedder: LocalEmbedder) -> None:
+        embedder.embed_batch(["a b", "c"])
+        embedder.embed_batch(["d"])
+        assert embedder._session.get_inputs_calls == 1
+
+    def test_thread_options(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ort = pytest.importorskip("onnxruntime")
+        monkeypatch.setenv("LORE_EMBED_INTRA_OP_THREADS", "3")
+        monkeypatch.setenv("LORE_EMBED_BATCH_SIZE", "8")
+        embedder = LocalEmbedder(inter_op_threads=2)
+        options = embedder._session_options(ort)
+        assert options.intra_op_num_threads == 3
+        assert options.inter_op_num_threads == 2
+        assert options.execution_mode == ort.ExecutionMode.ORT_PARALLEL
+        assert embedder._batch_size == 8
+
+
 class TestCustomEmbeddingFn:
     """Test that Lore accepts a custom embedding function."""
 
@@ -0,0 +1,95 @@
+"""Tests for the query-embedding LRU cache."""
+
+from __future__ import annotations
+
+from typing import List
+
+from lore.embed.base import Embedder
+from lore.embed.cache import CachedEmbedder, EmbeddingCache
+
+
+class _CountingEmbedder(Embedder):
+    model_id = "counting"
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def embed(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return [float(len(text)), 1.0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed(t) for t in texts]
+
+
+class TestEmbeddingCache:
+    def test_repeat_query_skips_inference(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(8))
+        first = embedder.embed("how do I deploy")
+        assert embedder.embed("how  do I\tdeploy ") == first
+        assert inner.calls == ["how do I deploy"]
+        assert embedder.cache.stats() == {"counting": (1, 1)}
+
+    def test_returned_vectors_are_copies(self) -> None:
+        embedder = CachedEmbedder(_CountingEmbedder(), EmbeddingCache(8))
+        embedder.embed("q").append(99.0)
+        assert embedder.embed("q") == [1.0, 1.0]
+
+    def test_lru_eviction(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(2))
+        for text in ("a", "b", "a", "c", "a", "b"):
+            embedder.embed(text)
+        # "b" was least recently used when "c" arrived.
+        assert inner.calls == ["a", "b", "c", "b"]
+
+    def test_models_do_not_share_entries(self) -> None:
+        cache = EmbeddingCache(8)
+        a = _CountingEmbedder()
+        b = _CountingEmbedder()
+        CachedEmbedder(a, cache, model_id="prose").embed("q")
+        CachedEmbedder(b, cache, model_id="code").embed("q")
+        assert a.calls == ["q"] and b.calls == ["q"]
+
+    def test_batch_only_embeds_misses(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(8))
+        embedder.embed("x")
+        out = embedder.embed_batch(["x", "yy", "x"])
+        assert out == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+        assert inner.calls == ["x", "yy"]
+
+    def test_long_texts_and_disabled_cache_bypass(self) -> None:
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(8, max_text_len=5))
+        embedder.embed("long text")
+        embedder.embed("long text")
+        disabled = CachedEmbedder(inner, EmbeddingCache(0))
+        disabled.embed("q")
+        disabled.embed("q")
+        assert inner.calls == ["long text", "long text", "q", "q"]
+
+    def test_save_and_load(self, tmp_path) -> None:
+        path = str(tmp_path / "embed_cache.npz")
+        cache = EmbeddingCache(8, path=path)
+        cache.put("prose", "hello", [0.5, 0.25])
+        cache.put("code", "def f()", [1.0, 0.0, 0.5])
+        cache.save()
+
+        restored = EmbeddingCache(8, path=path)
+        assert restored.load() == 2
+        assert restored.get("prose", "hello") == [0.5, 0.25]
+        assert restored.get("code", "def f()") == [1.0, 0.0, 0.5]
+        assert EmbeddingCache(8, path=str(tmp_path / "missing.npz")).load() == 0
+
+
+def test_metrics_export_cache_counters() -> None:
+    from lore.embed.cache import shared_embedding_cache
+    from lore.server.metrics import collect_all
+
+    cache = shared_embedding_cache()
+    cache.get("metrics-test-model", "q")
+    text = collect_all()
+    assert 'lore_embedding_cache_misses_total{model="metrics-test-model"}' in text
+    assert "lore_embedding_cache_size" in text
@@ -0,0 +1,159 @@
+"""Tests for the persistent content-hash embedding store (write paths)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from lore.embed.base import Embedder
+from lore.embed.persistent import (
+    EmbeddingStore,
+    PersistentCachedEmbedder,
+    shared_embedding_store,
+)
+
+
+class _CountingEmbedder(Embedder):
+    model_id = "counting"
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def embed(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.calls.extend(texts)
+        return [[float(len(t)), 0.5] + [0.0] * 382 for t in texts]
+
+
+class TestEmbeddingStore:
+    def test_vectors_survive_reopen(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "emb.db")
+        inner = _CountingEmbedder()
+        first = PersistentCachedEmbedder(inner, EmbeddingStore(path)).embed("hello")
+
+        reopened = PersistentCachedEmbedder(inner, EmbeddingStore(path))
+        assert reopened.embed("hello") == first
+        assert inner.calls == ["hello"]
+
+    def test_batch_infers_each_missing_text_once(self, tmp_path: Path) -> None:
+        inner = _CountingEmbedder()
+        embedder = PersistentCachedEmbedder(inner, EmbeddingStore(str(tmp_path / "emb.db")))
+        embedder.embed("a")
+        vecs = embedder.embed_batch(["a", "bb", "bb", "ccc"])
+        assert [v[0] for v in vecs] == [1.0, 2.0, 2.0, 3.0]
+        assert inner.calls == ["a", "bb", "ccc"]
+
+    def test_keyed_by_model_and_exact_text(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(str(tmp_path / "emb.db"))
+        inner = _CountingEmbedder()
+        PersistentCachedEmbedder(inner, store).embed("def f():\n    pass")
+        PersistentCachedEmbedder(inner, store).embed("def f(): pass")
+        PersistentCachedEmbedder(inner, store, model_id="other").embed("def f(): pass")
+        assert len(inner.calls) == 3
+        assert store.count("counting") == 2
+        assert store.count() == 3
+
+    def test_unusable_path_degrades_to_inference(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        inner = _CountingEmbedder()
+        embedder = PersistentCachedEmbedder(inner, EmbeddingStore(str(blocker / "emb.db")))
+        assert embedder.embed("x")[0] == 1.0
+        assert embedder.embed("x")[0] == 1.0
+        assert inner.calls == ["x", "x"]
+
+    def test_row_cap_evicts_least_recently_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        clock = iter(range(1_000, 2_000))
+        monkeypatch.setattr("lore.embed.persistent.time.time", lambda: next(clock))
+        inner = _CountingEmbedder()
+        store = EmbeddingStore(str(tmp_path / "emb.db"), max_rows=10)
+        embedder = PersistentCachedEmbedder(inner, store)
+        for i in range(10):
+            embedder.embed(f"text {i}")
+        embedder.embed("text 0")  # served → most recently used
+        assert inner.calls == [f"text {i}" for i in range(10)]
+
+        embedder.embed("text 10")  # 11 rows > cap → trimmed to 9
+        assert store.count() == 9
+        inner.calls.clear()
+        embedder.embed_batch(["text 0", "text 1", "text 2", "text 3", "text 10"])
+        assert inner.calls == ["text 1", "text 2"]
+
+    def test_unbounded_when_cap_is_zero(self, tmp_path: Path) -> None:
+        store = EmbeddingStore(str(tmp_path / "emb.db"), max_rows=0)
+        PersistentCachedEmbedder(_CountingEmbedder(), store).embed_batch([str(i) for i in range(50)])
+        assert store.count() == 50
+
+    def test_shared_store_is_opt_in(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("LORE_EMBED_STORE_PATH", raising=False)
+        assert shared_embedding_store() is None
+        monkeypatch.setenv("LORE_EMBED_STORE_PATH", "off")
+        assert shared_embedding_store() is None
+        monkeypatch.setenv("LORE_EMBED_STORE_PATH", str(tmp_path / "opt-in.db"))
+        monkeypatch.setenv("LORE_EMBED_STORE_MAX_ROWS", "42")
+        store = shared_embedding_store()
+        assert store is not None and store.max_rows == 42
+
+    @pytest.mark.asyncio
+    async def test_aembed_uses_the_store(self, tmp_path: Path) -> None:
+        inner = _CountingEmbedder()
+        embedder = PersistentCachedEmbedder(inner, EmbeddingStore(str(tmp_path / "emb.db")))
+        assert await embedder.aembed("q") == await embedder.aembed("q")
+        assert inner.calls == ["q"]
+
+    @pytest.mark.asyncio
+    async def test_aembed_batch_infers_only_missing_texts(self, tmp_path: Path) -> None:
+        inner = _CountingEmbedder()
+        embedder = PersistentCachedEmbedder(inner, EmbeddingStore(str(tmp_path / "emb.db")))
+        await embedder.aembed("a")
+        vecs = await embedder.aembed_batch(["a", "bb", "bb"])
+        assert [v[0] for v in vecs] == [1.0, 2.0, 2.0]
+        assert inner.calls == ["a", "bb"]
+
+
+class TestLoreWritePaths:
+    @pytest.fixture()
+    def inner(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _CountingEmbedder:
+        monkeypatch.setenv("LORE_EMBED_STORE_PATH", str(tmp_path / "emb.db"))
+        inner = _CountingEmbedder()
+        monkeypatch.setattr("lore.lore.LocalEmbedder", lambda: inner)
+        return inner
+
+    def test_remember_reindex_and_import_reuse_stored_vectors(
+        self, inner: _CountingEmbedder, tmp_path: Path,
+    ) -> None:
+        from lore import Lore
+        from lore.store.memory import MemoryStore
+
+        lore = Lore(store=MemoryStore())
+        lore.remember("deploys go through the staging cluster first")
+        lore.remember("deploys go through the staging cluster first", tags=["dup"])
+        assert inner.calls == ["deploys go through the staging cluster first"]
+
+        lore.reindex()
+        assert len(inner.calls) == 1
+
+        # A new process (fresh LRU) importing the same content re-infers nothing.
+        export_path = tmp_path / "export.json"
+        exported = lore.export_data(output=str(export_path))
+        fresh = Lore(store=MemoryStore())
+        result = fresh.import_data(str(export_path))
+        assert result.embeddings_regenerated == exported.memories == 2
+        assert len(inner.calls) == 1
+
+    def test_replaced_embedder_bypasses_the_store(self, inner: _CountingEmbedder) -> None:
+        from lore import Lore
+        from lore.store.memory import MemoryStore
+
+        lore = Lore(store=MemoryStore())
+        other = _CountingEmbedder()
+        lore._embedder = other
+        lore.remember("something")
+        assert other.calls == ["something"]
+        assert inner.calls == []
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 
-from lore.exceptions import LoreAuthError, LoreConnectionError
+from lore.exceptions import DuplicateSourceMessageError, LoreAuthError, LoreConnectionError
 from lore.store.http import HttpStore
 from lore.types import Memory
 
@@ -449,6 +449,18 @@ class TestSave:
         assert len(body["embedding"]) == 384
         store.close()
 
+    def test_save_conflict_on_source_key_raises_duplicate(self):
+        store = _make_store()
+        mem = _make_memory(source="slack", source_message_id="ts-1")
+        store._client.request = MagicMock(return_value=_mock_response(409))
+        with pytest.raises(DuplicateSourceMessageError) as exc:
+            store.save(mem)
+        assert (exc.value.source, exc.value.source_message_id) == ("slack", "ts-1")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            store.save(_make_memory())
+        store.close()
+
 
 class TestGet:
     def test_get_returns_memory(self):
@@ -477,6 +489,29 @@ class TestGet:
         assert store.get("nonexistent") is None
         store.close()
 
+    def test_get_by_source_id_uses_indexed_route(self):
+        store = _make_store()
+        lesson_data = {
+            "id": "srv-1", "problem": "content", "resolution": "content",
+            "source": "slack", "meta": {"type": "general"},
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+        store._client.request = MagicMock(
+            return_value=_mock_response(200, json_data=lesson_data)
+        )
+        mem = store.get_by_source_id("slack", "ts-1")
+        assert mem is not None
+        assert mem.id == "srv-1"
+        assert mem.source_message_id == "ts-1"
+        call_args = store._client.request.call_args
+        assert call_args[0] == ("GET", "/v1/lessons/by-source")
+        assert call_args[1]["params"] == {"source": "slack", "source_message_id": "ts-1"}
+
+        store._client.request = MagicMock(return_value=_mock_response(404))
+        assert store.get_by_source_id("slack", "ts-2") is None
+        store.close()
+
 
 class TestList:
     def test_list_with_filters(self):
@@ -601,14 +636,31 @@ class TestSearch:
         assert search_call[0] == ("POST", "/v1/lessons/search")
         body = search_call[1]["json"]
         assert len(body["embedding"]) == 384
+        assert body["record_access"] is True
         assert len(results) == 1
         assert results[0].score == 0.85
         assert results[0].memory.content == "use retries"
-        # Verify access tracking was called
+        # The server did not acknowledge record_access: per-result fallback
         access_call = store._client.request.call_args_list[1]
         assert access_call[0] == ("POST", "/v1/lessons/s1/access")
         store.close()
 
+    def test_search_is_one_round_trip_when_server_records_access(self):
+        store = _make_store()
+        lesson = {
+            "id": "s1", "problem": "p", "resolution": "r", "score": 0.9,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+        store._client.request = MagicMock(
+            return_value=_mock_response(
+                200, json_data={"lessons": [lesson, {**lesson, "id": "s2"}], "access_recorded": True},
+            )
+        )
+        assert len(store.search(embedding=[0.1] * 384)) == 2
+        assert store._client.request.call_count == 1
+        store.close()
+
     def test_search_with_filters(self):
         store = _make_store()
         store._client.request = MagicMock(
@@ -688,6 +740,8 @@ class TestRecallDispatch:
             lore._decay_threshold = 0.05
             lore._decay_config = None
             lore._tier_weights = {"working": 1.0, "short": 1.1, "long": 1.2}
+            lore._vector_index = None
+            lore._vector_index_path = None
 
             # MemoryStore has no search() method
             assert not hasattr(mem_store, 'search')
@@ -806,6 +860,7 @@ class TestUpvoteDownvoteDispatch:
         with patch.object(Lore, "__init__", lambda self, **kw: None):
             lore = Lore.__new__(Lore)
             lore._store = mem_store
+            lore._vector_index = None
             lore.upvote("m1")
         updated = mem_store.get("m1")
         assert updated.upvotes == 1
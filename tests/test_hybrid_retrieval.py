@@ -39,6 +39,7 @@ from lore.services.retrieve import (
     _hybrid_recall,
     _recency_signal,
     _rrf_fuse,
+    _trust_recall_config,
     hybrid_retrieve,
 )
 
@@ -214,21 +215,21 @@ def _fake_store_with(*, vec=None, fts=None, graph=None, fail=()):
             raise RuntimeError("graph branch boom")
         return list(graph or [])
 
-    async def _ent_by_name(_n, _org=None):
-        # Return a simple entity for any name so the graph branch fires.
+    async def _ents_by_names(names, _org=None):
+        # Return a simple entity for the first name so the graph branch fires.
         if not graph:
-            return None
+            return []
         from lore.persistence.types import StoredEntity
-        return StoredEntity(
-            id="ent-1", org_id="solo", name=str(_n), entity_type="topic", aliases=(),
+        return [StoredEntity(
+            id="ent-1", org_id="solo", name=str(names[0]), entity_type="topic", aliases=(),
             description=None, metadata={}, mention_count=1,
             first_seen_at=NOW, last_seen_at=NOW, created_at=NOW, updated_at=NOW,
-        )
+        )]
 
     store.recall_by_embedding = AsyncMock(side_effect=_vec)
     store.recall_by_text = AsyncMock(side_effect=_fts)
     store.recall_by_entities = AsyncMock(side_effect=_graph)
-    store.get_entity_by_name = AsyncMock(side_effect=_ent_by_name)
+    store.get_entities_by_names = AsyncMock(side_effect=_ents_by_names)
     # Phase 6F: hybrid recall calls are_superseded; default to no-op set.
     store.are_superseded = AsyncMock(return_value=set())
     return store
@@ -249,18 +250,22 @@ async def test_trust_recall_provenance_weighting_and_quarantine(monkeypatch):
     # Default env → no-op: both present.
     monkeypatch.delenv("LORE_RECALL_ANON_WEIGHT", raising=False)
     monkeypatch.delenv("LORE_RECALL_QUARANTINE_ANON", raising=False)
+    _trust_recall_config.cache_clear()
     rep = await _hybrid_recall(build(), _profile(min_score=0.0), params)
     assert {r.memory.id for r in rep.results} == {"owned", "anon"}
 
     # Quarantine → anonymous dropped entirely.
     monkeypatch.setenv("LORE_RECALL_QUARANTINE_ANON", "true")
+    _trust_recall_config.cache_clear()
     rep_q = await _hybrid_recall(build(), _profile(min_score=0.0), params)
     assert {r.memory.id for r in rep_q.results} == {"owned"}
 
     # Down-weight → owned outranks anon; provenance signal surfaced on both.
     monkeypatch.delenv("LORE_RECALL_QUARANTINE_ANON", raising=False)
     monkeypatch.setenv("LORE_RECALL_ANON_WEIGHT", "0.1")
+    _trust_recall_config.cache_clear()
     rep_w = await _hybrid_recall(build(), _profile(min_score=0.0), params)
+    _trust_recall_config.cache_clear()
     by_id = {r.memory.id: r for r in rep_w.results}
     assert by_id["owned"].score > by_id["anon"].score
     assert by_id["owned"].signals["provenance"] == 1.0
@@ -291,6 +296,23 @@ async def test_hybrid_recall_combines_signals():
     # Diagnostic plumbing must reflect that all three branches succeeded.
     assert report.attempted == {"vector": "ok", "fts": "ok", "graph": "ok"}
     assert report.best_score >= results[0].score
+    assert set(report.timings) == {"vector", "fts", "graph", "fuse", "supersession", "rescore"}
+    assert all(ms >= 0.0 for ms in report.timings.values())
+
+
+@pytest.mark.asyncio
+async def test_graph_branch_resolves_entities_in_one_lookup():
+    a = _make_stored("a", "alpha")
+    store = _fake_store_with(vec=[(a, 0.9)], graph=[(a, 1)])
+    await _hybrid_recall(
+        store, _profile(min_score=0.0),
+        HybridParams(org_id="solo", query_text="redis cache for New York users",
+                     query_vec=_vec(1), limit=5),
+    )
+    store.get_entities_by_names.assert_awaited_once()
+    names = store.get_entities_by_names.await_args.args[0]
+    assert {"redis", "Redis", "New York"} <= set(names)
+    assert store.recall_by_entities.await_args.args[1] == ["ent-1"]
 
 
 @pytest.mark.asyncio
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 
+from lore.exceptions import DuplicateSourceMessageError
 from lore.ingest.adapters.raw import RawAdapter
 from lore.ingest.dedup import Deduplicator, DedupResult
 from lore.ingest.pipeline import IngestionPipeline
@@ -92,6 +93,12 @@ class TestDedupModes:
         assert result.duplicate_of == "existing-1"
         lore._store.update.assert_called_once()
 
+    def test_dedup_embedding_reused_for_storage(self):
+        dedup = DedupResult(is_duplicate=False, embedding=[0.2] * 384)
+        pipeline, lore, _ = _make_pipeline(dedup_result=dedup)
+        pipeline.ingest(RawAdapter(), {"content": "hello"})
+        assert lore.remember.call_args[1]["embedding"] == [0.2] * 384
+
     def test_allow_mode_skips_dedup(self):
         pipeline, lore, deduplicator = _make_pipeline()
         result = pipeline.ingest(
@@ -126,6 +133,45 @@ class TestEdgeCases:
         assert result.status == "failed"
         assert "DB error" in result.error
 
+    def test_source_message_id_passed_to_remember(self):
+        pipeline, lore, _ = _make_pipeline()
+        pipeline.ingest(RawAdapter(), {"content": "hello", "message_id": "m-1"})
+        assert lore.remember.call_args[1]["source_message_id"] == "m-1"
+
+        pipeline.ingest(
+            RawAdapter(), {"content": "hello", "message_id": "m-1"}, dedup_mode="allow"
+        )
+        assert lore.remember.call_args[1]["source_message_id"] is None
+
+    def test_concurrent_insert_of_same_message_is_a_duplicate(self):
+        """Another worker stored the message between check and insert."""
+        pipeline, lore, deduplicator = _make_pipeline()
+        deduplicator.check.side_effect = [
+            DedupResult(is_duplicate=False),
+            DedupResult(is_duplicate=True, duplicate_of="winner", similarity=1.0, strategy="exact_id"),
+        ]
+        lore.remember.side_effect = RuntimeError("409 Conflict")
+        result = pipeline.ingest(RawAdapter(), {"content": "hello", "message_id": "m-1"})
+
+        assert result.status == "duplicate_rejected"
+        assert result.duplicate_of == "winner"
+        assert result.dedup_strategy == "exact_id"
+
+    def test_source_key_held_in_another_project_is_a_duplicate(self):
+        """The key is org-wide; the holder may be invisible to this project."""
+        pipeline, lore, deduplicator = _make_pipeline()
+        lore.remember.side_effect = DuplicateSourceMessageError("raw", "m-1")
+        payload = {"content": "hello", "message_id": "m-1"}
+
+        result = pipeline.ingest(RawAdapter(), payload, project="other")
+        assert result.status == "duplicate_rejected"
+        assert result.duplicate_of is None
+        assert result.dedup_strategy == "exact_id"
+
+        result = pipeline.ingest(RawAdapter(), payload, project="other", dedup_mode="merge")
+        assert result.status == "duplicate_skipped"
+        lore._store.get.assert_not_called()
+
 
 class TestBatchIngestion:
     def test_batch_returns_per_item_results(self):
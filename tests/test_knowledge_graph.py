@@ -1260,6 +1260,41 @@ class TestS15BackfillCascade:
         assert len(rels) == 0
         lore.close()
 
+    def test_forget_many_cascades_in_one_pass(self, tmp_path):
+        from lore.lore import Lore
+
+        lore = Lore(store=MemoryStore(),
+                    knowledge_graph=True, redact=False)
+        mid1 = lore.remember("Redis caching", type="general")
+        mid2 = lore.remember("Redis queues", type="general")
+        keep = lore.remember("Postgres", type="general")
+
+        e1 = _make_entity(lore._store, "redis", "tool")
+        e2 = _make_entity(lore._store, "cache", "concept")
+        e3 = _make_entity(lore._store, "postgres", "tool")
+        e1.mention_count = 2
+        lore._store.update_entity(e1)
+        e2.mention_count = 3
+        lore._store.update_entity(e2)
+        for mid in (mid1, mid2):
+            lore._store.save_entity_mention(EntityMention(
+                id=str(ULID()), entity_id=e1.id, memory_id=mid,
+                created_at=_utc_now_iso(),
+            ))
+        lore._store.save_entity_mention(EntityMention(
+            id=str(ULID()), entity_id=e2.id, memory_id=mid1,
+            created_at=_utc_now_iso(),
+        ))
+        _make_relationship(lore._store, e1.id, e2.id, "uses", memory_id=mid1)
+        kept_rel = _make_relationship(lore._store, e2.id, e3.id, "uses", memory_id=keep)
+
+        assert lore._forget_many([mid1, mid2]) == 2
+        assert lore._store.get_entity(e1.id) is None  # both mentions gone
+        assert lore._store.get_entity(e2.id).mention_count == 2
+        assert [r.id for r in lore._store.list_relationships()] == [kept_rel.id]
+        assert lore.get(keep) is not None
+        lore.close()
+
     def test_graph_backfill_basic(self, tmp_path):
         from lore.lore import Lore
 
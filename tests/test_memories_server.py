@@ -57,6 +57,10 @@ class FakeStore:
     def __init__(self):
         self._stored = _make_stored_memory()
         self.insert_memory = AsyncMock(return_value=_make_stored_memory())
+        self.insert_memories = AsyncMock(side_effect=lambda memories: [
+            _make_stored_memory(memory_id=f"mem-{i:03d}", content=m.content)
+            for i, m in enumerate(memories)
+        ])
         self.get_memory = AsyncMock(return_value=None)
         self.update_memory = AsyncMock(return_value=_make_stored_memory())
         self.delete_memory = AsyncMock(return_value=True)
@@ -101,6 +105,7 @@ def client(fake_store, mock_auth):
     # Mock the embedder so tests don't need ONNX models loaded
     mock_embedder = MagicMock()
     mock_embedder.embed.return_value = [0.0] * 384
+    mock_embedder.embed_batch.side_effect = lambda texts: [[0.0] * 384 for _ in texts]
 
     with patch("lore.server.routes.memories.get_store", fake_get_store):
         with patch("lore.server.routes.memories.require_role", return_value=lambda: mock_auth):
@@ -137,6 +142,26 @@ class TestMemoryCreate:
         assert resp.status_code == 422
 
 
+class TestMemoryBulkCreate:
+    def test_bulk_inserts_in_one_store_call(self, client):
+        test_client, store = client
+        resp = test_client.post("/v1/memories/bulk", json={"memories": [
+            {"content": "first", "tags": [" a ", ""]},
+            {"content": "second", "embedding": [0.1] * 384},
+        ]})
+        assert resp.status_code == 201
+        assert resp.json() == {"ids": ["mem-000", "mem-001"], "created": 2}
+        store.insert_memory.assert_not_awaited()
+        (batch,), _ = store.insert_memories.await_args
+        assert [m.content for m in batch] == ["first", "second"]
+        assert batch[0].tags == ("a",)
+        assert list(batch[1].embedding) == [0.1] * 384
+
+    def test_bulk_rejects_empty_batch(self, client):
+        test_client, _ = client
+        assert test_client.post("/v1/memories/bulk", json={"memories": []}).status_code == 422
+
+
 class TestMemoryRead:
     def test_get_not_found(self, client):
         test_client, store = client
@@ -210,6 +235,41 @@ class TestMemoryDelete:
         assert resp.status_code == 204
 
 
+class TestMemorySearch:
+    def _scored(self, memory_id: str, score: float):
+        from dataclasses import asdict
+
+        from lore.persistence.types import ScoredMemory
+        sm = _make_stored_memory(memory_id=memory_id, meta={"type": "lesson"})
+        return ScoredMemory(**asdict(sm), score=score)
+
+    def test_search_body_matches_response_model(self, client):
+        """The fast-path dict body serializes exactly like MemorySearchResponse."""
+        from lore.server.models import MemorySearchResponse
+        test_client, store = client
+        store.recall_by_embedding.return_value = [self._scored("mem-001", 0.9)]
+        resp = test_client.post("/v1/memories/search", json={"embedding": [0.1] * 384})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [m["id"] for m in data["memories"]] == ["mem-001"]
+        assert MemorySearchResponse.model_validate(data).model_dump(mode="json") == data
+
+    def test_search_streams_ndjson(self, client):
+        import json
+        test_client, store = client
+        store.recall_by_embedding.return_value = [
+            self._scored("mem-001", 0.9), self._scored("mem-002", 0.8),
+        ]
+        body = {"embedding": [0.1] * 384}
+        plain = test_client.post("/v1/memories/search", json=body).json()
+        resp = test_client.post("/v1/memories/search?stream=ndjson", json=body)
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in resp.text.splitlines()]
+        assert [e["event"] for e in events] == ["memory", "memory", "done"]
+        assert [e["data"] for e in events[:2]] == plain["memories"]
+        assert events[-1]["data"] == {"count": 2}
+
+
 class TestMemoryModels:
     def test_create_request_fields(self):
         from lore.server.models import MemoryCreateRequest
@@ -0,0 +1,112 @@
+"""Tests for the blocked near-duplicate grouping shared by both consolidation paths."""
+
+from __future__ import annotations
+
+import struct
+from typing import List
+
+import numpy as np
+
+from lore.near_duplicates import (
+    groups_from_edges,
+    max_pairwise_similarity,
+    near_duplicate_groups,
+)
+
+
+def _pairwise_groups(vectors: np.ndarray, threshold: float) -> List[List[int]]:
+    """Reference: the old pairwise loop with a plain union-find."""
+    parent = list(range(len(vectors)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    for i in range(len(unit)):
+        for j in range(i + 1, len(unit)):
+            if float(np.dot(unit[i], unit[j])) > threshold:
+                parent[find(i)] = find(j)
+    groups: dict = {}
+    for i in range(len(unit)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted((g for g in groups.values() if len(g) > 1), key=lambda g: g[0])
+
+
+def _clustered(n_clusters: int, per_cluster: int, singles: int, dim: int = 32) -> np.ndarray:
+    rng = np.random.RandomState(7)
+    rows = []
+    for _ in range(n_clusters):
+        base = rng.randn(dim)
+        rows.extend(base + rng.randn(dim) * 0.01 for _ in range(per_cluster))
+    rows.extend(rng.randn(dim) for _ in range(singles))
+    out = np.array(rows, dtype=np.float32)
+    return out[rng.permutation(len(out))]
+
+
+class TestNearDuplicateGroups:
+    def test_matches_pairwise_reference(self):
+        vectors = _clustered(n_clusters=6, per_cluster=4, singles=40)
+        assert near_duplicate_groups(list(vectors), 0.95) == _pairwise_groups(vectors, 0.95)
+
+    def test_block_size_does_not_change_groups(self):
+        vectors = _clustered(n_clusters=5, per_cluster=3, singles=30)
+        expected = near_duplicate_groups(list(vectors), 0.95)
+        # A handful of cells per block forces one-row blocks across the corpus.
+        assert near_duplicate_groups(list(vectors), 0.95, block_cells=1) == expected
+        assert near_duplicate_groups(list(vectors), 0.95, block_cells=100) == expected
+        assert len(expected) == 5
+
+    def test_transitive_closure_across_blocks(self):
+        a = np.array([1.0, 0.0], dtype=np.float32)
+        b = np.array([1.0, 0.3], dtype=np.float32)
+        c = np.array([1.0, 0.6], dtype=np.float32)
+        threshold = float(np.dot(a, c) / (np.linalg.norm(a) * np.linalg.norm(c))) + 0.001
+        groups = near_duplicate_groups([c, np.array([0.0, 1.0]), a, b], threshold, block_cells=1)
+        assert groups == [[0, 2, 3]]
+
+    def test_accepts_blobs_and_skips_unusable(self):
+        vec = [0.5] * 8
+        blob = struct.pack("8f", *vec)
+        vectors = [blob, None, vec, [0.0] * 8, b"", tuple(vec)]
+        assert near_duplicate_groups(vectors, 0.95) == [[0, 2, 5]]
+
+    def test_different_dimensions_are_not_compared(self):
+        groups = near_duplicate_groups([[1.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0]], 0.95)
+        assert groups == [[0, 2]]
+
+    def test_queries_only_compare_pairs_touching_them(self):
+        a = [1.0, 0.0]
+        b = [0.0, 1.0]
+        # 0~1 and 2~3 are duplicate pairs; only row 3 is new.
+        vectors = [a, a, b, b]
+        assert near_duplicate_groups(vectors, 0.95, queries=[3]) == [[2, 3]]
+        assert near_duplicate_groups(vectors, 0.95, queries=[3], block_cells=1) == [[2, 3]]
+        assert near_duplicate_groups(vectors, 0.95, queries=[]) == []
+
+    def test_empty_input(self):
+        assert near_duplicate_groups([], 0.95) == []
+
+
+class TestGroupsFromEdges:
+    def test_transitive_closure_over_ids(self):
+        edges = [("c", "d"), ("a", "b"), ("b", "c"), ("x", "y")]
+        assert groups_from_edges(edges) == [["c", "d", "a", "b"], ["x", "y"]]
+
+    def test_self_edges_and_empty_input(self):
+        assert groups_from_edges([("a", "a")]) == []
+        assert groups_from_edges([]) == []
+
+    def test_long_chain_collapses_to_one_group(self):
+        edges = [(i + 1, i) for i in range(500)]
+        assert groups_from_edges(edges) == [[1, 0] + list(range(2, 501))]
+
+
+class TestMaxPairwiseSimilarity:
+    def test_highest_pair(self):
+        sim = max_pairwise_similarity([[1.0, 0.0], [0.0, 1.0], [1.0, 0.1]])
+        assert abs(sim - 1.0 / np.sqrt(1.01)) < 1e-6
+
+    def test_fewer_than_two_vectors(self):
+        assert max_pairwise_similarity([[1.0, 0.0], None]) == 0.0
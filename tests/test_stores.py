@@ -96,6 +96,48 @@ class TestStore:
     def test_delete_nonexistent(self, store: Store) -> None:
         assert store.delete("nonexistent") is False
 
+    def test_delete_many_cascades_facts_and_mentions(self, memory_store: MemoryStore) -> None:
+        from lore.types import EntityMention, Fact
+
+        for mid in ("01", "02", "03"):
+            memory_store.save(_make_memory(id=mid))
+            memory_store.save_fact(Fact(
+                id=f"f{mid}", memory_id=mid, subject="s", predicate="p", object="o",
+            ))
+            memory_store.save_entity_mention(EntityMention(
+                id=f"em{mid}", entity_id="e1", memory_id=mid, created_at=TS,
+            ))
+
+        assert memory_store.delete_many(["01", "02", "missing"]) == 2
+        assert [m.id for m in memory_store.list()] == ["03"]
+        assert memory_store.get_facts("01") == []
+        assert [f.id for f in memory_store.list_all_facts()] == ["f03"]
+        assert [m.memory_id for m in memory_store.get_entity_mentions_for_entity("e1")] == ["03"]
+
+    def test_source_id_index_follows_writes(self, memory_store: MemoryStore) -> None:
+        memory_store.save(_make_memory(id="01", source="slack", source_message_id="ts-1"))
+        assert memory_store.get_by_source_id("slack", "ts-1").id == "01"
+        assert memory_store.get_by_source_id("telegram", "ts-1") is None
+
+        memory_store.update(_make_memory(id="01", source="slack", source_message_id="ts-2"))
+        assert memory_store.get_by_source_id("slack", "ts-1") is None
+        assert memory_store.get_by_source_id("slack", "ts-2").id == "01"
+
+        memory_store.delete_many(["01"])
+        assert memory_store.get_by_source_id("slack", "ts-2") is None
+
+    def test_save_rejects_taken_source_id(self, memory_store: MemoryStore) -> None:
+        from lore.exceptions import DuplicateSourceMessageError
+
+        memory_store.save(_make_memory(id="01", source="slack", source_message_id="ts-1"))
+        memory_store.save(_make_memory(id="01", source="slack", source_message_id="ts-1"))
+        with pytest.raises(DuplicateSourceMessageError):
+            memory_store.save(_make_memory(
+                id="02", project="other", source="slack", source_message_id="ts-1",
+            ))
+        assert memory_store.get("02") is None
+        assert memory_store.get_by_source_id("slack", "ts-1").id == "01"
+
     def test_tags_roundtrip(self, store: Store) -> None:
         store.save(_make_memory(tags=["a", "b"]))
         got = store.get("01")
@@ -0,0 +1,204 @@
+"""Tests for the in-memory recall vector index."""
+
+from __future__ import annotations
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import numpy as np
+
+from lore import Lore
+from lore.store.memory import MemoryStore
+from lore.store.vector_index import VectorIndex
+from lore.types import Memory
+
+_DIM = 8
+
+
+def _blob(vec: List[float]) -> bytes:
+    return struct.pack(f"{len(vec)}f", *vec)
+
+
+def _unit(i: int) -> List[float]:
+    vec = [0.0] * _DIM
+    vec[i % _DIM] = 1.0
+    return vec
+
+
+def _fake_embed(text: str) -> List[float]:
+    rng = np.random.RandomState(abs(hash(text)) % (2**31))
+    vec = rng.randn(384).astype(np.float32)
+    return (vec / np.linalg.norm(vec)).tolist()
+
+
+class TestVectorIndex:
+    def test_upsert_and_top_k(self) -> None:
+        index = VectorIndex(_DIM)
+        for i in range(4):
+            index.upsert(f"m{i}", _blob(_unit(i)))
+        top = index.top_k(_unit(2), 2)
+        assert top[0][0] == "m2"
+        assert abs(top[0][1] - 1.0) < 1e-6
+
+    def test_remove_swaps_last_row(self) -> None:
+        index = VectorIndex(_DIM)
+        for i in range(3):
+            index.upsert(f"m{i}", _blob(_unit(i)))
+        assert index.remove("m0")
+        assert "m0" not in index
+        assert len(index) == 2
+        assert index.top_k(_unit(2), 1)[0][0] == "m2"
+        assert not index.remove("m0")
+
+    def test_sync_reindexes_changed_embedding(self) -> None:
+        index = VectorIndex(_DIM)
+        index.upsert("m0", _blob(_unit(0)))
+        row = index.sync("m0", _blob(_unit(3)))
+        assert row == 0
+        assert abs(index.cosine(_unit(3))[0] - 1.0) < 1e-6
+
+    def test_wrong_dimension_is_skipped(self) -> None:
+        index = VectorIndex(_DIM)
+        assert index.sync("m0", _blob([1.0, 0.0])) is None
+        assert len(index) == 0
+
+    def test_grows_past_initial_capacity(self) -> None:
+        index = VectorIndex(_DIM)
+        for i in range(200):
+            index.upsert(f"m{i}", _blob(_unit(i)))
+        assert len(index) == 200
+        assert index.cosine(_unit(1)).shape == (200,)
+
+    def test_retain_drops_stale_rows(self) -> None:
+        index = VectorIndex(_DIM)
+        for i in range(5):
+            index.upsert(f"m{i}", _blob(_unit(i)))
+        assert index.retain(["m1", "m3"]) == 3
+        assert sorted(mid for mid, _ in index.top_k(_unit(1), 5)) == ["m1", "m3"]
+
+    def test_save_and_load_mmap(self, tmp_path) -> None:
+        path = str(tmp_path / "lore.db.vectors")
+        index = VectorIndex(_DIM, path=path)
+        for i in range(3):
+            index.upsert(f"m{i}", _blob(_unit(i)))
+        index.flush()
+
+        loaded = VectorIndex.load(path, _DIM)
+        assert len(loaded) == 3
+        assert loaded.top_k(_unit(1), 1)[0][0] == "m1"
+        # First mutation copies the read-only mapping into memory.
+        loaded.upsert("m3", _blob(_unit(3)))
+        loaded.remove("m0")
+        assert len(loaded) == 3
+
+    def test_load_missing_file_is_empty(self, tmp_path) -> None:
+        assert len(VectorIndex.load(str(tmp_path / "nope"), _DIM)) == 0
+
+
+def _memory(mid: str, i: int, **fields) -> Memory:
+    fields.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+    return Memory(id=mid, content=mid, embedding=_blob(_unit(i)), **fields)
+
+
+class TestSelect:
+    def _index(self, *memories: Memory) -> VectorIndex:
+        index = VectorIndex(_DIM)
+        for m in memories:
+            index.upsert(m.id, m.embedding, m)
+        return index
+
+    def _ids(self, index: VectorIndex, **filters) -> List[str]:
+        now = datetime.now(timezone.utc).timestamp()
+        return sorted(index.memory(r).id for r in index.select(now=now, **filters))
+
+    def test_filters_on_columns(self) -> None:
+        past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        index = self._index(
+            _memory("a", 0, project="p", tier="long", tags=["x", "y"]),
+            _memory("b", 1, project="p", tier="short", metadata={"user_id": "u1"}),
+            _memory("c", 2, project="q", type="fact"),
+            _memory("expired", 3, project="p", expires_at=past),
+            _memory("archived", 4, project="p", archived=True),
+        )
+        assert self._ids(index) == ["a", "b", "c"]
+        assert self._ids(index, project="p") == ["a", "b"]
+        assert self._ids(index, project="p", tier="short") == ["b"]
+        assert self._ids(index, type="fact") == ["c"]
+        assert self._ids(index, user_id="u1") == ["b"]
+        assert self._ids(index, tags=["x"]) == ["a"]
+        assert self._ids(index, project="nope") == []
+
+    def test_time_window_excludes_undated_rows(self) -> None:
+        old = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        index = self._index(_memory("old", 0, created_at=old), _memory("new", 1),
+                            _memory("undated", 2, created_at=""))
+        since = (datetime.now(timezone.utc) - timedelta(days=1)).timestamp()
+        assert self._ids(index, created_from=since) == ["new"]
+        assert self._ids(index) == ["new", "old", "undated"]
+
+    def test_rows_without_a_memory_are_not_selected(self) -> None:
+        index = VectorIndex(_DIM)
+        index.upsert("bare", _blob(_unit(0)))
+        assert self._ids(index) == []
+        index.sync("bare", _blob(_unit(0)), _memory("bare", 0))
+        assert self._ids(index) == ["bare"]
+
+    def test_columns_follow_swapped_rows(self) -> None:
+        index = self._index(_memory("a", 0, project="p"), _memory("b", 1, project="q"),
+                            _memory("c", 2, project="p"))
+        index.remove("a")
+        assert self._ids(index, project="p") == ["c"]
+        assert self._ids(index, project="q") == ["b"]
+
+
+class TestLoreRecallIndex:
+    def test_remember_and_forget_maintain_index(self) -> None:
+        lore = Lore(store=MemoryStore(), embedding_fn=_fake_embed, redact=False)
+        keep = lore.remember("alpha")
+        assert lore.recall("alpha")[0].memory.id == keep
+        gone = lore.remember("beta")
+        assert gone in lore._vector_index
+        lore.forget(gone)
+        assert gone not in lore._vector_index
+
+    def test_out_of_band_update_is_picked_up(self) -> None:
+        store = MemoryStore()
+        lore = Lore(store=store, embedding_fn=_fake_embed, redact=False)
+        mid = lore.remember("alpha")
+        lore.recall("alpha")
+        memory = store.get(mid)
+        memory.embedding = _blob(_fake_embed("gamma"))
+        store.update(memory)
+        result = lore.recall("gamma", limit=1)[0]
+        assert result.memory.id == mid
+        assert result.score > 0.99
+
+    def test_early_exit_matches_full_ranking(self) -> None:
+        lore = Lore(store=MemoryStore(), embedding_fn=_fake_embed, redact=False)
+        for i in range(300):
+            lore.remember(f"memory number {i}", tier=("working", "short", "long")[i % 3])
+        full = lore.recall("memory number 7", limit=300)
+        top = lore.recall("memory number 7", limit=5, offset=2)
+        assert [r.memory.id for r in top] == [r.memory.id for r in full[2:7]]
+
+    def test_recall_skips_store_list_until_a_foreign_write(self, monkeypatch) -> None:
+        store = MemoryStore()
+        lore = Lore(store=store, embedding_fn=_fake_embed, redact=False)
+        lore.remember("alpha")
+        lore.recall("alpha")  # builds the index
+
+        calls = []
+        real_list = store.list
+        monkeypatch.setattr(store, "list", lambda *a, **kw: calls.append(kw) or real_list(*a, **kw))
+        lore.remember("beta")
+        assert lore.recall("beta", limit=1)[0].memory.content == "beta"
+        assert lore.recall("alpha", limit=1)[0].memory.content == "alpha"
+        assert calls == []
+
+        # A write that bypasses Lore moves the store's generation: re-synced.
+        now = datetime.now(timezone.utc).isoformat()
+        store.save(Memory(id="direct", content="gamma", embedding=_blob(_fake_embed("gamma")),
+                          created_at=now, updated_at=now))
+        assert lore.recall("gamma", limit=1)[0].memory.id == "direct"
+        assert len(calls) == 1